@@ -1,19 +1,28 @@
 """System logs API endpoints."""
 
-from fastapi import APIRouter, HTTPException, Depends, Query
-from typing import List, Dict
+from fastapi import APIRouter, HTTPException, Depends, Query, Request
+from typing import List, Dict, Optional, Tuple
+from datetime import datetime, timedelta
 from pathlib import Path
+import asyncio
 import re
 import logging
 
+import logging_client
+
+from app.config import settings
 from app.middleware.auth import require_admin
+from app.services.log_index import SearchPattern, compile_search, read_lines, resolve_log_file, search_file
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/admin/logs", tags=["logs"])
 
-# Base path for logs directory
-LOGS_BASE_PATH = Path("/home/trosfy/projects/discord-ollama-agent/logs")
+# Base path for logs directory (same mount the cleanup service manages)
+LOGS_BASE_PATH = Path(settings.LOG_BASE_DIR)
+
+# Longest date range a single search may scan
+MAX_SEARCH_DAYS = 31
 
 
 def validate_date_format(date: str) -> bool:
@@ -29,6 +38,25 @@ def validate_date_format(date: str) -> bool:
     return bool(re.match(r'^\d{4}-\d{2}-\d{2}$', date))
 
 
+def validate_log_request(date: str, log_type: str):
+    """
+    Validate date and log type (prevents path traversal).
+
+    Raises:
+        HTTPException: 400 if either is invalid
+    """
+    if not validate_date_format(date):
+        logger.warning(f"Invalid date format: {date}")
+        raise HTTPException(status_code=400, detail="Invalid date format. Use YYYY-MM-DD")
+
+    if not validate_log_type(log_type):
+        logger.warning(f"Invalid log type: {log_type}")
+        raise HTTPException(
+            status_code=400,
+            detail="Invalid log type. Must be one of: app, debug, error"
+        )
+
+
 def validate_log_type(log_type: str) -> bool:
     """
     Validate log type is one of the allowed types.
@@ -78,18 +106,55 @@ async def get_log_dates(
         raise HTTPException(status_code=500, detail=f"Failed to read log dates: {str(e)}")
 
 
+@router.get("/transport")
+async def get_log_transport_stats(
+    request: Request,
+    admin_auth: Dict = Depends(require_admin)
+) -> Dict:
+    """
+    Get log transport drop and lag counters.
+
+    The logging service reports its ingest counters on its health endpoint,
+    which HealthCheckerService already polls; the client side is this
+    process's own batching handler.
+
+    Requires admin authentication.
+
+    Returns:
+        dict: {
+            "ingest": {"received": ..., "written": ..., "dropped": ...,
+                       "client_dropped": ..., "pending": ..., "lag_seconds": ...,
+                       "max_lag_seconds": ..., ...} or None if not yet polled,
+            "ingest_checked_at": "2025-12-29T10:00:00+00:00" or None,
+            "client": {"sent": ..., "dropped": ..., "buffered": ..., ...}
+        }
+    """
+    health_checker = getattr(request.app.state, "health_checker", None)
+    status = health_checker.get_health_snapshot().get("logging", {}) if health_checker else {}
+    details = status.get("details") or {}
+
+    return {
+        "ingest": (details.get("stats") or {}).get("ingest"),
+        "ingest_checked_at": status.get("timestamp"),
+        "client": logging_client.get_transport_stats()
+    }
+
+
 @router.get("/content")
 async def get_log_content(
     date: str = Query(..., description="Date in YYYY-MM-DD format"),
     log_type: str = Query(..., description="Log type: app, debug, or error"),
     lines: int = Query(100, ge=1, le=1000, description="Number of lines to return (max 1000)"),
     offset: int = Query(0, ge=0, description="Number of lines to skip from start"),
+    tail: bool = Query(False, description="Return the last `lines` lines (ignores offset)"),
     admin_auth: Dict = Depends(require_admin)
 ) -> Dict:
     """
     Get log file content with pagination.
 
-    Returns log content with pagination info.
+    Pages are served through a sidecar line index (seek, not full read), so
+    any page of any size file costs the same. Compressed (.gz) days are
+    read transparently.
 
     Requires admin authentication.
 
@@ -98,6 +163,7 @@ async def get_log_content(
         log_type: Type of log (app, debug, error)
         lines: Number of lines to return (1-1000)
         offset: Number of lines to skip from start
+        tail: Return the last page instead (offset in the response is where it starts)
 
     Returns:
         dict: {
@@ -113,47 +179,26 @@ async def get_log_content(
         HTTPException: If date format invalid, log type invalid, or file not found
     """
     try:
-        # Validate date format (prevent path traversal)
-        if not validate_date_format(date):
-            logger.warning(f"Invalid date format: {date}")
-            raise HTTPException(status_code=400, detail="Invalid date format. Use YYYY-MM-DD")
-
-        # Validate log type
-        if not validate_log_type(log_type):
-            logger.warning(f"Invalid log type: {log_type}")
-            raise HTTPException(
-                status_code=400,
-                detail="Invalid log type. Must be one of: app, debug, error"
-            )
-
-        # Build log file path
-        log_file = LOGS_BASE_PATH / date / f"{log_type}.log"
+        validate_log_request(date, log_type)
 
-        # Check if file exists
-        if not log_file.exists():
-            logger.warning(f"Log file not found: {log_file}")
+        log_file = resolve_log_file(LOGS_BASE_PATH / date, log_type)
+        if log_file is None:
+            logger.warning(f"Log file not found: {LOGS_BASE_PATH / date / log_type}.log")
             raise HTTPException(
                 status_code=404,
                 detail=f"Log file not found for date={date}, type={log_type}"
             )
 
-        # Read file content
         try:
-            with open(log_file, 'r', encoding='utf-8', errors='replace') as f:
-                all_lines = f.readlines()
+            if tail:
+                # Index first (cheap when current) to find where the last page starts
+                _, total_lines = await asyncio.to_thread(read_lines, log_file, 0, 0)
+                offset = max(0, total_lines - lines)
+            content, total_lines = await asyncio.to_thread(read_lines, log_file, offset, lines)
         except Exception as e:
             logger.error(f"Failed to read log file {log_file}: {e}")
             raise HTTPException(status_code=500, detail=f"Failed to read log file: {str(e)}")
 
-        total_lines = len(all_lines)
-
-        # Apply pagination
-        end_offset = min(offset + lines, total_lines)
-        content_lines = all_lines[offset:end_offset]
-
-        # Strip newlines and return
-        content = [line.rstrip('\n') for line in content_lines]
-
         logger.info(f"Returned {len(content)} lines from {log_file} (offset={offset}, total={total_lines})")
 
         return {
@@ -172,104 +217,131 @@ async def get_log_content(
         raise HTTPException(status_code=500, detail=f"Failed to get log content: {str(e)}")
 
 
+def _search_logs(
+    log_files: List[Tuple[str, Path]],
+    pattern: SearchPattern,
+    max_results: int
+) -> Tuple[List[Dict], bool]:
+    """
+    Stream matches across files, stopping one past max_results.
+
+    Returns:
+        (matches, truncated)
+    """
+    matches = []
+    for date, log_file in log_files:
+        for line_number, content in search_file(log_file, pattern):
+            if len(matches) >= max_results:
+                return matches, True
+            matches.append({"date": date, "line_number": line_number, "content": content})
+    return matches, False
+
+
 @router.get("/search")
 async def search_logs(
-    date: str = Query(..., description="Date in YYYY-MM-DD format"),
+    date: str = Query(..., description="Date in YYYY-MM-DD format (start of range)"),
     log_type: str = Query(..., description="Log type: app, debug, or error"),
-    query: str = Query(..., min_length=1, description="Search query text"),
+    query: str = Query(..., min_length=1, max_length=500, description="Search text or regular expression"),
     case_sensitive: bool = Query(False, description="Case sensitive search"),
+    regex: bool = Query(False, description="Treat query as a regular expression"),
+    end_date: Optional[str] = Query(None, description="End of date range, inclusive (YYYY-MM-DD)"),
     max_results: int = Query(100, ge=1, le=500, description="Maximum results to return (max 500)"),
     admin_auth: Dict = Depends(require_admin)
 ) -> Dict:
     """
     Search within log files.
 
-    Returns matching lines with line numbers.
+    The query is compiled once and each file is streamed in chunks, oldest
+    date first, stopping as soon as max_results matches are found. Days
+    without a log file in the range are skipped.
 
     Requires admin authentication.
 
     Args:
-        date: Date in YYYY-MM-DD format
+        date: Date in YYYY-MM-DD format (first day searched)
         log_type: Type of log (app, debug, error)
-        query: Text to search for
+        query: Text (or regex if regex=true) to search for
         case_sensitive: Whether search should be case sensitive
+        regex: Whether query is a regular expression
+        end_date: Last day searched (defaults to date; at most 31 days)
         max_results: Maximum number of results to return (1-500)
 
     Returns:
         dict: {
             "date": "2025-12-29",
+            "end_date": "2025-12-29",
             "log_type": "app",
             "query": "error",
             "case_sensitive": false,
+            "regex": false,
             "matches": [
-                {"line_number": 42, "content": "Error occurred..."},
-                {"line_number": 156, "content": "Another error..."}
+                {"date": "2025-12-29", "line_number": 42, "content": "Error occurred..."},
+                {"date": "2025-12-29", "line_number": 156, "content": "Another error..."}
             ],
             "total_matches": 2,
             "truncated": false
         }
 
     Raises:
-        HTTPException: If date format invalid, log type invalid, or file not found
+        HTTPException: If dates/log type/regex invalid, or no file found in range
     """
     try:
-        # Validate date format (prevent path traversal)
-        if not validate_date_format(date):
-            logger.warning(f"Invalid date format: {date}")
-            raise HTTPException(status_code=400, detail="Invalid date format. Use YYYY-MM-DD")
-
-        # Validate log type
-        if not validate_log_type(log_type):
-            logger.warning(f"Invalid log type: {log_type}")
+        validate_log_request(date, log_type)
+        end_date = end_date or date
+        if not validate_date_format(end_date):
+            raise HTTPException(status_code=400, detail="Invalid end_date format. Use YYYY-MM-DD")
+
+        try:
+            start_day = datetime.strptime(date, "%Y-%m-%d")
+            end_day = datetime.strptime(end_date, "%Y-%m-%d")
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid date. Use YYYY-MM-DD")
+        days = (end_day - start_day).days + 1
+        if days < 1 or days > MAX_SEARCH_DAYS:
             raise HTTPException(
                 status_code=400,
-                detail="Invalid log type. Must be one of: app, debug, error"
+                detail=f"end_date must be on or after date and within {MAX_SEARCH_DAYS} days"
             )
 
-        # Build log file path
-        log_file = LOGS_BASE_PATH / date / f"{log_type}.log"
-
-        # Check if file exists
-        if not log_file.exists():
-            logger.warning(f"Log file not found: {log_file}")
+        try:
+            pattern = compile_search(query, regex, case_sensitive)
+        except re.error as e:
+            raise HTTPException(status_code=400, detail=f"Invalid regular expression: {e}")
+
+        log_files = []
+        for i in range(days):
+            day = (start_day + timedelta(days=i)).strftime("%Y-%m-%d")
+            log_file = resolve_log_file(LOGS_BASE_PATH / day, log_type)
+            if log_file is not None:
+                log_files.append((day, log_file))
+
+        if not log_files:
+            logger.warning(f"No {log_type} log files between {date} and {end_date}")
             raise HTTPException(
                 status_code=404,
                 detail=f"Log file not found for date={date}, type={log_type}"
             )
 
-        # Read file and search
-        matches = []
-        search_query = query if case_sensitive else query.lower()
-
         try:
-            with open(log_file, 'r', encoding='utf-8', errors='replace') as f:
-                for line_number, line in enumerate(f, start=1):
-                    line_content = line.rstrip('\n')
-                    search_content = line_content if case_sensitive else line_content.lower()
-
-                    if search_query in search_content:
-                        matches.append({
-                            "line_number": line_number,
-                            "content": line_content
-                        })
-
-                        # Stop if we've hit max results
-                        if len(matches) >= max_results:
-                            break
+            matches, truncated = await asyncio.to_thread(_search_logs, log_files, pattern, max_results)
         except Exception as e:
-            logger.error(f"Failed to search log file {log_file}: {e}")
+            logger.error(f"Failed to search log files for {date}..{end_date}: {e}")
             raise HTTPException(status_code=500, detail=f"Failed to search log file: {str(e)}")
 
         total_matches = len(matches)
-        truncated = total_matches >= max_results
 
-        logger.info(f"Search in {log_file} for '{query}': found {total_matches} matches (truncated={truncated})")
+        logger.info(
+            f"Search in {len(log_files)} {log_type} log(s) {date}..{end_date} for '{query}': "
+            f"found {total_matches} matches (truncated={truncated})"
+        )
 
         return {
             "date": date,
+            "end_date": end_date,
             "log_type": log_type,
             "query": query,
             "case_sensitive": case_sensitive,
+            "regex": regex,
             "matches": matches,
             "total_matches": total_matches,
             "truncated": truncated
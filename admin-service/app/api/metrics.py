@@ -4,8 +4,12 @@ Metrics API - Historical Time-Series Data
 Provides endpoints for querying historical metrics with:
 - Configurable time ranges
 - Multiple aggregation types (simple, max, min, avg, sum, p95, p99)
-- Adjustable granularity (5s, 1m, 5m, 1h, etc.)
+- Adjustable granularity (5s, 1m, 5m, 1h, 1d, etc.)
 - Summary statistics
+
+Queries at 1 minute granularity or coarser are served from pre-aggregated
+rollup tiers (1m/1h/1d), so long ranges read hundreds of items instead of
+every raw 5s sample.
 """
 
 import logging
@@ -13,9 +17,11 @@ from datetime import datetime, timedelta
 from typing import Dict, List, Optional
 from fastapi import APIRouter, HTTPException, Depends, Query
 
+from app.config import settings
 from app.middleware.auth import require_admin
 from app.services.metrics_storage import MetricsStorage
 from app.services.metrics_aggregator import MetricsAggregator
+from app.services.metrics_rollup import ROLLUP_TIERS, plan_query, query_field_sketches
 
 logger = logging.getLogger(__name__)
 
@@ -29,7 +35,22 @@ VALID_METRIC_TYPES = ["vram", "health", "psi", "queue"]
 VALID_AGGREGATIONS = ["simple", "max", "min", "sum", "avg", "p95", "p99"]
 
 # Valid granularity values (in seconds)
-VALID_GRANULARITIES = [5, 60, 300, 900, 1800, 3600]  # 5s, 1m, 5m, 15m, 30m, 1h
+VALID_GRANULARITIES = [5, 60, 300, 900, 1800, 3600, 86400]  # 5s, 1m, 5m, 15m, 30m, 1h, 1d
+
+# Summaries use the coarsest tier leaving at least this many buckets in range
+SUMMARY_MIN_BUCKETS = 24
+
+
+def _plan_segments(start_dt: datetime, end_dt: datetime, granularity: int) -> List:
+    """Plan tier segments for a query (raw only when rollups are disabled)."""
+    if not settings.METRICS_ROLLUPS_ENABLED:
+        return [(None, start_dt, end_dt)]
+    return plan_query(start_dt, end_dt, granularity)
+
+
+def _segment_sources(segments: List) -> List[str]:
+    """Names of the data sources used by a plan (tier names or "raw")."""
+    return [tier.name if tier else "raw" for tier, _, _ in segments]
 
 
 @router.get("/history")
@@ -38,7 +59,7 @@ async def get_metrics_history(
     field: str = Query(..., description="Field to extract (e.g., used_gb, cpu, memory)"),
     start_time: str = Query(..., description="Start time (ISO 8601 format)"),
     end_time: str = Query(..., description="End time (ISO 8601 format)"),
-    granularity: int = Query(5, description="Granularity in seconds (5, 60, 300, 3600)"),
+    granularity: int = Query(5, description="Granularity in seconds (5, 60, 300, 3600, 86400)"),
     aggregation: str = Query("simple", description="Aggregation type"),
     admin_auth: Dict = Depends(require_admin)
 ) -> Dict:
@@ -64,6 +85,10 @@ async def get_metrics_history(
             - aggregation: Aggregation type used
             - data_points: List of {timestamp, value} objects
             - summary: Overall statistics {count, min, max, avg, p95, p99}
+            - sources: Data sources used ("1h", "1m", "raw", ...)
+
+    Granularities of 60s and above read rollup tiers; percentiles then
+    carry ~1% relative error and "simple" reports the bucket average.
 
     Example:
         GET /admin/metrics/history?
@@ -134,15 +159,47 @@ async def get_metrics_history(
                 detail="start_time must be before end_time"
             )
 
+        segments = _plan_segments(start_dt, end_dt, granularity)
+        raw_only = len(segments) == 1 and segments[0][0] is None
+
         time_range = end_dt - start_dt
-        if time_range > timedelta(days=2):
+        if raw_only and time_range > timedelta(days=2):
             raise HTTPException(
                 status_code=400,
-                detail="Time range cannot exceed 2 days (data retention limit)"
+                detail=(
+                    "Time range cannot exceed 2 days (data retention limit) "
+                    "at this granularity; use granularity >= 60 for longer ranges"
+                )
             )
 
-        # Query metrics from DynamoDB
         storage = MetricsStorage()
+
+        if not raw_only:
+            # Merge pre-aggregated rollup sketches
+            series = await query_field_sketches(storage, metric_type, field, segments)
+            aggregated_points, summary = MetricsAggregator.aggregate_sketches(
+                series, granularity, aggregation
+            )
+
+            logger.info(
+                f"Returned {len(aggregated_points)} {metric_type}.{field} data points "
+                f"from {len(series)} rollups ({_segment_sources(segments)}) "
+                f"for user {admin_auth.get('user_id')}"
+            )
+
+            return {
+                "metric_type": metric_type,
+                "field": field,
+                "start_time": start_time,
+                "end_time": end_time,
+                "granularity": granularity,
+                "aggregation": aggregation,
+                "data_points": aggregated_points,
+                "summary": summary,
+                "sources": _segment_sources(segments)
+            }
+
+        # Query raw metrics from DynamoDB
         raw_points = await storage.query_metrics(metric_type, start_dt, end_dt)
 
         if not raw_points:
@@ -165,7 +222,8 @@ async def get_metrics_history(
                     "avg": None,
                     "p95": None,
                     "p99": None
-                }
+                },
+                "sources": ["raw"]
             }
 
         # Aggregate data
@@ -190,7 +248,8 @@ async def get_metrics_history(
             "granularity": granularity,
             "aggregation": aggregation,
             "data_points": aggregated_points,
-            "summary": summary
+            "summary": summary,
+            "sources": ["raw"]
         }
 
     except HTTPException:
@@ -215,7 +274,8 @@ async def get_metrics_summary(
     Get summary statistics for a metric over a time range.
 
     Faster than /history endpoint since it doesn't return data points,
-    only overall statistics.
+    only overall statistics. Long ranges are summarized from rollup
+    sketches (exact count/min/max/avg, ~1% relative error on percentiles).
 
     Args:
         metric_type: Type of metric (vram, health, psi, queue)
@@ -281,13 +341,23 @@ async def get_metrics_summary(
                 detail="start_time must be before end_time"
             )
 
-        # Query metrics
-        storage = MetricsStorage()
-        raw_points = await storage.query_metrics(metric_type, start_dt, end_dt)
+        # Coarsest tier that still leaves SUMMARY_MIN_BUCKETS windows in range
+        range_seconds = (end_dt - start_dt).total_seconds()
+        resolution = 5
+        for tier in ROLLUP_TIERS:
+            if range_seconds >= tier.seconds * SUMMARY_MIN_BUCKETS:
+                resolution = tier.seconds
+        segments = _plan_segments(start_dt, end_dt, resolution)
 
-        # Extract values and calculate summary
-        values = MetricsAggregator.extract_field_values(raw_points, field)
-        summary = MetricsAggregator.calculate_summary_stats(values)
+        storage = MetricsStorage()
+        if len(segments) == 1 and segments[0][0] is None:
+            # Short range: exact statistics from raw samples
+            raw_points = await storage.query_metrics(metric_type, start_dt, end_dt)
+            values = MetricsAggregator.extract_field_values(raw_points, field)
+            summary = MetricsAggregator.calculate_summary_stats(values)
+        else:
+            series = await query_field_sketches(storage, metric_type, field, segments)
+            _, summary = MetricsAggregator.aggregate_sketches(series, resolution, "avg")
 
         logger.info(
             f"Returned summary for {metric_type}.{field} "
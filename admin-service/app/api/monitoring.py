@@ -10,17 +10,14 @@ Data sources:
 """
 
 import asyncio
-from datetime import datetime
 from typing import AsyncGenerator, Dict
 import logging
 
-from fastapi import APIRouter, Depends, Request
+from fastapi import APIRouter, Depends, Query, Request
 from sse_starlette.sse import EventSourceResponse
 
 from app.middleware.auth import require_admin_sse
-from app.services.system_metrics_service import SystemMetricsService
-from app.services.health_checker_service import HealthCheckerService
-from app.utils.json_encoder import json_dumps
+from app.services.monitoring_broadcaster import MonitoringBroadcaster
 
 logger = logging.getLogger(__name__)
 
@@ -28,63 +25,40 @@ router = APIRouter(prefix="/admin", tags=["monitoring"])
 
 
 async def monitoring_event_generator(
-    system_metrics: SystemMetricsService,
-    health_checker: HealthCheckerService
+    broadcaster: MonitoringBroadcaster,
+    delta: bool = False
 ) -> AsyncGenerator[dict, None]:
     """
     Generate monitoring events for SSE stream.
 
-    Pulls data from two sources:
-    - SystemMetricsService: VRAM, PSI, queue metrics
-    - HealthCheckerService: Service health status
+    Snapshots are built once per interval by the shared MonitoringBroadcaster
+    and fanned out to every connected client; this generator only drains
+    the client's own bounded queue.
 
-    Sends updates every 5 seconds with complete monitoring snapshot.
+    Args:
+        broadcaster: Shared monitoring producer
+        delta: Send full/delta frames instead of full snapshots every time
     """
-    while True:
-        try:
-            # Pull from both services
-            system_snapshot = await system_metrics.get_system_snapshot()
-            health_snapshot = health_checker.get_health_snapshot()
-
-            # Combine data from both sources
-            data = {
-                "timestamp": system_snapshot.get("timestamp"),
-                "vram": system_snapshot.get("vram", {}),
-                "queue_size": system_snapshot.get("queue_size", 0),
-                "psi": system_snapshot.get("psi", {}),
-                "gpu": system_snapshot.get("gpu", {}),
-                "cpu_utilization": system_snapshot.get("cpu_utilization", 0),
-                "maintenance_mode": system_snapshot.get("maintenance_mode", False),
-                "services": health_snapshot  # Service health from HealthCheckerService
-            }
-
-            # Yield SSE event (no event type - use default 'message')
-            yield {
-                "data": json_dumps(data),
-            }
-
-            # Wait 5 seconds before next update
-            await asyncio.sleep(5)
-
-        except asyncio.CancelledError:
-            # Client disconnected
-            logger.info("Monitoring SSE client disconnected")
-            break
-        except Exception as e:
-            logger.error(f"Error in monitoring stream: {e}", exc_info=True)
-            # Send error event (no event type - use default 'message')
-            yield {
-                "data": json_dumps({
-                    "error": str(e),
-                    "timestamp": datetime.utcnow().isoformat()
-                }),
-            }
-            await asyncio.sleep(5)
+    subscription = broadcaster.subscribe(delta=delta)
+    try:
+        while True:
+            event = await subscription.next_event()
+            if event is None:
+                # Dropped for falling behind; client reconnects
+                break
+            yield event
+
+    except asyncio.CancelledError:
+        # Client disconnected
+        logger.info("Monitoring SSE client disconnected")
+    finally:
+        broadcaster.unsubscribe(subscription)
 
 
 @router.get("/monitoring/stream")
 async def monitoring_stream(
     request: Request,
+    delta: bool = Query(False, description="Send JSON merge patch deltas after the first full frame"),
     admin_auth: Dict = Depends(require_admin_sse)
 ):
     """
@@ -92,9 +66,12 @@ async def monitoring_stream(
 
     Requires admin authentication via ?token query parameter or Authorization header.
 
-    Pulls data from:
-    - app.state.system_metrics: VRAM, PSI, queue
-    - app.state.health_checker: Service health
+    All clients share one producer (app.state.monitoring_broadcaster), which
+    pulls from app.state.system_metrics and app.state.health_checker.
+
+    With ?delta=true, frames are wrapped as {"type": "full" | "delta", "data": ...};
+    deltas are JSON merge patches against the previous frame (null = removed).
+    Without it, every frame is the full snapshot.
 
     Returns:
         EventSourceResponse: Server-Sent Events stream
@@ -107,10 +84,9 @@ async def monitoring_stream(
             console.log('Services:', data.services);
         });
     """
-    # Get services from app state (started in main.py)
-    system_metrics = request.app.state.system_metrics
-    health_checker = request.app.state.health_checker
+    # Get shared producer from app state (created in main.py)
+    broadcaster = request.app.state.monitoring_broadcaster
 
     return EventSourceResponse(
-        monitoring_event_generator(system_metrics, health_checker)
+        monitoring_event_generator(broadcaster, delta=delta)
     )
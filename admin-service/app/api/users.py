@@ -147,6 +147,7 @@ async def unban_user(
 async def list_all_users(
     limit: int = Query(100, ge=1, le=500, description="Maximum number of users to return"),
     offset: int = Query(0, ge=0, description="Number of users to skip"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
     admin_auth: Dict = Depends(require_admin),
     service: UserService = Depends(get_user_service)
 ):
@@ -158,12 +159,13 @@ async def list_all_users(
     Args:
         limit: Maximum number of users to return (1-500)
         offset: Number of users to skip (for pagination)
+        cursor: Resume after the previous page (preferred over offset)
 
     Returns:
-        dict: List of users with pagination info
+        dict: List of users with pagination info and next_cursor
     """
     try:
-        result = await service.list_all_users(limit=limit, offset=offset)
+        result = await service.list_all_users(limit=limit, offset=offset, cursor=cursor)
         return result
 
     except Exception as e:
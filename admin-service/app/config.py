@@ -12,6 +12,7 @@ class Settings(BaseSettings):
     # JWT Authentication
     JWT_SECRET: str = os.getenv("JWT_SECRET_KEY", "your-secret-key-change-me")
     JWT_ALGORITHM: str = "HS256"
+    VERIFIED_TOKEN_CACHE_TTL_SECONDS: float = float(os.getenv("VERIFIED_TOKEN_CACHE_TTL_SECONDS", "60"))
 
     # Discord Bot Authentication
     BOT_SECRET: str = os.getenv("BOT_SECRET", "")  # For Discord bot token verification
@@ -31,6 +32,9 @@ class Settings(BaseSettings):
     DYNAMODB_ACCESS_KEY: str = os.getenv("AWS_ACCESS_KEY_ID", "dummy")
     DYNAMODB_SECRET_KEY: str = os.getenv("AWS_SECRET_ACCESS_KEY", "dummy")
     USERS_TABLE_NAME: str = "users"
+    DYNAMODB_MAX_POOL_CONNECTIONS: int = int(os.getenv("DYNAMODB_MAX_POOL_CONNECTIONS", "20"))
+    USER_CACHE_TTL_SECONDS: float = float(os.getenv("USER_CACHE_TTL_SECONDS", "30"))
+    USER_CACHE_MAX_ENTRIES: int = int(os.getenv("USER_CACHE_MAX_ENTRIES", "5000"))
     ADMIN_AUDIT_LOG_TABLE: str = "admin_audit_logs"
 
     # Service Configuration
@@ -49,15 +53,23 @@ class Settings(BaseSettings):
     HEALTH_CHECK_INTERVAL_SECONDS: int = int(os.getenv("HEALTH_CHECK_INTERVAL_SECONDS", "5"))
     HEALTH_CHECK_ALERT_THRESHOLD: int = int(os.getenv("HEALTH_CHECK_ALERT_THRESHOLD", "3"))
     HEALTH_CHECK_ALERT_COOLDOWN_SECONDS: int = int(os.getenv("HEALTH_CHECK_ALERT_COOLDOWN_SECONDS", "300"))
+    MONITORING_STREAM_INTERVAL_SECONDS: float = float(os.getenv("MONITORING_STREAM_INTERVAL_SECONDS", "5"))
+    MONITORING_SUBSCRIBER_QUEUE_SIZE: int = int(os.getenv("MONITORING_SUBSCRIBER_QUEUE_SIZE", "4"))
+    MONITORING_SUBSCRIBER_MAX_OVERFLOWS: int = int(os.getenv("MONITORING_SUBSCRIBER_MAX_OVERFLOWS", "3"))
 
     # Metrics Configuration
     METRICS_WRITE_INTERVAL_SECONDS: int = int(os.getenv("METRICS_WRITE_INTERVAL_SECONDS", "5"))
     METRICS_RETENTION_DAYS: int = int(os.getenv("METRICS_RETENTION_DAYS", "2"))
+    METRICS_ROLLUPS_ENABLED: bool = os.getenv("METRICS_ROLLUPS_ENABLED", "true").lower() == "true"
+    METRICS_ROLLUP_1M_RETENTION_DAYS: int = int(os.getenv("METRICS_ROLLUP_1M_RETENTION_DAYS", "14"))
+    METRICS_ROLLUP_1H_RETENTION_DAYS: int = int(os.getenv("METRICS_ROLLUP_1H_RETENTION_DAYS", "90"))
+    METRICS_ROLLUP_1D_RETENTION_DAYS: int = int(os.getenv("METRICS_ROLLUP_1D_RETENTION_DAYS", "730"))
 
     # Log Cleanup Configuration
     LOG_CLEANUP_INTERVAL_HOURS: int = int(os.getenv("LOG_CLEANUP_INTERVAL_HOURS", "6"))
     LOG_RETENTION_DAYS: int = int(os.getenv("LOG_RETENTION_DAYS", "2"))
     LOG_BASE_DIR: str = os.getenv("LOG_BASE_DIR", "/app/logs")
+    LOG_COMPRESS_CLOSED_DAYS: bool = os.getenv("LOG_COMPRESS_CLOSED_DAYS", "true").lower() == "true"
 
     class Config:
         case_sensitive = True
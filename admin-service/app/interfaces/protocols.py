@@ -164,6 +164,10 @@ class IUserRepository(Protocol):
         """List users with pagination."""
         ...
 
+    async def count_users(self) -> Optional[int]:
+        """Approximate number of users."""
+        ...
+
 
 class IDockerClient(Protocol):
     """
@@ -71,6 +71,10 @@ async def startup_event():
     )
     app.state.metrics_writer = metrics_writer
 
+    # Shared monitoring SSE producer (starts on first subscriber)
+    from app.services.monitoring_broadcaster import MonitoringBroadcaster
+    app.state.monitoring_broadcaster = MonitoringBroadcaster(system_metrics, health_checker)
+
     # Start log cleanup service (independent)
     from app.services.log_cleanup_service import LogCleanupService
     log_cleanup = LogCleanupService()
@@ -91,6 +95,9 @@ async def shutdown_event():
         await app.state.log_cleanup.stop()
         logger.info("🧹 Log cleanup service stopped")
 
+    if hasattr(app.state, "monitoring_broadcaster"):
+        await app.state.monitoring_broadcaster.stop()
+
     if hasattr(app.state, "metrics_writer"):
         await app.state.metrics_writer.stop()
         logger.info("📊 Metrics writer stopped")
@@ -103,6 +110,10 @@ async def shutdown_event():
         await app.state.health_checker.stop()
         logger.info("🏥 Health checker service stopped")
 
+    # Release pooled DynamoDB connections held by the user repository
+    from app.container import get_container
+    await get_container().user_repository().close()
+
 
 @app.get("/health")
 async def health_check():
@@ -4,11 +4,20 @@ from datetime import datetime, timedelta
 from fastapi import HTTPException, Header, Depends, Query
 from typing import Optional, Dict
 import logging_client
+from token_cache import VerifiedTokenCache
 
 from app.config import settings
 
 logger = logging_client.setup_logger('admin-auth')
 
+# Dashboard polling and SSE reconnects present the same bearer token on every
+# call; reuse the decoded payload instead of re-verifying it each time.
+token_cache = VerifiedTokenCache(ttl_seconds=settings.VERIFIED_TOKEN_CACHE_TTL_SECONDS)
+
+
+def _decode_jwt(token: str) -> Dict:
+    return jwt.decode(token, settings.JWT_SECRET, algorithms=[settings.JWT_ALGORITHM])
+
 
 def verify_jwt_token(token: str) -> Dict:
     """
@@ -24,12 +33,8 @@ def verify_jwt_token(token: str) -> Dict:
         HTTPException: If token is invalid or expired
     """
     try:
-        # Decode and verify JWT
-        payload = jwt.decode(
-            token,
-            settings.JWT_SECRET,
-            algorithms=[settings.JWT_ALGORITHM]
-        )
+        # Decode and verify JWT (cached for recently verified tokens)
+        payload = token_cache.verify(token, _decode_jwt)
 
         # Validate required fields exist first
         user_id = payload.get("user_id")
@@ -3,13 +3,27 @@ DynamoDB User Repository
 
 Implementation of IUserRepository using DynamoDB for persistence.
 Follows Repository pattern and Dependency Inversion Principle.
+
+- One long-lived aioboto3 resource (pooled HTTP connections) shared by
+  all calls, instead of blocking boto3 calls on the event loop
+- Read-through user cache with a short TTL; every write through this
+  repository invalidates the user's entry (writes made by other services
+  show up once the TTL expires)
+- Cursor-based listing: each page reads only the items it returns
 """
 
-import boto3
-from typing import Dict, Optional, List
+import asyncio
+import collections
+import contextlib
+import copy
+import time
+from typing import Any, Dict, Optional, List, Tuple
 from datetime import datetime, timezone
 import logging
 
+import aioboto3
+from botocore.config import Config
+
 from app.config import settings
 
 logger = logging.getLogger(__name__)
@@ -23,15 +37,90 @@ class DynamoDBUserRepository:
     Uses DynamoDB as the underlying storage mechanism.
     """
 
-    def __init__(self):
-        """Initialize DynamoDB user repository."""
+    def __init__(
+        self,
+        cache_ttl_seconds: float = settings.USER_CACHE_TTL_SECONDS,
+        cache_max_entries: int = settings.USER_CACHE_MAX_ENTRIES
+    ):
+        """
+        Initialize DynamoDB user repository.
+
+        The DynamoDB resource is opened lazily on first use and kept open
+        until close().
+
+        Args:
+            cache_ttl_seconds: How long get_user results are served from memory (0 disables)
+            cache_max_entries: Cached users kept before evicting the least recently used
+        """
         self.table_name = settings.USERS_TABLE_NAME
-        self.dynamodb = boto3.resource(
-            'dynamodb',
-            endpoint_url=settings.DYNAMODB_ENDPOINT,
-            region_name=settings.AWS_REGION
-        )
-        self.table = self.dynamodb.Table(self.table_name)
+        self.session = aioboto3.Session()
+        self.cache_ttl_seconds = cache_ttl_seconds
+        self.cache_max_entries = max(1, cache_max_entries)
+        self.table = None
+        self._exit_stack: Optional[contextlib.AsyncExitStack] = None
+        self._connect_lock = asyncio.Lock()
+        self._cache: "collections.OrderedDict[str, Tuple[float, Dict]]" = collections.OrderedDict()
+        self._stats = {
+            "cache_hits": 0,
+            "cache_misses": 0,
+            "invalidations": 0,
+            "items_read": 0
+        }
+
+    async def _get_table(self):
+        """Get the shared table handle, opening the pooled resource once."""
+        if self.table is not None:
+            return self.table
+
+        async with self._connect_lock:
+            if self.table is None:
+                stack = contextlib.AsyncExitStack()
+                dynamodb = await stack.enter_async_context(self.session.resource(
+                    'dynamodb',
+                    endpoint_url=settings.DYNAMODB_ENDPOINT,
+                    region_name=settings.AWS_REGION,
+                    aws_access_key_id=settings.DYNAMODB_ACCESS_KEY,
+                    aws_secret_access_key=settings.DYNAMODB_SECRET_KEY,
+                    config=Config(max_pool_connections=settings.DYNAMODB_MAX_POOL_CONNECTIONS)
+                ))
+                self.table = await dynamodb.Table(self.table_name)
+                self._exit_stack = stack
+        return self.table
+
+    async def close(self):
+        """Close the pooled DynamoDB resource."""
+        if self._exit_stack is not None:
+            await self._exit_stack.aclose()
+            self._exit_stack = None
+        self.table = None
+
+    def _cache_get(self, user_id: str) -> Optional[Dict]:
+        entry = self._cache.get(user_id)
+        if entry is None or entry[0] <= time.monotonic():
+            if entry is not None:
+                del self._cache[user_id]
+            self._stats["cache_misses"] += 1
+            return None
+        self._cache.move_to_end(user_id)
+        self._stats["cache_hits"] += 1
+        return copy.deepcopy(entry[1])
+
+    def _cache_put(self, user_id: str, item: Dict):
+        if self.cache_ttl_seconds <= 0:
+            return
+        self._cache[user_id] = (time.monotonic() + self.cache_ttl_seconds, copy.deepcopy(item))
+        self._cache.move_to_end(user_id)
+        while len(self._cache) > self.cache_max_entries:
+            self._cache.popitem(last=False)
+
+    def invalidate(self, user_id: str):
+        """Drop a cached user (called after every write)."""
+        if self._cache.pop(user_id, None) is not None:
+            self._stats["invalidations"] += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache and read counters."""
+        return {**self._stats, "cached_users": len(self._cache)}
 
     async def get_user(self, user_id: str) -> Optional[Dict]:
         """
@@ -47,9 +136,17 @@ class DynamoDBUserRepository:
             user = await repo.get_user("12345")
             # {"user_id": "12345", "banned": False, ...}
         """
+        cached = self._cache_get(user_id)
+        if cached is not None:
+            return cached
+
         try:
-            response = self.table.get_item(Key={"user_id": user_id})
-            return response.get("Item")
+            table = await self._get_table()
+            response = await table.get_item(Key={"user_id": user_id})
+            item = response.get("Item")
+            if item is not None:
+                self._cache_put(user_id, item)
+            return item
         except Exception as e:
             logger.error(f"Failed to get user {user_id}: {e}")
             return None
@@ -77,7 +174,9 @@ class DynamoDBUserRepository:
                 "created_at": datetime.now(timezone.utc).isoformat(),
                 **user_data
             }
-            self.table.put_item(Item=item)
+            table = await self._get_table()
+            await table.put_item(Item=item)
+            self.invalidate(user_id)
             logger.info(f"Created user: {user_id}")
             return True
         except Exception as e:
@@ -109,12 +208,14 @@ class DynamoDBUserRepository:
             expr_attr_names["#last_updated"] = "last_updated"
             expr_attr_values[":last_updated"] = datetime.now(timezone.utc).isoformat()
 
-            self.table.update_item(
+            table = await self._get_table()
+            await table.update_item(
                 Key={"user_id": user_id},
                 UpdateExpression=update_expr,
                 ExpressionAttributeNames=expr_attr_names,
                 ExpressionAttributeValues=expr_attr_values
             )
+            self.invalidate(user_id)
             logger.info(f"Updated user: {user_id}")
             return True
         except Exception as e:
@@ -135,7 +236,9 @@ class DynamoDBUserRepository:
             await repo.delete_user("12345")
         """
         try:
-            self.table.delete_item(Key={"user_id": user_id})
+            table = await self._get_table()
+            await table.delete_item(Key={"user_id": user_id})
+            self.invalidate(user_id)
             logger.info(f"Deleted user: {user_id}")
             return True
         except Exception as e:
@@ -158,7 +261,8 @@ class DynamoDBUserRepository:
             await repo.ban_user("12345", "Abuse", "admin_user_id")
         """
         try:
-            self.table.update_item(
+            table = await self._get_table()
+            await table.update_item(
                 Key={"user_id": user_id},
                 UpdateExpression=(
                     "SET banned = :banned, ban_reason = :reason, "
@@ -171,6 +275,7 @@ class DynamoDBUserRepository:
                     ":timestamp": datetime.now(timezone.utc).isoformat()
                 }
             )
+            self.invalidate(user_id)
             logger.warning(f"User {user_id} banned by {admin_user}: {reason}")
             return True
         except Exception as e:
@@ -192,7 +297,8 @@ class DynamoDBUserRepository:
             await repo.unban_user("12345", "admin_user_id")
         """
         try:
-            self.table.update_item(
+            table = await self._get_table()
+            await table.update_item(
                 Key={"user_id": user_id},
                 UpdateExpression=(
                     "SET banned = :banned, unbanned_by = :admin, "
@@ -205,6 +311,7 @@ class DynamoDBUserRepository:
                     ":timestamp": datetime.now(timezone.utc).isoformat()
                 }
             )
+            self.invalidate(user_id)
             logger.info(f"User {user_id} unbanned by {admin_user}")
             return True
         except Exception as e:
@@ -234,7 +341,8 @@ class DynamoDBUserRepository:
             await repo.grant_tokens("12345", 10000, "Contest winner", "admin_id")
         """
         try:
-            self.table.update_item(
+            table = await self._get_table()
+            await table.update_item(
                 Key={"user_id": user_id},
                 UpdateExpression=(
                     "ADD token_balance :amount "
@@ -250,6 +358,7 @@ class DynamoDBUserRepository:
                     }
                 }
             )
+            self.invalidate(user_id)
             logger.info(
                 f"Granted {amount} tokens to user {user_id} by {admin_user}: {reason}"
             )
@@ -264,16 +373,20 @@ class DynamoDBUserRepository:
         last_key: Optional[str] = None
     ) -> Dict:
         """
-        List users with pagination.
+        List one page of users.
+
+        Reads only the page's items: Scan is called with Limit and resumed
+        from last_key (the previous page's cursor), looping only when
+        DynamoDB returns a short page (1 MB response cap).
 
         Args:
             limit: Maximum number of users to return
-            last_key: Last evaluated key for pagination
+            last_key: Cursor from the previous page (user_id of its last item)
 
         Returns:
             dict: {
                 "users": List of user dictionaries,
-                "last_key": Last evaluated key for next page (or None)
+                "last_key": Cursor for the next page (or None on the last page)
             }
 
         Example:
@@ -282,20 +395,44 @@ class DynamoDBUserRepository:
             next_key = result["last_key"]
         """
         try:
-            scan_kwargs = {"Limit": limit}
+            table = await self._get_table()
+            users: List[Dict] = []
+            start_key = {"user_id": last_key} if last_key else None
 
-            if last_key:
-                scan_kwargs["ExclusiveStartKey"] = {"user_id": last_key}
+            while len(users) < limit:
+                scan_kwargs = {"Limit": limit - len(users)}
+                if start_key:
+                    scan_kwargs["ExclusiveStartKey"] = start_key
 
-            response = self.table.scan(**scan_kwargs)
+                response = await table.scan(**scan_kwargs)
+                items = response.get("Items", [])
+                users.extend(items)
+                self._stats["items_read"] += len(items)
 
-            users = response.get("Items", [])
-            last_evaluated_key = response.get("LastEvaluatedKey")
+                start_key = response.get("LastEvaluatedKey")
+                if not start_key:
+                    break
 
             return {
                 "users": users,
-                "last_key": last_evaluated_key.get("user_id") if last_evaluated_key else None
+                "last_key": start_key.get("user_id") if start_key else None
             }
         except Exception as e:
             logger.error(f"Failed to list users: {e}")
             return {"users": [], "last_key": None}
+
+    async def count_users(self) -> Optional[int]:
+        """
+        Approximate user count from table metadata (no item reads).
+
+        DynamoDB refreshes ItemCount roughly every six hours.
+
+        Returns:
+            int: Approximate number of users, or None if unavailable
+        """
+        try:
+            table = await self._get_table()
+            return int(await table.item_count)
+        except Exception as e:
+            logger.error(f"Failed to count users: {e}")
+            return None
@@ -11,6 +11,7 @@ sys.path.insert(0, '/shared')
 import logging_client
 
 from app.config import settings
+from app.services.log_index import GZIP_SUFFIX, INDEX_SUFFIX, compress_log_file
 
 logger = logging_client.setup_logger('admin-service')
 
@@ -20,16 +21,20 @@ class LogCleanupService:
     Handles automatic cleanup of old log directories.
 
     Runs on configured interval and deletes log directories older than retention period.
+    Closed days (before today) are gzip-compressed in place; the logs API reads
+    them transparently.
     Database cleanup is not needed since DynamoDB uses automatic TTL.
     """
 
     LOG_DATE_FORMAT = "%Y-%m-%d"
+    COMPRESS_MIN_IDLE_SECONDS = 600  # Skip files written to recently (late writes after midnight)
 
     def __init__(self):
         """Initialize log cleanup service from settings."""
         self.base_dir = Path(settings.LOG_BASE_DIR)
         self.retention_days = settings.LOG_RETENTION_DAYS
         self.cleanup_interval_hours = settings.LOG_CLEANUP_INTERVAL_HOURS
+        self.compress_closed_days = settings.LOG_COMPRESS_CLOSED_DAYS
 
         self._task: Optional[asyncio.Task] = None
         self._running = False
@@ -136,6 +141,64 @@ class LogCleanupService:
             'errors': errors
         }
 
+    def compress_closed_logs(self) -> dict:
+        """
+        Compress log files in date directories before today.
+
+        Covers the day's files and their size-rotated segments (app.log,
+        app.log.1, ...). Files already compressed or written to within
+        COMPRESS_MIN_IDLE_SECONDS are skipped.
+
+        Returns:
+            Dict with compression statistics:
+            {
+                'compressed_count': int,
+                'saved_bytes': int,
+                'errors': list[str]
+            }
+        """
+        compressed_count = 0
+        saved_bytes = 0
+        errors = []
+
+        if not self.base_dir.exists():
+            return {'compressed_count': 0, 'saved_bytes': 0, 'errors': []}
+
+        today = datetime.now().strftime(self.LOG_DATE_FORMAT)
+        idle_cutoff = datetime.now().timestamp() - self.COMPRESS_MIN_IDLE_SECONDS
+
+        for dir_path in sorted(self.base_dir.iterdir()):
+            if not dir_path.is_dir():
+                continue
+            try:
+                datetime.strptime(dir_path.name, self.LOG_DATE_FORMAT)
+            except ValueError:
+                continue
+            if dir_path.name >= today:
+                continue
+
+            for file_path in sorted(dir_path.glob('*.log*')):
+                name = file_path.name
+                if name.endswith((GZIP_SUFFIX, INDEX_SUFFIX, '.tmp')) or not file_path.is_file():
+                    continue
+                try:
+                    stat = file_path.stat()
+                    if stat.st_mtime > idle_cutoff:
+                        continue
+                    target = compress_log_file(file_path)
+                    compressed_count += 1
+                    saved_bytes += stat.st_size - target.stat().st_size
+                except PermissionError:
+                    errors.append(f"Permission denied compressing {dir_path.name}/{name}")
+                except Exception as e:
+                    errors.append(f"Failed to compress {dir_path.name}/{name}: {e}")
+
+        return {
+            'compressed_count': compressed_count,
+            'saved_bytes': saved_bytes,
+            'errors': errors
+        }
+
     async def _cleanup_loop(self):
         """Background task that periodically cleans up old logs."""
         logger.info(
@@ -164,6 +227,17 @@ class LogCleanupService:
                 if result['errors']:
                     logger.warning(f"⚠️  Log cleanup had {len(result['errors'])} errors")
 
+                # Compress closed days off the event loop (large files)
+                if self.compress_closed_days:
+                    result = await asyncio.to_thread(self.compress_closed_logs)
+                    if result['compressed_count'] > 0:
+                        logger.info(
+                            f"🗜️  Compressed {result['compressed_count']} closed log files, "
+                            f"{result['saved_bytes'] / 1024 / 1024:.2f} MB saved"
+                        )
+                    for error in result['errors']:
+                        logger.warning(f"⏭️  {error}")
+
             except Exception as e:
                 logger.error(f"❌ Error in log cleanup loop: {e}", exc_info=True)
 
@@ -0,0 +1,481 @@
+"""
+Line index, paging and streaming search for log files.
+
+Log files are never read whole:
+
+- A sparse line index maps every ~64KB of a file to (line number, byte offset)
+  at a line boundary. Paging bisects the index, seeks, and skips at most a
+  couple of blocks of lines, so any page (including the last page of a
+  multi-GB file) costs the same. The index lives in a sidecar file next to the log
+  (<name>.idx) and is extended incrementally as the file grows; it is rebuilt
+  when the file is replaced (size-based rotation creates a new inode).
+- Closed days are compressed to <name>.gz as a series of independent gzip
+  members (one per block, each ending at a line boundary). The file is still
+  a normal .gz, and the sidecar index stores each member's compressed offset,
+  so paging into compressed logs also only decompresses one block.
+- Search compiles the query once and streams the file in 1MB chunks with
+  early cutoff, so memory stays bounded regardless of file size.
+
+Sidecar format (little-endian):
+    header: magic(8) inode(Q) size(Q) indexed_bytes(Q) lines(Q) count(Q)
+    body:   count x line number (Q), then count x byte offset (Q)
+"""
+
+import array
+import bisect
+import gzip
+import logging
+import os
+import re
+import struct
+import zlib
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+INDEX_MAGIC = b'LOGIDX1\x00'
+INDEX_HEADER = struct.Struct('<8sQQQQQ')
+INDEX_SUFFIX = '.idx'
+GZIP_SUFFIX = '.gz'
+
+BLOCK_SIZE = 64 * 1024  # Plain files: bytes between index checkpoints
+GZIP_BLOCK_SIZE = 256 * 1024  # Compressed files: uncompressed bytes per gzip member
+READ_SIZE = 1024 * 1024  # Streaming chunk size for search
+MAX_CACHED_INDEXES = 32
+
+
+class LineIndex:
+    """
+    Sparse (line number, byte offset) checkpoints for one log file.
+
+    For plain files offsets are file positions; for compressed files they
+    are the positions of gzip members. indexed_bytes is how far a plain
+    file has been scanned (always just after a newline).
+    """
+
+    def __init__(self, inode: int = 0, compressed: bool = False):
+        self.inode = inode
+        self.compressed = compressed
+        self.size = 0
+        self.indexed_bytes = 0
+        self.lines = 0
+        self.checkpoint_lines = array.array('Q')
+        self.checkpoint_offsets = array.array('Q')
+
+    @property
+    def total_lines(self) -> int:
+        """Complete lines, plus a trailing line still being written."""
+        partial = not self.compressed and self.size > self.indexed_bytes
+        return self.lines + (1 if partial else 0)
+
+    def add_checkpoint(self, line: int, offset: int):
+        self.checkpoint_lines.append(line)
+        self.checkpoint_offsets.append(offset)
+
+    def locate(self, line: int) -> Tuple[int, int]:
+        """Nearest checkpoint at or before line: (checkpoint line, offset)."""
+        i = bisect.bisect_right(self.checkpoint_lines, line) - 1
+        if i < 0:
+            return 0, 0
+        return self.checkpoint_lines[i], self.checkpoint_offsets[i]
+
+    def to_bytes(self) -> bytes:
+        header = INDEX_HEADER.pack(
+            INDEX_MAGIC, self.inode, self.size, self.indexed_bytes,
+            self.lines, len(self.checkpoint_lines)
+        )
+        return header + self.checkpoint_lines.tobytes() + self.checkpoint_offsets.tobytes()
+
+    @classmethod
+    def from_bytes(cls, data: bytes, compressed: bool) -> Optional['LineIndex']:
+        """Parse a sidecar (None if corrupt or from another format)."""
+        if len(data) < INDEX_HEADER.size:
+            return None
+        magic, inode, size, indexed_bytes, lines, count = INDEX_HEADER.unpack_from(data)
+        body = data[INDEX_HEADER.size:]
+        if magic != INDEX_MAGIC or len(body) != count * 16:
+            return None
+
+        index = cls(inode, compressed)
+        index.size = size
+        index.indexed_bytes = indexed_bytes
+        index.lines = lines
+        index.checkpoint_lines.frombytes(body[:count * 8])
+        index.checkpoint_offsets.frombytes(body[count * 8:])
+        return index
+
+
+# Recently used indexes, so repeated paging doesn't re-read sidecars
+_index_cache: 'OrderedDict[str, LineIndex]' = OrderedDict()
+
+
+def resolve_log_file(directory: Path, log_type: str) -> Optional[Path]:
+    """
+    Find a day's log file, plain or compressed.
+
+    Args:
+        directory: Date directory (e.g. /app/logs/2025-12-29)
+        log_type: app, debug or error
+
+    Returns:
+        Path to <log_type>.log or <log_type>.log.gz, or None
+    """
+    plain = directory / f"{log_type}.log"
+    if plain.exists():
+        return plain
+    compressed = directory / f"{log_type}.log{GZIP_SUFFIX}"
+    if compressed.exists():
+        return compressed
+    return None
+
+
+def _is_compressed(path: Path) -> bool:
+    return path.name.endswith(GZIP_SUFFIX)
+
+
+def _sidecar_path(path: Path) -> Path:
+    return path.with_name(path.name + INDEX_SUFFIX)
+
+
+def _save_index(path: Path, index: LineIndex):
+    """Write the sidecar atomically (log dir may be read-only: keep in memory)."""
+    sidecar = _sidecar_path(path)
+    tmp = sidecar.with_name(sidecar.name + '.tmp')
+    try:
+        tmp.write_bytes(index.to_bytes())
+        os.replace(tmp, sidecar)
+    except OSError as e:
+        logger.debug(f"Could not write log index {sidecar}: {e}")
+
+
+def _load_sidecar(path: Path) -> Optional[LineIndex]:
+    try:
+        return LineIndex.from_bytes(_sidecar_path(path).read_bytes(), _is_compressed(path))
+    except OSError:
+        return None
+
+
+def _extend_plain_index(path: Path, index: LineIndex, size: int):
+    """Scan a plain file from indexed_bytes to size, one checkpoint per block."""
+    position = index.indexed_bytes
+
+    with open(path, 'rb') as f:
+        while position < size:
+            f.seek(position)
+            data = f.read(min(BLOCK_SIZE, size - position))
+            end = data.rfind(b'\n')
+
+            # Line longer than a block: keep reading until it ends
+            while end < 0 and position + len(data) < size:
+                more = f.read(min(BLOCK_SIZE, size - position - len(data)))
+                if not more:
+                    break
+                more_end = more.rfind(b'\n')
+                if more_end >= 0:
+                    end = len(data) + more_end
+                data += more
+
+            if end < 0:
+                break  # Only a partial line left (still being written)
+
+            # Small appends between refreshes don't each get a checkpoint
+            if not index.checkpoint_offsets or position - index.checkpoint_offsets[-1] >= BLOCK_SIZE:
+                index.add_checkpoint(index.lines, position)
+            index.lines += data.count(b'\n', 0, end + 1)
+            position += end + 1
+
+    index.indexed_bytes = position
+    index.size = size
+
+
+def _iter_gzip_members(f, offset: int = 0, read_size: int = READ_SIZE) -> Iterator[Tuple[int, bytes]]:
+    """
+    Decompress a gzip file member by member.
+
+    Yields:
+        (compressed offset of the member being decoded, decompressed chunk)
+    """
+    f.seek(offset)
+    member_start = offset
+    consumed = offset
+    decompressor = zlib.decompressobj(31)
+
+    while True:
+        data = f.read(read_size)
+        if not data:
+            return
+        while data:
+            out = decompressor.decompress(data)
+            if out:
+                yield member_start, out
+            if decompressor.eof:
+                unused = decompressor.unused_data
+                consumed += len(data) - len(unused)
+                member_start = consumed
+                decompressor = zlib.decompressobj(31)
+                data = unused
+            else:
+                consumed += len(data)
+                data = b''
+
+
+def _build_gzip_index(path: Path, inode: int) -> LineIndex:
+    """Index a .gz without a sidecar: one checkpoint per gzip member."""
+    index = LineIndex(inode, compressed=True)
+    last_byte = b'\n'
+    with open(path, 'rb') as f:
+        last_member = -1
+        for member_start, chunk in _iter_gzip_members(f):
+            if member_start != last_member:
+                index.add_checkpoint(index.lines, member_start)
+                last_member = member_start
+            index.lines += chunk.count(b'\n')
+            last_byte = chunk[-1:]
+    if last_byte != b'\n':
+        index.lines += 1  # Trailing line without newline
+    index.size = path.stat().st_size
+    return index
+
+
+def get_line_index(path: Path) -> LineIndex:
+    """
+    Get an up-to-date line index for a log file.
+
+    Uses the in-memory cache, then the sidecar; extends plain-file indexes
+    incrementally and rebuilds when the file was replaced or truncated.
+    """
+    stat = path.stat()
+    key = str(path)
+    compressed = _is_compressed(path)
+
+    index = _index_cache.pop(key, None) or _load_sidecar(path)
+    if index is not None and (index.inode != stat.st_ino or stat.st_size < index.size):
+        index = None  # Rotated or truncated
+
+    changed = False
+    if index is None:
+        changed = True
+        if compressed:
+            index = _build_gzip_index(path, stat.st_ino)
+        else:
+            index = LineIndex(stat.st_ino)
+
+    if not compressed and stat.st_size > index.size:
+        _extend_plain_index(path, index, stat.st_size)
+        changed = True
+
+    if changed:
+        _save_index(path, index)
+
+    _index_cache[key] = index
+    while len(_index_cache) > MAX_CACHED_INDEXES:
+        _index_cache.popitem(last=False)
+    return index
+
+
+def _iter_chunks(path: Path, offset: int = 0, read_size: int = READ_SIZE) -> Iterator[bytes]:
+    """Stream decompressed bytes of a log file starting at an index offset."""
+    with open(path, 'rb') as f:
+        if _is_compressed(path):
+            for _, chunk in _iter_gzip_members(f, offset, read_size):
+                yield chunk
+        else:
+            f.seek(offset)
+            while True:
+                chunk = f.read(read_size)
+                if not chunk:
+                    return
+                yield chunk
+
+
+def _iter_lines(chunks: Iterator[bytes]) -> Iterator[bytes]:
+    """Split a byte stream into lines (without trailing newline)."""
+    pending = b''
+    for chunk in chunks:
+        lines = (pending + chunk).split(b'\n')
+        pending = lines.pop()
+        yield from lines
+    if pending:
+        yield pending
+
+
+def read_lines(path: Path, offset: int, count: int) -> Tuple[List[str], int]:
+    """
+    Read a page of lines.
+
+    Args:
+        path: Log file (plain or .gz)
+        offset: First line to return (0-based)
+        count: Maximum lines to return
+
+    Returns:
+        (lines, total line count)
+    """
+    index = get_line_index(path)
+    total = index.total_lines
+    if offset >= total or count <= 0:
+        return [], total
+
+    checkpoint_line, byte_offset = index.locate(offset)
+    skip = offset - checkpoint_line
+    result = []
+
+    # Pages are small: read a block at a time rather than READ_SIZE
+    for line in _iter_lines(_iter_chunks(path, byte_offset, BLOCK_SIZE)):
+        if skip:
+            skip -= 1
+            continue
+        result.append(line.decode('utf-8', errors='replace'))
+        if len(result) >= count:
+            break
+
+    return result, total
+
+
+class SearchPattern:
+    """
+    A search query compiled once for all files.
+
+    Plain-text queries use str.find (on lowercased text when case
+    insensitive), which is several times faster than an IGNORECASE regex;
+    regex queries use the compiled pattern.
+    """
+
+    def __init__(self, query: str, regex: bool, case_sensitive: bool):
+        """
+        Raises:
+            re.error: Invalid regular expression
+        """
+        flags = re.MULTILINE if case_sensitive else re.MULTILINE | re.IGNORECASE
+        self.regex = re.compile(query if regex else re.escape(query), flags)
+        self.literal = None if regex else (query if case_sensitive else query.lower())
+        self.fold = not regex and not case_sensitive
+
+    def finder(self, text: str) -> Callable[[int], int]:
+        """
+        Bind to a block of text.
+
+        Returns:
+            find(position) -> start of the next match at or after position, or -1
+        """
+        if self.literal is not None:
+            haystack = text.lower() if self.fold else text
+            # Lowercasing a few characters changes length; positions must line up
+            if len(haystack) == len(text):
+                literal = self.literal
+                return lambda position: haystack.find(literal, position)
+
+        search = self.regex.search
+
+        def find(position: int) -> int:
+            match = search(text, position)
+            return match.start() if match else -1
+
+        return find
+
+
+def compile_search(query: str, regex: bool, case_sensitive: bool) -> SearchPattern:
+    """
+    Compile a search query once for all files.
+
+    Raises:
+        re.error: Invalid regular expression
+    """
+    return SearchPattern(query, regex, case_sensitive)
+
+
+def search_file(path: Path, pattern: SearchPattern) -> Iterator[Tuple[int, str]]:
+    """
+    Stream matches from a log file.
+
+    Chunks are cut at the last newline and searched as a whole, so only
+    matching lines are materialized. Each line is reported once.
+
+    Yields:
+        (1-based line number, line content)
+    """
+    line_number = 0
+    carry = b''
+
+    for chunk in _iter_chunks(path):
+        data = carry + chunk
+        cut = data.rfind(b'\n')
+        if cut < 0:
+            carry = data
+            continue
+        carry = data[cut + 1:]
+        text = data[:cut + 1].decode('utf-8', errors='replace')
+
+        find = pattern.finder(text)
+        counted = 0
+        position = 0
+        while True:
+            start = find(position)
+            if start < 0 or start >= len(text):
+                break
+            line_start = text.rfind('\n', 0, start) + 1
+            line_end = text.find('\n', start)
+            line_number += text.count('\n', counted, line_start)
+            counted = line_start
+            yield line_number + 1, text[line_start:line_end]
+            position = line_end + 1
+            if position >= len(text):
+                break
+
+        line_number += text.count('\n', counted)
+
+    if carry:
+        text = carry.decode('utf-8', errors='replace')
+        if pattern.finder(text)(0) >= 0:
+            yield line_number + 1, text
+
+
+def compress_log_file(path: Path, block_size: int = GZIP_BLOCK_SIZE) -> Path:
+    """
+    Compress a closed log file into independently decodable gzip members.
+
+    The sidecar index for the .gz is written alongside; the original file
+    and its index are removed.
+
+    Returns:
+        Path of the .gz file
+    """
+    target = path.with_name(path.name + GZIP_SUFFIX)
+    tmp = target.with_name(target.name + '.tmp')
+    index = LineIndex(compressed=True)
+
+    with open(path, 'rb') as src, open(tmp, 'wb') as dst:
+        pending = b''
+        while True:
+            data = src.read(block_size)
+            if data:
+                buffer = pending + data
+                end = buffer.rfind(b'\n')
+                if end < 0:
+                    pending = buffer
+                    continue
+                block, pending = buffer[:end + 1], buffer[end + 1:]
+            else:
+                block, pending = pending, b''
+
+            if block:
+                index.add_checkpoint(index.lines, dst.tell())
+                dst.write(gzip.compress(block, compresslevel=6, mtime=0))
+                index.lines += block.count(b'\n')
+                if not block.endswith(b'\n'):
+                    index.lines += 1  # Trailing line without newline
+            if not data:
+                break
+
+    os.replace(tmp, target)
+    stat = target.stat()
+    index.inode = stat.st_ino
+    index.size = stat.st_size
+    _save_index(target, index)
+
+    path.unlink()
+    _sidecar_path(path).unlink(missing_ok=True)
+    _index_cache.pop(str(path), None)
+    return target
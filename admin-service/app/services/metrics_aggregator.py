@@ -7,6 +7,8 @@ Handles aggregation of time-series metric data with support for:
 - Percentiles: p95, p99
 
 Implements granularity bucketing to downsample 5s data to larger intervals.
+Rollup data (mergeable sketches) is aggregated by merging sketches per bucket,
+in memory proportional to the number of output buckets.
 """
 
 import math
@@ -15,6 +17,8 @@ from datetime import datetime, timedelta
 from typing import List, Dict, Tuple, Optional
 from decimal import Decimal
 
+from app.services.metrics_rollup import QuantileSketch, floor_time
+
 logger = logging.getLogger(__name__)
 
 
@@ -387,3 +391,87 @@ class MetricsAggregator:
                 "p95": None,
                 "p99": None
             }
+
+    @staticmethod
+    def sketch_value(sketch: QuantileSketch, aggregation: str) -> Optional[float]:
+        """
+        Read an aggregation from a merged sketch.
+
+        "simple" has no single sample in a rollup and reports the average.
+
+        Raises:
+            ValueError: If aggregation type is unknown
+        """
+        if sketch.count == 0:
+            return None
+
+        if aggregation in ("simple", "avg"):
+            return sketch.avg
+        elif aggregation == "max":
+            return sketch.max
+        elif aggregation == "min":
+            return sketch.min
+        elif aggregation == "sum":
+            return sketch.sum
+        elif aggregation == "p95":
+            return sketch.quantile(0.95)
+        elif aggregation == "p99":
+            return sketch.quantile(0.99)
+        else:
+            raise ValueError(f"Unknown aggregation type: {aggregation}")
+
+    @staticmethod
+    def sketch_summary_stats(sketch: QuantileSketch) -> Dict[str, Optional[float]]:
+        """Summary statistics (same shape as calculate_summary_stats) from a sketch."""
+        return {
+            "count": sketch.count,
+            "min": sketch.min,
+            "max": sketch.max,
+            "avg": sketch.avg,
+            "p95": sketch.quantile(0.95),
+            "p99": sketch.quantile(0.99)
+        }
+
+    @staticmethod
+    def aggregate_sketches(
+        series: List[Tuple[datetime, QuantileSketch]],
+        granularity: int,
+        aggregation: str
+    ) -> Tuple[List[dict], Dict[str, Optional[float]]]:
+        """
+        Aggregate rollup sketches into granularity buckets.
+
+        Args:
+            series: (timestamp, sketch) pairs, e.g. from query_field_sketches()
+            granularity: Bucket size in seconds
+            aggregation: Aggregation type
+
+        Returns:
+            Tuple of (aggregated_data_points, summary_stats), as
+            aggregate_time_series()
+        """
+        buckets: Dict[datetime, QuantileSketch] = {}
+        total = QuantileSketch()
+
+        for timestamp, sketch in series:
+            bucket_time = floor_time(timestamp, granularity)
+            if bucket_time not in buckets:
+                buckets[bucket_time] = QuantileSketch()
+            buckets[bucket_time].merge(sketch)
+            total.merge(sketch)
+
+        aggregated_points = []
+        for bucket_time in sorted(buckets):
+            value = MetricsAggregator.sketch_value(buckets[bucket_time], aggregation)
+            if value is not None:
+                aggregated_points.append({
+                    "timestamp": bucket_time.isoformat() + "Z",
+                    "value": value
+                })
+
+        logger.debug(
+            f"Merged {len(series)} sketches into {len(aggregated_points)} "
+            f"{aggregation} data points at {granularity}s granularity"
+        )
+
+        return aggregated_points, MetricsAggregator.sketch_summary_stats(total)
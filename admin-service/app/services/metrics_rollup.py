@@ -0,0 +1,540 @@
+"""
+Metrics Rollups
+
+Pre-aggregated rollup tiers for admin metrics:
+- 1m: built in memory from raw 5s samples, written when each minute closes
+- 1h: merged from the hour's 1m rollups when the hour closes
+- 1d: merged from the day's 1h rollups when the day closes
+
+Windows missed while the service was down, lost with in-memory state on a
+restart, or skipped because a read failed are backfilled from the tier
+below on the first sample per metric type (and again after a failure).
+
+Each rollup item stores one QuantileSketch per numeric field. Sketches are
+mergeable (count/sum/min/max are exact, percentiles carry a bounded relative
+error), so any range at any coarser resolution can be answered by merging
+rollups instead of re-reading and sorting raw samples.
+
+Queries call plan_query(), which picks the coarsest tier that satisfies the
+requested granularity and whose retention covers the range, and serves the
+not-yet-rolled-up tail of the range from finer tiers and raw samples.
+"""
+
+import calendar
+import logging
+import math
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+from app.config import settings
+from app.utils.metrics_transformer import MetricsTransformer
+
+logger = logging.getLogger(__name__)
+
+
+class QuantileSketch:
+    """
+    Mergeable quantile sketch with relative-error guarantees (DDSketch).
+
+    Values are counted in logarithmic bins, so any quantile estimate is
+    within relative_accuracy of a true sample value. Memory is bounded by
+    max_bins per sign; beyond that the lowest bins are collapsed.
+
+    Example:
+        sketch = QuantileSketch()
+        for value in values:
+            sketch.add(value)
+        sketch.quantile(0.95)
+    """
+
+    def __init__(self, relative_accuracy: float = 0.01, max_bins: int = 512):
+        self.relative_accuracy = relative_accuracy
+        self.max_bins = max_bins
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self.positive: Dict[int, int] = {}
+        self.negative: Dict[int, int] = {}
+        self.zero_count = 0
+        self.count = 0
+        self.sum = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+
+    def _key(self, value: float) -> int:
+        return math.ceil(math.log(value) / self._log_gamma)
+
+    def _value(self, key: int) -> float:
+        return 2 * self._gamma ** key / (self._gamma + 1)
+
+    def add(self, value: float, count: int = 1):
+        """Add a value (count times)."""
+        if value > 0:
+            key = self._key(value)
+            self.positive[key] = self.positive.get(key, 0) + count
+        elif value < 0:
+            key = self._key(-value)
+            self.negative[key] = self.negative.get(key, 0) + count
+        else:
+            self.zero_count += count
+
+        self.count += count
+        self.sum += value * count
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+        self._collapse()
+
+    def merge(self, other: "QuantileSketch"):
+        """Merge another sketch (same relative_accuracy) into this one."""
+        if other.count == 0:
+            return
+        for key, count in other.positive.items():
+            self.positive[key] = self.positive.get(key, 0) + count
+        for key, count in other.negative.items():
+            self.negative[key] = self.negative.get(key, 0) + count
+        self.zero_count += other.zero_count
+        self.count += other.count
+        self.sum += other.sum
+        self.min = other.min if self.min is None else min(self.min, other.min)
+        self.max = other.max if self.max is None else max(self.max, other.max)
+        self._collapse()
+
+    def _collapse(self):
+        """Fold the lowest-magnitude bins together to respect max_bins."""
+        for bins in (self.positive, self.negative):
+            if len(bins) <= self.max_bins:
+                continue
+            keys = sorted(bins)
+            overflow = keys[:len(keys) - self.max_bins + 1]
+            target = overflow[-1]
+            bins[target] = sum(bins.pop(key) for key in overflow[:-1]) + bins[target]
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Estimate a quantile using the nearest-rank convention.
+
+        Args:
+            q: Quantile in [0, 1] (e.g., 0.95)
+
+        Returns:
+            Estimated value, or None if the sketch is empty
+        """
+        if self.count == 0:
+            return None
+
+        rank = max(0, min(self.count - 1, int(math.ceil(q * self.count)) - 1))
+        seen = 0
+
+        # Negative values: largest magnitude (lowest value) first
+        for key in sorted(self.negative, reverse=True):
+            seen += self.negative[key]
+            if seen > rank:
+                return self._clamp(-self._value(key))
+
+        seen += self.zero_count
+        if seen > rank:
+            return 0.0
+
+        for key in sorted(self.positive):
+            seen += self.positive[key]
+            if seen > rank:
+                return self._clamp(self._value(key))
+
+        return self.max
+
+    def _clamp(self, value: float) -> float:
+        return max(self.min, min(self.max, value))
+
+    @property
+    def avg(self) -> Optional[float]:
+        return self.sum / self.count if self.count else None
+
+    def to_dict(self) -> dict:
+        """Serialize for storage (bin keys as strings for DynamoDB maps)."""
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "min": self.min,
+            "max": self.max,
+            "zero": self.zero_count,
+            "pos": {str(key): count for key, count in self.positive.items()},
+            "neg": {str(key): count for key, count in self.negative.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict, relative_accuracy: float = 0.01) -> "QuantileSketch":
+        """Deserialize a stored sketch (accepts DynamoDB Decimals)."""
+        sketch = cls(relative_accuracy=relative_accuracy)
+        sketch.count = int(data.get("count", 0))
+        sketch.sum = float(data.get("sum", 0))
+        sketch.min = float(data["min"]) if data.get("min") is not None else None
+        sketch.max = float(data["max"]) if data.get("max") is not None else None
+        sketch.zero_count = int(data.get("zero", 0))
+        sketch.positive = {int(key): int(count) for key, count in data.get("pos", {}).items()}
+        sketch.negative = {int(key): int(count) for key, count in data.get("neg", {}).items()}
+        return sketch
+
+
+@dataclass(frozen=True)
+class RollupTier:
+    """A pre-aggregated resolution level."""
+    name: str
+    seconds: int
+    partition_format: str  # strftime format of the partition key bucket
+    retention_days: int
+
+
+ROLLUP_TIERS: List[RollupTier] = [
+    RollupTier("1m", 60, "%Y-%m-%d", settings.METRICS_ROLLUP_1M_RETENTION_DAYS),
+    RollupTier("1h", 3600, "%Y-%m", settings.METRICS_ROLLUP_1H_RETENTION_DAYS),
+    RollupTier("1d", 86400, "%Y", settings.METRICS_ROLLUP_1D_RETENTION_DAYS),
+]
+
+
+def floor_time(timestamp: datetime, seconds: int) -> datetime:
+    """Round a naive UTC timestamp down to a multiple of seconds since epoch."""
+    epoch = calendar.timegm(timestamp.utctimetuple())
+    return datetime.utcfromtimestamp(epoch - epoch % seconds)
+
+
+def to_naive_utc(timestamp: datetime) -> datetime:
+    """Normalize a timestamp to naive UTC (as written by MetricsWriter)."""
+    if timestamp.tzinfo is not None:
+        return timestamp.astimezone(timezone.utc).replace(tzinfo=None)
+    return timestamp
+
+
+def select_tier(
+    start_time: datetime,
+    end_time: datetime,
+    granularity: int,
+    now: Optional[datetime] = None
+) -> Optional[RollupTier]:
+    """
+    Pick the coarsest tier that serves a query.
+
+    A tier qualifies if its resolution divides the requested granularity
+    and its retention still covers start_time.
+
+    Args:
+        start_time: Start of time range (naive UTC or tz-aware)
+        end_time: End of time range
+        granularity: Requested bucket size in seconds
+        now: Current time (defaults to utcnow)
+
+    Returns:
+        RollupTier, or None to read raw samples (no tier qualifies)
+    """
+    now = now or datetime.utcnow()
+    start = to_naive_utc(start_time)
+
+    for tier in reversed(ROLLUP_TIERS):
+        if granularity < tier.seconds or granularity % tier.seconds != 0:
+            continue
+        if start >= now - timedelta(days=tier.retention_days):
+            return tier
+
+    return None
+
+
+def plan_query(
+    start_time: datetime,
+    end_time: datetime,
+    granularity: int,
+    now: Optional[datetime] = None
+) -> List[Tuple[Optional[RollupTier], datetime, datetime]]:
+    """
+    Split a query range into segments served by tiers.
+
+    The selected tier only holds windows that have closed, so the tail of
+    a range reaching into the present is served by progressively finer
+    tiers, and finally by raw samples for the open minute.
+
+    Args:
+        start_time: Start of time range
+        end_time: End of time range
+        granularity: Requested bucket size in seconds
+        now: Current time (defaults to utcnow)
+
+    Returns:
+        List of (tier or None for raw, segment_start, segment_end), in order
+
+    Example:
+        plan_query(now - 30d, now, 3600)
+        # [(1h, now-30d, 10:00), (1m, 10:00, 10:41), (None, 10:41, now)]
+    """
+    now = now or datetime.utcnow()
+    start, end = to_naive_utc(start_time), to_naive_utc(end_time)
+    tier = select_tier(start, end, granularity, now)
+    if tier is None:
+        return [(None, start, end)]
+
+    segments = []
+    cursor = start
+    for candidate in reversed(ROLLUP_TIERS):
+        if candidate.seconds > tier.seconds or cursor >= end:
+            continue
+        segment_end = min(end, floor_time(now, candidate.seconds))
+        if segment_end > cursor:
+            segments.append((candidate, cursor, segment_end))
+            cursor = segment_end
+
+    if cursor < end:
+        segments.append((None, cursor, end))
+    return segments
+
+
+async def query_field_sketches(
+    storage,
+    metric_type: str,
+    field: str,
+    segments: List[Tuple[Optional[RollupTier], datetime, datetime]]
+) -> List[Tuple[datetime, QuantileSketch]]:
+    """
+    Load (bucket_time, sketch) pairs for one field across planned segments.
+
+    Rollup items contribute their stored sketch; raw samples contribute a
+    single-value sketch each.
+
+    Args:
+        storage: MetricsStorage
+        metric_type: Type of metric
+        field: Field path (dot notation)
+        segments: Output of plan_query()
+
+    Returns:
+        Time-ordered (timestamp, QuantileSketch) pairs
+    """
+    from app.services.metrics_aggregator import MetricsAggregator
+
+    series: List[Tuple[datetime, QuantileSketch]] = []
+    for tier, segment_start, segment_end in segments:
+        if tier is None:
+            points = await storage.query_metrics(metric_type, segment_start, segment_end)
+            for point in points:
+                value = MetricsAggregator.extract_field_value(point, field)
+                if value is not None:
+                    sketch = QuantileSketch()
+                    sketch.add(value)
+                    series.append((parse_sort_key(point["SK"]), sketch))
+            continue
+
+        items = await storage.query_rollups(
+            metric_type,
+            tier,
+            floor_time(segment_start, tier.seconds),
+            segment_end - timedelta(milliseconds=1)
+        )
+        for item in items:
+            data = item.get("data", {}).get(field)
+            if data is not None:
+                series.append((parse_sort_key(item["SK"]), QuantileSketch.from_dict(data)))
+
+    return series
+
+
+def parse_sort_key(sort_key: str) -> datetime:
+    """Parse a metrics sort key ("2025-01-25T10:30:45.123Z") to naive UTC."""
+    return datetime.fromisoformat(sort_key.replace("Z", ""))
+
+
+def iter_numeric_fields(data: Any, prefix: str = "") -> Iterator[Tuple[str, float]]:
+    """
+    Yield (dot.path, value) for every numeric leaf of a metric payload.
+
+    Booleans count as 1.0/0.0, matching MetricsAggregator.extract_field_value.
+    """
+    if isinstance(data, dict):
+        for key, value in data.items():
+            yield from iter_numeric_fields(value, f"{prefix}{key}.")
+    elif isinstance(data, bool):
+        yield prefix[:-1], float(data)
+    elif isinstance(data, (int, float, Decimal)):
+        yield prefix[:-1], float(data)
+
+
+def merge_field_sketches(items: List[dict]) -> Dict[str, QuantileSketch]:
+    """Merge the per-field sketches of several rollup items."""
+    merged: Dict[str, QuantileSketch] = {}
+    for item in items:
+        for field, data in item.get("data", {}).items():
+            sketch = QuantileSketch.from_dict(data)
+            if field in merged:
+                merged[field].merge(sketch)
+            else:
+                merged[field] = sketch
+    return merged
+
+
+class MetricsRollupManager:
+    """
+    Maintains rollup tiers as raw samples are written.
+
+    Fed by MetricsWriter.observe() on every write. Keeps only the open
+    minute per metric type in memory; coarser tiers are merged from the
+    stored rollups of the tier below when their window closes. Until a
+    metric type has been backfilled, closed windows are left to the
+    backfill instead, so a tier is never merged from an incomplete tier
+    below it.
+    """
+
+    def __init__(self, storage, tiers: Optional[List[RollupTier]] = None):
+        """
+        Args:
+            storage: MetricsStorage (write_rollup / query_rollups)
+            tiers: Tiers finest-first (defaults to ROLLUP_TIERS)
+        """
+        self.storage = storage
+        self.tiers = tiers or ROLLUP_TIERS
+        self._open: Dict[str, Tuple[datetime, Dict[str, QuantileSketch]]] = {}
+        self._backfilled: Set[str] = set()
+        self.rollups_written = 0
+
+    async def observe(self, metric_type: str, timestamp: datetime, data: dict):
+        """
+        Add a raw sample to the open minute, closing finished windows.
+
+        Args:
+            metric_type: Type of metric (vram, health, psi, queue)
+            timestamp: Sample time (naive UTC)
+            data: The metric payload
+        """
+        bucket = floor_time(timestamp, self.tiers[0].seconds)
+        current = self._open.get(metric_type)
+
+        if current is not None and current[0] != bucket:
+            await self._close(metric_type, current[0], current[1], next_bucket=bucket)
+            current = None
+
+        if current is None:
+            if metric_type not in self._backfilled:
+                await self._backfill(metric_type, bucket)
+            current = (bucket, {})
+            self._open[metric_type] = current
+
+        sketches = current[1]
+        for field, value in iter_numeric_fields(data):
+            sketches.setdefault(field, QuantileSketch()).add(value)
+
+    async def flush(self):
+        """Write all open minutes (on shutdown)."""
+        for metric_type, (bucket, sketches) in list(self._open.items()):
+            await self._write(metric_type, self.tiers[0], bucket, sketches)
+        self._open.clear()
+
+    async def _close(
+        self,
+        metric_type: str,
+        bucket: datetime,
+        sketches: Dict[str, QuantileSketch],
+        next_bucket: datetime
+    ):
+        """Write a finished minute and cascade into coarser tiers it closes."""
+        await self._write(metric_type, self.tiers[0], bucket, sketches)
+        if metric_type not in self._backfilled:
+            return
+
+        for source, tier in zip(self.tiers, self.tiers[1:]):
+            window = floor_time(bucket, tier.seconds)
+            if window == floor_time(next_bucket, tier.seconds):
+                break
+            end = window + timedelta(seconds=tier.seconds)
+            if not await self._rollup(metric_type, source, tier, window, end):
+                # Retried by the backfill, which also redoes coarser tiers
+                self._backfilled.discard(metric_type)
+                break
+
+    async def _backfill(self, metric_type: str, open_bucket: datetime):
+        """
+        Roll up closed windows that have source rollups but no tier item.
+
+        Scans each coarse tier finest-first over the retention of the tier
+        below, and rolls up runs of missing windows with one query each.
+        On any failure the metric type stays un-backfilled and is retried
+        when the next minute opens.
+
+        Args:
+            metric_type: Type of metric
+            open_bucket: Start of the open minute (windows before it are closed)
+        """
+        for source, tier in zip(self.tiers, self.tiers[1:]):
+            end = floor_time(open_bucket, tier.seconds)
+            start = floor_time(end - timedelta(days=source.retention_days), tier.seconds)
+            try:
+                existing = await self.storage.fetch_rollups(
+                    metric_type, tier, start, end - timedelta(milliseconds=1)
+                )
+            except Exception as e:
+                logger.warning(f"Failed to read {tier.name} {metric_type} rollups for backfill: {e}")
+                return
+
+            present = {parse_sort_key(item["SK"]) for item in existing}
+            step = timedelta(seconds=tier.seconds)
+            window, gap_start = start, None
+            while window <= end:
+                if window < end and window not in present:
+                    gap_start = gap_start or window
+                elif gap_start is not None:
+                    if not await self._rollup(metric_type, source, tier, gap_start, window):
+                        return
+                    gap_start = None
+                window += step
+
+        self._backfilled.add(metric_type)
+
+    async def _rollup(
+        self,
+        metric_type: str,
+        source: RollupTier,
+        tier: RollupTier,
+        start: datetime,
+        end: datetime
+    ) -> bool:
+        """
+        Merge source rollups in [start, end) into one tier item per window.
+
+        Windows without source rollups are skipped.
+
+        Returns:
+            False if reading or writing failed (the caller retries)
+        """
+        try:
+            items = await self.storage.fetch_rollups(
+                metric_type, source, start, end - timedelta(milliseconds=1)
+            )
+        except Exception as e:
+            logger.warning(
+                f"Failed to read {source.name} {metric_type} rollups for "
+                f"{tier.name} window {start.isoformat()}: {e}"
+            )
+            return False
+
+        windows: Dict[datetime, List[dict]] = {}
+        for item in items:
+            window = floor_time(parse_sort_key(item["SK"]), tier.seconds)
+            windows.setdefault(window, []).append(item)
+
+        written = True
+        for window, window_items in sorted(windows.items()):
+            if not await self._write(metric_type, tier, window, merge_field_sketches(window_items)):
+                written = False
+        return written
+
+    async def _write(
+        self,
+        metric_type: str,
+        tier: RollupTier,
+        bucket: datetime,
+        sketches: Dict[str, QuantileSketch]
+    ) -> bool:
+        if not sketches:
+            return True
+        ttl = int((bucket + timedelta(days=tier.retention_days)).timestamp())
+        data = MetricsTransformer.convert_floats_to_decimal(
+            {field: sketch.to_dict() for field, sketch in sketches.items()}
+        )
+        if not await self.storage.write_rollup(metric_type, tier, bucket, data, ttl):
+            return False
+        self.rollups_written += 1
+        return True
@@ -3,15 +3,19 @@ MetricsStorage Service
 
 Handles DynamoDB operations for metrics storage with hourly bucketing strategy.
 Supports 2-day TTL retention and efficient querying across time ranges.
+Also stores pre-aggregated rollups (see metrics_rollup) in the same table.
 """
 
 import asyncio
 import logging
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, TYPE_CHECKING
 import aioboto3
 from app.config import settings
 
+if TYPE_CHECKING:
+    from app.services.metrics_rollup import RollupTier
+
 logger = logging.getLogger(__name__)
 
 
@@ -213,7 +217,8 @@ class MetricsStorage:
         end_time: datetime
     ) -> List[dict]:
         """
-        Query a single hourly bucket with time range filter.
+        Query a single partition (hourly raw bucket or rollup partition)
+        with time range filter, following pagination.
 
         Args:
             partition_key: The partition key to query
@@ -221,28 +226,10 @@ class MetricsStorage:
             end_time: End of time range
 
         Returns:
-            List of metric items from DynamoDB
+            List of metric items from DynamoDB (empty on error)
         """
         try:
-            async with await self._get_dynamodb_client() as dynamodb:
-                table = await dynamodb.Table(self.table_name)
-
-                response = await table.query(
-                    KeyConditionExpression=(
-                        "#pk = :pk AND #sk BETWEEN :start AND :end"
-                    ),
-                    ExpressionAttributeNames={
-                        "#pk": "PK",
-                        "#sk": "SK"
-                    },
-                    ExpressionAttributeValues={
-                        ":pk": partition_key,
-                        ":start": self._get_sort_key(start_time),
-                        ":end": self._get_sort_key(end_time)
-                    }
-                )
-
-                return response.get("Items", [])
+            return await self._query_partition(partition_key, start_time, end_time)
 
         except Exception as e:
             logger.error(
@@ -251,6 +238,46 @@ class MetricsStorage:
             )
             return []
 
+    async def _query_partition(
+        self,
+        partition_key: str,
+        start_time: datetime,
+        end_time: datetime
+    ) -> List[dict]:
+        """
+        Query a single partition like _query_single_bucket, raising on errors.
+
+        Raises:
+            Exception: DynamoDB errors, so callers can tell them from "no data"
+        """
+        async with await self._get_dynamodb_client() as dynamodb:
+            table = await dynamodb.Table(self.table_name)
+
+            query_kwargs = {
+                "KeyConditionExpression": (
+                    "#pk = :pk AND #sk BETWEEN :start AND :end"
+                ),
+                "ExpressionAttributeNames": {
+                    "#pk": "PK",
+                    "#sk": "SK"
+                },
+                "ExpressionAttributeValues": {
+                    ":pk": partition_key,
+                    ":start": self._get_sort_key(start_time),
+                    ":end": self._get_sort_key(end_time)
+                }
+            }
+
+            # Follow pagination (query pages are capped at 1MB)
+            items = []
+            while True:
+                response = await table.query(**query_kwargs)
+                items.extend(response.get("Items", []))
+                last_key = response.get("LastEvaluatedKey")
+                if not last_key:
+                    return items
+                query_kwargs["ExclusiveStartKey"] = last_key
+
     async def query_metrics(
         self,
         metric_type: str,
@@ -308,6 +335,173 @@ class MetricsStorage:
             )
             return []
 
+    def _get_rollup_partition_key(
+        self,
+        metric_type: str,
+        tier: "RollupTier",
+        timestamp: datetime
+    ) -> str:
+        """
+        Generate rollup partition key.
+
+        Args:
+            metric_type: Type of metric
+            tier: Rollup tier
+            timestamp: Bucket start time
+
+        Returns:
+            Partition key in format: {metric_type}#{tier}#{partition bucket}
+
+        Example:
+            vram#1m#2025-01-25 (1m rollups are partitioned by day)
+        """
+        return f"{metric_type}#{tier.name}#{timestamp.strftime(tier.partition_format)}"
+
+    async def write_rollup(
+        self,
+        metric_type: str,
+        tier: "RollupTier",
+        bucket_start: datetime,
+        data: dict,
+        ttl: int
+    ) -> bool:
+        """
+        Write (or overwrite) one rollup item.
+
+        Args:
+            metric_type: Type of metric
+            tier: Rollup tier
+            bucket_start: Start of the rollup window
+            data: Serialized sketches by field
+            ttl: TTL as Unix timestamp
+
+        Returns:
+            True if write was successful, False otherwise
+        """
+        try:
+            async with await self._get_dynamodb_client() as dynamodb:
+                table = await dynamodb.Table(self.table_name)
+
+                await table.put_item(Item={
+                    "PK": self._get_rollup_partition_key(metric_type, tier, bucket_start),
+                    "SK": self._get_sort_key(bucket_start),
+                    "ttl": ttl,
+                    "entity_type": "rollup",
+                    "metric_type": metric_type,
+                    "tier": tier.name,
+                    "data": data
+                })
+                logger.debug(f"Wrote {tier.name} rollup {metric_type} at {bucket_start}")
+                return True
+
+        except Exception as e:
+            logger.error(
+                f"Failed to write {tier.name} rollup {metric_type}: {e}",
+                exc_info=True
+            )
+            return False
+
+    def _get_rollup_partitions(
+        self,
+        metric_type: str,
+        tier: "RollupTier",
+        start_time: datetime,
+        end_time: datetime
+    ) -> List[str]:
+        """
+        Generate the rollup partition keys overlapping a time range.
+
+        Args:
+            metric_type: Type of metric
+            tier: Rollup tier
+            start_time: Start of time range
+            end_time: End of time range
+
+        Returns:
+            List of partition keys, in order
+        """
+        partitions = []
+        current = start_time.replace(hour=0, minute=0, second=0, microsecond=0)
+
+        while current <= end_time:
+            key = self._get_rollup_partition_key(metric_type, tier, current)
+            if key not in partitions:
+                partitions.append(key)
+            current += timedelta(days=1)
+
+        return partitions
+
+    async def query_rollups(
+        self,
+        metric_type: str,
+        tier: "RollupTier",
+        start_time: datetime,
+        end_time: datetime
+    ) -> List[dict]:
+        """
+        Query rollup items of one tier whose window starts within a range.
+
+        Args:
+            metric_type: Type of metric to query
+            tier: Rollup tier
+            start_time: Start of time range (inclusive)
+            end_time: End of time range (inclusive)
+
+        Returns:
+            List of rollup items, sorted by window start
+
+        Example:
+            items = await storage.query_rollups(
+                "vram",
+                ROLLUP_TIERS[1],  # 1h
+                datetime.utcnow() - timedelta(days=30),
+                datetime.utcnow()
+            )
+            # ~720 items instead of ~518,000 raw samples
+        """
+        try:
+            return await self.fetch_rollups(metric_type, tier, start_time, end_time)
+
+        except Exception as e:
+            logger.error(
+                f"Failed to query {tier.name} rollups {metric_type}: {e}",
+                exc_info=True
+            )
+            return []
+
+    async def fetch_rollups(
+        self,
+        metric_type: str,
+        tier: "RollupTier",
+        start_time: datetime,
+        end_time: datetime
+    ) -> List[dict]:
+        """
+        Query rollup items like query_rollups, raising on errors.
+
+        Used to maintain the rollup tiers, where a failed read must not be
+        mistaken for a window without data.
+
+        Raises:
+            Exception: DynamoDB errors
+        """
+        partitions = self._get_rollup_partitions(metric_type, tier, start_time, end_time)
+
+        results = await asyncio.gather(*[
+            self._query_partition(partition, start_time, end_time)
+            for partition in partitions
+        ])
+
+        items = [item for partition_items in results for item in partition_items]
+        items.sort(key=lambda x: x["SK"])
+
+        logger.debug(
+            f"Queried {len(items)} {tier.name} {metric_type} rollups "
+            f"from {len(partitions)} partitions"
+        )
+
+        return items
+
     async def create_table(self) -> bool:
         """
         Create the admin_metrics table if it doesn't exist.
@@ -7,6 +7,8 @@ Implements 2-day TTL retention for automatic data expiration.
 Pulls metrics from two sources:
 - SystemMetricsService: VRAM, PSI, queue metrics
 - HealthCheckerService: Service health status
+
+Every sample also feeds the 1m/1h/1d rollup tiers (MetricsRollupManager).
 """
 
 import asyncio
@@ -18,6 +20,7 @@ from decimal import Decimal
 from app.services.system_metrics_service import SystemMetricsService
 from app.services.health_checker_service import HealthCheckerService
 from app.services.metrics_storage import MetricsStorage
+from app.services.metrics_rollup import MetricsRollupManager
 from app.utils.metrics_transformer import MetricsTransformer
 from app.config import settings
 
@@ -43,6 +46,7 @@ class MetricsWriter:
         self.system_metrics_service: Optional[SystemMetricsService] = None
         self.health_checker_service: Optional[HealthCheckerService] = None
         self.storage: Optional[MetricsStorage] = None
+        self.rollups: Optional[MetricsRollupManager] = None
         self.interval = settings.METRICS_WRITE_INTERVAL_SECONDS
         self.running = False
         self._task: Optional[asyncio.Task] = None
@@ -70,6 +74,8 @@ class MetricsWriter:
         self.health_checker_service = health_checker_service
         self.running = True
         self.storage = MetricsStorage()
+        if settings.METRICS_ROLLUPS_ENABLED:
+            self.rollups = MetricsRollupManager(self.storage)
 
         # Ensure table exists before starting
         table_created = await self.storage.create_table()
@@ -102,6 +108,13 @@ class MetricsWriter:
                 logger.warning("MetricsWriter stop timed out, cancelling task")
                 self._task.cancel()
 
+        # Persist the partially filled minute
+        if self.rollups:
+            try:
+                await self.rollups.flush()
+            except Exception as e:
+                logger.error(f"Failed to flush metric rollups: {e}", exc_info=True)
+
         logger.info("Background metrics writer stopped")
 
     async def _write_loop(self):
@@ -141,6 +154,13 @@ class MetricsWriter:
                     return_exceptions=True
                 )
 
+                await self._observe_rollups(timestamp, {
+                    "vram": vram_data,
+                    "psi": psi_data,
+                    "queue": queue_data,
+                    "health": health_data,
+                })
+
                 # Count successful writes
                 successful = sum(1 for r in results if r is True)
                 write_count += successful
@@ -212,6 +232,25 @@ class MetricsWriter:
             )
             return False
 
+    async def _observe_rollups(self, timestamp: datetime, payloads: Dict[str, dict]):
+        """
+        Feed a snapshot into the rollup tiers.
+
+        Rollup errors are logged and never interrupt raw metric writes.
+
+        Args:
+            timestamp: When the metrics were collected
+            payloads: Metric payload by metric type
+        """
+        if not self.rollups:
+            return
+
+        for metric_type, data in payloads.items():
+            try:
+                await self.rollups.observe(metric_type, timestamp, data)
+            except Exception as e:
+                logger.error(f"Failed to update {metric_type} rollups: {e}", exc_info=True)
+
     async def write_now(self) -> dict:
         """
         Manually trigger an immediate metrics write.
@@ -254,6 +293,13 @@ class MetricsWriter:
                 return_exceptions=True
             )
 
+            await self._observe_rollups(timestamp, {
+                "vram": vram_data,
+                "psi": psi_data,
+                "queue": queue_data,
+                "health": health_data,
+            })
+
             metric_types = ["vram", "psi", "queue", "health"]
             success = [mt for mt, r in zip(metric_types, results) if r is True]
             failed = [mt for mt, r in zip(metric_types, results) if r is not True]
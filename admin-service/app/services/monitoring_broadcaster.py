@@ -0,0 +1,293 @@
+"""
+Monitoring Broadcaster
+
+Builds the admin monitoring snapshot once per interval and fans it out to
+every SSE subscriber, so snapshot cost (shelling out for memory/GPU stats,
+health lookups) stays flat no matter how many dashboards are open.
+
+- One producer task, running only while there are subscribers
+- Bounded per-subscriber queues: the producer never awaits a client
+- Slow clients are resynced: stale frames are discarded and the current
+  snapshot is queued as a full frame. Clients that stay behind are dropped.
+- Delta mode (opt-in): after the first full frame, frames carry only the
+  changed fields as a JSON merge patch (RFC 7386)
+
+Frame formats:
+    legacy:  {...full snapshot...}
+    delta:   {"type": "full", "data": {...}}
+             {"type": "delta", "data": {...changed fields, null = removed...}}
+             {"type": "error", "error": "...", "timestamp": "..."}
+"""
+
+import asyncio
+import logging
+from datetime import datetime
+from typing import Any, Dict, Optional, Set
+
+from app.config import settings
+from app.utils.json_encoder import json_dumps
+
+logger = logging.getLogger(__name__)
+
+
+def diff_snapshot(previous: Dict[str, Any], current: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Compute a JSON merge patch turning previous into current.
+
+    Nested dicts are diffed recursively; lists and scalars are replaced
+    whole. Removed keys map to None.
+
+    Args:
+        previous: Last published snapshot
+        current: New snapshot
+
+    Returns:
+        Merge patch (empty if nothing changed)
+
+    Example:
+        diff_snapshot({"vram": {"used_gb": 18.5, "total_gb": 24}},
+                      {"vram": {"used_gb": 18.7, "total_gb": 24}})
+        # {"vram": {"used_gb": 18.7}}
+    """
+    patch = {}
+
+    for key, value in current.items():
+        old = previous.get(key)
+        if isinstance(value, dict) and isinstance(old, dict):
+            nested = diff_snapshot(old, value)
+            if nested:
+                patch[key] = nested
+        elif key not in previous or old != value:
+            patch[key] = value
+
+    for key in previous:
+        if key not in current:
+            patch[key] = None
+
+    return patch
+
+
+class MonitoringSubscription:
+    """A subscriber's bounded frame queue."""
+
+    def __init__(self, queue_size: int, delta: bool):
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self.delta = delta
+        self.needs_full = True
+        self.overflows = 0
+        self.dropped = False
+
+    async def next_event(self) -> Optional[dict]:
+        """
+        Wait for the next SSE event.
+
+        Returns:
+            Event dict for EventSourceResponse, or None once dropped
+        """
+        event = await self.queue.get()
+        if self.queue.empty():
+            self.overflows = 0  # Caught up
+        return event
+
+
+class MonitoringBroadcaster:
+    """
+    Shared producer for the monitoring SSE stream.
+
+    Example:
+        broadcaster = MonitoringBroadcaster(system_metrics, health_checker)
+        subscription = broadcaster.subscribe(delta=True)
+        try:
+            while (event := await subscription.next_event()) is not None:
+                yield event
+        finally:
+            broadcaster.unsubscribe(subscription)
+    """
+
+    def __init__(
+        self,
+        system_metrics,
+        health_checker,
+        interval: float = settings.MONITORING_STREAM_INTERVAL_SECONDS,
+        queue_size: int = settings.MONITORING_SUBSCRIBER_QUEUE_SIZE,
+        max_overflows: int = settings.MONITORING_SUBSCRIBER_MAX_OVERFLOWS
+    ):
+        """
+        Args:
+            system_metrics: SystemMetricsService (VRAM, PSI, queue, GPU)
+            health_checker: HealthCheckerService (service health)
+            interval: Seconds between snapshots
+            queue_size: Frames buffered per subscriber
+            max_overflows: Resyncs allowed before a lagging client is dropped
+        """
+        self.system_metrics = system_metrics
+        self.health_checker = health_checker
+        self.interval = interval
+        self.queue_size = max(1, queue_size)
+        self.max_overflows = max_overflows
+        self._subscribers: Set[MonitoringSubscription] = set()
+        self._task: Optional[asyncio.Task] = None
+        self._latest: Optional[Dict[str, Any]] = None
+        self._stats = {
+            "snapshots": 0,
+            "frames_sent": 0,
+            "resyncs": 0,
+            "dropped_subscribers": 0
+        }
+
+    def subscribe(self, delta: bool = False) -> MonitoringSubscription:
+        """
+        Register a subscriber and start the producer if needed.
+
+        The latest snapshot (if any) is queued immediately, so new clients
+        don't wait for the next interval.
+        """
+        subscription = MonitoringSubscription(self.queue_size, delta)
+        self._subscribers.add(subscription)
+
+        if self._latest is not None:
+            self._offer(subscription, self._latest, patch=None)
+
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._produce())
+
+        logger.info(f"Monitoring subscriber added ({len(self._subscribers)} active, delta={delta})")
+        return subscription
+
+    def unsubscribe(self, subscription: MonitoringSubscription):
+        """Remove a subscriber (the producer idles when none are left)."""
+        self._subscribers.discard(subscription)
+        logger.info(f"Monitoring subscriber removed ({len(self._subscribers)} active)")
+
+    async def stop(self):
+        """Stop the producer and release all subscribers."""
+        if self._task and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        for subscription in list(self._subscribers):
+            self._drop(subscription)
+        self._task = None
+
+    async def _produce(self):
+        """Build one snapshot per interval while anyone is subscribed."""
+        while self._subscribers:
+            try:
+                snapshot = await self._build_snapshot()
+                patch = diff_snapshot(self._latest, snapshot) if self._latest is not None else None
+                self._latest = snapshot
+                self._stats["snapshots"] += 1
+                self._publish(snapshot, patch)
+
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Error in monitoring stream: {e}", exc_info=True)
+                self._publish_error(str(e))
+
+            await asyncio.sleep(self.interval)
+
+        logger.info("Monitoring producer idle (no subscribers)")
+
+    async def _build_snapshot(self) -> Dict[str, Any]:
+        """Pull from both services and combine into one snapshot."""
+        system_snapshot = await self.system_metrics.get_system_snapshot()
+        health_snapshot = self.health_checker.get_health_snapshot()
+
+        return {
+            "timestamp": system_snapshot.get("timestamp"),
+            "vram": system_snapshot.get("vram", {}),
+            "queue_size": system_snapshot.get("queue_size", 0),
+            "psi": system_snapshot.get("psi", {}),
+            "gpu": system_snapshot.get("gpu", {}),
+            "cpu_utilization": system_snapshot.get("cpu_utilization", 0),
+            "maintenance_mode": system_snapshot.get("maintenance_mode", False),
+            "services": health_snapshot  # Service health from HealthCheckerService
+        }
+
+    def _publish(self, snapshot: Dict[str, Any], patch: Optional[Dict[str, Any]]):
+        """Fan a snapshot out to all subscribers without awaiting any."""
+        # Serialize each frame kind at most once per snapshot
+        frames: Dict[str, str] = {}
+        for subscription in list(self._subscribers):
+            self._offer(subscription, snapshot, patch, frames)
+
+    def _offer(
+        self,
+        subscription: MonitoringSubscription,
+        snapshot: Dict[str, Any],
+        patch: Optional[Dict[str, Any]],
+        frames: Optional[Dict[str, str]] = None
+    ):
+        """Queue the right frame for one subscriber, resyncing if it lags."""
+        frames = frames if frames is not None else {}
+        kind = self._frame_kind(subscription, patch)
+
+        if subscription.queue.full():
+            subscription.overflows += 1
+            self._stats["resyncs"] += 1
+            if subscription.overflows > self.max_overflows:
+                logger.warning("Dropping monitoring subscriber that stopped reading")
+                self._drop(subscription)
+                return
+            # Discard stale frames; a full frame brings the client current
+            self._clear(subscription)
+            subscription.needs_full = True
+            kind = self._frame_kind(subscription, patch)
+
+        if kind not in frames:
+            frames[kind] = self._serialize(kind, snapshot, patch)
+
+        subscription.queue.put_nowait({"data": frames[kind]})
+        subscription.needs_full = False
+        self._stats["frames_sent"] += 1
+
+    @staticmethod
+    def _frame_kind(subscription: MonitoringSubscription, patch: Optional[Dict[str, Any]]) -> str:
+        if not subscription.delta:
+            return "legacy"
+        if subscription.needs_full or patch is None:
+            return "full"
+        return "delta"
+
+    @staticmethod
+    def _serialize(kind: str, snapshot: Dict[str, Any], patch: Optional[Dict[str, Any]]) -> str:
+        if kind == "legacy":
+            return json_dumps(snapshot)
+        if kind == "full":
+            return json_dumps({"type": "full", "data": snapshot})
+        return json_dumps({"type": "delta", "data": patch})
+
+    def _publish_error(self, error: str):
+        """Send an error frame; delta clients resync on the next snapshot."""
+        timestamp = datetime.utcnow().isoformat()
+        for subscription in list(self._subscribers):
+            if subscription.queue.full():
+                continue
+            payload = {"error": error, "timestamp": timestamp}
+            if subscription.delta:
+                payload = {"type": "error", **payload}
+            subscription.queue.put_nowait({"data": json_dumps(payload)})
+
+    @staticmethod
+    def _clear(subscription: MonitoringSubscription):
+        while not subscription.queue.empty():
+            subscription.queue.get_nowait()
+
+    def _drop(self, subscription: MonitoringSubscription):
+        """Disconnect a subscriber: its stream ends at the None sentinel."""
+        self._subscribers.discard(subscription)
+        subscription.dropped = True
+        self._clear(subscription)
+        subscription.queue.put_nowait(None)
+        self._stats["dropped_subscribers"] += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get broadcaster statistics."""
+        return {
+            **self._stats,
+            "subscribers": len(self._subscribers),
+            "producer_running": self._task is not None and not self._task.done()
+        }
@@ -347,34 +347,40 @@ class UserService:
     async def list_all_users(
         self,
         limit: int = 100,
-        offset: int = 0
+        offset: int = 0,
+        cursor: Optional[str] = None
     ) -> Dict:
         """
-        List all users with pagination.
+        List users with pagination.
+
+        Pass the previous response's next_cursor to page forward; each page
+        then reads only its own items. Offset paging is kept for backwards
+        compatibility and reads offset + limit items.
 
         Args:
             limit: Maximum number of users to return
-            offset: Number of users to skip (for pagination)
+            offset: Number of users to skip (ignored when cursor is given)
+            cursor: next_cursor from the previous page
 
         Returns:
             dict: List of users with pagination info
         """
         try:
-            # Use repository to list users
-            # Note: Repository list_users uses last_key for pagination,
-            # but this method uses offset-based pagination for backwards compatibility
-            result = await self.user_repository.list_users(limit=limit * 2)  # Get more to handle offset
-            all_users = result.get('users', [])
-
-            # Sort by created_at (descending)
-            all_users.sort(
+            if cursor:
+                offset = 0
+                result = await self.user_repository.list_users(limit=limit, last_key=cursor)
+            else:
+                result = await self.user_repository.list_users(limit=offset + limit)
+
+            page = result.get('users', [])[offset:offset + limit]
+            next_cursor = result.get('last_key')
+
+            # Newest first within the page (scan order is not chronological)
+            page.sort(
                 key=lambda u: u.get('created_at', ''),
                 reverse=True
             )
 
-            # Apply offset-based pagination
-            paginated_users = all_users[offset:offset + limit]
-
             # Format user data for response
             users = [
                 {
@@ -386,15 +392,23 @@ class UserService:
                     "last_active": u.get('last_active'),
                     "created_at": u.get('created_at')
                 }
-                for u in paginated_users
+                for u in page
             ]
 
+            seen = offset + len(page)
+            if next_cursor is None:
+                total = seen
+            else:
+                # Approximate (table metadata), never below what we've seen
+                total = max(seen, await self.user_repository.count_users() or 0)
+
             return {
                 "users": users,
-                "total": len(all_users),
+                "total": total,
                 "limit": limit,
                 "offset": offset,
-                "has_more": offset + limit < len(all_users)
+                "has_more": next_cursor is not None,
+                "next_cursor": next_cursor
             }
 
         except Exception as e:
@@ -226,6 +226,36 @@ class TestVRAMMonitoringEndpoints:
         assert data["loaded_models_count"] == 2
 
 
+class TestLogTransportEndpoint:
+    """Tests for log transport counters endpoint."""
+
+    def test_get_log_transport_stats(self, client, admin_token):
+        """Test ingest counters come from the logging service health details."""
+        health_checker = MagicMock()
+        health_checker.get_health_snapshot.return_value = {
+            "logging": {
+                "healthy": True,
+                "timestamp": "2025-12-29T10:00:00+00:00",
+                "details": {"stats": {"ingest": {"written": 1200, "dropped": 0, "lag_seconds": 0.04}}}
+            }
+        }
+        app.state.health_checker = health_checker
+
+        try:
+            response = client.get(
+                "/admin/logs/transport",
+                headers={"Authorization": f"Bearer {admin_token}"}
+            )
+        finally:
+            del app.state.health_checker
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["ingest"]["written"] == 1200
+        assert data["ingest"]["lag_seconds"] == 0.04
+        assert data["client"]["dropped"] >= 0
+
+
 class TestUserManagementEndpoints:
     """Tests for user management API endpoints."""
 
@@ -204,3 +204,39 @@ class TestRequireAdmin:
             await require_admin(authorization="InvalidFormat token123")
         assert exc_info.value.status_code == 401
         assert "Invalid Authorization header" in str(exc_info.value.detail)
+
+
+class TestVerifiedTokenCache:
+    """Tests for reuse of verified JWT payloads."""
+
+    def test_repeat_verification_hits_cache(self):
+        from app.middleware import auth as auth_middleware
+
+        auth_middleware.token_cache.clear()
+        payload = {
+            "user_id": "cached_admin",
+            "role": "admin",
+            "exp": datetime.now(timezone.utc) + timedelta(hours=1)
+        }
+        token = jwt.encode(payload, settings.JWT_SECRET, algorithm=settings.JWT_ALGORITHM)
+        before = auth_middleware.token_cache.get_stats()
+
+        for _ in range(5):
+            assert verify_jwt_token(token)["user_id"] == "cached_admin"
+
+        stats = auth_middleware.token_cache.get_stats()
+        assert stats["misses"] - before["misses"] == 1
+        assert stats["hits"] - before["hits"] == 4
+
+    def test_role_is_checked_on_cache_hits(self):
+        payload = {
+            "user_id": "cached_user",
+            "role": "user",
+            "exp": datetime.now(timezone.utc) + timedelta(hours=1)
+        }
+        token = jwt.encode(payload, settings.JWT_SECRET, algorithm=settings.JWT_ALGORITHM)
+
+        for _ in range(2):
+            with pytest.raises(HTTPException) as exc_info:
+                verify_jwt_token(token)
+            assert exc_info.value.status_code == 403
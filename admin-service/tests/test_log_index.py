@@ -0,0 +1,254 @@
+"""Unit tests for indexed log paging, streaming search and compression."""
+
+import gzip
+import os
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi.testclient import TestClient
+from jose import jwt
+
+from app.api import logs as logs_api
+from app.config import settings
+from app.main import app
+from app.services import log_index
+from app.services.log_cleanup_service import LogCleanupService
+from app.services.log_index import (
+    compile_search,
+    compress_log_file,
+    get_line_index,
+    read_lines,
+    resolve_log_file,
+    search_file,
+)
+
+
+def make_lines(count, start=0):
+    return [f"2025-12-29 10:00:00 - [svc] - INFO - app - request {i} {'x' * (i % 37)}" for i in range(start, start + count)]
+
+
+def write_log(path, lines, trailing_newline=True):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    text = "\n".join(lines) + ("\n" if trailing_newline else "")
+    path.write_text(text)
+
+
+@pytest.fixture(autouse=True)
+def small_blocks(monkeypatch):
+    """Small blocks so a few thousand lines span many checkpoints and members."""
+    monkeypatch.setattr(log_index, "BLOCK_SIZE", 1024)
+    monkeypatch.setattr(log_index, "READ_SIZE", 4096)
+    log_index._index_cache.clear()
+
+
+class TestLineIndex:
+    """Tests for seek-based paging."""
+
+    def test_pages_match_full_read(self, tmp_path):
+        path = tmp_path / "app.log"
+        lines = make_lines(3000)
+        write_log(path, lines)
+
+        for offset in (0, 1, 999, 2950, 2999):
+            page, total = read_lines(path, offset, 100)
+            assert total == 3000
+            assert page == lines[offset:offset + 100]
+
+        assert len(get_line_index(path).checkpoint_lines) > 100
+
+    def test_index_extends_incrementally(self, tmp_path):
+        path = tmp_path / "app.log"
+        lines = make_lines(500)
+        write_log(path, lines)
+        get_line_index(path)
+
+        more = make_lines(700, start=500)
+        with open(path, "a") as f:
+            f.write("\n".join(more) + "\n")
+        log_index._index_cache.clear()  # Force reload from sidecar
+
+        page, total = read_lines(path, 1150, 100)
+
+        assert total == 1200
+        assert page == (lines + more)[1150:1200]
+
+    def test_partial_last_line_is_counted(self, tmp_path):
+        path = tmp_path / "app.log"
+        lines = make_lines(10)
+        write_log(path, lines, trailing_newline=False)
+
+        page, total = read_lines(path, 8, 10)
+
+        assert total == 10
+        assert page == lines[8:]
+
+    def test_rotated_file_rebuilds_index(self, tmp_path):
+        path = tmp_path / "app.log"
+        write_log(path, make_lines(2000))
+        get_line_index(path)
+
+        os.replace(path, tmp_path / "app.log.1")
+        replacement = make_lines(5, start=9000)
+        write_log(path, replacement)
+
+        page, total = read_lines(path, 0, 10)
+
+        assert total == 5
+        assert page == replacement
+
+
+class TestCompressedLogs:
+    """Tests for block-gzipped closed days."""
+
+    def test_compressed_file_is_plain_gzip_and_pageable(self, tmp_path):
+        path = tmp_path / "app.log"
+        lines = make_lines(3000)
+        write_log(path, lines)
+
+        target = compress_log_file(path, block_size=2048)
+        log_index._index_cache.clear()
+
+        assert not path.exists()
+        assert resolve_log_file(tmp_path, "app") == target
+        assert gzip.decompress(target.read_bytes()).decode().splitlines() == lines
+
+        page, total = read_lines(target, 2500, 50)
+        assert total == 3000
+        assert page == lines[2500:2550]
+        assert len(get_line_index(target).checkpoint_lines) > 50
+
+    def test_gzip_without_sidecar_is_indexed_by_member(self, tmp_path):
+        path = tmp_path / "debug.log"
+        lines = make_lines(1000)
+        write_log(path, lines, trailing_newline=False)
+        target = compress_log_file(path, block_size=2048)
+        (tmp_path / "debug.log.gz.idx").unlink()
+        log_index._index_cache.clear()
+
+        page, total = read_lines(target, 990, 20)
+
+        assert total == 1000
+        assert page == lines[990:]
+
+    def test_cleanup_compresses_closed_days_only(self, tmp_path):
+        service = LogCleanupService()
+        service.base_dir = tmp_path
+        service.COMPRESS_MIN_IDLE_SECONDS = 0
+        today = datetime.now().strftime("%Y-%m-%d")
+        yesterday = (datetime.now() - timedelta(days=1)).strftime("%Y-%m-%d")
+        write_log(tmp_path / today / "app.log", make_lines(10))
+        write_log(tmp_path / yesterday / "app.log", make_lines(10))
+        write_log(tmp_path / yesterday / "app.log.1", make_lines(10))
+
+        result = service.compress_closed_logs()
+
+        assert result["compressed_count"] == 2
+        assert (tmp_path / today / "app.log").exists()
+        assert (tmp_path / yesterday / "app.log.gz").exists()
+        assert (tmp_path / yesterday / "app.log.1.gz").exists()
+
+
+class TestSearch:
+    """Tests for streaming search."""
+
+    def test_matches_report_line_numbers_once_per_line(self, tmp_path):
+        path = tmp_path / "app.log"
+        lines = make_lines(2000)
+        lines[1234] = "ERROR boom ERROR again"
+        write_log(path, lines)
+
+        pattern = compile_search("error", regex=False, case_sensitive=False)
+
+        assert list(search_file(path, pattern)) == [(1235, "ERROR boom ERROR again")]
+
+    def test_regex_matches_equal_line_scan(self, tmp_path):
+        path = tmp_path / "app.log"
+        lines = make_lines(3000)
+        write_log(path, lines, trailing_newline=False)
+        pattern = compile_search(r"request \d*7 x{3}", regex=True, case_sensitive=True)
+
+        expected = [(i + 1, line) for i, line in enumerate(lines) if pattern.regex.search(line)]
+        target = compress_log_file(path, block_size=2048)
+
+        assert expected
+        assert list(search_file(target, pattern)) == expected
+
+    def test_escaped_query_is_literal(self, tmp_path):
+        path = tmp_path / "app.log"
+        write_log(path, ["a.b", "axb"])
+
+        pattern = compile_search("a.b", regex=False, case_sensitive=True)
+
+        assert [n for n, _ in search_file(path, pattern)] == [1]
+
+
+@pytest.fixture
+def admin_headers():
+    payload = {
+        "user_id": "admin_user_123",
+        "role": "admin",
+        "exp": datetime.now(timezone.utc) + timedelta(hours=1)
+    }
+    return {"Authorization": f"Bearer {jwt.encode(payload, settings.JWT_SECRET, algorithm=settings.JWT_ALGORITHM)}"}
+
+
+class TestLogEndpoints:
+    """Tests for the paging/search API on top of the index."""
+
+    @pytest.fixture
+    def log_dir(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(logs_api, "LOGS_BASE_PATH", tmp_path)
+        write_log(tmp_path / "2025-12-28" / "app.log", ["old error"] + make_lines(50))
+        compress_log_file(tmp_path / "2025-12-28" / "app.log")
+        write_log(tmp_path / "2025-12-29" / "app.log", make_lines(300) + ["new error"])
+        return tmp_path
+
+    def test_tail_returns_last_page(self, log_dir, admin_headers):
+        response = TestClient(app).get(
+            "/admin/logs/content",
+            params={"date": "2025-12-29", "log_type": "app", "lines": 10, "tail": True},
+            headers=admin_headers
+        )
+
+        data = response.json()
+        assert response.status_code == 200
+        assert data["total_lines"] == 301
+        assert data["offset"] == 291
+        assert data["content"][-1] == "new error"
+
+    def test_search_across_date_range(self, log_dir, admin_headers):
+        response = TestClient(app).get(
+            "/admin/logs/search",
+            params={
+                "date": "2025-12-27", "end_date": "2025-12-29", "log_type": "app",
+                "query": "^(old|new) error$", "regex": True
+            },
+            headers=admin_headers
+        )
+
+        data = response.json()
+        assert response.status_code == 200
+        assert [(m["date"], m["line_number"]) for m in data["matches"]] == [
+            ("2025-12-28", 1), ("2025-12-29", 301)
+        ]
+        assert data["truncated"] is False
+
+    def test_search_stops_at_max_results(self, log_dir, admin_headers):
+        response = TestClient(app).get(
+            "/admin/logs/search",
+            params={"date": "2025-12-29", "log_type": "app", "query": "request", "max_results": 5},
+            headers=admin_headers
+        )
+
+        data = response.json()
+        assert data["total_matches"] == 5
+        assert data["truncated"] is True
+
+    def test_invalid_regex_is_rejected(self, log_dir, admin_headers):
+        response = TestClient(app).get(
+            "/admin/logs/search",
+            params={"date": "2025-12-29", "log_type": "app", "query": "(", "regex": True},
+            headers=admin_headers
+        )
+
+        assert response.status_code == 400
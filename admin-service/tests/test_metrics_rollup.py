@@ -0,0 +1,271 @@
+"""Unit tests for metrics rollup tiers and mergeable sketches.
+
+Rollups are exercised against an in-memory MetricsStorage: the real
+partition/sort key and query planning logic runs, only DynamoDB calls are
+replaced.
+"""
+
+import math
+import random
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+import pytest
+
+from app.services.metrics_aggregator import MetricsAggregator
+from app.services.metrics_rollup import (
+    ROLLUP_TIERS,
+    MetricsRollupManager,
+    QuantileSketch,
+    plan_query,
+    query_field_sketches,
+    select_tier,
+)
+from app.services.metrics_storage import MetricsStorage
+from app.utils.metrics_transformer import MetricsTransformer
+
+TIER_1M, TIER_1H, TIER_1D = ROLLUP_TIERS
+
+
+class InMemoryMetricsStorage(MetricsStorage):
+    """MetricsStorage with partitions held in a dict."""
+
+    def __init__(self):
+        super().__init__()
+        self.partitions = {}
+        self.items_read = 0
+        self.fail_queries = False
+
+    def _put(self, item):
+        self.partitions.setdefault(item["PK"], {})[item["SK"]] = item
+
+    async def write_metric(self, metric_type, timestamp, data, ttl):
+        self._put({
+            "PK": self._get_partition_key(metric_type, timestamp),
+            "SK": self._get_sort_key(timestamp),
+            "data": data
+        })
+        return True
+
+    async def write_rollup(self, metric_type, tier, bucket_start, data, ttl):
+        self._put({
+            "PK": self._get_rollup_partition_key(metric_type, tier, bucket_start),
+            "SK": self._get_sort_key(bucket_start),
+            "tier": tier.name,
+            "data": data
+        })
+        return True
+
+    async def _query_partition(self, partition_key, start_time, end_time):
+        if self.fail_queries:
+            raise ConnectionError("DynamoDB unavailable")
+        start, end = self._get_sort_key(start_time), self._get_sort_key(end_time)
+        items = [
+            item for sk, item in sorted(self.partitions.get(partition_key, {}).items())
+            if start <= sk <= end
+        ]
+        self.items_read += len(items)
+        return items
+
+
+def nearest_rank(values, percentile):
+    return MetricsAggregator.calculate_percentile(values, percentile)
+
+
+async def feed(storage, manager, start, count, step_seconds, value_fn):
+    """Write count raw samples and feed them into the rollups."""
+    values = []
+    for i in range(count):
+        timestamp = start + timedelta(seconds=i * step_seconds)
+        value = value_fn(i)
+        values.append(value)
+        data = MetricsTransformer.convert_floats_to_decimal({"used_gb": value, "ok": True})
+        await storage.write_metric("vram", timestamp, data, ttl=0)
+        await manager.observe("vram", timestamp, data)
+    return values
+
+
+class TestQuantileSketch:
+    """Tests for the mergeable sketch."""
+
+    def test_percentiles_within_relative_accuracy(self):
+        rng = random.Random(7)
+        values = [rng.lognormvariate(3, 1) for _ in range(20000)]
+        sketch = QuantileSketch()
+        for value in values:
+            sketch.add(value)
+
+        for percentile in (50, 95, 99):
+            exact = nearest_rank(values, percentile)
+            assert sketch.quantile(percentile / 100) == pytest.approx(exact, rel=0.011)
+        assert sketch.min == min(values)
+        assert sketch.max == max(values)
+        assert sketch.avg == pytest.approx(sum(values) / len(values))
+
+    def test_merge_matches_single_sketch(self):
+        values = [float(v) for v in range(-50, 200)]
+        whole, left, right = QuantileSketch(), QuantileSketch(), QuantileSketch()
+        for value in values:
+            whole.add(value)
+            (left if value < 75 else right).add(value)
+
+        left.merge(right)
+
+        assert left.count == whole.count
+        assert left.quantile(0.95) == whole.quantile(0.95)
+        assert left.quantile(0.01) == whole.quantile(0.01)
+
+    def test_round_trip_through_dynamodb_types(self):
+        sketch = QuantileSketch()
+        for value in (0.0, 1.5, 2.5, 18.25):
+            sketch.add(value)
+
+        stored = MetricsTransformer.convert_floats_to_decimal(sketch.to_dict())
+        restored = QuantileSketch.from_dict(stored)
+
+        assert isinstance(stored["sum"], Decimal)
+        assert restored.count == 4
+        assert restored.quantile(0.5) == sketch.quantile(0.5)
+
+    def test_bins_are_bounded(self):
+        sketch = QuantileSketch(max_bins=32)
+        for exponent in range(-20, 20):
+            sketch.add(10.0 ** exponent)
+
+        assert len(sketch.positive) <= 32
+        assert sketch.quantile(1.0) == pytest.approx(1e19, rel=0.01)
+
+
+class TestTierSelection:
+    """Tests for select_tier / plan_query."""
+
+    NOW = datetime(2025, 3, 10, 10, 41, 30)
+
+    def test_coarsest_tier_dividing_granularity(self):
+        start = self.NOW - timedelta(hours=6)
+
+        assert select_tier(start, self.NOW, 5, now=self.NOW) is None
+        assert select_tier(start, self.NOW, 300, now=self.NOW) is TIER_1M
+        assert select_tier(start, self.NOW, 3600, now=self.NOW) is TIER_1H
+        assert select_tier(start, self.NOW, 86400, now=self.NOW) is TIER_1D
+
+    def test_tier_retention_limits_selection(self):
+        old = self.NOW - timedelta(days=TIER_1M.retention_days + 1)
+
+        assert select_tier(old, self.NOW, 300, now=self.NOW) is None
+        assert select_tier(old, self.NOW, 3600, now=self.NOW) is TIER_1H
+
+    def test_open_windows_served_by_finer_sources(self):
+        start = self.NOW - timedelta(days=30)
+
+        segments = plan_query(start, self.NOW, 3600, now=self.NOW)
+
+        assert [(t.name if t else "raw") for t, _, _ in segments] == ["1h", "1m", "raw"]
+        assert segments[0][2] == datetime(2025, 3, 10, 10, 0)
+        assert segments[1][2] == datetime(2025, 3, 10, 10, 41)
+        assert segments[-1][2] == self.NOW
+
+
+class TestRollupManager:
+    """Tests for rollup maintenance and tiered queries."""
+
+    @pytest.mark.asyncio
+    async def test_hour_rollup_merged_from_minutes(self):
+        storage = InMemoryMetricsStorage()
+        manager = MetricsRollupManager(storage)
+        start = datetime(2025, 3, 1, 9, 58)
+
+        # 9:58 -> 11:01 at 5s, crossing two hour boundaries
+        await feed(storage, manager, start, 63 * 12, 5, lambda i: float(i % 40))
+
+        hour_items = await storage.query_rollups(
+            "vram", TIER_1H, datetime(2025, 3, 1, 9), datetime(2025, 3, 1, 10, 59)
+        )
+        counts = {item["SK"][11:13]: item["data"]["used_gb"]["count"] for item in hour_items}
+
+        assert counts == {"09": 24, "10": 720}
+
+    @pytest.mark.asyncio
+    async def test_flush_writes_open_minute(self):
+        storage = InMemoryMetricsStorage()
+        manager = MetricsRollupManager(storage)
+        await feed(storage, manager, datetime(2025, 3, 1, 9, 0), 3, 5, float)
+
+        await manager.flush()
+
+        items = await storage.query_rollups(
+            "vram", TIER_1M, datetime(2025, 3, 1, 9), datetime(2025, 3, 1, 9, 1)
+        )
+        assert items[0]["data"]["used_gb"]["count"] == 3
+        assert items[0]["data"]["ok"]["min"] == 1
+
+    @pytest.mark.asyncio
+    async def test_thirty_day_query_reads_hundreds_of_items(self):
+        """30 days at 1h resolution: ~720 rollups read, stats match raw data."""
+        storage = InMemoryMetricsStorage()
+        manager = MetricsRollupManager(storage)
+        start = datetime(2025, 2, 1)
+        rng = random.Random(1)
+        # One sample per minute keeps the simulation fast; 5s samples only
+        # change the size of the 1m sketches, not the number of items read.
+        # The extra final sample at `now` closes the last hour.
+        values = (await feed(
+            storage, manager, start, 30 * 1440 + 1, 60,
+            lambda i: 15 + 5 * math.sin(i / 300) + rng.random()
+        ))[:-1]
+        now = start + timedelta(days=30)
+
+        segments = plan_query(start, now, 3600, now=now)
+        storage.items_read = 0
+        series = await query_field_sketches(storage, "vram", "used_gb", segments)
+        points, summary = MetricsAggregator.aggregate_sketches(series, 3600, "p95")
+
+        assert storage.items_read < 1000
+        assert len(points) == 720
+        assert summary["count"] == len(values)
+        assert summary["max"] == max(values)
+        assert summary["avg"] == pytest.approx(sum(values) / len(values))
+        assert summary["p99"] == pytest.approx(nearest_rank(values, 99), rel=0.011)
+
+        first_hour = values[:60]
+        assert points[0]["timestamp"] == "2025-02-01T00:00:00Z"
+        assert points[0]["value"] == pytest.approx(nearest_rank(first_hour, 95), rel=0.011)
+
+    @pytest.mark.asyncio
+    async def test_restart_backfills_hours_closed_while_down(self):
+        """A new manager rolls up the hour the previous process left open."""
+        storage = InMemoryMetricsStorage()
+        manager = MetricsRollupManager(storage)
+        # 9:58 -> 10:29:55, then a graceful shutdown and a restart at 11:05
+        await feed(storage, manager, datetime(2025, 3, 1, 9, 58), 32 * 12, 5, float)
+        await manager.flush()
+
+        restarted = MetricsRollupManager(storage)
+        await feed(storage, restarted, datetime(2025, 3, 1, 11, 5), 1, 5, float)
+
+        hour_items = await storage.query_rollups(
+            "vram", TIER_1H, datetime(2025, 3, 1, 9), datetime(2025, 3, 1, 11, 59)
+        )
+        counts = {item["SK"][11:13]: item["data"]["used_gb"]["count"] for item in hour_items}
+        assert counts == {"09": 24, "10": 360}
+
+    @pytest.mark.asyncio
+    async def test_failed_rollup_query_is_retried(self):
+        """A read error at the hour boundary is not mistaken for an empty hour."""
+        storage = InMemoryMetricsStorage()
+        manager = MetricsRollupManager(storage)
+        await feed(storage, manager, datetime(2025, 3, 1, 9, 58), 24, 5, float)
+
+        storage.fail_queries = True
+        await feed(storage, manager, datetime(2025, 3, 1, 10, 0), 12, 5, float)
+        storage.fail_queries = False
+        assert await storage.query_rollups(
+            "vram", TIER_1H, datetime(2025, 3, 1, 9), datetime(2025, 3, 1, 9, 59)
+        ) == []
+
+        await feed(storage, manager, datetime(2025, 3, 1, 10, 1), 1, 5, float)
+
+        hour_items = await storage.query_rollups(
+            "vram", TIER_1H, datetime(2025, 3, 1, 9), datetime(2025, 3, 1, 9, 59)
+        )
+        assert hour_items[0]["data"]["used_gb"]["count"] == 24
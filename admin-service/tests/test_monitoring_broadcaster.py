@@ -0,0 +1,154 @@
+"""Unit tests for the shared monitoring SSE broadcaster."""
+
+import asyncio
+import json
+
+import pytest
+
+from app.services.monitoring_broadcaster import MonitoringBroadcaster, diff_snapshot
+
+
+class FakeSystemMetrics:
+    """SystemMetricsService stand-in that counts snapshot builds."""
+
+    def __init__(self):
+        self.calls = 0
+        self.used_gb = 10.0
+
+    async def get_system_snapshot(self):
+        self.calls += 1
+        return {
+            "timestamp": f"t{self.calls}",
+            "vram": {"used_gb": self.used_gb, "total_gb": 128.0, "loaded_models": []},
+            "queue_size": 0,
+            "psi": {"cpu": 1.0, "memory": 0.0, "io": 0.0},
+            "gpu": {},
+            "cpu_utilization": 5,
+            "maintenance_mode": False
+        }
+
+
+class FakeHealthChecker:
+    def get_health_snapshot(self):
+        return {"dynamodb": "healthy", "ollama": "healthy"}
+
+
+async def receive(subscription):
+    event = await asyncio.wait_for(subscription.next_event(), timeout=1)
+    return json.loads(event["data"]) if event else None
+
+
+@pytest.fixture
+def system_metrics():
+    return FakeSystemMetrics()
+
+
+@pytest.fixture
+async def broadcaster(system_metrics):
+    broadcaster = MonitoringBroadcaster(
+        system_metrics, FakeHealthChecker(), interval=0.02, queue_size=2, max_overflows=2
+    )
+    yield broadcaster
+    await broadcaster.stop()
+
+
+class TestDiffSnapshot:
+    """Tests for the merge patch builder."""
+
+    def test_only_changed_fields(self):
+        previous = {"vram": {"used_gb": 10, "total_gb": 128}, "queue_size": 0}
+        current = {"vram": {"used_gb": 12, "total_gb": 128}, "queue_size": 0}
+
+        assert diff_snapshot(previous, current) == {"vram": {"used_gb": 12}}
+
+    def test_removed_keys_and_lists(self):
+        previous = {"gpu": {"temperature_c": 50}, "models": ["a"]}
+        current = {"gpu": {}, "models": ["a", "b"]}
+
+        assert diff_snapshot(previous, current) == {
+            "gpu": {"temperature_c": None},
+            "models": ["a", "b"]
+        }
+
+
+class TestMonitoringBroadcaster:
+    """Tests for the shared producer."""
+
+    @pytest.mark.asyncio
+    async def test_one_snapshot_per_tick_for_all_subscribers(self, broadcaster, system_metrics):
+        subscriptions = [broadcaster.subscribe() for _ in range(20)]
+
+        for _ in range(3):
+            frames = [await receive(s) for s in subscriptions]
+            assert len({f["timestamp"] for f in frames}) == 1
+
+        # One build per tick regardless of the 20 subscribers
+        assert system_metrics.calls <= 4
+        assert frames[0]["services"] == {"dynamodb": "healthy", "ollama": "healthy"}
+
+    @pytest.mark.asyncio
+    async def test_delta_frames_carry_changes_only(self, broadcaster, system_metrics):
+        subscription = broadcaster.subscribe(delta=True)
+
+        first = await receive(subscription)
+        system_metrics.used_gb = 12.5
+        second = await receive(subscription)
+
+        assert first["type"] == "full"
+        assert first["data"]["vram"]["total_gb"] == 128.0
+        assert second["type"] == "delta"
+        assert second["data"] == {"timestamp": "t2", "vram": {"used_gb": 12.5}}
+
+    @pytest.mark.asyncio
+    async def test_late_subscriber_starts_with_full_frame(self, broadcaster):
+        early = broadcaster.subscribe(delta=True)
+        await receive(early)
+
+        late = broadcaster.subscribe(delta=True)
+        frame = await receive(late)
+
+        assert frame["type"] == "full"
+
+    @pytest.mark.asyncio
+    async def test_slow_subscriber_is_resynced_then_dropped(self, broadcaster):
+        fast = broadcaster.subscribe(delta=True)
+        slow = broadcaster.subscribe(delta=True)
+
+        # Fast client keeps receiving while the slow one never reads
+        for _ in range(12):
+            await receive(fast)
+        stats = broadcaster.get_stats()
+
+        assert stats["resyncs"] > 0
+        assert stats["dropped_subscribers"] == 1
+        assert stats["subscribers"] == 1
+        assert await receive(slow) is None
+
+    @pytest.mark.asyncio
+    async def test_resync_replaces_stale_frames_with_full_frame(self, system_metrics):
+        broadcaster = MonitoringBroadcaster(
+            system_metrics, FakeHealthChecker(), interval=0.02, queue_size=2, max_overflows=5
+        )
+        try:
+            subscription = broadcaster.subscribe(delta=True)
+            await asyncio.sleep(0.07)  # Overflow the 2-frame queue once
+
+            frame = await receive(subscription)
+
+            assert frame["type"] == "full"
+            assert frame["data"]["timestamp"] != "t1"
+        finally:
+            await broadcaster.stop()
+
+    @pytest.mark.asyncio
+    async def test_producer_stops_without_subscribers(self, broadcaster, system_metrics):
+        subscription = broadcaster.subscribe()
+        await receive(subscription)
+        broadcaster.unsubscribe(subscription)
+        await asyncio.sleep(0.05)
+        calls = system_metrics.calls
+
+        await asyncio.sleep(0.05)
+
+        assert system_metrics.calls == calls
+        assert broadcaster.get_stats()["producer_running"] is False
@@ -0,0 +1,144 @@
+"""Unit tests for the cached, cursor-paged DynamoDB user repository."""
+
+import pytest
+
+from app.repositories.dynamodb_user_repository import DynamoDBUserRepository
+
+
+class FakeUsersTable:
+    """In-memory stand-in for the aioboto3 users Table (hash key: user_id)."""
+
+    def __init__(self, count=0):
+        self.items = {f"user{i:04d}": {"user_id": f"user{i:04d}", "created_at": f"2025-01-{i % 28 + 1:02d}"}
+                      for i in range(count)}
+        self.calls = {"get_item": 0, "scan": 0, "update_item": 0, "put_item": 0, "delete_item": 0}
+        self.items_scanned = 0
+        self.page_cap = None  # Simulate DynamoDB's 1 MB short pages
+
+    async def get_item(self, Key):
+        self.calls["get_item"] += 1
+        item = self.items.get(Key["user_id"])
+        return {"Item": dict(item)} if item else {}
+
+    async def put_item(self, Item):
+        self.calls["put_item"] += 1
+        self.items[Item["user_id"]] = dict(Item)
+
+    async def update_item(self, Key, **kwargs):
+        self.calls["update_item"] += 1
+        item = self.items.setdefault(Key["user_id"], {"user_id": Key["user_id"]})
+        item["writes"] = item.get("writes", 0) + 1
+
+    async def delete_item(self, Key):
+        self.calls["delete_item"] += 1
+        self.items.pop(Key["user_id"], None)
+
+    async def scan(self, Limit, ExclusiveStartKey=None):
+        self.calls["scan"] += 1
+        keys = sorted(self.items)
+        start = keys.index(ExclusiveStartKey["user_id"]) + 1 if ExclusiveStartKey else 0
+        count = min(Limit, self.page_cap or Limit)
+        page = keys[start:start + count]
+        self.items_scanned += len(page)
+
+        response = {"Items": [dict(self.items[k]) for k in page]}
+        if start + count < len(keys):
+            response["LastEvaluatedKey"] = {"user_id": page[-1]}
+        return response
+
+
+@pytest.fixture
+def table():
+    return FakeUsersTable(count=250)
+
+
+@pytest.fixture
+def repo(table):
+    repo = DynamoDBUserRepository(cache_ttl_seconds=60, cache_max_entries=100)
+    repo.table = table
+    return repo
+
+
+class TestUserCache:
+    """Tests for the read-through user cache."""
+
+    @pytest.mark.asyncio
+    async def test_repeat_reads_served_from_cache(self, repo, table):
+        for _ in range(5):
+            user = await repo.get_user("user0001")
+
+        assert user["user_id"] == "user0001"
+        assert table.calls["get_item"] == 1
+        assert repo.get_stats()["cache_hits"] == 4
+
+    @pytest.mark.asyncio
+    async def test_cached_copy_is_not_shared(self, repo):
+        user = await repo.get_user("user0001")
+        user["banned"] = True
+
+        assert "banned" not in await repo.get_user("user0001")
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("write", [
+        lambda r: r.update_user("user0001", {"user_tier": "premium"}),
+        lambda r: r.ban_user("user0001", "spam", "admin"),
+        lambda r: r.unban_user("user0001", "admin"),
+        lambda r: r.grant_tokens("user0001", 100, "bonus", "admin"),
+    ])
+    async def test_writes_invalidate(self, repo, table, write):
+        await repo.get_user("user0001")
+
+        assert await write(repo) is True
+        user = await repo.get_user("user0001")
+
+        assert table.calls["get_item"] == 2
+        assert user["writes"] == 1
+
+    @pytest.mark.asyncio
+    async def test_delete_invalidates(self, repo):
+        await repo.get_user("user0001")
+
+        await repo.delete_user("user0001")
+
+        assert await repo.get_user("user0001") is None
+
+    @pytest.mark.asyncio
+    async def test_missing_users_are_not_cached(self, repo, table):
+        assert await repo.get_user("new_user") is None
+        await table.put_item(Item={"user_id": "new_user"})
+
+        assert (await repo.get_user("new_user"))["user_id"] == "new_user"
+
+    @pytest.mark.asyncio
+    async def test_cache_is_bounded(self, repo):
+        for i in range(150):
+            await repo.get_user(f"user{i:04d}")
+
+        assert repo.get_stats()["cached_users"] == 100
+
+
+class TestListUsers:
+    """Tests for cursor paging."""
+
+    @pytest.mark.asyncio
+    async def test_cursor_walks_all_users_reading_only_each_page(self, repo, table):
+        seen, cursor = [], None
+        while True:
+            result = await repo.list_users(limit=100, last_key=cursor)
+            seen.extend(u["user_id"] for u in result["users"])
+            cursor = result["last_key"]
+            if cursor is None:
+                break
+
+        assert seen == sorted(table.items)
+        assert table.items_scanned == 250
+
+    @pytest.mark.asyncio
+    async def test_short_pages_are_filled(self, repo, table):
+        table.page_cap = 30
+
+        result = await repo.list_users(limit=100)
+
+        assert len(result["users"]) == 100
+        assert result["last_key"] == "user0099"
+        assert table.items_scanned == 100
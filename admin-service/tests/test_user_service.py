@@ -270,3 +270,19 @@ class TestUserServiceStats:
 
         # Verify repository was called
         mock_user_repository.list_users.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_list_all_users_with_cursor(self, user_service, mock_user_repository):
+        """Test cursor paging passes the cursor through and returns the next one."""
+        mock_user_repository.list_users = AsyncMock(return_value={
+            'users': [{'user_id': 'user3', 'created_at': '2025-01-03T00:00:00Z'}],
+            'last_key': 'user3'
+        })
+        mock_user_repository.count_users = AsyncMock(return_value=40)
+
+        result = await user_service.list_all_users(limit=1, cursor="user2")
+
+        mock_user_repository.list_users.assert_called_once_with(limit=1, last_key="user2")
+        assert result["next_cursor"] == "user3"
+        assert result["has_more"] is True
+        assert result["total"] == 40
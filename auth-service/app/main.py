@@ -12,7 +12,8 @@ import jwt
 
 from app.models.requests import LoginRequest, RegisterRequest, LinkAuthMethodRequest
 from app.models.responses import LoginResponse, UserResponse, RefreshResponse
-from app.utils.jwt import verify_refresh_token, create_access_token
+from app.utils.jwt import verify_refresh_token, create_access_token, token_cache
+from app.utils.crypto import PasswordHasherBusy, password_hasher
 from app.services.authentication_service import AuthenticationService
 from app.providers.password_provider import PasswordAuthProvider
 from app.repositories.user_repository import DynamoDBUserRepository
@@ -38,6 +39,12 @@ async def startup_event():
         logger.error(f"Failed to initialize DynamoDB tables: {e}")
         raise
 
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Stop the password hashing pool."""
+    password_hasher.shutdown()
+
 # CORS
 app.add_middleware(
     CORSMiddleware,
@@ -83,6 +90,9 @@ async def login(request: LoginRequest):
     except HTTPException:
         # Re-raise HTTPException to preserve status code
         raise
+    except PasswordHasherBusy as e:
+        logger.warning(f"Rejected request: {e}")
+        raise HTTPException(status_code=503, detail="Server busy, retry shortly", headers={"Retry-After": "1"})
     except ValueError as e:
         logger.error(f"Login error: {e}")
         raise HTTPException(status_code=400, detail=str(e))
@@ -114,6 +124,9 @@ async def register(request: RegisterRequest):
     except HTTPException:
         # Re-raise HTTPException to preserve status code
         raise
+    except PasswordHasherBusy as e:
+        logger.warning(f"Rejected request: {e}")
+        raise HTTPException(status_code=503, detail="Server busy, retry shortly", headers={"Retry-After": "1"})
     except ValueError as e:
         logger.error(f"Registration error: {e}")
         raise HTTPException(status_code=400, detail=str(e))
@@ -181,6 +194,9 @@ async def link_auth_method(request: LinkAuthMethodRequest):
     except HTTPException:
         # Re-raise HTTPException to preserve status code
         raise
+    except PasswordHasherBusy as e:
+        logger.warning(f"Rejected request: {e}")
+        raise HTTPException(status_code=503, detail="Server busy, retry shortly", headers={"Retry-After": "1"})
     except ValueError as e:
         logger.error(f"Link auth method error: {e}")
         raise HTTPException(status_code=400, detail=str(e))
@@ -195,5 +211,9 @@ async def health():
     return {
         "status": "healthy",
         "service": "auth-service",
-        "version": "2.0.0"
+        "version": "2.0.0",
+        "stats": {
+            "password_hasher": password_hasher.get_stats(),
+            "token_cache": token_cache.get_stats()
+        }
     }
@@ -5,7 +5,7 @@ import uuid
 from app.interfaces.auth_provider import IAuthProvider
 from app.interfaces.auth_method_repository import IAuthMethodRepository
 from app.domain.auth_method import AuthMethod
-from app.utils.crypto import hash_password, verify_password
+from app.utils.crypto import hash_password_async, verify_password_async
 
 
 class PasswordAuthProvider(IAuthProvider):
@@ -35,7 +35,7 @@ class PasswordAuthProvider(IAuthProvider):
         if not password_hash:
             return None
 
-        if not verify_password(credentials, password_hash):
+        if not await verify_password_async(credentials, password_hash):
             return None
 
         # Update last used
@@ -53,8 +53,8 @@ class PasswordAuthProvider(IAuthProvider):
     ) -> AuthMethod:
         """Create new password auth method"""
 
-        # Hash password
-        password_hash = hash_password(credentials)
+        # Hash password (off the event loop)
+        password_hash = await hash_password_async(credentials)
 
         # Create auth method
         auth_method = AuthMethod(
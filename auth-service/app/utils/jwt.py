@@ -4,10 +4,16 @@ from datetime import datetime, timedelta
 from typing import Dict, Tuple
 import os
 
+from token_cache import VerifiedTokenCache
+
 SECRET_KEY = os.getenv("JWT_SECRET_KEY", "change-me-in-production")
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_HOURS = 8
 REFRESH_TOKEN_EXPIRE_DAYS = 7
+VERIFIED_TOKEN_CACHE_TTL = float(os.getenv("VERIFIED_TOKEN_CACHE_TTL_SECONDS", "60"))
+
+# Recently verified tokens (skips re-verifying the same bearer token per call)
+token_cache = VerifiedTokenCache(ttl_seconds=VERIFIED_TOKEN_CACHE_TTL)
 
 
 def create_access_token(data: Dict) -> str:
@@ -36,7 +42,11 @@ def create_token_pair(data: Dict) -> Tuple[str, str]:
 
 
 def verify_token(token: str) -> Dict:
-    """Verify and decode JWT token."""
+    """Verify and decode JWT token (served from the verified-token cache when possible)."""
+    return token_cache.verify(token, _decode)
+
+
+def _decode(token: str) -> Dict:
     return jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
 
 
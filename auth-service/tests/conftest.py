@@ -2,10 +2,14 @@
 import pytest
 import asyncio
 import sys
+from pathlib import Path
 from unittest.mock import Mock
 from datetime import datetime
 import uuid
 
+# Make the shared modules (mounted at /shared in the container) importable
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / 'shared'))
+
 # Mock logging_client from shared module before any imports
 mock_logging = Mock()
 mock_logging.setup_logger = Mock(return_value=Mock())
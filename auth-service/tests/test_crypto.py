@@ -87,3 +87,70 @@ def test_verify_password_empty_hash():
     result = verify_password("password", "")
 
     assert result is False
+
+
+@pytest.mark.asyncio
+async def test_async_hash_and_verify_run_on_pool():
+    """Test async variants produce verifiable hashes off the event loop."""
+    from app.utils.crypto import PasswordHasher
+
+    hasher = PasswordHasher(workers=2, max_queue=4)
+    try:
+        hashed = await hasher.hash("test_password_123")
+
+        assert verify_password("test_password_123", hashed)
+        assert await hasher.verify("test_password_123", hashed) is True
+        assert await hasher.verify("wrong_password", hashed) is False
+        assert hasher.get_stats()["completed"] == 3
+        assert hasher.get_stats()["in_flight"] == 0
+    finally:
+        hasher.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_async_verify_does_not_block_event_loop():
+    """Test the event loop keeps running while bcrypt works."""
+    import asyncio
+    from app.utils.crypto import PasswordHasher
+
+    hasher = PasswordHasher(workers=1, max_queue=4)
+    hashed = hash_password("test_password_123")
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.01)
+
+    task = asyncio.create_task(ticker())
+    try:
+        await hasher.verify("test_password_123", hashed)
+    finally:
+        task.cancel()
+        hasher.shutdown()
+
+    assert ticks > 5
+
+
+@pytest.mark.asyncio
+async def test_full_queue_rejects_and_reports_depth():
+    """Test calls beyond workers + max_queue fail fast."""
+    import asyncio
+    from app.utils.crypto import PasswordHasher, PasswordHasherBusy
+
+    hasher = PasswordHasher(workers=1, max_queue=1)
+    hashed = hash_password("test_password_123")
+    try:
+        results = await asyncio.gather(
+            *(hasher.verify("test_password_123", hashed) for _ in range(3)),
+            return_exceptions=True
+        )
+    finally:
+        hasher.shutdown()
+
+    assert results[:2] == [True, True]
+    assert isinstance(results[2], PasswordHasherBusy)
+    stats = hasher.get_stats()
+    assert stats["rejected"] == 1
+    assert stats["max_queue_depth"] == 1
@@ -121,3 +121,36 @@ def test_token_contains_all_user_data():
     assert decoded['role'] == data['role']
     assert decoded['email'] == data['email']
     assert decoded['custom_field'] == data['custom_field']
+
+
+def test_verify_token_is_cached():
+    """Test repeated verification of the same token reuses the verified payload."""
+    from unittest.mock import patch
+    from app.utils import jwt as jwt_utils
+
+    jwt_utils.token_cache.clear()
+    token = create_access_token({"user_id": "user_123"})
+
+    with patch.object(jwt_utils.jwt, "decode", wraps=pyjwt.decode) as decode:
+        first = verify_token(token)
+        first["user_id"] = "mutated"
+        second = verify_token(token)
+
+    assert decode.call_count == 1
+    assert second["user_id"] == "user_123"
+
+
+def test_verify_token_cache_never_outlives_exp(monkeypatch):
+    """Test cached payloads expire with the token, even within the TTL."""
+    import time
+    import token_cache
+    from app.utils import jwt as jwt_utils
+
+    jwt_utils.token_cache.clear()
+    now = time.time()
+    token = pyjwt.encode({"user_id": "user_123", "exp": int(now) + 2}, SECRET_KEY, algorithm=ALGORITHM)
+    verify_token(token)
+
+    monkeypatch.setattr(token_cache.time, "time", lambda: now + 3)
+
+    assert jwt_utils.token_cache.get(token) is None
@@ -353,7 +353,8 @@ class DiscordBotClient(commands.Bot):
 
         # Start listening for responses
         asyncio.create_task(self.ws_manager.listen_for_responses(
-            self.message_handler.handle_response
+            self.message_handler.handle_response,
+            on_disconnect=self.message_handler.reset_streams
         ))
 
         # Sync slash commands globally
@@ -9,7 +9,8 @@ import asyncio
 import re
 import time
 from bot.websocket_manager import WebSocketManager
-from bot.utils import split_message, validate_attachment, encode_file_base64, find_stream_split_point
+from bot.utils import split_message, validate_attachment, encode_file_base64, StreamSplitter
+from bot.stream_state import StreamStateRegistry
 from bot.animation_manager import AnimationManager
 from bot.minio_client import MinIOClient
 import logging_client
@@ -71,6 +72,10 @@ MIN_STREAM_INTERVAL_MS = 1500
 SPLIT_THRESHOLD = 1800           # When to trigger mid-stream split
 MIN_NEW_MESSAGE_CONTENT = 100    # Minimum content for new message
 
+# Stream state reclamation
+STREAM_IDLE_TIMEOUT_SECONDS = 600  # Drop streams with no chunks for this long
+MAX_ACTIVE_STREAMS = 500           # Upper bound on tracked streams
+
 
 class MessageHandler:
     """Handles Discord messages and responses."""
@@ -81,6 +86,14 @@ class MessageHandler:
         self.rate_limiter = global_rate_limiter  # Shared rate limiter
         self.animation_manager = AnimationManager(rate_limiter=global_rate_limiter)  # Share rate limiter
         self.minio_client = MinIOClient()  # For fetching generated images
+        self.streams = StreamStateRegistry(
+            splitter_factory=lambda: StreamSplitter(
+                threshold=SPLIT_THRESHOLD,
+                min_remaining=MIN_NEW_MESSAGE_CONTENT
+            ),
+            idle_timeout=STREAM_IDLE_TIMEOUT_SECONDS,
+            max_streams=MAX_ACTIVE_STREAMS,
+        )
 
     async def handle_user_message(self, message: discord.Message):
         """
@@ -232,6 +245,7 @@ class MessageHandler:
 
         elif response_type == 'cancelled':
             logger.info(f"Request {data.get('request_id')} cancelled")
+            self._release_streams(data)
 
     async def _update_reaction(self, channel_id: str, message_id: str,
                                remove_emoji: str = None, add_emoji: str = None):
@@ -310,13 +324,16 @@ class MessageHandler:
 
     async def _handle_error(self, data: dict):
         """Handle error response."""
-        error = data['error']
+        error = data.get('error') or data.get('content')
         channel_id = data.get('channel_id')
         message_channel_id = data.get('message_channel_id', channel_id)  # Fallback for backwards compat
         message_id = data.get('message_id')
 
         logger.error(f"❌ Error: {error}")
 
+        # The failed request will not send stream_end
+        self._release_streams(data)
+
         # Update reaction: ⏳ → ❌ (use message_channel_id where message actually is)
         if message_channel_id and message_id:
             await self._update_reaction(
@@ -424,6 +441,29 @@ class MessageHandler:
         else:
             logger.warning(f"Received configure response for unknown interaction: {interaction_id}")
 
+    def _release_streams(self, data: dict):
+        """Reclaim stream state for a request that ended without stream_end."""
+        request_id = data.get('request_id')
+        channel_id = data.get('channel_id')
+
+        if request_id:
+            self.streams.release(request_id)
+        if channel_id:
+            channel_id = int(channel_id)
+            self.streams.release(str(channel_id))
+            if not request_id:
+                self.streams.release_channel(channel_id)
+            if hasattr(self.bot, 'early_status_messages'):
+                self.bot.early_status_messages.pop(channel_id, None)
+
+    def reset_streams(self):
+        """Drop all stream state (the WebSocket session it belonged to is gone)."""
+        dropped = self.streams.clear()
+        if hasattr(self.bot, 'early_status_messages'):
+            self.bot.early_status_messages.clear()
+        if dropped:
+            logger.info(f"Dropped {dropped} in-flight stream(s) after disconnect")
+
     def _has_meaningful_content(self, content: str) -> bool:
         """
         Check if content has meaningful characters for Discord.
@@ -461,44 +501,26 @@ class MessageHandler:
             logger.error(f"Thread {channel_id} not found for streaming")
             return
 
-        # Initialize streaming buffers
-        if not hasattr(self.bot, 'streaming_buffers'):
-            self.bot.streaming_buffers = {}
-        if not hasattr(self.bot, 'streaming_messages'):
-            self.bot.streaming_messages = {}
-        if not hasattr(self.bot, 'stream_backoff'):
-            self.bot.stream_backoff = {}
-        if not hasattr(self.bot, 'stream_last_edit'):
-            self.bot.stream_last_edit = {}
-
         # Use request_id as key if available, otherwise channel_id
         buffer_key = request_id or str(channel_id)
 
-        # Get or create buffer state
-        if buffer_key not in self.bot.streaming_buffers:
-            self.bot.streaming_buffers[buffer_key] = {
-                'content': '',
-                'committed_length': 0,  # Track content already in finalized messages
-                'channel_id': channel_id,
-                'request_id': request_id,
-            }
-            # Use list to track multiple Discord messages per request
-            self.bot.streaming_messages[buffer_key] = []
-            logger.debug(f"Started streaming buffer for {buffer_key}")
+        # Get or create stream state (None for late chunks of a finished stream)
+        state = self.streams.open(buffer_key, channel_id, request_id)
+        if state is None:
+            return
 
-        state = self.bot.streaming_buffers[buffer_key]
-        state['content'] += content  # Accumulate tokens from TROISE AI
+        splitter = state.splitter
+        splitter.append(content)  # Accumulate tokens from TROISE AI
 
         # Apply rate limit backoff if needed
-        backoff_delay, last_attempt = self.bot.stream_backoff.get(buffer_key, (0, 0))
-        if backoff_delay > 0:
-            time_since_last = time.time() - last_attempt
-            if time_since_last < backoff_delay:
-                wait_time = backoff_delay - time_since_last
+        if state.backoff_delay > 0:
+            time_since_last = time.time() - state.last_attempt
+            if time_since_last < state.backoff_delay:
+                wait_time = state.backoff_delay - time_since_last
                 logger.debug(f"Backing off for {wait_time:.2f}s due to rate limits")
                 await asyncio.sleep(wait_time)
 
-        self.bot.stream_backoff[buffer_key] = (backoff_delay, time.time())
+        state.last_attempt = time.time()
 
         # Check for early status message to reuse
         early_msg = None
@@ -506,64 +528,44 @@ class MessageHandler:
             early_msg = self.bot.early_status_messages.get(channel_id)
 
         try:
-            # Get message list for this request
-            messages = self.bot.streaming_messages.get(buffer_key, [])
+            # Discord messages for this request
+            messages = state.messages
 
             # Cancel animation when first meaningful chunk arrives
             if not messages:
                 await self.animation_manager.cancel(channel_id)
                 await asyncio.sleep(0.15)  # Let pending Discord edits complete
 
-            # Calculate pending (uncommitted) content
-            committed = state.get('committed_length', 0)
-            pending_content = state['content'][committed:]
-
             # Validate content before Discord operations
-            if not self._has_meaningful_content(pending_content):
-                logger.debug(f"Not enough meaningful content yet: {len(pending_content)} chars")
+            if not splitter.has_meaningful_content:
+                logger.debug(f"Not enough meaningful content yet: {len(splitter.pending)} chars")
                 return
 
             # Check if we need to split (approaching threshold)
-            if len(pending_content) >= SPLIT_THRESHOLD and messages:
-                split_point, suffix, prefix = find_stream_split_point(
-                    pending_content,
-                    threshold=SPLIT_THRESHOLD,
-                    min_remaining=MIN_NEW_MESSAGE_CONTENT
-                )
+            if messages:
+                # Segment closes any open code block; the tail reopens it
+                finalize_content = splitter.split()
 
-                if split_point >= MIN_NEW_MESSAGE_CONTENT:
+                if finalize_content is not None:
                     # Finalize current message
-                    finalize_content = pending_content[:split_point]
-                    if suffix:
-                        finalize_content += suffix  # Close code block
-
                     current_msg = messages[-1]
                     await self.rate_limiter.acquire()
                     await current_msg.edit(content=finalize_content)
 
-                    # Update committed length
-                    state['committed_length'] = committed + split_point
-
-                    # Prepare content for new message
-                    new_pending = pending_content[split_point:]
-                    if prefix:
-                        new_pending = prefix + new_pending  # Reopen code block
-
                     # Create new message
-                    display_new = new_pending.rstrip() + " ..."
+                    display_new = splitter.tail.rstrip() + " ..."
                     new_msg = await thread.send(display_new)
                     messages.append(new_msg)
-                    self.bot.streaming_messages[buffer_key] = messages
-                    self.bot.stream_last_edit[buffer_key] = time.time()
+                    state.last_edit = time.time()
 
                     logger.debug(f"Split streaming message for {buffer_key}, now {len(messages)} messages")
 
                     # Reset backoff on success
-                    self.bot.stream_backoff[buffer_key] = (0, time.time())
+                    state.backoff_delay, state.last_attempt = 0, time.time()
                     return
 
             # Normal streaming update (content below threshold or first message)
-            display_content = pending_content.rstrip() + " ..."
+            display_content = splitter.tail.rstrip() + " ..."
 
             if not messages:
                 # First chunk with meaningful content
@@ -580,12 +582,10 @@ class MessageHandler:
                     logger.debug(f"Created streaming message for {buffer_key}")
 
                 messages.append(discord_msg)
-                self.bot.streaming_messages[buffer_key] = messages
-                self.bot.stream_last_edit[buffer_key] = time.time()
+                state.last_edit = time.time()
             else:
                 # Subsequent chunks - throttle edits to 1 per second
-                last_edit = self.bot.stream_last_edit.get(buffer_key, 0)
-                elapsed_ms = (time.time() - last_edit) * 1000
+                elapsed_ms = (time.time() - state.last_edit) * 1000
 
                 if elapsed_ms < MIN_STREAM_INTERVAL_MS:
                     # Too soon - skip this edit, content is buffered for next time
@@ -594,10 +594,10 @@ class MessageHandler:
                 current_msg = messages[-1]
                 await self.rate_limiter.acquire()
                 await current_msg.edit(content=display_content)
-                self.bot.stream_last_edit[buffer_key] = time.time()
+                state.last_edit = time.time()
 
             # Reset backoff on success
-            self.bot.stream_backoff[buffer_key] = (0, time.time())
+            state.backoff_delay, state.last_attempt = 0, time.time()
 
         except discord.HTTPException as e:
             if e.status == 429:
@@ -606,9 +606,9 @@ class MessageHandler:
                 if retry_after:
                     new_backoff = float(retry_after)
                 else:
-                    current_backoff = self.bot.stream_backoff.get(buffer_key, (0, 0))[0]
+                    current_backoff = state.backoff_delay
                     new_backoff = max(2.0, current_backoff * 2.0) if current_backoff > 0 else 2.0
-                self.bot.stream_backoff[buffer_key] = (new_backoff, time.time())
+                state.backoff_delay, state.last_attempt = new_backoff, time.time()
                 logger.warning(f"Rate limited, backing off to {new_backoff}s")
             elif e.code == 50006:
                 logger.error(f"Empty message error: {repr(display_content[:50])}")
@@ -634,47 +634,40 @@ class MessageHandler:
 
         channel_id = int(channel_id)
 
+        # Find buffer by request_id or channel_id, releasing it up front so
+        # it is reclaimed even if finalizing fails
+        buffer_key = request_id or str(channel_id)
+        state = self.streams.release(buffer_key)
+        if not state:
+            logger.debug(f"No streaming buffer found for {buffer_key} (request may have failed before streaming started)")
+            return
+
         # Get thread
         thread = self.bot.get_channel(channel_id)
         if not thread:
             logger.error(f"Thread {channel_id} not found for stream_end")
             return
 
-        # Find buffer by request_id or channel_id
-        buffer_key = request_id or str(channel_id)
-
-        # Check streaming buffers
-        if not hasattr(self.bot, 'streaming_buffers'):
-            self.bot.streaming_buffers = {}
-
-        state = self.bot.streaming_buffers.get(buffer_key)
-        if not state:
-            logger.debug(f"No streaming buffer found for {buffer_key} (request may have failed before streaming started)")
-            return
-
-        full_content = state['content']
-        committed = state.get('committed_length', 0)
-        logger.debug(f"Stream completed for {buffer_key}: {len(full_content)} total chars, {committed} committed")
+        splitter = state.splitter
+        logger.debug(
+            f"Stream completed for {buffer_key}: {splitter.total_length} total chars, "
+            f"{splitter.committed_length} committed"
+        )
 
         # Cancel animation
         await self.animation_manager.cancel(channel_id)
 
-        # Get Discord messages list
-        if not hasattr(self.bot, 'streaming_messages'):
-            self.bot.streaming_messages = {}
-
-        messages = self.bot.streaming_messages.get(buffer_key, [])
+        messages = state.messages
 
-        # Calculate remaining uncommitted content
-        remaining_content = full_content[committed:]
+        # Remaining uncommitted content (no messages yet means nothing was committed)
+        chunks = splitter.finish()
 
         try:
             if messages:
                 last_msg = messages[-1]
 
-                if len(remaining_content) > 2000:
+                if len(chunks) > 1:
                     # Split remaining content
-                    chunks = split_message(remaining_content)
                     await self.rate_limiter.acquire()
                     await last_msg.edit(content=chunks[0])
 
@@ -683,22 +676,18 @@ class MessageHandler:
                         await thread.send(chunk)
 
                     logger.debug(f"Finalized with {len(messages)} messages + {len(chunks) - 1} overflow chunks")
-                elif remaining_content:
+                elif chunks:
                     # Finalize last message (remove "..." indicator)
                     await self.rate_limiter.acquire()
-                    await last_msg.edit(content=remaining_content)
+                    await last_msg.edit(content=chunks[0])
                     logger.debug(f"Finalized stream with {len(messages)} message(s)")
                 else:
                     # No remaining content - edge case, just log
                     logger.debug(f"Stream ended with no remaining content, {len(messages)} message(s) already sent")
-            elif full_content:
+            elif chunks:
                 # No messages exist yet (all chunks were too short) - send final content
-                if len(full_content) > 2000:
-                    chunks = split_message(full_content)
-                    for chunk in chunks:
-                        await thread.send(chunk)
-                else:
-                    await thread.send(full_content)
+                for chunk in chunks:
+                    await thread.send(chunk)
 
             # Remove loading reaction from original message
             if message_channel_id and message_id:
@@ -713,16 +702,6 @@ class MessageHandler:
         except Exception as e:
             logger.error(f"Error finalizing stream for {buffer_key}: {e}")
 
-        # Clean up buffers
-        if buffer_key in self.bot.streaming_buffers:
-            del self.bot.streaming_buffers[buffer_key]
-        if buffer_key in self.bot.streaming_messages:
-            del self.bot.streaming_messages[buffer_key]
-        if buffer_key in self.bot.stream_backoff:
-            del self.bot.stream_backoff[buffer_key]
-        if hasattr(self.bot, 'stream_last_edit') and buffer_key in self.bot.stream_last_edit:
-            del self.bot.stream_last_edit[buffer_key]
-
     async def _handle_response_complete(self, data: dict):
         """
         Handle complete non-streaming response from TROISE AI.
@@ -0,0 +1,145 @@
+"""Per-response streaming state for the Discord bot."""
+import sys
+sys.path.insert(0, '/shared')
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Callable, List, Optional
+
+import discord
+from bot.utils import StreamSplitter
+from recent_keys import RecentKeys
+import logging_client
+
+logger = logging_client.setup_logger('discord-bot')
+
+
+@dataclass
+class StreamState:
+    """State for one streamed response."""
+    channel_id: int
+    request_id: Optional[str]
+    splitter: StreamSplitter
+    messages: List[discord.Message] = field(default_factory=list)
+    backoff_delay: float = 0.0   # Rate limit backoff (seconds)
+    last_attempt: float = 0.0    # time.time() of the last edit attempt
+    last_edit: float = 0.0       # time.time() of the last successful edit
+    last_activity: float = 0.0   # Registry clock at the last chunk
+
+
+class StreamStateRegistry:
+    """
+    Registry of in-flight streamed responses.
+
+    Every entry is reclaimed on one of: stream end, error or cancellation
+    (release / release_channel), WebSocket disconnect (clear), or going idle
+    for idle_timeout seconds. Entries are kept in activity order, so idle
+    ones are expired from the front as new chunks arrive, and the registry
+    never holds more than max_streams entries.
+
+    Request ids of released streams are remembered for a while, so late
+    chunks of a finished response do not open a new stream.
+    """
+
+    def __init__(
+        self,
+        splitter_factory: Callable[[], StreamSplitter] = StreamSplitter,
+        idle_timeout: float = 600.0,
+        max_streams: int = 500,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize registry.
+
+        Args:
+            splitter_factory: Creates the splitter for a new stream
+            idle_timeout: Seconds without chunks before a stream is dropped
+            max_streams: Streams kept before dropping the least active
+            clock: Monotonic time source (injectable for tests)
+        """
+        self.splitter_factory = splitter_factory
+        self.idle_timeout = idle_timeout
+        self.max_streams = max(1, max_streams)
+        self._clock = clock
+        self._streams: "OrderedDict[str, StreamState]" = OrderedDict()
+        self._finished = RecentKeys(ttl_seconds=idle_timeout, max_entries=max_streams * 20, clock=clock)
+
+    def __len__(self) -> int:
+        return len(self._streams)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._streams
+
+    def get(self, key: str) -> Optional[StreamState]:
+        """Get the state of an in-flight stream."""
+        return self._streams.get(key)
+
+    def open(self, key: str, channel_id: int, request_id: Optional[str]) -> Optional[StreamState]:
+        """
+        Get or create the state for a stream and mark it active.
+
+        Returns:
+            Stream state, or None if the stream already finished
+        """
+        now = self._clock()
+        state = self._streams.get(key)
+        if state is None:
+            if key in self._finished:
+                logger.debug(f"Ignoring chunk for finished stream {key}")
+                return None
+            state = StreamState(
+                channel_id=channel_id,
+                request_id=request_id,
+                splitter=self.splitter_factory(),
+            )
+            self._streams[key] = state
+            logger.debug(f"Started streaming buffer for {key}")
+        else:
+            self._streams.move_to_end(key)
+
+        state.last_activity = now
+        self.expire(now)
+        return state
+
+    def release(self, key: str) -> Optional[StreamState]:
+        """Remove a finished stream, returning its state if it was in flight."""
+        state = self._streams.pop(key, None)
+        if state is not None and state.request_id:
+            # Channel-keyed streams are reused by the next response
+            self._finished.add(key)
+        return state
+
+    def release_channel(self, channel_id: int) -> int:
+        """Remove every stream posting to a channel (e.g. after an error)."""
+        keys = [key for key, state in self._streams.items() if state.channel_id == channel_id]
+        for key in keys:
+            self.release(key)
+        return len(keys)
+
+    def clear(self) -> int:
+        """Remove all streams (e.g. after the WebSocket disconnects)."""
+        count = len(self._streams)
+        self._streams.clear()
+        return count
+
+    def expire(self, now: Optional[float] = None) -> int:
+        """
+        Drop streams idle for longer than idle_timeout, then the least
+        active ones beyond max_streams.
+
+        Returns:
+            Number of streams dropped
+        """
+        now = self._clock() if now is None else now
+        dropped = 0
+        while self._streams:
+            key, state = next(iter(self._streams.items()))
+            if now - state.last_activity < self.idle_timeout and len(self._streams) <= self.max_streams:
+                break
+            self.release(key)
+            dropped += 1
+
+        if dropped:
+            logger.warning(f"Dropped {dropped} stalled stream(s), {len(self._streams)} active")
+        return dropped
@@ -1,5 +1,6 @@
 """Utility functions for Discord bot."""
 from typing import List, Tuple, Optional
+import re
 import discord
 import base64
 import sys
@@ -114,18 +115,31 @@ def track_code_block_state(content: str) -> Tuple[bool, Optional[str]]:
         - is_in_code_block: True if content ends inside an unclosed code block
         - language: The code block language (e.g., 'python', '') or None if not in block
     """
-    import re
+    return _advance_code_block_state(content, False, None)
 
-    # Find all code block markers (``` optionally followed by language)
-    # This pattern matches ``` at the start of a line or after whitespace
-    pattern = re.compile(r'```(\w*)')
-    matches = list(pattern.finditer(content))
 
-    # Track open/close state
-    is_open = False
-    language = None
+# Code block markers (``` optionally followed by language)
+_CODE_FENCE_PATTERN = re.compile(r'```(\w*)')
+_ALPHANUMERIC_PATTERN = re.compile(r'[a-zA-Z0-9]')
 
-    for match in matches:
+
+def _advance_code_block_state(
+    content: str,
+    is_open: bool,
+    language: Optional[str]
+) -> Tuple[bool, Optional[str]]:
+    """
+    Carry code block state across content.
+
+    Args:
+        content: Content following the point the state describes
+        is_open: Whether a code block is open before content
+        language: Language of the open block (None if not in block)
+
+    Returns:
+        Tuple of (is_in_code_block, language) at the end of content
+    """
+    for match in _CODE_FENCE_PATTERN.finditer(content):
         if is_open:
             # This closes the block (``` closes any open block)
             is_open = False
@@ -138,6 +152,48 @@ def track_code_block_state(content: str) -> Tuple[bool, Optional[str]]:
     return (is_open, language)
 
 
+def _find_split_index(content: str, threshold: int) -> int:
+    """
+    Find the best boundary to split content at, near threshold.
+
+    Searches the window from threshold-200 to threshold for, in order: a
+    paragraph break, a line break, a sentence end, a space. Falls back to
+    a hard split at threshold.
+    """
+    search_start = max(0, threshold - 200)
+    search_region = content[search_start:threshold]
+
+    # Priority 1: Paragraph boundary (double newline)
+    para_idx = search_region.rfind('\n\n')
+    if para_idx != -1:
+        return search_start + para_idx + 2  # After the double newline
+
+    # Priority 2: Line boundary (single newline)
+    line_idx = search_region.rfind('\n')
+    if line_idx != -1:
+        return search_start + line_idx + 1  # After the newline
+
+    # Priority 3: Sentence boundary (period followed by space)
+    sentence_idx = search_region.rfind('. ')
+    if sentence_idx != -1:
+        return search_start + sentence_idx + 2  # After the ". "
+
+    # Priority 4: Word boundary (space)
+    space_idx = search_region.rfind(' ')
+    if space_idx != -1:
+        return search_start + space_idx + 1  # After the space
+
+    # Priority 5: Hard split at threshold
+    return threshold
+
+
+def _code_block_markers(is_in_block: bool, language: Optional[str]) -> Tuple[Optional[str], Optional[str]]:
+    """Close/reopen markers for a split made inside a code block."""
+    if not is_in_block:
+        return (None, None)
+    return ('\n```', f'```{language}\n' if language else '```\n')
+
+
 def find_stream_split_point(
     content: str,
     threshold: int = 1800,
@@ -169,49 +225,119 @@ def find_stream_split_point(
     if len(content) < threshold + min_remaining:
         return (0, None, None)  # Not enough content to warrant a split
 
-    # Search window: from threshold-200 to threshold
-    # This gives us room to find natural break points
-    search_start = max(0, threshold - 200)
-    search_end = threshold
-    search_region = content[search_start:search_end]
-
-    split_at = None
-
-    # Priority 1: Paragraph boundary (double newline)
-    para_idx = search_region.rfind('\n\n')
-    if para_idx != -1:
-        split_at = search_start + para_idx + 2  # After the double newline
-    else:
-        # Priority 2: Line boundary (single newline)
-        line_idx = search_region.rfind('\n')
-        if line_idx != -1:
-            split_at = search_start + line_idx + 1  # After the newline
-        else:
-            # Priority 3: Sentence boundary (period followed by space)
-            sentence_idx = search_region.rfind('. ')
-            if sentence_idx != -1:
-                split_at = search_start + sentence_idx + 2  # After the ". "
-            else:
-                # Priority 4: Word boundary (space)
-                space_idx = search_region.rfind(' ')
-                if space_idx != -1:
-                    split_at = search_start + space_idx + 1  # After the space
-                else:
-                    # Priority 5: Hard split at threshold
-                    split_at = threshold
+    split_at = _find_split_index(content, threshold)
 
     # Check code block state at the split point
-    is_in_block, language = track_code_block_state(content[:split_at])
+    suffix, prefix = _code_block_markers(*track_code_block_state(content[:split_at]))
 
-    suffix = None
-    prefix = None
+    return (split_at, suffix, prefix)
 
-    if is_in_block:
-        # Need to close the code block in current message and reopen in next
-        suffix = '\n```'
-        prefix = f'```{language}\n' if language else '```\n'
 
-    return (split_at, suffix, prefix)
+class StreamSplitter:
+    """
+    Incremental splitter for one streamed response.
+
+    Appended text collects in an open tail, the only mutable part of the
+    response. split() finalizes the head of the tail as a Discord-safe
+    segment once the tail is long enough, using the same split points as
+    find_stream_split_point. Code block state at the start of the tail is
+    carried forward, so finalized text is never rescanned and a block that
+    spans several messages is closed and reopened in each of them.
+    """
+
+    def __init__(self, threshold: int = 1800, min_remaining: int = 100, max_length: int = 2000):
+        """
+        Initialize splitter.
+
+        Args:
+            threshold: Target character count for mid-stream splits
+            min_remaining: Minimum content that must remain after a split
+            max_length: Maximum length per final chunk (Discord limit: 2000)
+        """
+        self.threshold = threshold
+        self.min_remaining = min_remaining
+        self.max_length = max_length
+
+        self.total_length = 0       # Characters appended so far
+        self.committed_length = 0   # Characters in finalized segments
+        self.segment_count = 0
+
+        self._parts: List[str] = []
+        self._pending = ''          # Tail text (without reopen prefix), joined lazily
+        self._pending_length = 0
+        self._in_block = False      # Code block state at the start of the tail
+        self._language: Optional[str] = None
+        self._prefix = ''
+        self._meaningful = False
+
+    def append(self, text: str) -> None:
+        """Append streamed text to the open tail."""
+        if not text:
+            return
+        self._parts.append(text)
+        self._pending_length += len(text)
+        self.total_length += len(text)
+        if not self._meaningful and _ALPHANUMERIC_PATTERN.search(text):
+            self._meaningful = True
+
+    @property
+    def pending(self) -> str:
+        """Tail text not yet in a finalized segment."""
+        if self._parts:
+            self._pending += ''.join(self._parts)
+            self._parts = []
+        return self._pending
+
+    @property
+    def tail(self) -> str:
+        """Open tail as displayed, including any reopened code block."""
+        return self._prefix + self.pending
+
+    @property
+    def has_meaningful_content(self) -> bool:
+        """Whether the pending text contains an alphanumeric character."""
+        return self._meaningful
+
+    def split(self) -> Optional[str]:
+        """
+        Finalize the head of the tail if it has grown past the threshold.
+
+        Returns:
+            The finalized segment (with code block close/reopen markers),
+            or None if the tail is not ready to split
+        """
+        if self._pending_length < self.threshold + self.min_remaining:
+            return None
+
+        pending = self.pending
+        split_at = _find_split_index(pending, self.threshold)
+        if split_at < self.min_remaining:
+            return None
+
+        head = pending[:split_at]
+        is_in_block, language = _advance_code_block_state(head, self._in_block, self._language)
+        suffix, prefix = _code_block_markers(is_in_block, language)
+        segment = self._prefix + head + (suffix or '')
+
+        self._pending = pending[split_at:]
+        self._pending_length = len(self._pending)
+        self._in_block, self._language = is_in_block, language
+        self._prefix = prefix or ''
+        self._meaningful = bool(_ALPHANUMERIC_PATTERN.search(self._pending))
+        self.committed_length += split_at
+        self.segment_count += 1
+        return segment
+
+    def finish(self) -> List[str]:
+        """
+        Final chunks for the open tail, split to max_length if needed.
+
+        Returns:
+            List of message chunks (empty if nothing is pending)
+        """
+        if not self.pending:
+            return []
+        return split_message(self.tail, self.max_length)
 
 
 def validate_attachment(attachment: discord.Attachment) -> bool:
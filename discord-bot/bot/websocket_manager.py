@@ -141,12 +141,14 @@ class WebSocketManager:
             'request_id': request_id
         }))
 
-    async def listen_for_responses(self, callback: Callable):
+    async def listen_for_responses(self, callback: Callable, on_disconnect: Optional[Callable] = None):
         """
         Listen for responses from TROISE AI.
 
         Args:
             callback: Async function to call with received messages
+            on_disconnect: Optional function called when the connection drops
+                (state tied to the old session should be released)
         """
         current_delay = self.reconnect_delay  # Track current backoff delay
 
@@ -169,6 +171,12 @@ class WebSocketManager:
                 logger.warning("❌ WebSocket connection closed, reconnecting...")
                 self.connected = False
 
+                if on_disconnect:
+                    try:
+                        on_disconnect()
+                    except Exception as e:
+                        logger.error(f"❌ Disconnect handler failed: {e}")
+
                 # Actually reconnect instead of breaking
                 if self.bot_id:
                     try:
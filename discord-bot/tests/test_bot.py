@@ -2,7 +2,7 @@
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 
-from bot.utils import split_message, track_code_block_state, find_stream_split_point
+from bot.utils import split_message, track_code_block_state, find_stream_split_point, StreamSplitter
 
 
 def test_split_message_no_split():
@@ -262,3 +262,183 @@ def test_find_stream_split_point_hard_split():
     assert split_at == 1800  # Hard split at threshold
     assert suffix is None
     assert prefix is None
+
+
+# Tests for StreamSplitter
+def _recorded_responses():
+    """Long responses shaped like streamed model output."""
+    prose = "\n\n".join(
+        f"Paragraph {i}. " + "The quick brown fox jumps over the lazy dog. " * (i % 7 + 3)
+        for i in range(40)
+    )
+    code = "Here is the module:\n\n```python\n" + "".join(
+        f"def handler_{i}(event):\n    return process(event, {i})\n\n" for i in range(150)
+    ) + "```\n\nAnd a shell example:\n```\n" + "echo done\n" * 60 + "```\nThat's all."
+    unbroken = "A" * 5000
+    return [prose, code, unbroken]
+
+
+def _stream(splitter, content, chunk_size):
+    """Feed content in chunks, splitting after each one like the handler."""
+    segments = []
+    for i in range(0, len(content), chunk_size):
+        splitter.append(content[i:i + chunk_size])
+        segment = splitter.split()
+        if segment is not None:
+            segments.append(segment)
+    return segments
+
+
+def _reference_split_points(content, chunk_size):
+    """Split offsets of the previous rescanning implementation."""
+    points, committed = [], 0
+    for end in range(chunk_size, len(content) + chunk_size, chunk_size):
+        pending = content[committed:min(end, len(content))]
+        if len(pending) >= 1800:
+            split_at, _, _ = find_stream_split_point(pending, threshold=1800, min_remaining=100)
+            if split_at >= 100:
+                committed += split_at
+                points.append(committed)
+    return points
+
+
+@pytest.mark.parametrize("chunk_size", [7, 64, 500])
+def test_stream_splitter_matches_reference_split_points(chunk_size):
+    """Test streaming splits land where the rescanning splitter put them."""
+    for content in _recorded_responses():
+        splitter = StreamSplitter()
+        points = []
+        for i in range(0, len(content), chunk_size):
+            splitter.append(content[i:i + chunk_size])
+            if splitter.split() is not None:
+                points.append(splitter.committed_length)
+
+        assert points == _reference_split_points(content, chunk_size)
+        assert splitter.pending == content[splitter.committed_length:]
+
+
+def test_stream_splitter_prose_output_identical():
+    """Test plain text segments are exactly the committed slices."""
+    content = _recorded_responses()[0]
+    splitter = StreamSplitter()
+    segments = _stream(splitter, content, 40)
+
+    assert len(segments) > 2
+    assert "".join(segments) + splitter.tail == content
+    assert splitter.finish() == split_message(splitter.tail)
+
+
+def test_stream_splitter_carries_code_block_across_messages():
+    """Test a long code block is closed and reopened in every message."""
+    content = _recorded_responses()[1]
+    splitter = StreamSplitter()
+    messages = _stream(splitter, content, 25) + splitter.finish()
+
+    assert len(messages) >= 4
+    for message in messages:
+        assert len(message) <= 2000
+        assert track_code_block_state(message) == (False, None)
+    assert messages[1].startswith("```python\n")
+    assert messages[2].startswith("```python\n")
+
+    # Removing the added markers restores the original text
+    restored = [m[len("```python\n"):] if i else m for i, m in enumerate(messages)]
+    restored = [m[:-len("\n```")] for m in restored[:-1]] + restored[-1:]
+    assert "".join(restored) == content
+
+
+def test_stream_splitter_meaningful_content():
+    """Test meaningful content tracking over the open tail."""
+    splitter = StreamSplitter()
+    splitter.append("  \n")
+    assert not splitter.has_meaningful_content
+    splitter.append("**ok")
+    assert splitter.has_meaningful_content
+    assert splitter.finish() == ["  \n**ok"]
+    assert StreamSplitter().finish() == []
+
+
+# Tests for RecentKeys and StreamStateRegistry
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_recent_keys_detects_duplicates_within_window():
+    """Test duplicates are detected until the key expires."""
+    from recent_keys import RecentKeys
+
+    clock = FakeClock()
+    keys = RecentKeys(ttl_seconds=60, max_entries=10, clock=clock)
+
+    assert keys.seen("msg-1") is False
+    assert keys.seen("msg-1") is True
+    clock.now += 61
+    assert "msg-1" not in keys
+    assert keys.seen("msg-1") is False
+
+
+def test_recent_keys_memory_stays_bounded():
+    """Test a million distinct keys never grow past max_entries."""
+    from recent_keys import RecentKeys
+
+    clock = FakeClock()
+    keys = RecentKeys(ttl_seconds=3600, max_entries=1000, clock=clock)
+
+    for i in range(1_000_000):
+        keys.seen(i)
+        clock.now += 0.001
+        assert len(keys) <= 1000
+
+    assert keys.seen(999_999) is True
+    assert keys.seen(0) is False
+    assert keys.get_stats()['evicted'] >= 998_000
+
+
+def test_stream_registry_reclaims_on_release_and_timeout():
+    """Test streams are reclaimed on completion and when idle."""
+    from bot.stream_state import StreamStateRegistry
+
+    clock = FakeClock()
+    streams = StreamStateRegistry(idle_timeout=600, max_streams=100, clock=clock)
+
+    done = streams.open("req-1", 1, "req-1")
+    streams.open("req-2", 2, "req-2")
+    assert streams.release("req-1") is done
+    assert streams.open("req-1", 1, "req-1") is None  # Late chunk of finished stream
+
+    clock.now += 601
+    streams.open("req-3", 3, "req-3")
+    assert "req-2" not in streams
+    assert len(streams) == 1
+
+    # Channel-keyed streams can be reused by the next response
+    streams.open("42", 42, None)
+    streams.release("42")
+    assert streams.open("42", 42, None) is not None
+
+
+def test_stream_registry_bounded_under_abandoned_streams():
+    """Test abandoned streams never grow the registry past max_streams."""
+    from bot.stream_state import StreamStateRegistry
+
+    clock = FakeClock()
+    streams = StreamStateRegistry(idle_timeout=600, max_streams=100, clock=clock)
+
+    for i in range(20_000):
+        state = streams.open(f"req-{i}", i % 7, f"req-{i}")
+        state.splitter.append("token ")
+        if i % 3:
+            streams.release(f"req-{i}")  # Others error out without stream_end
+        clock.now += 0.01
+        assert len(streams) <= 100
+
+    assert streams.release_channel(0) > 0
+    assert all(state.channel_id != 0 for state in streams._streams.values())
+    streams.clear()
+    assert len(streams) == 0
@@ -352,6 +352,39 @@ async def get_queue_stats(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get("/orchestrator/timings")
+async def get_orchestrator_timings(
+    _: bool = Depends(verify_internal_api_key)
+):
+    """
+    Get per-stage request latency and background work statistics.
+
+    Returns:
+        dict: Average ms per orchestrator stage, user cache hit rate,
+              background summarization and token usage flush counters
+    """
+    try:
+        from app.dependencies import (
+            get_user_storage,
+            get_summarization_service,
+            get_usage_accumulator
+        )
+
+        user_storage = get_user_storage()
+        usage_accumulator = get_usage_accumulator()
+
+        return {
+            "stages": get_orchestrator().get_stage_timings(),
+            "user_cache": user_storage.get_cache_stats(),
+            "summarization": get_summarization_service().get_stats(),
+            "token_usage": usage_accumulator.get_stats() if usage_accumulator else None
+        }
+
+    except Exception as e:
+        logger.error(f"Failed to get orchestrator timings: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @router.post("/queue/purge")
 async def purge_queue(
     _: bool = Depends(verify_internal_api_key)
@@ -335,10 +335,42 @@ async def handle_summarize_request(data: Dict, storage, websocket: WebSocket):
         return
 
     try:
-        # Get all messages in thread
-        messages = await storage.get_conversation_messages(conversation_id)
+        # Get summarization service
+        summarization_service = get_summarization_service()
 
-        if not messages:
+        async def summarize_thread():
+            # Get all messages in thread
+            messages = await storage.get_conversation_messages(conversation_id)
+            if not messages:
+                return None, []
+
+            # Generate summary
+            logger.info(f"📝 Generating summary for thread {conversation_id} ({len(messages)} messages)")
+            summary = await summarization_service.generate_summary(messages)
+
+            # Delete all old messages
+            timestamps = [msg['message_timestamp'] for msg in messages]
+            await storage.delete_messages(conversation_id, timestamps)
+
+            # Add summary as new message
+            import time
+
+            await storage.add_message(
+                conversation_id=conversation_id,
+                message_id=f"summary_{int(time.time())}",
+                role='system',
+                content=f"[Previous conversation summary]\n{summary}",
+                token_count=len(summary) // 4,  # Rough estimate
+                user_id=user_id,
+                model_used='summary',
+                is_summary=True
+            )
+            return summary, timestamps
+
+        # Same per-conversation slot as background summaries (waits for a running one)
+        summary, timestamps = await summarization_service.run_exclusive(conversation_id, summarize_thread)
+
+        if summary is None:
             logger.info(f"Thread {conversation_id} has no messages to summarize")
             await websocket.send_json({
                 'type': 'summarize_response',
@@ -348,33 +380,6 @@ async def handle_summarize_request(data: Dict, storage, websocket: WebSocket):
             })
             return
 
-        # Get summarization service
-        summarization_service = get_summarization_service()
-
-        # Generate summary
-        logger.info(f"📝 Generating summary for thread {conversation_id} ({len(messages)} messages)")
-        summary = await summarization_service.generate_summary(messages)
-
-        # Delete all old messages
-        timestamps = [msg['message_timestamp'] for msg in messages]
-        await storage.delete_messages(conversation_id, timestamps)
-
-        # Add summary as new message
-        import time
-        from datetime import datetime
-
-        summary_timestamp = datetime.utcnow().isoformat()
-        await storage.add_message(
-            conversation_id=conversation_id,
-            message_id=f"summary_{int(time.time())}",
-            role='system',
-            content=f"[Previous conversation summary]\n{summary}",
-            token_count=len(summary) // 4,  # Rough estimate
-            user_id=user_id,
-            model_used='summary',
-            is_summary=True
-        )
-
         logger.info(f"📝 Summarized thread {conversation_id}: {len(timestamps)} messages → summary (user: {user_id})")
 
         # Send summary back to user
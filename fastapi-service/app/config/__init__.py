@@ -301,6 +301,15 @@ class Settings(BaseSettings):
     FREE_TIER_WEEKLY_BUDGET: int = 100000
     ADMIN_TIER_WEEKLY_BUDGET: int = 500000
     DISABLE_TOKEN_BUDGET: bool = True  # Set to False to enforce token budgets
+    BACKGROUND_SUMMARIZATION: bool = True  # Fold new messages into the summary off the request path
+    TOKEN_USAGE_WRITE_BEHIND: bool = True  # Buffer usage in-process, flush as batched atomic ADDs
+    TOKEN_USAGE_FLUSH_INTERVAL: float = 5.0  # Seconds between usage flushes
+    TOKEN_USAGE_MAX_UNFLUSHED: int = 50000  # Unflushed tokens that force a flush (bounds loss on crash)
+    TOKEN_COUNT_CACHE_SIZE: int = 2048  # Memoized tiktoken counts (0 = disabled)
+
+    # User Record Cache (UserStorage)
+    USER_CACHE_TTL_SECONDS: float = 30.0  # Short TTL; local writes invalidate immediately (0 = disabled)
+    USER_CACHE_MAX_ENTRIES: int = 1000
 
     # Discord
     DISCORD_MESSAGE_MAX_LENGTH: int = 2000
@@ -348,6 +357,7 @@ class Settings(BaseSettings):
     # Embedding & RAG Settings
     EMBEDDING_DIMENSION: int = 1024  # Dimension of embedding vectors (qwen3-embedding:4b)
     VECTOR_CACHE_TTL_HOURS: int = 2  # Cache duration for webpage chunks (hours)
+    VECTOR_EMBEDDING_PRECISION: str = "float16"  # Stored embedding precision: float32 | float16 | int8
     VECTOR_TOP_K: int = 7  # Number of most similar chunks to retrieve (7 × 1K = ~7K tokens per fetch)
     CHUNK_SIZE: int = 1000  # Tokens per chunk (LangChain)
     CHUNK_OVERLAP: int = 500  # Token overlap between chunks (50% for better context preservation)
@@ -9,6 +9,7 @@ from app.implementations.websocket_manager import WebSocketManager
 from app.services.context_manager import ContextManager
 from app.services.token_tracker import TokenTracker
 from app.services.summarization_service import SummarizationService
+from app.services.usage_accumulator import UsageAccumulator
 from app.services.router_service import RouterService
 from app.services.orchestrator import Orchestrator
 from app.services.queue_worker import QueueWorker
@@ -23,6 +24,9 @@ _queue = None
 _llm = None
 _ws_manager = None
 _router_service = None
+_summarization_service = None
+_token_tracker = None
+_usage_accumulator = None
 _orchestrator = None
 _queue_worker = None
 _ocr_service = None
@@ -126,26 +130,57 @@ def get_context_manager():
     return ContextManager(storage=get_storage())
 
 
+def get_usage_accumulator():
+    """
+    Get write-behind token usage accumulator (singleton).
+
+    Returns:
+        UsageAccumulator instance, or None if TOKEN_USAGE_WRITE_BEHIND is off
+    """
+    global _usage_accumulator
+    if _usage_accumulator is None and settings.TOKEN_USAGE_WRITE_BEHIND:
+        _usage_accumulator = UsageAccumulator(
+            storage=get_user_storage(),
+            flush_interval=settings.TOKEN_USAGE_FLUSH_INTERVAL,
+            max_unflushed_tokens=settings.TOKEN_USAGE_MAX_UNFLUSHED
+        )
+    return _usage_accumulator
+
+
 def get_token_tracker():
     """
-    Get token tracker.
+    Get token tracker (singleton).
 
     Note: Now uses UserStorage for token tracking (not DynamoDBStorage).
+    Singleton so buffered usage and memoized counts are shared.
 
     Returns:
         TokenTracker instance
     """
-    return TokenTracker(storage=get_user_storage(), llm=get_llm())
+    global _token_tracker
+    if _token_tracker is None:
+        _token_tracker = TokenTracker(
+            storage=get_user_storage(),
+            llm=get_llm(),
+            accumulator=get_usage_accumulator(),
+            count_cache_size=settings.TOKEN_COUNT_CACHE_SIZE
+        )
+    return _token_tracker
 
 
 def get_summarization_service():
     """
-    Get summarization service.
+    Get summarization service (singleton).
+
+    Singleton so background summaries are deduplicated per conversation.
 
     Returns:
         SummarizationService instance
     """
-    return SummarizationService(storage=get_storage(), llm=get_llm())
+    global _summarization_service
+    if _summarization_service is None:
+        _summarization_service = SummarizationService(storage=get_storage(), llm=get_llm())
+    return _summarization_service
 
 
 def get_router_service():
@@ -145,9 +145,15 @@ class ConversationStorage:
         user_id: str,
         model_used: str,
         is_summary: bool = False,
-        generation_time: Optional[float] = None
+        generation_time: Optional[float] = None,
+        message_timestamp: Optional[str] = None
     ) -> None:
-        """Add a message to a conversation."""
+        """
+        Add a message to a conversation.
+
+        message_timestamp defaults to now; passing an existing timestamp
+        replaces that message in place (used to position summaries).
+        """
         # Truncate content if it exceeds DynamoDB's size limit
         content_bytes = content.encode('utf-8')
         if len(content_bytes) > MAX_MESSAGE_SIZE:
@@ -159,7 +165,7 @@ class ConversationStorage:
             table = await dynamodb.Table('conversations')
             item = {
                 'conversation_id': conversation_id,
-                'message_timestamp': datetime.now(timezone.utc).isoformat(),
+                'message_timestamp': message_timestamp or datetime.now(timezone.utc).isoformat(),
                 'message_id': message_id,
                 'role': role,
                 'content': content,
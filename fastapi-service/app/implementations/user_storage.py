@@ -1,4 +1,7 @@
 """User storage implementation for preferences and token tracking."""
+import asyncio
+import time
+from collections import OrderedDict
 import aioboto3
 from datetime import datetime, timezone
 from typing import Optional, Dict
@@ -22,6 +25,95 @@ class UserStorage:
             'aws_secret_access_key': settings.DYNAMODB_SECRET_KEY
         }
 
+        # User record cache: preferences and tokens come from the same row,
+        # so both reads share one cached item. Writes through this class
+        # invalidate; the short TTL bounds staleness from other writers
+        # (admin-service grants, weekly resets).
+        self._cache_ttl = settings.USER_CACHE_TTL_SECONDS
+        self._cache_max_entries = settings.USER_CACHE_MAX_ENTRIES
+        self._user_cache: "OrderedDict[str, tuple]" = OrderedDict()  # user_id -> (expires_at, item)
+        self._pending_reads: Dict[str, asyncio.Future] = {}
+        self._write_version = 0  # Bumped on every invalidation
+        self._cache_hits = 0
+        self._cache_misses = 0
+
+    async def _get_user_item(self, user_id: str, use_cache: bool = True) -> Optional[Dict]:
+        """
+        Get the raw users row, served from the TTL cache when fresh.
+
+        Concurrent reads of the same user (e.g., preferences and tokens
+        fetched in parallel) share a single get_item.
+
+        Args:
+            user_id: User to read
+            use_cache: False to force a DynamoDB read (read-modify-write paths)
+        """
+        if use_cache and self._cache_ttl > 0:
+            entry = self._user_cache.get(user_id)
+            if entry and time.monotonic() < entry[0]:
+                self._user_cache.move_to_end(user_id)
+                self._cache_hits += 1
+                return entry[1]
+
+            pending = self._pending_reads.get(user_id)
+            if pending is not None:
+                self._cache_hits += 1
+                try:
+                    return await asyncio.shield(pending)
+                except asyncio.CancelledError:
+                    if not pending.cancelled():
+                        raise
+                    # The leading read was cancelled, not us - read ourselves
+                    return await self._get_user_item(user_id, use_cache)
+
+        self._cache_misses += 1
+        version = self._write_version
+        future = asyncio.get_running_loop().create_future()
+        if use_cache:
+            self._pending_reads[user_id] = future
+        try:
+            async with self.session.resource('dynamodb', **self._resource_config) as dynamodb:
+                table = await dynamodb.Table('users')
+                response = await table.get_item(Key={'user_id': user_id})
+                user = response.get('Item')
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # Mark retrieved (no "never retrieved" warning)
+            raise
+        finally:
+            if self._pending_reads.get(user_id) is future:
+                del self._pending_reads[user_id]
+
+        # Only cache existing users, and never a row read while a write landed
+        if user and self._cache_ttl > 0 and version == self._write_version:
+            self._user_cache[user_id] = (time.monotonic() + self._cache_ttl, user)
+            self._user_cache.move_to_end(user_id)
+            while len(self._user_cache) > self._cache_max_entries:
+                self._user_cache.popitem(last=False)
+        future.set_result(user)
+        return user
+
+    def invalidate_user(self, user_id: str) -> None:
+        """Drop the cached row for a user (called after every write)."""
+        self._write_version += 1
+        self._user_cache.pop(user_id, None)
+        # Later readers must not join a read that may return the old row
+        self._pending_reads.pop(user_id, None)
+
+    def get_cache_stats(self) -> Dict:
+        """Get user record cache statistics."""
+        total = self._cache_hits + self._cache_misses
+        return {
+            'entries': len(self._user_cache),
+            'ttl_seconds': self._cache_ttl,
+            'hits': self._cache_hits,
+            'misses': self._cache_misses,
+            'hit_rate': round(self._cache_hits / total, 3) if total else 0.0
+        }
+
     async def get_user_preferences(self, user_id: str) -> Optional[Dict]:
         """
         Get user preferences including model, temperature, thinking_enabled.
@@ -30,25 +122,22 @@ class UserStorage:
             Dict with keys: preferred_model, temperature, thinking_enabled, base_prompt
             None if user doesn't exist
         """
-        async with self.session.resource('dynamodb', **self._resource_config) as dynamodb:
-            table = await dynamodb.Table('users')
-            response = await table.get_item(Key={'user_id': user_id})
-            user = response.get('Item')
-
-            if not user:
-                return None
-
-            # Extract only preference-related fields
-            return {
-                'preferred_model': user.get('preferred_model'),
-                'temperature': user.get('temperature'),
-                'thinking_enabled': user.get('thinking_enabled'),  # None, True, or False
-                'base_prompt': user.get('base_prompt'),
-                'user_tier': user.get('user_tier'),
-                'discord_username': user.get('discord_username'),
-                'auto_summarize_threshold': user.get('auto_summarize_threshold'),
-                'notify_on_summarization': user.get('notify_on_summarization', True)
-            }
+        user = await self._get_user_item(user_id)
+
+        if not user:
+            return None
+
+        # Extract only preference-related fields
+        return {
+            'preferred_model': user.get('preferred_model'),
+            'temperature': user.get('temperature'),
+            'thinking_enabled': user.get('thinking_enabled'),  # None, True, or False
+            'base_prompt': user.get('base_prompt'),
+            'user_tier': user.get('user_tier'),
+            'discord_username': user.get('discord_username'),
+            'auto_summarize_threshold': user.get('auto_summarize_threshold'),
+            'notify_on_summarization': user.get('notify_on_summarization', True)
+        }
 
     async def create_user(
         self,
@@ -89,6 +178,7 @@ class UserStorage:
                 'created_at': datetime.now(timezone.utc).isoformat(),
                 'last_active': datetime.now(timezone.utc).isoformat()
             })
+        self.invalidate_user(user_id)
 
     async def update_temperature(
         self,
@@ -115,6 +205,7 @@ class UserStorage:
                     ':now': datetime.now(timezone.utc).isoformat()
                 }
             )
+        self.invalidate_user(user_id)
 
     async def update_thinking(
         self,
@@ -137,6 +228,7 @@ class UserStorage:
                     ':now': datetime.now(timezone.utc).isoformat()
                 }
             )
+        self.invalidate_user(user_id)
 
     async def update_model(
         self,
@@ -159,6 +251,7 @@ class UserStorage:
                     ':now': datetime.now(timezone.utc).isoformat()
                 }
             )
+        self.invalidate_user(user_id)
 
     async def reset_preferences(self, user_id: str) -> None:
         """
@@ -184,6 +277,7 @@ class UserStorage:
                     ':now': datetime.now(timezone.utc).isoformat()
                 }
             )
+        self.invalidate_user(user_id)
 
     # ============================================================================
     # Token Tracking Methods (ITokenTrackingStorage)
@@ -198,25 +292,25 @@ class UserStorage:
                            tokens_remaining, bonus_tokens
             None if user doesn't exist
         """
-        async with self.session.resource('dynamodb', **self._resource_config) as dynamodb:
-            table = await dynamodb.Table('users')
-            response = await table.get_item(Key={'user_id': user_id})
-            user = response.get('Item')
-
-            if not user:
-                return None
-
-            # Return only token-related fields
-            return {
-                'weekly_token_budget': int(user.get('weekly_token_budget', 0)),
-                'tokens_used_this_week': int(user.get('tokens_used_this_week', 0)),
-                'tokens_remaining': int(user.get('tokens_remaining', 0)),
-                'bonus_tokens': int(user.get('bonus_tokens', 0))
-            }
+        return self._token_fields(await self._get_user_item(user_id))
+
+    @staticmethod
+    def _token_fields(user: Optional[Dict]) -> Optional[Dict]:
+        """Extract token-related fields from a users row."""
+        if not user:
+            return None
+
+        return {
+            'weekly_token_budget': int(user.get('weekly_token_budget', 0)),
+            'tokens_used_this_week': int(user.get('tokens_used_this_week', 0)),
+            'tokens_remaining': int(user.get('tokens_remaining', 0)),
+            'bonus_tokens': int(user.get('bonus_tokens', 0))
+        }
 
     async def update_user_tokens(self, user_id: str, tokens_used: int) -> None:
         """Update user's token usage."""
-        tokens = await self.get_user_tokens(user_id)
+        # Read-modify-write: always start from the stored row, never the cache
+        tokens = self._token_fields(await self._get_user_item(user_id, use_cache=False))
         if not tokens:
             return
 
@@ -240,16 +334,69 @@ class UserStorage:
                     ':now': datetime.now(timezone.utc).isoformat()
                 }
             )
+        self.invalidate_user(user_id)
+
+    async def add_token_usage_batch(self, deltas: Dict[str, int]) -> Dict[str, int]:
+        """
+        Apply accumulated token usage for many users with atomic ADD updates.
+
+        Uses one DynamoDB resource for the whole batch and issues the
+        per-user updates concurrently. ADD is commutative, so concurrent
+        flushes from several workers never lose usage.
+
+        Args:
+            deltas: user_id -> tokens used since the last flush
+
+        Returns:
+            Deltas that failed to apply (to be retried), empty on success
+        """
+        failed: Dict[str, int] = {}
+        now = datetime.now(timezone.utc).isoformat()
+
+        async with self.session.resource('dynamodb', **self._resource_config) as dynamodb:
+            table = await dynamodb.Table('users')
+
+            async def apply(user_id: str, tokens_used: int) -> None:
+                try:
+                    await table.update_item(
+                        Key={'user_id': user_id},
+                        UpdateExpression='ADD tokens_used_this_week :used, '
+                                       'tokens_remaining :spent '
+                                       'SET last_active = :now',
+                        ConditionExpression='attribute_exists(user_id)',
+                        ExpressionAttributeValues={
+                            ':used': tokens_used,
+                            ':spent': -tokens_used,
+                            ':now': now
+                        }
+                    )
+                except Exception as e:
+                    if 'ConditionalCheckFailed' in type(e).__name__ or 'ConditionalCheckFailed' in str(e):
+                        return  # User deleted since the request - nothing to charge
+                    failed[user_id] = tokens_used
+
+            await asyncio.gather(*(apply(uid, n) for uid, n in deltas.items()))
+
+        for user_id in deltas:
+            if user_id not in failed:
+                self.invalidate_user(user_id)
+        return failed
 
     async def grant_bonus_tokens(self, user_id: str, amount: int) -> None:
-        """Grant bonus tokens to a user."""
+        """
+        Grant bonus tokens to a user.
+
+        The bonus is added to tokens_remaining in the same atomic ADD, since
+        usage flushes only ever decrement it.
+        """
         async with self.session.resource('dynamodb', **self._resource_config) as dynamodb:
             table = await dynamodb.Table('users')
             await table.update_item(
                 Key={'user_id': user_id},
-                UpdateExpression='SET bonus_tokens = bonus_tokens + :amount',
+                UpdateExpression='ADD bonus_tokens :amount, tokens_remaining :amount',
                 ExpressionAttributeValues={':amount': amount}
             )
+        self.invalidate_user(user_id)
 
     async def reset_weekly_tokens(self) -> None:
         """Reset weekly token counters for all users."""
@@ -277,6 +424,9 @@ class UserStorage:
                     }
                 )
 
+        self._write_version += 1
+        self._user_cache.clear()
+
     def _get_week_start(self) -> str:
         """Get Monday of current week (for token tracking initialization)."""
         from datetime import timedelta
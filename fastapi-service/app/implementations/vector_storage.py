@@ -1,14 +1,16 @@
 """DynamoDB vector storage for webpage chunks with embeddings."""
+import asyncio
 import hashlib
 import math
 from datetime import datetime, timedelta
-from decimal import Decimal
-from typing import List, Dict, Optional
+from typing import Any, List, Dict, Optional, Set, Tuple
 import aioboto3
+import numpy as np
 from botocore.exceptions import ClientError
 
 from app.interfaces.storage import VectorChunk, IVectorStorage
 from app.config import settings
+from app.utils.embedding_codec import DTYPE_ATTRIBUTE, PRECISIONS, decode_embedding, encode_embedding
 import logging_client
 
 logger = logging_client.setup_logger('vector_storage')
@@ -23,18 +25,28 @@ class DynamoDBVectorStorage:
     Note: DynamoDB doesn't support native vector similarity search.
     Uses client-side cosine similarity computation.
     For production scale, consider Pinecone/Weaviate/pgvector.
+
+    Embeddings are stored as compact binary (see app.utils.embedding_codec)
+    in VECTOR_EMBEDDING_PRECISION. Chunks written as Decimal lists
+    ('embedding_vector') are still readable and are rewritten in the
+    background after a read returns.
     """
 
     def __init__(self):
         """Initialize DynamoDB vector storage."""
         self.session = aioboto3.Session()
         self.table_name = 'webpage_chunks'
+        self.precision = settings.VECTOR_EMBEDDING_PRECISION
+        if self.precision not in PRECISIONS:
+            raise ValueError(f"Invalid VECTOR_EMBEDDING_PRECISION: {self.precision}")
         self._dynamodb_config = {
             'region_name': settings.DYNAMODB_REGION,
             'endpoint_url': settings.DYNAMODB_ENDPOINT,
             'aws_access_key_id': settings.DYNAMODB_ACCESS_KEY,
             'aws_secret_access_key': settings.DYNAMODB_SECRET_KEY
         }
+        self._migrating: Set[Tuple[str, str]] = set()  # (url_hash, chunk_id) queued for rewrite
+        self._migration_tasks: Set[asyncio.Task] = set()
 
         logger.info(
             f"✅ DynamoDBVectorStorage initialized (table={self.table_name})"
@@ -81,40 +93,115 @@ class DynamoDBVectorStorage:
         return dot_product / (magnitude1 * magnitude2)
 
     @staticmethod
-    def _convert_float_to_decimal(obj):
-        """Recursively convert floats to Decimal for DynamoDB compatibility.
+    def _item_vector(item: Dict[str, Any]) -> Optional[np.ndarray]:
+        """Decode a chunk's embedding into a float32 array.
 
         Args:
-            obj: Object to convert (can be dict, list, float, or other type)
+            item: DynamoDB item (binary 'embedding' or legacy 'embedding_vector')
 
         Returns:
-            Converted object with Decimals instead of floats
+            Embedding array, or None if the item has no embedding
         """
-        if isinstance(obj, list):
-            return [DynamoDBVectorStorage._convert_float_to_decimal(item) for item in obj]
-        elif isinstance(obj, dict):
-            return {k: DynamoDBVectorStorage._convert_float_to_decimal(v) for k, v in obj.items()}
-        elif isinstance(obj, float):
-            return Decimal(str(obj))
-        return obj
+        if item.get('embedding'):
+            return decode_embedding(item['embedding'], item.get(DTYPE_ATTRIBUTE, 'float32'))
+        if item.get('embedding_vector'):
+            return np.array([float(v) for v in item['embedding_vector']], dtype=np.float32)
+        return None
+
+    def _to_vector_chunk(self, item: Dict[str, Any], vector: Optional[np.ndarray]) -> VectorChunk:
+        """Build a VectorChunk from a DynamoDB item and its decoded embedding."""
+        return VectorChunk(
+            chunk_id=item['chunk_id'],
+            chunk_text=item['chunk_text'],
+            embedding_vector=vector.tolist() if vector is not None else [],
+            chunk_index=item['chunk_index'],
+            token_count=item['token_count'],
+            source_url=item['source_url'],
+            created_at=item['created_at'],
+            url_hash=item['url_hash']
+        )
 
-    @staticmethod
-    def _convert_decimal_to_float(obj):
-        """Recursively convert Decimal to float when reading from DynamoDB.
+    async def _migrate_legacy_items(self, table, items: List[Dict[str, Any]], limit: int = 100) -> int:
+        """Rewrite chunks stored as Decimal lists into the binary format.
+
+        Best effort: updates are conditional on the chunk still holding
+        its legacy Decimal list, so a chunk deleted or re-stored by a
+        concurrent re-index is left alone. Failures leave the chunk for a
+        later read.
 
         Args:
-            obj: Object to convert (can be dict, list, Decimal, or other type)
+            table: DynamoDB table resource
+            items: Items as read from the table
+            limit: Maximum chunks to rewrite in this call
 
         Returns:
-            Converted object with floats instead of Decimals
+            Number of chunks rewritten
         """
-        if isinstance(obj, list):
-            return [DynamoDBVectorStorage._convert_decimal_to_float(item) for item in obj]
-        elif isinstance(obj, dict):
-            return {k: DynamoDBVectorStorage._convert_decimal_to_float(v) for k, v in obj.items()}
-        elif isinstance(obj, Decimal):
-            return float(obj)
-        return obj
+        legacy = [
+            item for item in items
+            if item.get('embedding_vector') and not item.get('embedding')
+        ][:limit]
+
+        migrated = 0
+        for item in legacy:
+            try:
+                await table.update_item(
+                    Key={'url_hash': item['url_hash'], 'chunk_id': item['chunk_id']},
+                    UpdateExpression='SET embedding = :embedding, #dtype = :dtype REMOVE embedding_vector',
+                    ConditionExpression='attribute_exists(embedding_vector) AND attribute_not_exists(#dtype)',
+                    ExpressionAttributeNames={'#dtype': DTYPE_ATTRIBUTE},
+                    ExpressionAttributeValues={
+                        ':embedding': encode_embedding(self._item_vector(item), self.precision),
+                        ':dtype': self.precision,
+                    },
+                )
+                migrated += 1
+            except ClientError as e:
+                logger.debug(f"Embedding migration skipped for chunk {item.get('chunk_id')}: {e}")
+
+        if migrated:
+            logger.info(f"🔄 Migrated {migrated} chunk embeddings to {self.precision}")
+        return migrated
+
+    def _schedule_migration(self, items: List[Dict[str, Any]], limit: int = 100) -> Optional[asyncio.Task]:
+        """Migrate legacy chunks in a background task, off the read path.
+
+        The task opens its own DynamoDB resource; chunks already queued
+        are skipped.
+
+        Args:
+            items: Items as read from the table
+            limit: Maximum chunks to rewrite in this batch
+
+        Returns:
+            The background task, or None if nothing needed migrating
+        """
+        legacy = [
+            {key: item[key] for key in ('url_hash', 'chunk_id', 'embedding_vector')}
+            for item in items
+            if item.get('embedding_vector') and not item.get('embedding')
+            and (item['url_hash'], item['chunk_id']) not in self._migrating
+        ][:limit]
+        if not legacy:
+            return None
+
+        keys = {(item['url_hash'], item['chunk_id']) for item in legacy}
+        self._migrating |= keys
+
+        async def migrate():
+            try:
+                async with self.session.resource('dynamodb', **self._dynamodb_config) as dynamodb:
+                    table = await dynamodb.Table(self.table_name)
+                    await self._migrate_legacy_items(table, legacy, limit)
+            except Exception as e:
+                logger.debug(f"Embedding migration failed: {e}")
+            finally:
+                self._migrating -= keys
+
+        task = asyncio.create_task(migrate())
+        self._migration_tasks.add(task)
+        task.add_done_callback(self._migration_tasks.discard)
+        return task
 
     async def initialize_table(self):
         """Create webpage_chunks table with TTL enabled.
@@ -122,7 +209,7 @@ class DynamoDBVectorStorage:
         Table Schema:
         - PK: url_hash (SHA256 of URL)
         - SK: chunk_id (UUID)
-        - Attributes: chunk_text, embedding_vector (List[float]), chunk_index,
+        - Attributes: chunk_text, embedding (binary) + embedding_dtype, chunk_index,
                      token_count, source_url, created_at, ttl (Unix timestamp)
         - TTL: Enabled on 'ttl' attribute
         """
@@ -209,16 +296,15 @@ class DynamoDBVectorStorage:
                         'url_hash': url_hash,
                         'chunk_id': chunk['chunk_id'],
                         'chunk_text': chunk['chunk_text'],
-                        'embedding_vector': chunk['embedding_vector'],
+                        'embedding': encode_embedding(chunk['embedding_vector'], self.precision),
+                        DTYPE_ATTRIBUTE: self.precision,
                         'chunk_index': chunk['chunk_index'],
                         'token_count': chunk['token_count'],
                         'source_url': url,
                         'created_at': created_at,
                         'ttl': ttl_timestamp
                     }
-                    # Convert floats to Decimal for DynamoDB
-                    item_converted = self._convert_float_to_decimal(item)
-                    await batch.put_item(Item=item_converted)
+                    await batch.put_item(Item=item)
 
         logger.info(f"✅ Stored {len(chunks)} chunks for {url}")
         return len(chunks)
@@ -266,20 +352,11 @@ class DynamoDBVectorStorage:
                     logger.debug(f"ℹ️ All chunks expired for URL: {url}")
                     return None
 
-                # Convert to VectorChunk objects (convert Decimal to float)
                 chunks = [
-                    VectorChunk(
-                        chunk_id=item['chunk_id'],
-                        chunk_text=item['chunk_text'],
-                        embedding_vector=self._convert_decimal_to_float(item['embedding_vector']),
-                        chunk_index=item['chunk_index'],
-                        token_count=item['token_count'],
-                        source_url=item['source_url'],
-                        created_at=item['created_at'],
-                        url_hash=item['url_hash']
-                    )
+                    self._to_vector_chunk(item, self._item_vector(item))
                     for item in valid_chunks
                 ]
+                self._schedule_migration(valid_chunks)
 
                 logger.info(
                     f"✅ Retrieved {len(chunks)} valid chunks for {url} (cache hit)"
@@ -344,42 +421,40 @@ class DynamoDBVectorStorage:
                     logger.debug("ℹ️ All chunks expired")
                     return []
 
-                # Compute similarities
-                similarities = []
+                # Compute all similarities in one matrix product
+                query = np.asarray(query_embedding, dtype=np.float32)
+                scored_items = []
+                vectors = []
                 for item in valid_items:
-                    try:
-                        embedding = item.get('embedding_vector', [])
-                        if not embedding:
-                            continue
-
-                        # Convert Decimal to float for cosine similarity
-                        embedding_float = self._convert_decimal_to_float(embedding)
-                        similarity = self._cosine_similarity(query_embedding, embedding_float)
-                        similarities.append((similarity, item))
-                    except Exception as e:
+                    vector = self._item_vector(item)
+                    if vector is None:
+                        continue
+                    if vector.shape != query.shape:
                         logger.warning(
-                            f"⚠️ Error computing similarity for chunk {item.get('chunk_id')}: {e}"
+                            f"⚠️ Skipping chunk {item.get('chunk_id')}: "
+                            f"dimension {vector.size} != {query.size}"
                         )
                         continue
+                    scored_items.append(item)
+                    vectors.append(vector)
+
+                if not scored_items:
+                    return []
+
+                matrix = np.stack(vectors)
+                norms = np.linalg.norm(matrix, axis=1) * np.linalg.norm(query)
+                dots = matrix @ query
+                scores = np.divide(dots, norms, out=np.zeros_like(dots), where=norms > 0)
 
                 # Sort by similarity (descending) and take top-K
-                similarities.sort(reverse=True, key=lambda x: x[0])
-                top_items = similarities[:top_k]
+                order = np.argsort(-scores, kind='stable')[:top_k]
+                top_items = [(float(scores[i]), scored_items[i], vectors[i]) for i in order]
 
-                # Convert to VectorChunk objects (convert Decimal to float)
                 chunks = [
-                    VectorChunk(
-                        chunk_id=item['chunk_id'],
-                        chunk_text=item['chunk_text'],
-                        embedding_vector=self._convert_decimal_to_float(item['embedding_vector']),
-                        chunk_index=item['chunk_index'],
-                        token_count=item['token_count'],
-                        source_url=item['source_url'],
-                        created_at=item['created_at'],
-                        url_hash=item['url_hash']
-                    )
-                    for similarity, item in top_items
+                    self._to_vector_chunk(item, vector)
+                    for similarity, item, vector in top_items
                 ]
+                self._schedule_migration(scored_items)
 
                 logger.info(
                     f"✅ Found {len(chunks)} similar chunks "
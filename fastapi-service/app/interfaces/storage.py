@@ -29,9 +29,10 @@ class IConversationStorage(Protocol):
         user_id: str,
         model_used: str,
         is_summary: bool = False,
-        generation_time: Optional[float] = None
+        generation_time: Optional[float] = None,
+        message_timestamp: Optional[str] = None
     ) -> None:
-        """Add a message to a conversation."""
+        """Add a message to a conversation (message_timestamp defaults to now)."""
         ...
 
     async def delete_messages(
@@ -142,6 +143,10 @@ class ITokenTrackingStorage(Protocol):
         """Update user's token usage."""
         ...
 
+    async def add_token_usage_batch(self, deltas: Dict[str, int]) -> Dict[str, int]:
+        """Atomically add accumulated usage per user; returns deltas that failed."""
+        ...
+
     async def grant_bonus_tokens(
         self,
         user_id: str,
@@ -56,7 +56,9 @@ from app.dependencies import (
     get_llm,
     get_websocket_manager,
     get_orchestrator,
-    get_queue_worker
+    get_queue_worker,
+    get_summarization_service,
+    get_usage_accumulator
 )
 from app.utils.health_checks import (
     check_dynamodb,
@@ -204,6 +206,12 @@ async def lifespan(app: FastAPI):
     await worker.start()
     logger.info("Queue worker started")
 
+    # Start write-behind token usage flushing
+    usage_accumulator = get_usage_accumulator()
+    if usage_accumulator:
+        await usage_accumulator.start()
+        logger.info("Token usage accumulator started")
+
     # Pre-register external models (SGLang) if orchestrator enabled
     if settings.VRAM_ENABLE_ORCHESTRATOR:
         from app.services.vram import get_orchestrator as get_vram_orchestrator
@@ -372,6 +380,9 @@ async def lifespan(app: FastAPI):
             pass
     await worker.stop()
     await queue.stop()
+    await get_summarization_service().wait_for_pending(timeout=30)
+    if usage_accumulator:
+        await usage_accumulator.stop()  # Flushes remaining usage
     logger.info("Shutdown complete")
 
 
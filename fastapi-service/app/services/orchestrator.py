@@ -3,7 +3,8 @@ import sys
 sys.path.insert(0, '/shared')
 
 import asyncio
-from typing import Dict
+import time
+from typing import Dict, List, Tuple
 import re
 import uuid
 
@@ -110,6 +111,114 @@ class Orchestrator:
         self.profile_manager = profile_manager
         self.preference_resolver = preference_resolver
         self.file_context_builder = FileContextBuilder()  # SOLID: Extract preprocessing
+        self._stage_totals: Dict[str, float] = {}  # stage -> cumulative ms
+        self._stage_counts: Dict[str, int] = {}
+
+    async def _timed(self, timings: Dict[str, float], stage: str, coro):
+        """Await a coroutine, recording its duration (ms) under stage."""
+        start = time.perf_counter()
+        try:
+            return await coro
+        finally:
+            timings[stage] = round((time.perf_counter() - start) * 1000, 2)
+
+    def _record_timings(self, timings: Dict[str, float]) -> None:
+        """Accumulate per-request stage timings for get_stage_timings()."""
+        for stage, ms in timings.items():
+            self._stage_totals[stage] = self._stage_totals.get(stage, 0.0) + ms
+            self._stage_counts[stage] = self._stage_counts.get(stage, 0) + 1
+        logger.debug(f"⏱️  Stage timings (ms): {timings}")
+
+    def get_stage_timings(self) -> Dict[str, Dict]:
+        """
+        Get average per-stage latency across processed requests.
+
+        Returns:
+            Dict of stage -> {'count', 'avg_ms'}
+        """
+        return {
+            stage: {
+                'count': self._stage_counts[stage],
+                'avg_ms': round(total / self._stage_counts[stage], 2)
+            }
+            for stage, total in self._stage_totals.items()
+        }
+
+    async def _summarize_if_needed(
+        self,
+        request: Dict,
+        context: List[Dict],
+        timings: Dict[str, float]
+    ) -> List[Dict]:
+        """
+        Handle a context over the user's summarization threshold.
+
+        With BACKGROUND_SUMMARIZATION the summary is folded in by a
+        background job and this request uses the current context as-is;
+        otherwise the context is summarized inline.
+
+        Returns:
+            Context to use for this request
+        """
+        if settings.BACKGROUND_SUMMARIZATION:
+            self.summarization_service.schedule_summarization(
+                request['conversation_id'],
+                request['user_id']
+            )
+            return context
+
+        return await self._timed(timings, 'summarization', self.summarization_service.summarize_and_prune(
+            conversation_id=request['conversation_id'],
+            messages=context,
+            user_id=request['user_id']
+        ))
+
+    async def _assemble_context(
+        self,
+        request: Dict,
+        timings: Dict[str, float]
+    ) -> Tuple[Dict, Dict, List[Dict]]:
+        """
+        Load user preferences, token record and conversation context.
+
+        The three reads are independent, so they are issued concurrently
+        (UserStorage serves preferences and tokens from one cached row).
+        Unknown users are created and re-read.
+
+        Args:
+            request: Request dictionary with user_id and conversation_id
+            timings: Dict receiving per-stage durations in ms
+
+        Returns:
+            Tuple of (user_prefs, user_tokens, context)
+        """
+        user_id = request['user_id']
+        start = time.perf_counter()
+
+        user_prefs, user_tokens, context = await asyncio.gather(
+            self._timed(timings, 'user_preferences', self.user_storage.get_user_preferences(user_id)),
+            self._timed(timings, 'user_tokens', self.user_storage.get_user_tokens(user_id)),
+            self._timed(
+                timings,
+                'conversation_context',
+                self.context_manager.get_conversation_context(request['conversation_id'], user_id)
+            )
+        )
+
+        if not user_prefs or not user_tokens:
+            # Create new user
+            await self.user_storage.create_user(
+                user_id=user_id,
+                discord_username=f"user_{user_id[:8]}",
+                user_tier='free'
+            )
+            user_prefs, user_tokens = await asyncio.gather(
+                self.user_storage.get_user_preferences(user_id),
+                self.user_storage.get_user_tokens(user_id)
+            )
+
+        timings['context_assembly'] = round((time.perf_counter() - start) * 1000, 2)
+        return user_prefs, user_tokens, context
 
     async def _resolve_route_config(
         self,
@@ -211,44 +320,25 @@ class Orchestrator:
         # Log incoming request
         logger.info(f"📥 Processing request from user {request['user_id']}: {request['message']}")
 
-        # Step 1: Get user data (preferences + tokens)
-        user_prefs = await self.user_storage.get_user_preferences(request['user_id'])
-        user_tokens = await self.user_storage.get_user_tokens(request['user_id'])
-
-        if not user_prefs or not user_tokens:
-            # Create new user
-            await self.user_storage.create_user(
-                user_id=request['user_id'],
-                discord_username=f"user_{request['user_id'][:8]}",
-                user_tier='free'
-            )
-            user_prefs = await self.user_storage.get_user_preferences(request['user_id'])
-            user_tokens = await self.user_storage.get_user_tokens(request['user_id'])
+        # Step 1: Get user data (preferences + tokens) and conversation context concurrently
+        timings: Dict[str, float] = {}
+        user_prefs, user_tokens, context = await self._assemble_context(request, timings)
 
         # Step 3: Check token budget (if enabled)
         if not settings.DISABLE_TOKEN_BUDGET:
             if not await self.token_tracker.has_budget(
                 user_tokens,
-                request['estimated_tokens']
+                request['estimated_tokens'],
+                user_id=request['user_id']
             ):
                 raise Exception(
                     f"Token budget exceeded. Remaining: {user_tokens['tokens_remaining']}"
                 )
 
-        # Step 4: Load conversation context
-        context = await self.context_manager.get_conversation_context(
-            request['conversation_id'],
-            request['user_id']
-        )
-
         # Step 5: Check if summarization needed
         total_tokens = sum(msg['token_count'] for msg in context)
         if total_tokens > user_prefs['auto_summarize_threshold']:
-            context = await self.summarization_service.summarize_and_prune(
-                conversation_id=request['conversation_id'],
-                messages=context,
-                user_id=request['user_id']
-            )
+            context = await self._summarize_if_needed(request, context, timings)
 
         # Step 6: Build enriched message with file context (SOLID preprocessing)
         file_refs = request.get('file_refs', [])
@@ -272,13 +362,13 @@ class Orchestrator:
         resolved_prefs = None  # Will hold ResolvedPreferences if PreferenceResolver is used
 
         if route_config is None:
-            route_config, resolved_prefs = await self._resolve_route_config(
+            route_config, resolved_prefs = await self._timed(timings, 'routing', self._resolve_route_config(
                 request=request,
                 user_prefs=user_prefs,
                 file_refs=file_refs,
                 user_message_content=user_message_content,
                 source=source
-            )
+            ))
 
             # Legacy fallback if PreferenceResolver not configured
             if route_config is None:
@@ -511,12 +601,15 @@ class Orchestrator:
                 profile_name = get_active_profile().profile_name.title()
                 logger.debug(f"💤 {profile_name} profile: Router stays loaded (keep_alive=30m)")
 
+        self._record_timings(timings)
+
         return {
             'request_id': request['request_id'],
             'response': response_content,
             'tokens_used': total_tokens_used,
             'model': response['model'],
-            'artifacts': artifacts  # NEW: Include artifacts for Discord upload
+            'artifacts': artifacts,  # NEW: Include artifacts for Discord upload
+            'stage_timings': timings  # ms per stage (context assembly, routing, ...)
         }
 
     async def process_request_stream(
@@ -546,44 +639,26 @@ class Orchestrator:
         # Log incoming request
         logger.info(f"📥 Processing streaming request from user {request['user_id']}: {request['message']}")
 
-        # Step 1: Get user data (preferences + tokens) - identical to process_request()
-        user_prefs = await self.user_storage.get_user_preferences(request['user_id'])
-        user_tokens = await self.user_storage.get_user_tokens(request['user_id'])
-
-        if not user_prefs or not user_tokens:
-            # Create new user
-            await self.user_storage.create_user(
-                user_id=request['user_id'],
-                discord_username=f"user_{request['user_id'][:8]}",
-                user_tier='free'
-            )
-            user_prefs = await self.user_storage.get_user_preferences(request['user_id'])
-            user_tokens = await self.user_storage.get_user_tokens(request['user_id'])
+        # Step 1: Get user data and conversation context - identical to process_request()
+        request_start = time.perf_counter()
+        timings: Dict[str, float] = {}
+        user_prefs, user_tokens, context = await self._assemble_context(request, timings)
 
         # Step 2: Check token budget (if enabled)
         if not settings.DISABLE_TOKEN_BUDGET:
             if not await self.token_tracker.has_budget(
                 user_tokens,
-                request['estimated_tokens']
+                request['estimated_tokens'],
+                user_id=request['user_id']
             ):
                 raise Exception(
                     f"Token budget exceeded. Remaining: {user_tokens['tokens_remaining']}"
                 )
 
-        # Step 3: Load conversation context
-        context = await self.context_manager.get_conversation_context(
-            request['conversation_id'],
-            request['user_id']
-        )
-
         # Step 4: Check if summarization needed
         total_tokens = sum(msg['token_count'] for msg in context)
         if total_tokens > user_prefs['auto_summarize_threshold']:
-            context = await self.summarization_service.summarize_and_prune(
-                conversation_id=request['conversation_id'],
-                messages=context,
-                user_id=request['user_id']
-            )
+            context = await self._summarize_if_needed(request, context, timings)
 
         # Step 5: Build enriched message with file context (SOLID preprocessing)
         file_refs = request.get('file_refs', [])
@@ -606,13 +681,13 @@ class Orchestrator:
         # Both Web UI model selector and Discord /model use the same path via PreferenceResolver
         source = request.get('metadata', {}).get('source', 'discord')
 
-        route_config, resolved_prefs = await self._resolve_route_config(
+        route_config, resolved_prefs = await self._timed(timings, 'routing', self._resolve_route_config(
             request=request,
             user_prefs=user_prefs,
             file_refs=file_refs,
             user_message_content=user_message_content,
             source=source
-        )
+        ))
 
         logger.info(f"🎯 Route resolved: {route_config['route']} via {resolved_prefs.model_source if resolved_prefs else 'legacy'} [streaming]")
 
@@ -667,6 +742,8 @@ class Orchestrator:
                 continue  # Don't accumulate or send this chunk
 
             # First chunk is now just regular content (status sent earlier by queue_worker)
+            if first_chunk:
+                timings['first_chunk'] = round((time.perf_counter() - request_start) * 1000, 2)
             first_chunk = False
 
             # Don't skip empty chunks - let them accumulate
@@ -715,7 +792,6 @@ class Orchestrator:
         logger.info(f"📤 Generated streaming response for user {request['user_id']}: {preview}{'...' if len(response_content) > 150 else ''}")
 
         # DEBUG: Measure post-generation operations
-        import time
         start_time = time.time()
         logger.info(f"📏 Response size: {len(response_content)} chars ({len(response_content.encode('utf-8'))} bytes)")
         logger.debug(f"⏱️  Starting post-generation operations")
@@ -897,10 +973,13 @@ class Orchestrator:
         thinking_tokens = getattr(self.llm, 'last_thinking_tokens', 0)
         total_tokens_generated = response_tokens + thinking_tokens
 
+        self._record_timings(timings)
+
         return {
             'request_id': request['request_id'],
             'response': response_content,
             'tokens_used': total_tokens_used,
+            'stage_timings': timings,  # ms per stage (context assembly, routing, first chunk)
             'generation_time': generation_time,  # seconds
             'output_tokens': response_tokens,  # For display
             'total_tokens_generated': total_tokens_generated,  # For accurate TPS (includes thinking)
@@ -1,9 +1,21 @@
 """Conversation summarization service."""
-from typing import List, Dict
+import sys
+sys.path.insert(0, '/shared')
+
+import asyncio
+from typing import Awaitable, Callable, List, Dict, Optional, TypeVar
 
 from app.interfaces.storage import IConversationStorage
 from app.interfaces.llm import LLMInterface
 from app.config import settings
+import logging_client
+
+T = TypeVar('T')
+
+logger = logging_client.setup_logger('fastapi')
+
+SUMMARY_PREFIX = "[SUMMARY OF PREVIOUS CONVERSATION]\n"
+KEEP_RECENT_MESSAGES = 5
 
 
 class SummarizationService:
@@ -28,6 +40,24 @@ You are a conversation summarizer. Create a concise summary of the conversation
 {conversation}
 
 **Summary:**
+"""
+
+    INCREMENTAL_SUMMARIZATION_PROMPT = """
+You are a conversation summarizer. Update the existing summary with the new messages below.
+
+**Rules:**
+- Keep everything in the existing summary that is still relevant
+- Fold in new requests, actions taken, key technical points and unresolved items
+- Drop unresolved items that the new messages resolved
+- Write in past tense, use bullet points, max 500 tokens
+
+**Existing summary:**
+{summary}
+
+**New messages:**
+{conversation}
+
+**Updated summary:**
 """
 
     def __init__(self, storage: IConversationStorage, llm: LLMInterface):
@@ -40,6 +70,179 @@ You are a conversation summarizer. Create a concise summary of the conversation
         """
         self.storage = storage
         self.llm = llm
+        self._pending: Dict[str, asyncio.Task] = {}  # conversation_id -> background job
+        self._stats = {'scheduled': 0, 'deduplicated': 0, 'completed': 0, 'skipped': 0, 'failed': 0}
+
+    def schedule_summarization(self, conversation_id: str, user_id: str) -> bool:
+        """
+        Summarize a conversation in the background (off the request path).
+
+        At most one job runs per conversation; triggers while a job is
+        running are dropped, since that job already covers the thread.
+
+        Args:
+            conversation_id: Thread identifier
+            user_id: User ID for the summary attribution
+
+        Returns:
+            True if a job was started, False if one is already running
+        """
+        if conversation_id in self._pending:
+            self._stats['deduplicated'] += 1
+            return False
+
+        task = asyncio.create_task(self._run_background(conversation_id, user_id))
+        self._pending[conversation_id] = task
+        self._stats['scheduled'] += 1
+        return True
+
+    async def _run_background(self, conversation_id: str, user_id: str) -> None:
+        """Background job wrapper: never raises, always clears the pending slot."""
+        try:
+            if await self.summarize_incremental(conversation_id, user_id):
+                self._stats['completed'] += 1
+            else:
+                self._stats['skipped'] += 1
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self._stats['failed'] += 1
+            logger.error(f"❌ Background summarization failed for {conversation_id}: {e}")
+        finally:
+            self._pending.pop(conversation_id, None)
+
+    async def summarize_incremental(self, conversation_id: str, user_id: str) -> bool:
+        """
+        Fold messages added since the last summary into that summary.
+
+        Only messages not yet covered by the latest summary are sent to the
+        LLM - history already in the summary is not re-summarized. The last
+        KEEP_RECENT_MESSAGES are always kept verbatim. The new summary
+        overwrites the newest folded message (keeping its position in the
+        thread, before the kept messages), then the older summaries and the
+        other folded messages are deleted.
+
+        Messages stored before the latest summary are folded as well, never
+        just deleted: summaries written by summarize_and_prune (and those
+        stored before summaries were anchored) sit after the messages they
+        kept.
+
+        Args:
+            conversation_id: Thread identifier
+            user_id: User ID for the summary attribution
+
+        Returns:
+            True if a new summary was written
+        """
+        messages = await self.storage.get_conversation_messages(conversation_id)
+
+        summaries = [msg for msg in messages if msg.get('is_summary')]
+        existing_summary = summaries[-1] if summaries else None
+        # Older summaries are left over from an interrupted run; the latest one covers them
+        stale = summaries[:-1]
+        unsummarized = [msg for msg in messages if not msg.get('is_summary')]
+        new_messages = unsummarized[:-KEEP_RECENT_MESSAGES]
+
+        if not new_messages:
+            if stale:
+                await self.storage.delete_messages(
+                    conversation_id, [msg['message_timestamp'] for msg in stale]
+                )
+            return False
+
+        conversation_text = self._format_for_summary(new_messages)
+        if existing_summary:
+            prompt = self.INCREMENTAL_SUMMARIZATION_PROMPT.format(
+                summary=self._strip_summary_prefix(existing_summary['content']),
+                conversation=conversation_text
+            )
+        else:
+            prompt = self.SUMMARIZATION_PROMPT.format(conversation=conversation_text)
+
+        summary_response = await self.llm.generate(
+            context=[{'role': 'user', 'content': prompt}],
+            model=settings.OLLAMA_SUMMARIZATION_MODEL,
+            temperature=0.3  # Lower temp for factual summary
+        )
+        summary_content = summary_response['content']
+
+        anchor = new_messages[-1]
+        await self.storage.add_message(
+            conversation_id=conversation_id,
+            message_id=f"summary_{conversation_id}_{anchor['message_timestamp']}",
+            role='system',
+            content=f"{SUMMARY_PREFIX}{summary_content}",
+            token_count=len(summary_content.split()),
+            user_id=user_id,
+            model_used=settings.OLLAMA_SUMMARIZATION_MODEL,
+            is_summary=True,
+            message_timestamp=anchor['message_timestamp']
+        )
+
+        replaced = summaries + new_messages[:-1]
+        if replaced:
+            await self.storage.delete_messages(
+                conversation_id, [msg['message_timestamp'] for msg in replaced]
+            )
+
+        logger.info(
+            f"📝 Folded {len(new_messages)} messages into summary for {conversation_id} "
+            f"({'incremental' if existing_summary else 'initial'})"
+        )
+        return True
+
+    @staticmethod
+    def _strip_summary_prefix(content: str) -> str:
+        """Remove the summary marker from stored summary content."""
+        return content[len(SUMMARY_PREFIX):] if content.startswith(SUMMARY_PREFIX) else content
+
+    async def run_exclusive(self, conversation_id: str, job: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run a summarization job in the conversation's background slot.
+
+        Used by manual /summarize so it never rewrites a thread while a
+        background job is folding it: a running job is awaited first, and
+        background triggers while this job runs are deduplicated.
+
+        Args:
+            conversation_id: Thread identifier
+            job: Coroutine function doing the summarization
+
+        Returns:
+            The job's result
+        """
+        while conversation_id in self._pending:
+            await asyncio.wait([self._pending[conversation_id]])
+
+        task = asyncio.create_task(job())
+        self._pending[conversation_id] = task
+        try:
+            return await task
+        finally:
+            if self._pending.get(conversation_id) is task:
+                del self._pending[conversation_id]
+
+    def is_pending(self, conversation_id: str) -> bool:
+        """Check whether a background summary is running for a conversation."""
+        return conversation_id in self._pending
+
+    async def wait_for_pending(self, timeout: Optional[float] = None) -> None:
+        """
+        Wait for running background jobs (used on shutdown and in tests).
+
+        Args:
+            timeout: Max seconds to wait; remaining jobs are cancelled after it
+        """
+        tasks = list(self._pending.values())
+        if not tasks:
+            return
+        _, still_running = await asyncio.wait(tasks, timeout=timeout)
+        for task in still_running:
+            task.cancel()
+
+    def get_stats(self) -> Dict:
+        """Get background summarization statistics."""
+        return {**self._stats, 'pending': len(self._pending)}
 
     async def summarize_and_prune(
         self,
@@ -60,8 +263,8 @@ You are a conversation summarizer. Create a concise summary of the conversation
             Updated context with summary replacing old messages
         """
         # Keep last 5 messages, summarize the rest
-        messages_to_summarize = messages[:-5]
-        messages_to_keep = messages[-5:]
+        messages_to_summarize = messages[:-KEEP_RECENT_MESSAGES]
+        messages_to_keep = messages[-KEEP_RECENT_MESSAGES:]
 
         if not messages_to_summarize:
             return messages
@@ -87,22 +290,24 @@ You are a conversation summarizer. Create a concise summary of the conversation
         timestamps = [msg['message_timestamp'] for msg in messages_to_summarize]
         await self.storage.delete_messages(conversation_id, timestamps)
 
-        # Add summary to database
+        # Add summary to database, in place of the newest summarized message
+        # so it sorts before the kept messages
         await self.storage.add_message(
             conversation_id=conversation_id,
             message_id=f"summary_{conversation_id}_{len(messages_to_summarize)}",
             role='system',
-            content=f"[SUMMARY OF PREVIOUS CONVERSATION]\n{summary_content}",
+            content=f"{SUMMARY_PREFIX}{summary_content}",
             token_count=len(summary_content.split()),
             user_id=user_id,
             model_used=settings.OLLAMA_SUMMARIZATION_MODEL,
-            is_summary=True
+            is_summary=True,
+            message_timestamp=messages_to_summarize[-1]['message_timestamp']
         )
 
         # Return updated context
         return [{
             'role': 'system',
-            'content': f"[SUMMARY OF PREVIOUS CONVERSATION]\n{summary_content}",
+            'content': f"{SUMMARY_PREFIX}{summary_content}",
             'token_count': len(summary_content.split()),
             'message_timestamp': 'summary'
         }] + messages_to_keep
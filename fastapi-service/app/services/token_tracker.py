@@ -1,57 +1,102 @@
 """Token tracking and budget management."""
-from typing import Dict
+import hashlib
+from collections import OrderedDict
+from typing import Dict, Optional
 
 from app.interfaces.storage import ITokenTrackingStorage
 from app.interfaces.llm import LLMInterface
+from app.services.usage_accumulator import UsageAccumulator
 
 
 class TokenTracker:
     """Manages token counting and budget tracking."""
 
-    def __init__(self, storage: ITokenTrackingStorage, llm: LLMInterface):
+    def __init__(
+        self,
+        storage: ITokenTrackingStorage,
+        llm: LLMInterface,
+        accumulator: Optional[UsageAccumulator] = None,
+        count_cache_size: int = 0
+    ):
         """
         Initialize token tracker.
 
         Args:
             storage: Token tracking storage interface
             llm: LLM interface for token counting
+            accumulator: Write-behind usage buffer (None = write per request)
+            count_cache_size: Memoized token counts kept (0 = disabled)
         """
         self.storage = storage
         self.llm = llm
+        self.accumulator = accumulator
+        self._count_cache_size = count_cache_size
+        self._count_cache: "OrderedDict[bytes, int]" = OrderedDict()
 
     async def count_tokens(self, text: str) -> int:
         """
         Count tokens in text.
 
+        Counts are memoized by content digest, so text that was already
+        counted (retried requests, repeated file content) isn't re-encoded.
+
         Args:
             text: Text to count tokens for
 
         Returns:
             Estimated token count
         """
-        return await self.llm.count_tokens(text)
-
-    async def has_budget(self, user: Dict, estimated_tokens: int) -> bool:
+        if not self._count_cache_size:
+            return await self.llm.count_tokens(text)
+
+        key = hashlib.blake2b(text.encode('utf-8'), digest_size=16).digest()
+        cached = self._count_cache.get(key)
+        if cached is not None:
+            self._count_cache.move_to_end(key)
+            return cached
+
+        count = await self.llm.count_tokens(text)
+        self._count_cache[key] = count
+        if len(self._count_cache) > self._count_cache_size:
+            self._count_cache.popitem(last=False)
+        return count
+
+    async def has_budget(
+        self,
+        user: Dict,
+        estimated_tokens: int,
+        user_id: Optional[str] = None
+    ) -> bool:
         """
         Check if user has sufficient token budget.
 
         Args:
-            user: User data dictionary
+            user: User data dictionary (last flushed token record)
             estimated_tokens: Estimated tokens needed
+            user_id: User ID, to include usage not yet flushed
 
         Returns:
             True if user has sufficient budget, False otherwise
         """
-        return user['tokens_remaining'] >= estimated_tokens
+        remaining = user['tokens_remaining']
+        if self.accumulator and user_id:
+            remaining -= self.accumulator.pending(user_id)
+        return remaining >= estimated_tokens
 
     async def update_usage(self, user_id: str, tokens_used: int) -> None:
         """
         Update user's token usage.
 
+        With an accumulator the usage is buffered and flushed in batches;
+        otherwise it is written immediately.
+
         Args:
             user_id: User ID
             tokens_used: Number of tokens consumed
         """
+        if self.accumulator:
+            await self.accumulator.record(user_id, tokens_used)
+            return
         await self.storage.update_user_tokens(user_id, tokens_used)
 
     async def get_remaining(self, user_id: str) -> int:
@@ -62,7 +107,10 @@ class TokenTracker:
             user_id: User ID
 
         Returns:
-            Remaining tokens in budget
+            Remaining tokens in budget (including usage not yet flushed)
         """
         tokens = await self.storage.get_user_tokens(user_id)
-        return tokens['tokens_remaining'] if tokens else 0
+        if not tokens:
+            return 0
+        pending = self.accumulator.pending(user_id) if self.accumulator else 0
+        return max(0, tokens['tokens_remaining'] - pending)
@@ -0,0 +1,139 @@
+"""Write-behind token usage accumulator."""
+import sys
+sys.path.insert(0, '/shared')
+
+import asyncio
+from typing import Dict, Optional
+
+import logging_client
+
+logger = logging_client.setup_logger('fastapi')
+
+
+class UsageAccumulator:
+    """
+    Aggregates per-user token usage in memory and flushes it in batches.
+
+    Completed requests record their usage here instead of writing the users
+    row directly. A background loop flushes the summed deltas every
+    flush_interval seconds as atomic ADD updates (one per user, not per
+    request). Unflushed usage is bounded: once max_unflushed_tokens is
+    pending, record() flushes before returning, so a crash loses at most
+    that many tokens of accounting.
+
+    Single Responsibility: Token usage write-behind buffering
+    """
+
+    def __init__(
+        self,
+        storage,
+        flush_interval: float = 5.0,
+        max_unflushed_tokens: int = 50000
+    ):
+        """
+        Initialize accumulator.
+
+        Args:
+            storage: User storage implementing add_token_usage_batch()
+            flush_interval: Seconds between background flushes
+            max_unflushed_tokens: Pending total that forces an immediate flush
+        """
+        self.storage = storage
+        self.flush_interval = flush_interval
+        self.max_unflushed_tokens = max_unflushed_tokens
+        self._pending: Dict[str, int] = {}
+        self._in_flight: Dict[str, int] = {}  # Deltas being written by a flush
+        self._flush_lock = asyncio.Lock()
+        self._flush_task: Optional[asyncio.Task] = None
+        self._stats = {'recorded': 0, 'flushes': 0, 'users_flushed': 0, 'flush_errors': 0}
+
+    async def start(self):
+        """Start the periodic background flush."""
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_loop())
+
+    async def stop(self):
+        """Stop the background flush and write out remaining usage."""
+        if self._flush_task:
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+            self._flush_task = None
+        await self.flush()
+
+    async def _flush_loop(self):
+        """Flush pending usage every flush_interval seconds."""
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.error(f"❌ Token usage flush loop error: {e}")
+
+    async def record(self, user_id: str, tokens_used: int) -> None:
+        """
+        Record token usage for a user (write-behind).
+
+        Args:
+            user_id: User ID
+            tokens_used: Number of tokens consumed
+        """
+        if tokens_used <= 0:
+            return
+        self._pending[user_id] = self._pending.get(user_id, 0) + tokens_used
+        self._stats['recorded'] += 1
+
+        if self.unflushed_total() >= self.max_unflushed_tokens:
+            await self.flush()
+
+    def pending(self, user_id: str) -> int:
+        """Usage recorded for a user but not yet persisted."""
+        return self._pending.get(user_id, 0) + self._in_flight.get(user_id, 0)
+
+    def unflushed_total(self) -> int:
+        """Total usage across users not yet persisted."""
+        return sum(self._pending.values()) + sum(self._in_flight.values())
+
+    async def flush(self) -> int:
+        """
+        Persist all pending usage as batched atomic ADD updates.
+
+        Failed deltas are merged back into the pending buffer and retried
+        on the next flush.
+
+        Returns:
+            Number of users whose usage was written
+        """
+        async with self._flush_lock:
+            if not self._pending:
+                return 0
+
+            self._in_flight, self._pending = self._pending, {}
+            deltas = self._in_flight
+            try:
+                failed = await self.storage.add_token_usage_batch(deltas)
+            except Exception as e:
+                logger.error(f"❌ Token usage flush failed ({len(deltas)} users): {e}")
+                failed = deltas
+            finally:
+                self._in_flight = {}
+
+            for user_id, tokens in (failed or {}).items():
+                self._pending[user_id] = self._pending.get(user_id, 0) + tokens
+
+            written = len(deltas) - len(failed or {})
+            self._stats['flushes'] += 1
+            self._stats['users_flushed'] += written
+            if failed:
+                self._stats['flush_errors'] += 1
+            return written
+
+    def get_stats(self) -> Dict:
+        """Get accumulator statistics."""
+        return {
+            **self._stats,
+            'pending_users': len(self._pending),
+            'unflushed_tokens': self.unflushed_total()
+        }
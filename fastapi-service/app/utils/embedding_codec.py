@@ -0,0 +1,68 @@
+"""Compact binary encoding for stored embedding vectors.
+
+Vectors are stored as a binary ``embedding`` attribute plus an
+``embedding_dtype`` attribute naming the layout:
+
+    float32 - 4 bytes per dimension
+    float16 - 2 bytes per dimension
+    int8    - float32 scale, then 1 byte per dimension (value = q * scale)
+
+Decoding returns float32 NumPy arrays straight from the stored bytes.
+"""
+from typing import Any, Sequence, Union
+
+import numpy as np
+
+DTYPE_ATTRIBUTE = "embedding_dtype"
+PRECISIONS = ("float32", "float16", "int8")
+
+Vector = Union[Sequence[float], np.ndarray]
+
+
+def encode_embedding(embedding: Vector, precision: str) -> bytes:
+    """Encode a vector in the given precision.
+
+    Args:
+        embedding: Vector as a list or NumPy array
+        precision: float32, float16 or int8
+
+    Returns:
+        Encoded bytes
+    """
+    vector = np.asarray(embedding, dtype=np.float32)
+    if precision == "float32":
+        return vector.astype("<f4").tobytes()
+    if precision == "float16":
+        return vector.astype("<f2").tobytes()
+    if precision == "int8":
+        peak = float(np.max(np.abs(vector))) if vector.size else 0.0
+        scale = peak / 127.0 if peak > 0 else 1.0
+        quantized = np.clip(np.rint(vector / scale), -127, 127).astype(np.int8)
+        return np.float32(scale).astype("<f4").tobytes() + quantized.tobytes()
+    raise ValueError(
+        f"Unknown embedding precision '{precision}' (expected one of {', '.join(PRECISIONS)})"
+    )
+
+
+def decode_embedding(data: Any, precision: str) -> np.ndarray:
+    """Decode stored bytes (or boto3 Binary) into a float32 array.
+
+    Args:
+        data: Encoded vector
+        precision: Layout the vector was encoded with
+
+    Returns:
+        float32 array (read-only for float32 data, which is not copied)
+    """
+    if hasattr(data, "value"):
+        data = data.value  # boto3 Binary type
+    if precision == "float32":
+        return np.frombuffer(data, dtype="<f4")
+    if precision == "float16":
+        return np.frombuffer(data, dtype="<f2").astype(np.float32)
+    if precision == "int8":
+        if not data:
+            return np.zeros(0, dtype=np.float32)
+        scale = np.frombuffer(data, dtype="<f4", count=1)[0]
+        return np.frombuffer(data, dtype=np.int8, offset=4).astype(np.float32) * scale
+    raise ValueError(f"Unknown embedding precision '{precision}'")
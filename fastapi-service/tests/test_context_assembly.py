@@ -0,0 +1,242 @@
+"""Unit tests for cached user reads and concurrent context assembly."""
+import asyncio
+import time
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from app.implementations.user_storage import UserStorage
+from app.services.context_manager import ContextManager
+from app.services.orchestrator import Orchestrator
+
+
+DYNAMO_LATENCY = 0.03  # Simulated round-trip of a local DynamoDB stand-in
+
+
+class FakeUsersTable:
+    """In-memory 'users' table with per-call latency."""
+
+    def __init__(self, latency: float = DYNAMO_LATENCY):
+        self.items = {}
+        self.latency = latency
+        self.get_calls = 0
+
+    async def get_item(self, Key):
+        self.get_calls += 1
+        await asyncio.sleep(self.latency)
+        item = self.items.get(Key['user_id'])
+        return {'Item': dict(item)} if item else {}
+
+    async def put_item(self, Item):
+        await asyncio.sleep(self.latency)
+        self.items[Item['user_id']] = dict(Item)
+
+    async def update_item(self, Key, UpdateExpression, ExpressionAttributeValues, ConditionExpression=None):
+        await asyncio.sleep(self.latency)
+        item = self.items[Key['user_id']]
+        if UpdateExpression.startswith('ADD'):
+            for clause in UpdateExpression[len('ADD '):].split(' SET ')[0].split(','):
+                attribute, placeholder = clause.split()
+                item[attribute] = item.get(attribute, 0) + ExpressionAttributeValues[placeholder]
+            return
+        if ':used' in ExpressionAttributeValues:
+            item['tokens_used_this_week'] = ExpressionAttributeValues[':used']
+            item['tokens_remaining'] = ExpressionAttributeValues[':remaining']
+        if ':temp' in ExpressionAttributeValues:
+            item['temperature'] = ExpressionAttributeValues[':temp']
+
+
+@pytest.fixture
+def table():
+    return FakeUsersTable()
+
+
+@pytest.fixture
+def storage(table):
+    """UserStorage backed by the fake table."""
+    with patch('app.implementations.user_storage.aioboto3.Session'):
+        storage = UserStorage()
+    storage._cache_ttl = 30.0
+    storage.session.resource.return_value.__aenter__.return_value.Table = AsyncMock(
+        return_value=table
+    )
+    return storage
+
+
+def make_messages_storage(latency: float = DYNAMO_LATENCY):
+    async def get_conversation_messages(conversation_id):
+        await asyncio.sleep(latency)
+        return [{
+            'role': 'user',
+            'content': 'Hello',
+            'token_count': 5,
+            'message_timestamp': '2024-01-01T00:00:00'
+        }]
+
+    conversation_storage = MagicMock()
+    conversation_storage.get_conversation_messages = get_conversation_messages
+    return conversation_storage
+
+
+def make_orchestrator(user_storage) -> Orchestrator:
+    conversation_storage = make_messages_storage()
+    return Orchestrator(
+        conversation_storage=conversation_storage,
+        user_storage=user_storage,
+        llm=MagicMock(),
+        context_manager=ContextManager(storage=conversation_storage),
+        token_tracker=MagicMock(),
+        summarization_service=MagicMock(),
+        router_service=MagicMock(),
+        strategy_registry=MagicMock()
+    )
+
+
+@pytest.mark.asyncio
+async def test_preferences_and_tokens_share_cached_row(storage, table):
+    """Preferences and tokens come from one get_item, then from cache."""
+    await storage.create_user('u1', 'User One')
+
+    prefs, tokens = await asyncio.gather(
+        storage.get_user_preferences('u1'),
+        storage.get_user_tokens('u1')
+    )
+    await storage.get_user_preferences('u1')
+
+    assert prefs['user_tier'] == 'free'
+    assert tokens['weekly_token_budget'] == 100000
+    assert table.get_calls == 1
+    assert storage.get_cache_stats()['hits'] == 2
+
+
+@pytest.mark.asyncio
+async def test_writes_invalidate_cached_row(storage, table):
+    await storage.create_user('u1', 'User One')
+    await storage.get_user_preferences('u1')
+
+    await storage.update_temperature('u1', 0.7)
+    prefs = await storage.get_user_preferences('u1')
+
+    assert prefs['temperature'] == '0.7'
+    assert table.get_calls == 2
+
+
+@pytest.mark.asyncio
+async def test_token_update_reads_stored_row_not_cache(storage, table):
+    """Read-modify-write of token usage never starts from a stale cached row."""
+    await storage.create_user('u1', 'User One')
+    await storage.get_user_tokens('u1')  # Cached with 0 used
+
+    table.items['u1']['tokens_used_this_week'] = 500  # Written by another worker
+    await storage.update_user_tokens('u1', 100)
+
+    tokens = await storage.get_user_tokens('u1')
+    assert tokens['tokens_used_this_week'] == 600
+
+
+@pytest.mark.asyncio
+async def test_token_usage_batch_adds_and_invalidates(storage, table):
+    await storage.create_user('u1', 'User One')
+    await storage.create_user('u2', 'User Two')
+    await storage.get_user_tokens('u1')
+
+    failed = await storage.add_token_usage_batch({'u1': 300, 'u2': 50})
+    tokens = await storage.get_user_tokens('u1')
+
+    assert failed == {}
+    assert tokens['tokens_used_this_week'] == 300
+    assert tokens['tokens_remaining'] == 100000 - 300
+
+
+@pytest.mark.asyncio
+async def test_bonus_grant_survives_usage_flush(storage, table):
+    await storage.create_user('u1', 'User One')
+
+    await storage.grant_bonus_tokens('u1', 5000)
+    assert await storage.add_token_usage_batch({'u1': 300}) == {}
+    tokens = await storage.get_user_tokens('u1')
+
+    assert tokens['bonus_tokens'] == 5000
+    assert tokens['tokens_remaining'] == 100000 + 5000 - 300
+
+
+@pytest.mark.asyncio
+async def test_missing_user_is_not_cached(storage, table):
+    assert await storage.get_user_preferences('ghost') is None
+
+    await storage.create_user('ghost', 'Ghost')
+
+    assert await storage.get_user_preferences('ghost') is not None
+
+
+@pytest.mark.asyncio
+async def test_cache_entries_expire(storage, table):
+    storage._cache_ttl = 0.01
+    await storage.create_user('u1', 'User One')
+
+    await storage.get_user_tokens('u1')
+    time.sleep(0.02)
+    await storage.get_user_tokens('u1')
+
+    assert table.get_calls == 2
+
+
+@pytest.mark.asyncio
+async def test_assemble_context_reads_concurrently(storage, table):
+    """Context assembly takes about one round-trip instead of three."""
+    await storage.create_user('u1', 'User One')
+    storage._cache_ttl = 0  # Measure uncached reads
+    orchestrator = make_orchestrator(storage)
+    timings = {}
+
+    prefs, tokens, context = await orchestrator._assemble_context(
+        {'user_id': 'u1', 'conversation_id': 'c1'}, timings
+    )
+
+    assert prefs['auto_summarize_threshold'] == 9000
+    assert tokens['tokens_remaining'] == 100000
+    assert context[0]['content'] == 'Hello'
+    assert set(timings) >= {'user_preferences', 'user_tokens', 'conversation_context', 'context_assembly'}
+    sequential_ms = timings['user_preferences'] + timings['user_tokens'] + timings['conversation_context']
+    assert timings['context_assembly'] < sequential_ms * 0.6
+
+
+@pytest.mark.asyncio
+async def test_assemble_context_creates_unknown_user(storage, table):
+    orchestrator = make_orchestrator(storage)
+
+    prefs, tokens, _ = await orchestrator._assemble_context(
+        {'user_id': 'new_user_1234', 'conversation_id': 'c1'}, {}
+    )
+
+    assert prefs['discord_username'] == 'user_new_user'
+    assert tokens['weekly_token_budget'] == 100000
+
+
+@pytest.mark.asyncio
+async def test_stage_timings_are_aggregated(storage, table):
+    await storage.create_user('u1', 'User One')
+    orchestrator = make_orchestrator(storage)
+
+    for _ in range(2):
+        timings = {}
+        await orchestrator._assemble_context({'user_id': 'u1', 'conversation_id': 'c1'}, timings)
+        orchestrator._record_timings(timings)
+
+    stages = orchestrator.get_stage_timings()
+    assert stages['context_assembly']['count'] == 2
+    assert stages['context_assembly']['avg_ms'] > 0
+
+
+@pytest.mark.asyncio
+async def test_stream_request_assembles_context_before_budget_check(storage, table):
+    await storage.create_user('u1', 'User One')
+    orchestrator = make_orchestrator(storage)
+    orchestrator.token_tracker.has_budget = AsyncMock(return_value=False)
+
+    with patch('app.services.orchestrator.settings') as mock_settings:
+        mock_settings.DISABLE_TOKEN_BUDGET = False
+        with pytest.raises(Exception, match="Token budget exceeded"):
+            await orchestrator.process_request_stream(
+                {'user_id': 'u1', 'conversation_id': 'c1', 'message': 'hi', 'estimated_tokens': 10},
+                AsyncMock()
+            )
@@ -1,6 +1,6 @@
 """Unit tests for business logic services."""
 import pytest
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from app.services.context_manager import ContextManager
 from app.services.token_tracker import TokenTracker
@@ -149,3 +149,329 @@ async def test_summarization_no_prune_if_few_messages():
     assert result == messages
     mock_llm.generate.assert_not_called()
     mock_storage.delete_messages.assert_not_called()
+
+
+@pytest.fixture
+def summarization_settings():
+    """Settings with a fixed summarization model (no active profile needed)."""
+    with patch('app.services.summarization_service.settings') as mock_settings:
+        mock_settings.OLLAMA_SUMMARIZATION_MODEL = 'gpt-oss:20b'
+        yield mock_settings
+
+
+def make_thread(count: int, summary: str = None):
+    """Build stored conversation rows, optionally starting with a summary."""
+    rows = []
+    if summary:
+        rows.append({
+            'role': 'system',
+            'content': f'[SUMMARY OF PREVIOUS CONVERSATION]\n{summary}',
+            'token_count': 10,
+            'message_timestamp': '2024-01-01T00:00:00',
+            'is_summary': True
+        })
+    rows.extend(
+        {
+            'role': 'user' if i % 2 == 0 else 'assistant',
+            'content': f'Message {i}',
+            'token_count': 10,
+            'message_timestamp': f'2024-01-01T00:01:{i:02d}',
+            'is_summary': False
+        }
+        for i in range(count)
+    )
+    return rows
+
+
+@pytest.mark.asyncio
+async def test_incremental_summary_folds_only_new_messages(summarization_settings):
+    """Existing summary + new messages are summarized, not the whole history."""
+    mock_storage = AsyncMock()
+    mock_storage.get_conversation_messages.return_value = make_thread(8, summary='Old summary')
+    mock_llm = AsyncMock()
+    mock_llm.generate.return_value = {'content': 'Updated summary', 'model': 'gpt-oss:20b'}
+
+    service = SummarizationService(storage=mock_storage, llm=mock_llm)
+    assert await service.summarize_incremental("conversation_123", "user_456") is True
+
+    prompt = mock_llm.generate.call_args.kwargs['context'][0]['content']
+    assert 'Old summary' in prompt
+    assert 'Message 2' in prompt and 'Message 3' not in prompt  # Last 5 kept verbatim
+
+    # Summary replaces the newest folded message in place
+    add_kwargs = mock_storage.add_message.call_args.kwargs
+    assert add_kwargs['is_summary'] is True
+    assert add_kwargs['message_timestamp'] == '2024-01-01T00:01:02'
+
+    deleted = mock_storage.delete_messages.call_args[0][1]
+    assert deleted == ['2024-01-01T00:00:00', '2024-01-01T00:01:00', '2024-01-01T00:01:01']
+
+
+@pytest.mark.asyncio
+async def test_incremental_summary_skips_when_nothing_new():
+    mock_storage = AsyncMock()
+    mock_storage.get_conversation_messages.return_value = make_thread(5, summary='Old summary')
+    mock_llm = AsyncMock()
+
+    service = SummarizationService(storage=mock_storage, llm=mock_llm)
+
+    assert await service.summarize_incremental("conversation_123", "user_456") is False
+    mock_llm.generate.assert_not_called()
+
+
+class InMemoryConversationStorage:
+    """Conversation rows keyed by timestamp, read back in sort-key order."""
+
+    def __init__(self):
+        self.rows = {}
+
+    async def get_conversation_messages(self, conversation_id, limit=None):
+        return [dict(self.rows[ts]) for ts in sorted(self.rows)]
+
+    async def add_message(self, conversation_id, message_id, role, content, token_count,
+                          user_id, model_used, is_summary=False, generation_time=None,
+                          message_timestamp=None):
+        timestamp = message_timestamp or '2024-01-01T09:00:00'  # "now": after every message
+        self.rows[timestamp] = {
+            'role': role,
+            'content': content,
+            'token_count': token_count,
+            'message_timestamp': timestamp,
+            'is_summary': is_summary
+        }
+
+    async def delete_messages(self, conversation_id, message_timestamps):
+        for timestamp in message_timestamps:
+            self.rows.pop(timestamp, None)
+
+
+def add_rows(storage, start: int, count: int):
+    for row in make_thread(start + count)[start:]:
+        storage.rows[row['message_timestamp']] = row
+
+
+@pytest.mark.asyncio
+async def test_incremental_summary_after_inline_summary_loses_nothing(summarization_settings):
+    """A thread summarized inline keeps its recent messages through the background job."""
+    storage = InMemoryConversationStorage()
+    add_rows(storage, 0, 10)
+    mock_llm = AsyncMock()
+    mock_llm.generate.return_value = {'content': 'Inline summary', 'model': 'gpt-oss:20b'}
+    service = SummarizationService(storage=storage, llm=mock_llm)
+
+    context = await service.summarize_and_prune("c1", await storage.get_conversation_messages("c1"), "u1")
+
+    # Summary is stored before the kept messages, matching the returned context
+    stored = await storage.get_conversation_messages("c1")
+    assert [msg['content'] for msg in stored] == [msg['content'] for msg in context]
+    assert stored[0]['is_summary']
+
+    add_rows(storage, 10, 3)
+    mock_llm.generate.return_value = {'content': 'Updated summary', 'model': 'gpt-oss:20b'}
+    assert await service.summarize_incremental("c1", "u1") is True
+
+    prompt = mock_llm.generate.call_args.kwargs['context'][0]['content']
+    assert 'Inline summary' in prompt
+    assert all(f'Message {i}' in prompt for i in (5, 6, 7))
+
+    stored = await storage.get_conversation_messages("c1")
+    assert [msg['content'] for msg in stored] == (
+        ['[SUMMARY OF PREVIOUS CONVERSATION]\nUpdated summary'] + [f'Message {i}' for i in range(8, 13)]
+    )
+
+
+@pytest.mark.asyncio
+async def test_incremental_summary_folds_messages_before_legacy_summary(summarization_settings):
+    """Summaries stored after the messages they kept don't cause those messages to be dropped."""
+    storage = InMemoryConversationStorage()
+    add_rows(storage, 5, 5)
+    await storage.add_message("c1", "s", 'system', '[SUMMARY OF PREVIOUS CONVERSATION]\nLegacy',
+                              3, "u1", 'gpt-oss:20b', is_summary=True)
+    storage.rows.update({
+        f'2024-01-01T10:00:{i:02d}': {**row, 'message_timestamp': f'2024-01-01T10:00:{i:02d}'}
+        for i, row in enumerate(make_thread(13)[10:])
+    })
+    mock_llm = AsyncMock()
+    mock_llm.generate.return_value = {'content': 'Updated summary', 'model': 'gpt-oss:20b'}
+    service = SummarizationService(storage=storage, llm=mock_llm)
+
+    assert await service.summarize_incremental("c1", "u1") is True
+
+    prompt = mock_llm.generate.call_args.kwargs['context'][0]['content']
+    assert 'Legacy' in prompt
+    assert all(f'Message {i}' in prompt for i in (5, 6, 7))
+
+    stored = await storage.get_conversation_messages("c1")
+    assert [msg['content'] for msg in stored][1:] == [f'Message {i}' for i in range(8, 13)]
+    assert stored[0]['is_summary'] and sum(msg['is_summary'] for msg in stored) == 1
+
+
+@pytest.mark.asyncio
+async def test_background_summarization_deduplicated_per_conversation(summarization_settings):
+    """Triggers while a job runs for the same conversation don't start another."""
+    import asyncio
+
+    mock_storage = AsyncMock()
+    mock_storage.get_conversation_messages.return_value = make_thread(10)
+    mock_llm = AsyncMock()
+
+    async def slow_generate(**kwargs):
+        await asyncio.sleep(0.02)
+        return {'content': 'Summary', 'model': 'gpt-oss:20b'}
+
+    mock_llm.generate.side_effect = slow_generate
+    service = SummarizationService(storage=mock_storage, llm=mock_llm)
+
+    assert service.schedule_summarization("c1", "u1") is True
+    assert service.schedule_summarization("c1", "u1") is False
+    assert service.schedule_summarization("c2", "u1") is True
+    assert service.is_pending("c1")
+
+    await service.wait_for_pending()
+
+    assert mock_llm.generate.await_count == 2
+    stats = service.get_stats()
+    assert stats['deduplicated'] == 1
+    assert stats['completed'] == 2
+    assert stats['pending'] == 0
+
+
+@pytest.mark.asyncio
+async def test_manual_summarize_waits_for_background_job(summarization_settings):
+    """/summarize runs after a background fold, not interleaved with it."""
+    import asyncio
+    from app.api.websocket import handle_summarize_request
+
+    storage = InMemoryConversationStorage()
+    add_rows(storage, 0, 10)
+    release = asyncio.Event()
+    mock_llm = AsyncMock()
+
+    async def generate(**kwargs):
+        if mock_llm.generate.await_count == 1:
+            await release.wait()
+            return {'content': 'Background summary', 'model': 'gpt-oss:20b'}
+        return {'content': 'Manual summary', 'model': 'gpt-oss:20b'}
+
+    mock_llm.generate.side_effect = generate
+    service = SummarizationService(storage=storage, llm=mock_llm)
+    websocket = AsyncMock()
+
+    with patch('app.dependencies.get_summarization_service', return_value=service):
+        service.schedule_summarization("c1", "u1")
+        await asyncio.sleep(0)
+        manual = asyncio.create_task(handle_summarize_request(
+            {'conversation_id': "c1", 'user_id': "u1", 'interaction_id': "i1"}, storage, websocket
+        ))
+        for _ in range(5):
+            await asyncio.sleep(0)
+        assert mock_llm.generate.await_count == 1  # Manual summary waits for the job
+        assert service.schedule_summarization("c1", "u1") is False
+        release.set()
+        await manual
+
+    response = websocket.send_json.call_args[0][0]
+    assert response['summary'] == 'Manual summary'
+    assert response['messages_summarized'] == 6  # Background summary + 5 kept messages
+    stored = await storage.get_conversation_messages("c1")
+    assert [msg['content'] for msg in stored] == ['[Previous conversation summary]\nManual summary']
+    assert not service.is_pending("c1")
+
+
+@pytest.mark.asyncio
+async def test_background_summarization_failure_is_contained():
+    mock_storage = AsyncMock()
+    mock_storage.get_conversation_messages.side_effect = RuntimeError("dynamo down")
+    service = SummarizationService(storage=mock_storage, llm=AsyncMock())
+
+    service.schedule_summarization("c1", "u1")
+    await service.wait_for_pending()
+
+    assert service.get_stats()['failed'] == 1
+    assert not service.is_pending("c1")
+
+
+@pytest.mark.asyncio
+async def test_usage_accumulator_batches_per_user_deltas():
+    """Many requests become one ADD per user at flush time."""
+    from app.services.usage_accumulator import UsageAccumulator
+
+    mock_storage = AsyncMock()
+    mock_storage.add_token_usage_batch.return_value = {}
+    accumulator = UsageAccumulator(storage=mock_storage)
+    tracker = TokenTracker(storage=mock_storage, llm=AsyncMock(), accumulator=accumulator)
+
+    for _ in range(3):
+        await tracker.update_usage("user_1", 100)
+    await tracker.update_usage("user_2", 50)
+
+    mock_storage.update_user_tokens.assert_not_called()
+    assert accumulator.pending("user_1") == 300
+
+    assert await accumulator.flush() == 2
+    mock_storage.add_token_usage_batch.assert_awaited_once_with({"user_1": 300, "user_2": 50})
+    assert accumulator.unflushed_total() == 0
+
+
+@pytest.mark.asyncio
+async def test_usage_accumulator_retries_failed_deltas():
+    from app.services.usage_accumulator import UsageAccumulator
+
+    mock_storage = AsyncMock()
+    mock_storage.add_token_usage_batch.return_value = {"user_1": 100}
+    accumulator = UsageAccumulator(storage=mock_storage)
+
+    await accumulator.record("user_1", 100)
+    await accumulator.record("user_2", 10)
+    await accumulator.flush()
+
+    assert accumulator.pending("user_1") == 100
+    assert accumulator.pending("user_2") == 0
+    assert accumulator.get_stats()['flush_errors'] == 1
+
+
+@pytest.mark.asyncio
+async def test_usage_accumulator_bounds_unflushed_usage():
+    """Reaching max_unflushed_tokens flushes before record() returns."""
+    from app.services.usage_accumulator import UsageAccumulator
+
+    mock_storage = AsyncMock()
+    mock_storage.add_token_usage_batch.return_value = {}
+    accumulator = UsageAccumulator(storage=mock_storage, max_unflushed_tokens=1000)
+
+    await accumulator.record("user_1", 600)
+    mock_storage.add_token_usage_batch.assert_not_called()
+
+    await accumulator.record("user_2", 500)
+    mock_storage.add_token_usage_batch.assert_awaited_once()
+    assert accumulator.unflushed_total() == 0
+
+
+@pytest.mark.asyncio
+async def test_token_tracker_budget_includes_unflushed_usage():
+    from app.services.usage_accumulator import UsageAccumulator
+
+    accumulator = UsageAccumulator(storage=AsyncMock())
+    tracker = TokenTracker(storage=AsyncMock(), llm=AsyncMock(), accumulator=accumulator)
+    await accumulator.record("user_1", 800)
+
+    user = {'tokens_remaining': 1000}
+    assert await tracker.has_budget(user, 500) is True  # Without user_id: flushed view only
+    assert await tracker.has_budget(user, 500, user_id="user_1") is False
+    assert await tracker.has_budget(user, 200, user_id="user_1") is True
+
+
+@pytest.mark.asyncio
+async def test_token_tracker_memoizes_counts():
+    mock_llm = AsyncMock()
+    mock_llm.count_tokens.return_value = 42
+    tracker = TokenTracker(storage=AsyncMock(), llm=mock_llm, count_cache_size=2)
+
+    assert await tracker.count_tokens("long history text") == 42
+    assert await tracker.count_tokens("long history text") == 42
+    mock_llm.count_tokens.assert_awaited_once()
+
+    await tracker.count_tokens("b")
+    await tracker.count_tokens("c")  # Evicts the oldest entry
+    await tracker.count_tokens("long history text")
+    assert mock_llm.count_tokens.await_count == 4
@@ -1,4 +1,5 @@
 """Tests for DynamoDB vector storage."""
+import asyncio
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 from datetime import datetime, timedelta
@@ -450,3 +451,58 @@ async def test_search_similar_filters_expired(vector_storage):
         # Should only return valid chunk
         assert len(results) == 1
         assert results[0].chunk_id == "chunk-valid"
+
+
+@pytest.mark.parametrize("precision,size", [("float32", 4096), ("float16", 2048), ("int8", 1028)])
+def test_embedding_codec_roundtrip(precision, size):
+    """Test binary encoding size and round-trip error per precision."""
+    from app.utils.embedding_codec import decode_embedding, encode_embedding
+
+    vector = [((i * 37) % 101 - 50) / 50.0 for i in range(1024)]
+
+    data = encode_embedding(vector, precision)
+    decoded = decode_embedding(data, precision)
+
+    assert len(data) == size
+    assert max(abs(a - b) for a, b in zip(decoded.tolist(), vector)) < 0.01
+
+
+@pytest.mark.asyncio
+async def test_legacy_decimal_chunks_are_read_and_migrated(vector_storage):
+    """Test that Decimal-list chunks decode and are rewritten as binary."""
+    from decimal import Decimal
+    from app.utils.embedding_codec import decode_embedding
+
+    future_ttl = int((datetime.utcnow() + timedelta(hours=1)).timestamp())
+    legacy_item = {
+        "url_hash": "hash1",
+        "chunk_id": "chunk-1",
+        "chunk_text": "Legacy chunk",
+        "embedding_vector": [Decimal("0.5"), Decimal("-0.25")],
+        "chunk_index": 0,
+        "token_count": 2,
+        "source_url": "https://example.com",
+        "created_at": datetime.utcnow().isoformat(),
+        "ttl": future_ttl,
+    }
+    mock_table = AsyncMock()
+    mock_table.query = AsyncMock(return_value={"Items": [legacy_item]})
+
+    mock_dynamodb = AsyncMock()
+    mock_dynamodb.Table = AsyncMock(return_value=mock_table)
+    mock_dynamodb.__aenter__ = AsyncMock(return_value=mock_dynamodb)
+    mock_dynamodb.__aexit__ = AsyncMock()
+    vector_storage.session = MagicMock()
+    vector_storage.session.resource = MagicMock(return_value=mock_dynamodb)
+
+    chunks = await vector_storage.get_chunks_by_url("https://example.com")
+
+    assert chunks[0].embedding_vector == [0.5, -0.25]
+    mock_table.update_item.assert_not_called()  # Rewritten in the background
+
+    await asyncio.gather(*vector_storage._migration_tasks)
+    update = mock_table.update_item.call_args.kwargs
+    assert "REMOVE embedding_vector" in update["UpdateExpression"]
+    assert "attribute_exists(embedding_vector)" in update["ConditionExpression"]
+    values = update["ExpressionAttributeValues"]
+    assert decode_embedding(values[":embedding"], values[":dtype"]).tolist() == [0.5, -0.25]
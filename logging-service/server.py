@@ -1,81 +1,186 @@
 """
 Centralized logging service that receives logs from all containers.
-Uses a FIFO queue to buffer incoming logs and prevent blocking.
+
+An asyncio ingest loop reads framed log batches (see shared/log_transport.py)
+and a single writer task appends them to the date-partitioned files in
+batches. When the write backlog is full the server stops reading from
+sockets, pushing backpressure to clients (which buffer, then drop and count).
 """
+import asyncio
+import collections
 import logging
 import os
-import pickle
-import queue
-import socketserver
-import struct
 import sys
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from logging.handlers import RotatingFileHandler
 from pathlib import Path
+from typing import Any, Dict, List, Optional
 
 # Add shared directory to path
 sys.path.insert(0, '/shared')
 from health_server import HealthCheckServer
 from log_config import LogSettings, get_log_file_path
+from log_transport import FRAME_HEADER, MAX_FRAME_BYTES, FrameError, decode_payload
+
+
+class LogIngestServer:
+    """
+    Asyncio TCP server for batched log frames.
+
+    Records are buffered in a bounded backlog and written by one writer task,
+    so file writes happen in batches and stay in arrival order.
+
+    Counters (get_stats):
+        received/written: records accepted from sockets and written to files
+        dropped: local records dropped because the backlog was full
+        client_dropped: records clients reported dropping before sending
+        backpressure_waits: frames that waited for backlog space
+        lag_seconds/max_lag_seconds: record age when written (last/max)
+    """
+
+    def __init__(self, max_pending: int = 10000, write_batch_size: int = 2000):
+        self.max_pending = max_pending
+        self.write_batch_size = write_batch_size
+
+        self._pending: collections.deque = collections.deque()
+        self._ready = asyncio.Event()
+        self._space = asyncio.Event()
+        self._space.set()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._writer_task: Optional[asyncio.Task] = None
+        # One thread keeps file writes ordered and off the event loop
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='log-writer')
+
+        self._stats = {
+            'connections': 0,
+            'frames': 0,
+            'received': 0,
+            'written': 0,
+            'dropped': 0,
+            'client_dropped': 0,
+            'decode_errors': 0,
+            'write_errors': 0,
+            'backpressure_waits': 0,
+            'lag_seconds': 0.0,
+            'max_lag_seconds': 0.0,
+        }
+
+    async def start(self, host: str, port: int):
+        """Start listening and start the writer task."""
+        self._loop = asyncio.get_running_loop()
+        self._writer_task = asyncio.create_task(self._write_loop())
+        self._server = await asyncio.start_server(self._handle_client, host, port)
+
+    async def serve_forever(self):
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def _handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Read frames from one client until it disconnects."""
+        self._stats['connections'] += 1
+        try:
+            while True:
+                length, flags = FRAME_HEADER.unpack(await reader.readexactly(FRAME_HEADER.size))
+                if length > MAX_FRAME_BYTES:
+                    raise FrameError(f"Frame too large: {length} bytes")
+                header, records = decode_payload(flags, await reader.readexactly(length))
+
+                self._stats['frames'] += 1
+                self._stats['client_dropped'] += header.get('dropped', 0)
+
+                # Backpressure: don't read more until the writer catches up
+                if len(self._pending) >= self.max_pending:
+                    self._stats['backpressure_waits'] += 1
+                    while len(self._pending) >= self.max_pending:
+                        self._space.clear()
+                        await self._space.wait()
+
+                self._pending.extend(records)
+                self._stats['received'] += len(records)
+                self._ready.set()
+
+        except asyncio.IncompleteReadError:
+            pass  # Client disconnected
+        except FrameError as e:
+            self._stats['decode_errors'] += 1
+            logging.getLogger('logging-service').error(f"Error receiving log: {e}")
+        except Exception as e:
+            logging.getLogger('logging-service').error(f"Error receiving log: {e}")
+        finally:
+            self._stats['connections'] -= 1
+            writer.close()
+
+    def submit(self, records: List[Any]):
+        """Queue records produced in this process (drops if backlog is full)."""
+        if len(self._pending) >= self.max_pending:
+            self._stats['dropped'] += len(records)
+            return
+        self._pending.extend(records)
+        self._ready.set()
+
+    def submit_threadsafe(self, records: List[Any]):
+        """submit() from any thread."""
+        if self._loop is None:
+            self.submit(records)
+        else:
+            self._loop.call_soon_threadsafe(self.submit, records)
+
+    async def _write_loop(self):
+        """Drain the backlog in batches; file I/O runs on the writer thread."""
+        loop = asyncio.get_running_loop()
+        while True:
+            await self._ready.wait()
+            count = min(len(self._pending), self.write_batch_size)
+            batch = [self._pending.popleft() for _ in range(count)]
+            if not self._pending:
+                self._ready.clear()
+            if len(self._pending) < self.max_pending:
+                self._space.set()
+            if not batch:
+                continue
+
+            try:
+                oldest = await loop.run_in_executor(self._executor, write_records, batch)
+                self._stats['written'] += len(batch)
+                lag = max(0.0, time.time() - oldest)
+                self._stats['lag_seconds'] = round(lag, 3)
+                self._stats['max_lag_seconds'] = round(max(lag, self._stats['max_lag_seconds']), 3)
+            except Exception as e:
+                # Last resort: print to stdout (can't use logger here)
+                self._stats['write_errors'] += 1
+                print(f"CRITICAL: Error processing log: {e}")
 
-# Global FIFO queue for log records
-log_queue = queue.Queue(maxsize=10000)  # Buffer up to 10,000 log records
+    def check_health(self) -> bool:
+        """Healthy while the backlog is below 90% of capacity."""
+        return len(self._pending) < self.max_pending * 0.9
 
+    def get_stats(self) -> Dict[str, Any]:
+        """Get ingest counters."""
+        return {**self._stats, 'pending': len(self._pending), 'max_pending': self.max_pending}
 
-class QueueHandler(logging.Handler):
-    """Handler that puts log records into the FIFO queue."""
+
+class IngestHandler(logging.Handler):
+    """Handler that routes logging-service's own records into the ingest backlog."""
+
+    def __init__(self, ingest: LogIngestServer):
+        super().__init__()
+        self.ingest = ingest
 
     def emit(self, record):
-        """Put log record into queue."""
+        """Put log record into the backlog."""
         try:
             # Add service attribute if not present
             if not hasattr(record, 'service'):
                 record.service = 'logging-service'
-            log_queue.put(record, block=False)
-        except queue.Full:
-            # Queue full - drop log silently
-            pass
+            self.ingest.submit_threadsafe([record])
         except Exception:
             self.handleError(record)
 
 
-class LogRecordStreamHandler(socketserver.StreamRequestHandler):
-    """Handler for streaming log records via TCP."""
-
-    def handle(self):
-        """Handle incoming log records and put them in queue."""
-        while True:
-            try:
-                chunk = self.connection.recv(4)
-                if len(chunk) < 4:
-                    break
-                slen = struct.unpack('>L', chunk)[0]
-                chunk = self.connection.recv(slen)
-                while len(chunk) < slen:
-                    chunk += self.connection.recv(slen - len(chunk))
-                obj = pickle.loads(chunk)
-                record = logging.makeLogRecord(obj)
-
-                # Put record in FIFO queue (non-blocking to prevent client hangs)
-                try:
-                    log_queue.put(record, block=False)
-                except queue.Full:
-                    # Queue full - drop log
-                    # Note: Can't easily log here without service_logger reference
-                    pass
-
-            except Exception as e:
-                # Log errors if they occur
-                try:
-                    service_logger = logging.getLogger('logging-service')
-                    service_logger.error(f"Error receiving log: {e}")
-                except:
-                    pass
-                break
-
-
 class DailyRotatingFileHandler(RotatingFileHandler):
     """
     File handler that creates new log files in date-based directories.
@@ -140,6 +245,37 @@ class DailyRotatingFileHandler(RotatingFileHandler):
         except Exception:
             self.handleError(record)
 
+    def emit_batch(self, records: List[logging.LogRecord]):
+        """
+        Write a batch of records with one lock acquisition and one flush.
+
+        Size-based rotation is checked per record against a running byte
+        count instead of seeking the file for every record.
+        """
+        self.acquire()
+        try:
+            today = datetime.now().date()
+            if today != self.current_date:
+                self._rotate_to_new_date(today)
+            if self.stream is None:
+                self.stream = self._open()
+
+            position = self.stream.tell()
+            for record in records:
+                try:
+                    msg = self.format(record) + self.terminator
+                    if self.maxBytes > 0 and position + len(msg) >= self.maxBytes and position > 0:
+                        self.doRollover()
+                        position = 0
+                    self.stream.write(msg)
+                    position += len(msg)
+                except Exception:
+                    self.handleError(record)
+
+            self.stream.flush()
+        finally:
+            self.release()
+
     def _rotate_to_new_date(self, new_date: datetime.date):
         """
         Rotate to a new date directory.
@@ -172,28 +308,27 @@ class DailyRotatingFileHandler(RotatingFileHandler):
         self.stream = self._open()
 
 
-def log_worker():
-    """Worker thread that processes logs from FIFO queue and writes to files."""
-    # Get root logger which has the file handlers
-    root_logger = logging.getLogger()
+def write_records(items: List[Any]) -> float:
+    """
+    Write a batch to the file handlers (runs on the writer thread).
 
-    while True:
-        try:
-            # Block until log record available (FIFO order)
-            record = log_queue.get(block=True)
-
-            # Write directly to file handlers (skip QueueHandler to avoid loops)
-            for handler in root_logger.handlers:
-                # Only write to file handlers, not QueueHandler or console
-                if isinstance(handler, (RotatingFileHandler, DailyRotatingFileHandler)):
-                    if record.levelno >= handler.level:
-                        handler.handle(record)
-
-            # Mark task as done
-            log_queue.task_done()
-        except Exception as e:
-            # Last resort: print to stdout (can't use logger here)
-            print(f"CRITICAL: Error processing log: {e}")
+    Args:
+        items: LogRecords or record dicts decoded from the wire
+
+    Returns:
+        Oldest record creation time in the batch (for lag accounting)
+    """
+    records = [
+        item if isinstance(item, logging.LogRecord) else logging.makeLogRecord(item)
+        for item in items
+    ]
+
+    # Write directly to file handlers (console output is for the service's own logs)
+    for handler in logging.getLogger().handlers:
+        if isinstance(handler, DailyRotatingFileHandler):
+            handler.emit_batch([r for r in records if r.levelno >= handler.level])
+
+    return min(record.created for record in records)
 
 
 def setup_logging_server():
@@ -254,8 +389,8 @@ class ServiceFilter(logging.Filter):
         return True
 
 
-def setup_service_logger():
-    """Setup logger for logging-service itself (writes to queue)."""
+def setup_service_logger(ingest: LogIngestServer):
+    """Setup logger for logging-service itself (writes to the ingest backlog)."""
     logger = logging.getLogger('logging-service')
     logger.setLevel(logging.INFO)
     logger.propagate = False  # Don't propagate to root logger to avoid duplicates
@@ -264,9 +399,8 @@ def setup_service_logger():
     service_filter = ServiceFilter()
     logger.addFilter(service_filter)
 
-    # Add queue handler so service logs go through the same FIFO queue
-    queue_handler = QueueHandler()
-    logger.addHandler(queue_handler)
+    # Route service logs through the same backlog as client logs
+    logger.addHandler(IngestHandler(ingest))
 
     # Also add console handler for immediate visibility
     console_handler = logging.StreamHandler()
@@ -308,11 +442,6 @@ def check_mount_health() -> bool:
         return False
 
 
-def check_queue_health() -> bool:
-    """Check if log queue is healthy (not too full)."""
-    return log_queue.qsize() < log_queue.maxsize * 0.9
-
-
 def mount_health_monitor():
     """Background thread that monitors mount health."""
     failure_count = 0
@@ -343,17 +472,19 @@ def mount_health_monitor():
             time.sleep(HEALTH_CHECK_INTERVAL)
 
 
-if __name__ == '__main__':
+async def main():
+    settings = LogSettings()
+
     # Setup file handlers first
     setup_logging_server()
 
-    # Setup service logger (logs go to queue)
-    service_logger = setup_service_logger()
+    ingest = LogIngestServer(
+        max_pending=settings.LOG_INGEST_MAX_PENDING_RECORDS,
+        write_batch_size=settings.LOG_INGEST_WRITE_BATCH_RECORDS
+    )
 
-    # Start log worker thread (processes queue)
-    worker_thread = threading.Thread(target=log_worker, daemon=True)
-    worker_thread.start()
-    service_logger.info("Log worker thread started")
+    # Setup service logger (logs go to ingest backlog)
+    service_logger = setup_service_logger(ingest)
 
     # Start mount health monitor thread
     monitor_thread = threading.Thread(target=mount_health_monitor, daemon=True)
@@ -363,16 +494,18 @@ if __name__ == '__main__':
     # Setup and start health check server
     health_server = HealthCheckServer(service_name="logging-service", port=9998)
     health_server.register_check("mount", check_mount_health)
-    health_server.register_check("queue", check_queue_health)
+    health_server.register_check("queue", ingest.check_health)
+    health_server.register_stats("ingest", ingest.get_stats)
     health_server.start()
     service_logger.info("Health check endpoint started on port 9998")
 
-    # Start TCP server on port 9999
-    server = socketserver.ThreadingTCPServer(
-        ('0.0.0.0', 9999),
-        LogRecordStreamHandler
-    )
+    # Start TCP ingest on port 9999
+    await ingest.start('0.0.0.0', 9999)
 
     service_logger.info("Logging service started on port 9999")
-    service_logger.info("Receiving logs and processing via FIFO queue")
-    server.serve_forever()
+    service_logger.info("Receiving batched log frames, writing in batches")
+    await ingest.serve_forever()
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,8 @@
+"""Pytest configuration for logging-service tests."""
+import sys
+from pathlib import Path
+
+# Make server.py and the shared modules (mounted at /shared in the container) importable
+SERVICE_DIR = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(SERVICE_DIR.parent / 'shared'))
+sys.path.insert(0, str(SERVICE_DIR))
@@ -0,0 +1,151 @@
+"""Unit tests for the framed log transport (shared/log_transport.py)."""
+import json
+import logging
+import socket
+import sys
+
+import pytest
+
+from log_transport import (
+    FLAG_COMPRESSED,
+    FRAME_HEADER,
+    BatchingLogHandler,
+    FrameError,
+    decode_payload,
+    encode_frame,
+    record_to_row,
+)
+
+
+def make_record(msg, *args, level=logging.INFO):
+    record = logging.LogRecord('app.test', level, __file__, 10, msg, args, None)
+    record.service = 'test-service'
+    return record
+
+
+def split_frame(frame):
+    length, flags = FRAME_HEADER.unpack(frame[:FRAME_HEADER.size])
+    payload = frame[FRAME_HEADER.size:]
+    assert len(payload) == length
+    return flags, payload
+
+
+@pytest.fixture
+def refused_port():
+    """A local port that refuses connections (bound, never listening)."""
+    sock = socket.socket()
+    sock.bind(('127.0.0.1', 0))
+    yield sock.getsockname()[1]
+    sock.close()
+
+
+# =============================================================================
+# Frame Encoding Tests
+# =============================================================================
+
+def test_frame_round_trip():
+    """Rows decode back into records with the rendered message and fields."""
+    rows = [record_to_row(make_record('user %s joined', 'alice')), record_to_row(make_record('bye'))]
+
+    flags, payload = split_frame(encode_frame(rows, dropped=3, compress_min_bytes=None))
+    header, records = decode_payload(flags, payload)
+
+    assert flags == 0
+    assert header['dropped'] == 3
+    restored = [logging.makeLogRecord(r) for r in records]
+    assert [r.getMessage() for r in restored] == ['user alice joined', 'bye']
+    assert restored[0].service == 'test-service'
+    assert restored[0].levelno == logging.INFO
+
+
+def test_large_payloads_are_compressed():
+    """Payloads over compress_min_bytes are zlib-compressed and still decode."""
+    rows = [record_to_row(make_record('repeated message %d', i)) for i in range(200)]
+
+    compressed = encode_frame(rows, compress_min_bytes=1024)
+    plain = encode_frame(rows, compress_min_bytes=None)
+    flags, payload = split_frame(compressed)
+
+    assert flags & FLAG_COMPRESSED
+    assert len(compressed) < len(plain)
+    assert len(decode_payload(flags, payload)[1]) == 200
+
+
+def test_exception_text_crosses_the_wire():
+    """exc_info is rendered to exc_text before encoding."""
+    try:
+        raise ValueError('boom')
+    except ValueError:
+        record = logging.LogRecord('app.test', logging.ERROR, __file__, 1, 'failed', (), sys.exc_info())
+
+    flags, payload = split_frame(encode_frame([record_to_row(record)]))
+    _, records = decode_payload(flags, payload)
+
+    assert 'ValueError: boom' in records[0]['exc_text']
+
+
+def test_unknown_version_is_rejected():
+    """Frames from a newer protocol version raise FrameError."""
+    payload = (json.dumps({'v': 99, 'fields': ['msg'], 'dropped': 0}) + '\n[["x"]]').encode()
+
+    with pytest.raises(FrameError, match='version'):
+        decode_payload(0, payload)
+
+
+def test_corrupt_payload_is_rejected():
+    """Garbage (or a bad compression flag) raises FrameError, not a raw exception."""
+    with pytest.raises(FrameError):
+        decode_payload(0, b'not json')
+    with pytest.raises(FrameError):
+        decode_payload(FLAG_COMPRESSED, b'not zlib')
+
+
+# =============================================================================
+# BatchingLogHandler Tests
+# =============================================================================
+
+def test_full_buffer_drops_and_reports_once(refused_port):
+    """Records beyond buffer_size are dropped, counted, and reported in the next batch."""
+    handler = BatchingLogHandler('127.0.0.1', refused_port, batch_size=2, buffer_size=2, flush_interval=60)
+    try:
+        for i in range(5):
+            handler.emit(make_record('message %d', i))
+
+        stats = handler.get_stats()
+        assert stats['buffered'] == 2
+        assert stats['dropped'] == 3
+        assert stats['sent'] == 0
+
+        batch, dropped = handler._take_batch()
+        assert len(batch) == 2
+        assert dropped == 3
+        assert handler._take_batch() == ([], 0)
+    finally:
+        handler.close(timeout=0)
+
+
+def test_send_error_counts_batch_as_dropped(refused_port):
+    """A failed send drops the batch and carries the count to the next frame."""
+
+    class BrokenSocket:
+        def sendall(self, data):
+            raise ConnectionResetError('peer reset')
+
+        def close(self):
+            pass
+
+    handler = BatchingLogHandler('127.0.0.1', refused_port, batch_size=10, flush_interval=60)
+    try:
+        handler.emit(make_record('one'))
+        handler.emit(make_record('two'))
+        handler._sock = BrokenSocket()
+
+        assert handler._send_next_batch() is False
+
+        stats = handler.get_stats()
+        assert stats['send_errors'] == 1
+        assert stats['dropped'] == 2
+        assert stats['connected'] is False
+        assert handler._unreported_drops == 2
+    finally:
+        handler.close(timeout=0)
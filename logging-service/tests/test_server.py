@@ -0,0 +1,149 @@
+"""Unit tests for LogIngestServer frame handling and backpressure."""
+import asyncio
+import logging
+
+import pytest
+
+import server
+from log_transport import FRAME_HEADER, MAX_FRAME_BYTES, encode_frame, record_to_row
+from server import LogIngestServer
+
+
+class FakeWriter:
+    """StreamWriter stand-in (the ingest server only closes it)."""
+
+    def __init__(self):
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+def make_frame(messages, dropped=0):
+    rows = []
+    for message in messages:
+        record = logging.LogRecord('app.test', logging.INFO, __file__, 1, message, (), None)
+        record.service = 'test-service'
+        rows.append(record_to_row(record))
+    return encode_frame(rows, dropped=dropped, compress_min_bytes=None)
+
+
+def start_client(ingest):
+    reader = asyncio.StreamReader()
+    writer = FakeWriter()
+    task = asyncio.create_task(ingest._handle_client(reader, writer))
+    return reader, writer, task
+
+
+async def settle(condition):
+    """Poll until condition() holds (file writes run on the writer thread)."""
+    for _ in range(500):
+        if condition():
+            return
+        await asyncio.sleep(0.01)
+    raise AssertionError('condition not reached')
+
+
+# =============================================================================
+# Frame Handling Tests
+# =============================================================================
+
+@pytest.mark.asyncio
+async def test_frames_split_across_reads_are_reassembled():
+    """A frame arriving a few bytes at a time is decoded once complete."""
+    ingest = LogIngestServer()
+    reader, writer, task = start_client(ingest)
+    frame = make_frame(['first', 'second'], dropped=4)
+
+    for i in range(0, len(frame), 7):
+        reader.feed_data(frame[i:i + 7])
+        await asyncio.sleep(0)
+    reader.feed_eof()
+    await task
+
+    stats = ingest.get_stats()
+    assert stats['frames'] == 1
+    assert stats['received'] == 2
+    assert stats['client_dropped'] == 4
+    assert [r['msg'] for r in ingest._pending] == ['first', 'second']
+    assert writer.closed
+
+
+@pytest.mark.asyncio
+async def test_truncated_frame_is_treated_as_disconnect():
+    """A client that disconnects mid-frame is not counted as a decode error."""
+    ingest = LogIngestServer()
+    reader, writer, task = start_client(ingest)
+    frame = make_frame(['lost'])
+
+    reader.feed_data(frame[:-3])
+    reader.feed_eof()
+    await task
+
+    stats = ingest.get_stats()
+    assert stats['frames'] == 0
+    assert stats['decode_errors'] == 0
+    assert stats['connections'] == 0
+    assert writer.closed
+
+
+@pytest.mark.asyncio
+async def test_oversized_frame_closes_connection():
+    """A length prefix above MAX_FRAME_BYTES is rejected without reading the body."""
+    ingest = LogIngestServer()
+    reader, writer, task = start_client(ingest)
+
+    reader.feed_data(FRAME_HEADER.pack(MAX_FRAME_BYTES + 1, 0))
+    await task
+
+    assert ingest.get_stats()['decode_errors'] == 1
+    assert writer.closed
+
+
+# =============================================================================
+# Backpressure Tests
+# =============================================================================
+
+@pytest.mark.asyncio
+async def test_full_backlog_pauses_reading_until_writer_drains(monkeypatch):
+    """Frames wait for backlog space instead of being dropped, and stay in order."""
+    written = []
+
+    def write_records(items):
+        written.extend(r['msg'] for r in items)
+        return min(r['created'] for r in items)
+
+    monkeypatch.setattr(server, 'write_records', write_records)
+    ingest = LogIngestServer(max_pending=2, write_batch_size=2)
+    reader, writer, task = start_client(ingest)
+
+    reader.feed_data(make_frame(['a', 'b']) + make_frame(['c', 'd']))
+    await settle(lambda: ingest.get_stats()['backpressure_waits'] == 1)
+    assert ingest.get_stats()['received'] == 2
+
+    writer_task = asyncio.create_task(ingest._write_loop())
+    try:
+        reader.feed_eof()
+        await task
+        await settle(lambda: len(written) == 4)
+    finally:
+        writer_task.cancel()
+        ingest._executor.shutdown(wait=True)
+
+    stats = ingest.get_stats()
+    assert written == ['a', 'b', 'c', 'd']
+    assert stats['received'] == 4
+    assert stats['dropped'] == 0
+
+
+@pytest.mark.asyncio
+async def test_local_submit_drops_when_backlog_full():
+    """The service's own records are dropped (and counted) rather than blocking."""
+    ingest = LogIngestServer(max_pending=2)
+
+    ingest.submit(['x', 'y'])
+    ingest.submit(['z'])
+
+    stats = ingest.get_stats()
+    assert stats['pending'] == 2
+    assert stats['dropped'] == 1
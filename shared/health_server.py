@@ -2,7 +2,7 @@
 import threading
 from http.server import HTTPServer, BaseHTTPRequestHandler
 import json
-from typing import Dict, Callable
+from typing import Any, Dict, Callable
 
 
 class HealthCheckHandler(BaseHTTPRequestHandler):
@@ -10,6 +10,7 @@ class HealthCheckHandler(BaseHTTPRequestHandler):
 
     # Class variables shared across instances
     health_checks: Dict[str, Callable[[], bool]] = {}
+    stats_providers: Dict[str, Callable[[], Dict[str, Any]]] = {}
     service_name: str = "unknown"
 
     def do_GET(self):
@@ -40,6 +41,10 @@ class HealthCheckHandler(BaseHTTPRequestHandler):
                     "status": "healthy" if all_healthy else "unhealthy",
                     "checks": results
                 }
+                if self.stats_providers:
+                    response["stats"] = {
+                        name: provider() for name, provider in self.stats_providers.items()
+                    }
 
                 status_code = 200 if all_healthy else 503
                 self.send_response(status_code)
@@ -71,6 +76,7 @@ class HealthCheckServer:
         self.service_name = service_name
         self.port = port
         self.health_checks: Dict[str, Callable[[], bool]] = {}
+        self.stats_providers: Dict[str, Callable[[], Dict[str, Any]]] = {}
         self.server = None
         self.thread = None
 
@@ -83,10 +89,20 @@ class HealthCheckServer:
         """
         self.health_checks[name] = check_func
 
+    def register_stats(self, name: str, stats_func: Callable[[], Dict[str, Any]]):
+        """Register a stats provider, reported under "stats" in /health.
+
+        Args:
+            name: Name of the stats section (e.g., "ingest")
+            stats_func: Function returning a JSON-serializable dict of counters
+        """
+        self.stats_providers[name] = stats_func
+
     def start(self):
         """Start the health check HTTP server."""
         # Update class variables
         HealthCheckHandler.health_checks = self.health_checks
+        HealthCheckHandler.stats_providers = self.stats_providers
         HealthCheckHandler.service_name = self.service_name
 
         # Start HTTP server in background thread
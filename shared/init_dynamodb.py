@@ -433,17 +433,24 @@ async def create_troise_vectors_table(dynamodb):
 
     Partition Key (PK):
     - TEXT#{text_hash} - SHA256 hash of the text being embedded
+    - NAMESPACE#{model_name} - Namespace version of a model
+    - STATS#{model_name} / STATS - Entry counters / model registry
 
     Sort Key (SK):
-    - MODEL#{model_name} - Embedding model identifier (e.g., nomic-embed-text)
+    - MODEL#{model_name}[#V{version}] - Embedding model and namespace version
+    - VERSION - Namespace version item
+    - V{version}#B{day} - Entry counter for one TTL day bucket
+    - MODELS - String set of cached models
 
     Attributes:
     - embedding: Binary - The embedding vector
+    - embedding_dtype: String - float32 | float16 | int8
     - dimensions: Number - Vector dimensions (e.g., 768)
     - created_at: String - ISO8601 timestamp
     - text_preview: String - First 100 chars for debugging
 
-    TTL: 30-day cache expiry to handle model updates
+    TTL: 30-day cache expiry; also removes invalidated namespace versions
+    and expired counters (no cleanup scans)
     """
     try:
         print("Creating 'troise_vectors' table...")
@@ -25,6 +25,16 @@ class LogSettings(BaseSettings):
     DEBUG_LOG_LEVEL: str = "DEBUG"
     ERROR_LOG_LEVEL: str = "ERROR"
 
+    # Transport (services -> logging-service)
+    LOG_TRANSPORT_BATCH_RECORDS: int = 256  # Send when this many records are buffered
+    LOG_TRANSPORT_FLUSH_INTERVAL_MS: int = 200  # ...or when this much time has passed
+    LOG_TRANSPORT_BUFFER_RECORDS: int = 10000  # Client buffer; records beyond this are dropped
+    LOG_TRANSPORT_COMPRESS_MIN_BYTES: int = 4096  # zlib batches at least this large (0 = off)
+
+    # Ingest (logging-service)
+    LOG_INGEST_MAX_PENDING_RECORDS: int = 10000  # Stop reading sockets above this backlog
+    LOG_INGEST_WRITE_BATCH_RECORDS: int = 2000  # Max records per file write batch
+
     # Third-party loggers to silence (set to WARNING level)
     # Can be overridden via NOISY_LOGGERS env var (comma-separated)
     NOISY_LOGGERS: str = "botocore,boto3,aioboto3,aiobotocore,urllib3,httpx,httpcore,asyncio,websockets,sse_starlette"
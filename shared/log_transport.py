@@ -0,0 +1,304 @@
+"""
+Batched log transport between services and the centralized logging service.
+
+Replaces the stdlib SocketHandler (one pickled record per frame, one send()
+per record, sent inline from the logging call) with:
+
+- BatchingLogHandler: emit() only appends to a bounded in-memory buffer; a
+  background thread encodes and sends batches when the buffer reaches a size
+  threshold or the flush interval elapses. When the buffer is full (logging
+  service down or slow), records are dropped and counted, never blocking the
+  caller.
+- A framed, non-pickle wire format shared with logging-service.
+
+Wire format (one frame per batch):
+    [4 bytes] payload length (big-endian uint32)
+    [1 byte]  flags (bit 0 = zlib-compressed payload)
+    [payload] Two JSON lines: a header object, then an array of records
+
+    Header: {"v": 1, "fields": [...], "dropped": <records dropped client-side
+             since the previous batch>}
+    Records are positional arrays in header["fields"] order, so a whole batch
+    is encoded and decoded by one json call instead of one per record.
+"""
+import collections
+import json
+import logging
+import socket
+import struct
+import threading
+import time
+import zlib
+from typing import Any, Dict, List, Optional, Tuple
+
+PROTOCOL_VERSION = 1
+FRAME_HEADER = struct.Struct('>LB')
+FLAG_COMPRESSED = 0x01
+MAX_FRAME_BYTES = 16 * 1024 * 1024
+
+# LogRecord attributes carried over the wire (enough to format on the server)
+RECORD_FIELDS = (
+    'name', 'levelno', 'levelname', 'created', 'msecs', 'service',
+    'pathname', 'filename', 'module', 'lineno', 'funcName',
+    'process', 'processName', 'thread', 'threadName',
+)
+WIRE_FIELDS = RECORD_FIELDS + ('msg', 'exc_text', 'stack_info')
+
+
+class FrameError(ValueError):
+    """Raised when a frame cannot be decoded."""
+
+
+def record_to_row(record: logging.LogRecord) -> Tuple[Any, ...]:
+    """
+    Flatten a LogRecord into a WIRE_FIELDS-ordered tuple.
+
+    The message is rendered here (like SocketHandler) so mutable args can't
+    change before the batch is sent, and exc_info is rendered to exc_text
+    because tracebacks can't cross the wire.
+    """
+    if record.exc_info and not record.exc_text:
+        record.exc_text = logging.Formatter().formatException(record.exc_info)
+    return tuple(getattr(record, field, None) for field in RECORD_FIELDS) + (
+        record.getMessage(), record.exc_text, record.stack_info
+    )
+
+
+def encode_frame(
+    rows: List[Tuple[Any, ...]],
+    dropped: int = 0,
+    compress_min_bytes: Optional[int] = 4096
+) -> bytes:
+    """
+    Encode a batch of record rows as one frame.
+
+    Args:
+        rows: Output of record_to_row
+        dropped: Records dropped client-side since the previous frame
+        compress_min_bytes: Compress payloads at least this large (None disables)
+
+    Returns:
+        Frame bytes ready for sendall()
+    """
+    header = json.dumps({'v': PROTOCOL_VERSION, 'fields': WIRE_FIELDS, 'dropped': dropped})
+    payload = (header + '\n' + json.dumps(rows, default=str)).encode('utf-8')
+
+    flags = 0
+    if compress_min_bytes is not None and len(payload) >= compress_min_bytes:
+        payload = zlib.compress(payload, 1)
+        flags |= FLAG_COMPRESSED
+
+    return FRAME_HEADER.pack(len(payload), flags) + payload
+
+
+def decode_payload(flags: int, payload: bytes) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+    """
+    Decode a frame payload.
+
+    Returns:
+        (header, record dicts suitable for logging.makeLogRecord)
+
+    Raises:
+        FrameError: Corrupt payload or unsupported protocol version
+    """
+    try:
+        if flags & FLAG_COMPRESSED:
+            payload = zlib.decompress(payload)
+        header_line, _, body = payload.partition(b'\n')
+        header = json.loads(header_line)
+        if header.get('v') != PROTOCOL_VERSION:
+            raise FrameError(f"Unsupported log protocol version: {header.get('v')}")
+        fields = header['fields']
+        return header, [dict(zip(fields, row)) for row in json.loads(body)]
+    except FrameError:
+        raise
+    except Exception as e:
+        raise FrameError(f"Invalid log frame: {e}") from e
+
+
+class BatchingLogHandler(logging.Handler):
+    """
+    Logging handler that ships records to the logging service in batches.
+
+    emit() never touches the network: it renders the record and appends it
+    to a bounded buffer. A daemon thread owns the socket and flushes when
+    batch_size records are buffered or flush_interval seconds have passed.
+
+    Example:
+        handler = BatchingLogHandler('logging-service', 9999)
+        logging.getLogger().addHandler(handler)
+        handler.get_stats()  # {'sent': ..., 'dropped': ..., ...}
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        batch_size: int = 256,
+        flush_interval: float = 0.2,
+        buffer_size: int = 10000,
+        compress_min_bytes: Optional[int] = 4096,
+        connect_timeout: float = 2.0,
+        send_timeout: float = 10.0,
+        max_retry_seconds: float = 30.0
+    ):
+        super().__init__()
+        self.host = host
+        self.port = port
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self.buffer_size = max(self.batch_size, buffer_size)
+        self.compress_min_bytes = compress_min_bytes
+        self.connect_timeout = connect_timeout
+        self.send_timeout = send_timeout
+        self.max_retry_seconds = max_retry_seconds
+
+        self._buffer: collections.deque = collections.deque()
+        self._buffer_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopping = threading.Event()
+        self._sock: Optional[socket.socket] = None
+        self._retry_at = 0.0
+        self._retry_delay = 1.0
+        self._unreported_drops = 0
+
+        self._stats = {
+            'sent': 0,
+            'batches': 0,
+            'bytes': 0,
+            'dropped': 0,
+            'send_errors': 0,
+            'connects': 0,
+        }
+
+        self._thread = threading.Thread(
+            target=self._run, name='log-transport', daemon=True
+        )
+        self._thread.start()
+
+    def emit(self, record: logging.LogRecord):
+        """Buffer a record (drops and counts it if the buffer is full)."""
+        try:
+            data = record_to_row(record)
+        except Exception:
+            self.handleError(record)
+            return
+
+        with self._buffer_lock:
+            if len(self._buffer) >= self.buffer_size:
+                self._stats['dropped'] += 1
+                self._unreported_drops += 1
+                return
+            self._buffer.append(data)
+            full = len(self._buffer) >= self.batch_size
+
+        if full and not self._wakeup.is_set():
+            self._wakeup.set()
+
+    def flush(self):
+        """Ask the sender thread to flush now (does not wait)."""
+        self._wakeup.set()
+
+    def close(self, timeout: float = 2.0):
+        """Flush what's buffered (bounded by timeout) and stop the sender."""
+        if not self._stopping.is_set():
+            self._stopping.set()
+            self._wakeup.set()
+            if threading.current_thread() is not self._thread:
+                self._thread.join(timeout)
+        super().close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get transport counters."""
+        with self._buffer_lock:
+            buffered = len(self._buffer)
+        return {
+            **self._stats,
+            'buffered': buffered,
+            'buffer_size': self.buffer_size,
+            'connected': self._sock is not None,
+        }
+
+    def _run(self):
+        """Sender loop: wait for a full batch or the flush interval."""
+        while True:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            closing = self._stopping.is_set()
+
+            while self._send_next_batch():
+                pass
+
+            if closing:
+                self._disconnect()
+                return
+
+    def _take_batch(self) -> Tuple[List[Tuple[Any, ...]], int]:
+        with self._buffer_lock:
+            count = min(len(self._buffer), self.batch_size)
+            batch = [self._buffer.popleft() for _ in range(count)]
+            dropped, self._unreported_drops = self._unreported_drops, 0
+        return batch, dropped
+
+    def _send_next_batch(self) -> bool:
+        """
+        Send one batch.
+
+        Returns:
+            True if a batch was sent and more may be waiting
+        """
+        if not self._buffer or not self._connect():
+            return False
+
+        batch, dropped = self._take_batch()
+        if not batch:
+            return False
+
+        frame = encode_frame(batch, dropped, self.compress_min_bytes)
+        try:
+            self._sock.sendall(frame)
+        except OSError:
+            # Partial sends corrupt the stream: reconnect, count the batch lost
+            self._stats['send_errors'] += 1
+            self._stats['dropped'] += len(batch)
+            with self._buffer_lock:
+                self._unreported_drops += len(batch) + dropped
+            self._disconnect()
+            return False
+
+        self._stats['sent'] += len(batch)
+        self._stats['batches'] += 1
+        self._stats['bytes'] += len(frame)
+        return True
+
+    def _connect(self) -> bool:
+        """Connect if needed, with exponential backoff between failures."""
+        if self._sock is not None:
+            return True
+
+        now = time.monotonic()
+        if now < self._retry_at:
+            return False
+
+        try:
+            sock = socket.create_connection(
+                (self.host, self.port), timeout=self.connect_timeout
+            )
+            sock.settimeout(self.send_timeout)
+        except OSError:
+            self._retry_at = now + self._retry_delay
+            self._retry_delay = min(self._retry_delay * 2, self.max_retry_seconds)
+            return False
+
+        self._sock = sock
+        self._retry_delay = 1.0
+        self._stats['connects'] += 1
+        return True
+
+    def _disconnect(self):
+        if self._sock is not None:
+            try:
+                self._sock.close()
+            except OSError:
+                pass
+            self._sock = None
@@ -1,11 +1,43 @@
 """
 Logging client configuration for sending logs to centralized service.
 """
+import atexit
 import logging
-import logging.handlers
 import os
+from typing import Optional
 
 from log_config import LogSettings
+from log_transport import BatchingLogHandler
+
+# One transport per process: setup_logger() is called from many modules
+_transport_handler: Optional[BatchingLogHandler] = None
+
+
+def _get_transport_handler(host: str, port: int, settings: LogSettings) -> BatchingLogHandler:
+    """Create the process-wide batching handler on first use."""
+    global _transport_handler
+    if _transport_handler is None:
+        _transport_handler = BatchingLogHandler(
+            host,
+            port,
+            batch_size=settings.LOG_TRANSPORT_BATCH_RECORDS,
+            flush_interval=settings.LOG_TRANSPORT_FLUSH_INTERVAL_MS / 1000,
+            buffer_size=settings.LOG_TRANSPORT_BUFFER_RECORDS,
+            compress_min_bytes=settings.LOG_TRANSPORT_COMPRESS_MIN_BYTES or None
+        )
+        atexit.register(_transport_handler.close)
+    return _transport_handler
+
+
+def get_transport_stats() -> Optional[dict]:
+    """
+    Get this process's log transport counters.
+
+    Returns:
+        dict with sent/dropped/buffered counts, or None if setup_logger()
+        hasn't been called
+    """
+    return _transport_handler.get_stats() if _transport_handler else None
 
 
 def setup_logger(service_name: str) -> logging.Logger:
@@ -32,10 +64,12 @@ def setup_logger(service_name: str) -> logging.Logger:
 
     logging.setLogRecordFactory(record_factory)
 
+    settings = LogSettings()
+
     # Create handlers
-    # Socket handler sends DEBUG+ to centralized logging service
-    socket_handler = logging.handlers.SocketHandler(log_host, log_port)
-    socket_handler.setLevel(logging.DEBUG)
+    # Batching handler sends DEBUG+ to centralized logging service (off the hot path)
+    transport_handler = _get_transport_handler(log_host, log_port, settings)
+    transport_handler.setLevel(logging.DEBUG)
 
     # Console handler shows INFO+ only (less verbose)
     console_handler = logging.StreamHandler()
@@ -49,11 +83,10 @@ def setup_logger(service_name: str) -> logging.Logger:
     root_logger = logging.getLogger()
     root_logger.setLevel(logging.DEBUG)  # Allow DEBUG through, handlers filter
     root_logger.handlers = []  # Clear existing handlers
-    root_logger.addHandler(socket_handler)
+    root_logger.addHandler(transport_handler)
     root_logger.addHandler(console_handler)
 
     # Silence noisy third-party loggers from config (OCP: extend via env var)
-    settings = LogSettings()
     for logger_name in settings.NOISY_LOGGERS.split(","):
         logger_name = logger_name.strip()
         if logger_name:
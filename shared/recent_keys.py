@@ -0,0 +1,100 @@
+"""
+Bounded, time-windowed set of recently seen keys.
+
+Long-running processes that deduplicate ids (client message ids, finished
+request ids) otherwise keep every id they have ever seen. RecentKeys only
+remembers ids for a time window and never holds more than max_entries:
+
+- Keys are kept in insertion order with their expiry, so expired keys are
+  dropped from the front as new keys arrive (amortized O(1))
+- When full, the oldest key is evicted even if it has not expired
+- Membership checks are a single dict lookup
+
+Not thread-safe: each event loop owns its instance.
+
+Example:
+    processed = RecentKeys(ttl_seconds=3600, max_entries=10000)
+
+    if processed.seen(message_id):
+        return  # Duplicate
+"""
+import collections
+import time
+from typing import Callable, Dict, Hashable
+
+
+class RecentKeys:
+    """Set of keys seen within the last ttl_seconds, capped at max_entries."""
+
+    def __init__(
+        self,
+        ttl_seconds: float = 3600.0,
+        max_entries: int = 10000,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            ttl_seconds: How long a key is remembered after it was last added
+            max_entries: Keys kept before evicting the oldest
+            clock: Monotonic time source (injectable for tests)
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max(1, max_entries)
+        self._clock = clock
+        self._expiry: "collections.OrderedDict[Hashable, float]" = collections.OrderedDict()
+        self._stats = {
+            'added': 0,
+            'duplicates': 0,
+            'expired': 0,
+            'evicted': 0,
+        }
+
+    def _purge(self, now: float):
+        """Drop expired keys from the front, then evict down to max_entries."""
+        expiry = self._expiry
+        while expiry:
+            key, expires_at = next(iter(expiry.items()))
+            if expires_at > now:
+                break
+            del expiry[key]
+            self._stats['expired'] += 1
+
+        while len(expiry) > self.max_entries:
+            expiry.popitem(last=False)
+            self._stats['evicted'] += 1
+
+    def __contains__(self, key: Hashable) -> bool:
+        expires_at = self._expiry.get(key)
+        return expires_at is not None and expires_at > self._clock()
+
+    def __len__(self) -> int:
+        return len(self._expiry)
+
+    def add(self, key: Hashable):
+        """Remember a key for ttl_seconds from now."""
+        now = self._clock()
+        self._expiry[key] = now + self.ttl_seconds
+        self._expiry.move_to_end(key)
+        self._stats['added'] += 1
+        self._purge(now)
+
+    def seen(self, key: Hashable) -> bool:
+        """
+        Check a key and remember it.
+
+        Returns:
+            True if the key was already seen within the window
+        """
+        if key in self:
+            self._stats['duplicates'] += 1
+            return True
+        self.add(key)
+        return False
+
+    def discard(self, key: Hashable):
+        """Forget a key."""
+        self._expiry.pop(key, None)
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get counters and current size."""
+        return {**self._stats, 'size': len(self._expiry)}
@@ -0,0 +1,124 @@
+"""
+Short-lived cache of already-verified JWT payloads.
+
+Services that authenticate every request with the same bearer token
+(admin dashboard polling, SSE reconnects) otherwise re-run signature
+verification and claim validation on each call. The cache remembers the
+decoded payload of tokens that verified successfully:
+
+- Keyed by SHA-256 of the token, so raw tokens are never held in memory
+- Entries live for ttl_seconds, and never past the token's own "exp"
+- Bounded LRU: the least recently used entry is evicted when full
+- Only successful verifications are cached; invalid tokens always hit
+  the verifier
+
+Each service owns its cache instance, so a payload verified with one
+service's secret is never served by another.
+
+Example:
+    _token_cache = VerifiedTokenCache(ttl_seconds=60)
+
+    def verify(token):
+        return _token_cache.verify(token, lambda t: jwt.decode(t, KEY, algorithms=["HS256"]))
+"""
+import collections
+import hashlib
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+
+class VerifiedTokenCache:
+    """Thread-safe TTL/LRU cache of verified token payloads."""
+
+    def __init__(self, ttl_seconds: float = 60.0, max_entries: int = 10000):
+        """
+        Args:
+            ttl_seconds: Longest time a verified payload is reused (0 disables caching)
+            max_entries: Entries kept before evicting the least recently used
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max(1, max_entries)
+        self._entries: "collections.OrderedDict[bytes, Tuple[float, Dict[str, Any]]]" = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {
+            'hits': 0,
+            'misses': 0,
+            'evictions': 0,
+        }
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        return hashlib.sha256(token.encode('utf-8')).digest()
+
+    def get(self, token: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the cached payload for a token.
+
+        Returns:
+            Copy of the payload, or None if not cached or expired
+        """
+        key = self._key(token)
+        now = time.time()
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= now:
+                if entry is not None:
+                    del self._entries[key]
+                self._stats['misses'] += 1
+                return None
+            self._entries.move_to_end(key)
+            self._stats['hits'] += 1
+
+        return dict(entry[1])
+
+    def put(self, token: str, payload: Dict[str, Any]):
+        """Cache a verified payload until min(now + ttl, payload["exp"])."""
+        if self.ttl_seconds <= 0:
+            return
+
+        expires_at = time.time() + self.ttl_seconds
+        exp = payload.get('exp')
+        if isinstance(exp, (int, float)):
+            expires_at = min(expires_at, exp)
+        if expires_at <= time.time():
+            return
+
+        key = self._key(token)
+        with self._lock:
+            self._entries[key] = (expires_at, dict(payload))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._stats['evictions'] += 1
+
+    def verify(self, token: str, verifier: Callable[[str], Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Return the cached payload, or run verifier and cache its result.
+
+        Exceptions from verifier propagate unchanged and are not cached.
+        """
+        payload = self.get(token)
+        if payload is None:
+            payload = verifier(token)
+            self.put(token, payload)
+        return payload
+
+    def clear(self):
+        """Drop all cached payloads."""
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache counters."""
+        with self._lock:
+            size = len(self._entries)
+        lookups = self._stats['hits'] + self._stats['misses']
+        return {
+            **self._stats,
+            'size': size,
+            'max_entries': self.max_entries,
+            'ttl_seconds': self.ttl_seconds,
+            'hit_rate': round(self._stats['hits'] / lookups, 3) if lookups else 0.0,
+        }
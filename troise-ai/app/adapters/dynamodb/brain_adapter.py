@@ -10,10 +10,12 @@ Table Design:
     SK patterns:
     - META - Note metadata (title, tags, links, modified_at)
     - CHUNK#{chunk_index:04d} - Individual text chunks with embeddings
+
+    Embeddings are stored compactly (see embedding_codec).
 """
+import asyncio
 import hashlib
 import logging
-import struct
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Tuple
@@ -21,6 +23,15 @@ from typing import Any, Dict, List, Optional, Tuple
 from boto3.dynamodb.conditions import Key
 
 from .base import DynamoDBClient
+from .embedding_codec import (
+    DEFAULT_PRECISION,
+    EmbeddingMigrator,
+    Vector,
+    embedding_attributes,
+    item_embedding,
+    stored_precision,
+    validate_precision,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -36,17 +47,6 @@ def path_to_hash(path: str) -> str:
     return hashlib.md5(path.encode('utf-8')).hexdigest()
 
 
-def embedding_to_binary(embedding: List[float]) -> bytes:
-    """Convert embedding list to binary format for storage."""
-    return struct.pack(f'{len(embedding)}f', *embedding)
-
-
-def binary_to_embedding(data: bytes) -> List[float]:
-    """Convert binary data back to embedding list."""
-    count = len(data) // 4  # 4 bytes per float
-    return list(struct.unpack(f'{count}f', data))
-
-
 @dataclass
 class NoteMetaItem:
     """Note metadata item."""
@@ -125,7 +125,8 @@ class NoteChunkItem:
     start_line: int  # Line number where chunk starts
     end_line: int  # Line number where chunk ends
     heading: Optional[str] = None  # Nearest heading above chunk
-    embedding: Optional[List[float]] = None  # Vector embedding
+    embedding: Optional[Vector] = None  # Vector embedding
+    precision: str = DEFAULT_PRECISION  # Storage precision of the embedding
 
     @property
     def path_hash(self) -> str:
@@ -158,22 +159,13 @@ class NoteChunkItem:
             'end_line': self.end_line,
             'heading': self.heading,
         }
-        if self.embedding:
-            item['embedding'] = embedding_to_binary(self.embedding)
+        if self.embedding is not None and len(self.embedding):
+            item.update(embedding_attributes(self.embedding, self.precision))
         return item
 
     @classmethod
     def from_dynamo_item(cls, item: Dict[str, Any]) -> "NoteChunkItem":
         """Create from DynamoDB item."""
-        embedding = None
-        if 'embedding' in item and item['embedding']:
-            embedding_data = item['embedding']
-            if isinstance(embedding_data, bytes):
-                embedding = binary_to_embedding(embedding_data)
-            elif hasattr(embedding_data, 'value'):
-                # boto3 Binary type
-                embedding = binary_to_embedding(embedding_data.value)
-
         return cls(
             path=item['path'],
             chunk_index=item.get('chunk_index', 0),
@@ -181,7 +173,8 @@ class NoteChunkItem:
             start_line=item.get('start_line', 0),
             end_line=item.get('end_line', 0),
             heading=item.get('heading'),
-            embedding=embedding,
+            embedding=item_embedding(item),
+            precision=stored_precision(item),
         )
 
 
@@ -232,15 +225,22 @@ class TroiseBrainAdapter:
         notes = await adapter.get_notes_by_tag("project")
     """
 
-    def __init__(self, client: DynamoDBClient):
+    def __init__(
+        self,
+        client: DynamoDBClient,
+        embedding_precision: str = DEFAULT_PRECISION,
+    ):
         """
         Initialize the adapter.
 
         Args:
             client: DynamoDBClient instance.
+            embedding_precision: Stored embedding precision (float32, float16, int8).
         """
         self._client = client
         self._table_name = TABLE_NAME
+        self._precision = validate_precision(embedding_precision)
+        self._migrator = EmbeddingMigrator(client, self._table_name, self._precision)
 
     # ========== Indexing Operations ==========
 
@@ -273,8 +273,8 @@ class TroiseBrainAdapter:
         Returns:
             NoteMetaItem for the indexed note.
         """
-        # Split content into chunks
-        chunks = self._chunk_content(content, path)
+        # Split content into chunks (off the event loop; notes can be long)
+        chunks = await asyncio.to_thread(self._chunk_content, content, path)
 
         # Verify embedding count matches if provided
         if chunk_embeddings and len(chunk_embeddings) != len(chunks):
@@ -321,6 +321,7 @@ class TroiseBrainAdapter:
                     embedding = chunk_embeddings[i]
 
                 chunk.embedding = embedding
+                chunk.precision = self._precision
                 await table.put_item(Item=chunk.to_dynamo_item())
 
         logger.info(f"Indexed note {path} with {len(chunks)} chunks")
@@ -488,8 +489,12 @@ class TroiseBrainAdapter:
                 }
 
             response = await table.query(**params)
+            items = response.get('Items', [])
+
+            if include_embeddings:
+                self._migrator.schedule(items)
 
-            return [NoteChunkItem.from_dynamo_item(item) for item in response.get('Items', [])]
+            return [NoteChunkItem.from_dynamo_item(item) for item in items]
 
     async def get_chunk(
         self,
@@ -629,11 +634,14 @@ class TroiseBrainAdapter:
                 Limit=limit,
             )
 
-            for item in response.get('Items', []):
+            items = response.get('Items', [])
+            for item in items:
                 chunk = NoteChunkItem.from_dynamo_item(item)
-                if chunk.embedding and chunk.path in note_map:
+                if chunk.embedding is not None and chunk.path in note_map:
                     results.append((chunk, note_map[chunk.path]))
 
+            self._migrator.schedule(items)
+
         return results
 
     # ========== Chunking ==========
@@ -0,0 +1,283 @@
+"""Compact embedding storage for DynamoDB items.
+
+Embeddings are stored as a binary attribute next to an ``embedding_dtype``
+attribute naming the layout:
+
+    float32 - 4 bytes per dimension
+    float16 - 2 bytes per dimension
+    int8    - float32 scale, then 1 byte per dimension (value = q * scale)
+
+Decoding goes straight from the stored bytes to a float32 NumPy array.
+
+Items written before ``embedding_dtype`` existed hold raw float32 bytes and
+decode as float32. Readers migrate them lazily: when an item is stored wider
+than the configured precision, ``EmbeddingMigrator`` re-encodes it in place
+in a background task, off the read path.
+"""
+import asyncio
+import logging
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple, Union
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+DTYPE_ATTRIBUTE = "embedding_dtype"
+
+# Layout of items written without a dtype attribute
+LEGACY_PRECISION = "float32"
+DEFAULT_PRECISION = "float16"
+
+PRECISIONS = ("float32", "float16", "int8")
+_BYTES_PER_DIMENSION = {"float32": 4, "float16": 2, "int8": 1}
+
+# Stale items rewritten per read; the rest are migrated on later reads
+MIGRATION_BATCH_LIMIT = 100
+
+Vector = Union[Sequence[float], np.ndarray]
+
+
+def validate_precision(precision: str) -> str:
+    """Check a precision name, returning it unchanged."""
+    if precision not in _BYTES_PER_DIMENSION:
+        raise ValueError(
+            f"Unknown embedding precision '{precision}' (expected one of {', '.join(PRECISIONS)})"
+        )
+    return precision
+
+
+def encode_embedding(embedding: Vector, precision: str = DEFAULT_PRECISION) -> bytes:
+    """Encode an embedding in the given precision.
+
+    Args:
+        embedding: Vector as a list or NumPy array.
+        precision: float32, float16 or int8.
+
+    Returns:
+        Bytes for the ``embedding`` attribute.
+    """
+    vector = np.asarray(embedding, dtype=np.float32)
+    if precision == "float32":
+        return vector.astype("<f4").tobytes()
+    if precision == "float16":
+        return vector.astype("<f2").tobytes()
+    if precision == "int8":
+        peak = float(np.max(np.abs(vector))) if vector.size else 0.0
+        scale = peak / 127.0 if peak > 0 else 1.0
+        quantized = np.clip(np.rint(vector / scale), -127, 127).astype(np.int8)
+        return np.float32(scale).astype("<f4").tobytes() + quantized.tobytes()
+    raise ValueError(f"Unknown embedding precision '{precision}'")
+
+
+def decode_embedding(data: Any, precision: Optional[str] = None) -> np.ndarray:
+    """Decode stored bytes into a float32 array.
+
+    Args:
+        data: bytes, bytearray, memoryview or boto3 Binary.
+        precision: Stored layout; None for items written before the
+            dtype attribute existed.
+
+    Returns:
+        float32 array. float32 data is decoded without copying, so the
+        array is read-only.
+    """
+    if hasattr(data, "value"):
+        data = data.value  # boto3 Binary type
+    precision = precision or LEGACY_PRECISION
+    if precision == "float32":
+        return np.frombuffer(data, dtype="<f4")
+    if precision == "float16":
+        return np.frombuffer(data, dtype="<f2").astype(np.float32)
+    if precision == "int8":
+        if not data:
+            return np.zeros(0, dtype=np.float32)
+        scale = np.frombuffer(data, dtype="<f4", count=1)[0]
+        return np.frombuffer(data, dtype=np.int8, offset=4).astype(np.float32) * scale
+    raise ValueError(f"Unknown embedding precision '{precision}'")
+
+
+def cosine_similarities(query: Vector, vectors: Sequence[np.ndarray]) -> np.ndarray:
+    """Cosine similarity of a query against each vector.
+
+    Vectors with a different dimension than the query, or with zero norm,
+    score 0.0.
+    """
+    query = np.asarray(query, dtype=np.float32)
+    vectors = [None if v is None else np.asarray(v, dtype=np.float32) for v in vectors]
+    scores = np.zeros(len(vectors), dtype=np.float32)
+    rows = [i for i, v in enumerate(vectors) if v is not None and v.shape == query.shape]
+    if not rows or not query.size:
+        return scores
+
+    matrix = np.stack([vectors[i] for i in rows])
+    norms = np.linalg.norm(matrix, axis=1) * np.linalg.norm(query)
+    dots = matrix @ query
+    scores[rows] = np.divide(dots, norms, out=np.zeros_like(dots), where=norms > 0)
+    return scores
+
+
+def embedding_attributes(embedding: Vector, precision: str) -> Dict[str, Any]:
+    """Item attributes holding an embedding in the given precision."""
+    return {
+        "embedding": encode_embedding(embedding, precision),
+        DTYPE_ATTRIBUTE: precision,
+    }
+
+
+def item_embedding(item: Dict[str, Any]) -> Optional[np.ndarray]:
+    """Decode the embedding of a DynamoDB item, or None if it has none."""
+    data = item.get("embedding")
+    if not data:
+        return None
+    return decode_embedding(data, item.get(DTYPE_ATTRIBUTE))
+
+
+def stored_precision(item: Dict[str, Any]) -> str:
+    """Layout an item's embedding is stored in."""
+    return item.get(DTYPE_ATTRIBUTE) or LEGACY_PRECISION
+
+
+def needs_migration(item: Dict[str, Any], precision: str) -> bool:
+    """Whether an item's embedding is stored wider than ``precision``.
+
+    Narrower items are left alone: widening them would cost space
+    without recovering any precision.
+    """
+    if not item.get("embedding"):
+        return False
+    stored = _BYTES_PER_DIMENSION.get(stored_precision(item), 0)
+    return stored > _BYTES_PER_DIMENSION[precision]
+
+
+async def rewrite_embeddings(
+    table,
+    items: Iterable[Dict[str, Any]],
+    precision: str,
+    limit: int = MIGRATION_BATCH_LIMIT,
+) -> int:
+    """Re-encode stale embeddings in place (best effort).
+
+    Updates are conditional on the item still holding the layout it was
+    read with, so a chunk deleted or re-embedded by a concurrent re-index
+    is not brought back or overwritten with the stale vector. Failures are
+    logged and the item is retried on a later read.
+
+    Args:
+        table: DynamoDB table resource.
+        items: Items as read from the table (with PK, SK and embedding).
+        precision: Target precision.
+        limit: Maximum items to rewrite in this call.
+
+    Returns:
+        Number of items rewritten.
+    """
+    stale: List[Dict[str, Any]] = [
+        item for item in items if needs_migration(item, precision)
+    ][:limit]
+    count = 0
+    for item in stale:
+        vector = item_embedding(item)
+        try:
+            await table.update_item(
+                Key={'PK': item['PK'], 'SK': item['SK']},
+                UpdateExpression="SET embedding = :embedding, #dtype = :dtype",
+                ConditionExpression=(
+                    "attribute_exists(embedding) AND "
+                    "(attribute_not_exists(#dtype) OR #dtype = :old)"
+                ),
+                ExpressionAttributeNames={"#dtype": DTYPE_ATTRIBUTE},
+                ExpressionAttributeValues={
+                    ":embedding": encode_embedding(vector, precision),
+                    ":dtype": precision,
+                    ":old": stored_precision(item),
+                },
+            )
+            count += 1
+        except Exception as e:
+            logger.debug(f"Embedding migration skipped for {item.get('PK')}/{item.get('SK')}: {e}")
+
+    if count:
+        logger.info(f"Migrated {count} embeddings to {precision}")
+    return count
+
+
+class EmbeddingMigrator:
+    """Rewrites stale embeddings found by reads in background tasks.
+
+    Reads hand the items they fetched to schedule() and return straight
+    away; the rewrite runs on its own DynamoDB resource, so a search never
+    waits on the update round-trips. Items already queued are skipped.
+
+    Example:
+        migrator = EmbeddingMigrator(client, "troise_brain", "float16")
+        migrator.schedule(items)
+    """
+
+    def __init__(
+        self,
+        client,
+        table_name: str,
+        precision: str,
+        limit: int = MIGRATION_BATCH_LIMIT,
+    ):
+        """Initialize the migrator.
+
+        Args:
+            client: DynamoDBClient used to open the table.
+            table_name: Table the items were read from.
+            precision: Target precision.
+            limit: Maximum items rewritten per scheduled batch.
+        """
+        self._client = client
+        self._table_name = table_name
+        self._precision = precision
+        self._limit = limit
+        self._pending: Set[Tuple[Any, Any]] = set()
+        self._tasks: Set[asyncio.Task] = set()
+
+    def schedule(self, items: Iterable[Dict[str, Any]]) -> Optional[asyncio.Task]:
+        """Start rewriting the stale items among ``items`` in the background.
+
+        Returns:
+            The background task, or None if nothing needed migrating.
+        """
+        stale = [
+            {key: item[key] for key in ('PK', 'SK', 'embedding', DTYPE_ATTRIBUTE) if key in item}
+            for item in items
+            if needs_migration(item, self._precision)
+            and (item['PK'], item['SK']) not in self._pending
+        ][:self._limit]
+        if not stale:
+            return None
+
+        keys = {(item['PK'], item['SK']) for item in stale}
+        self._pending |= keys
+        task = asyncio.create_task(self._rewrite(stale, keys))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    async def _rewrite(self, items: List[Dict[str, Any]], keys: Set[Tuple[Any, Any]]) -> None:
+        try:
+            async with self._client.resource() as dynamodb:
+                table = await dynamodb.Table(self._table_name)
+                await rewrite_embeddings(table, items, self._precision, self._limit)
+        except Exception as e:
+            logger.debug(f"Embedding migration failed for {self._table_name}: {e}")
+        finally:
+            self._pending -= keys
+
+    async def drain(self) -> None:
+        """Wait for scheduled rewrites (used on shutdown and in tests)."""
+        while self._tasks:
+            await asyncio.gather(*list(self._tasks), return_exceptions=True)
+
+
+def embedding_to_binary(embedding: Vector) -> bytes:
+    """Convert embedding to the original raw float32 format."""
+    return encode_embedding(embedding, "float32")
+
+
+def binary_to_embedding(data: Any) -> List[float]:
+    """Convert raw float32 data back to an embedding list."""
+    return decode_embedding(data, "float32").tolist()
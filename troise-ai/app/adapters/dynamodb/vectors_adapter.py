@@ -4,20 +4,49 @@ Caches text embeddings to avoid redundant API calls.
 Embeddings are keyed by text hash and model name.
 
 Table Design:
+    Entries:
     PK: TEXT#{text_hash} - SHA256 hash of the text being embedded
-    SK: MODEL#{model_name} - Embedding model identifier
+    SK: MODEL#{model_name} - Embedding model identifier (namespace version 0)
+        MODEL#{model_name}#V{version} - After the namespace was invalidated
 
-    TTL: 30-day cache expiry to handle model updates
+    Namespace versions:
+    PK: NAMESPACE#{model_name}, SK: VERSION - Current version (absent = 0)
+
+    Counters:
+    PK: STATS#{model_name}, SK: V{version}#B{bucket} - Entries whose TTL
+        falls in that day bucket; the counter item expires with them
+    PK: STATS, SK: MODELS - String set of models with counters
+
+    TTL: 30-day cache expiry, enforced by DynamoDB TTL on the 'ttl'
+    attribute (no scan-and-delete sweeps)
+
+Invalidating a model bumps its namespace version: old entries are no longer
+addressed and age out through TTL. Stats read the counters of the current
+version, so both are O(1) in the number of cached entries.
+
+Embeddings are stored compactly (see embedding_codec) and returned as
+float32 NumPy arrays.
 """
 import hashlib
 import logging
-import struct
 import time
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+import numpy as np
+from boto3.dynamodb.conditions import Key
 
 from .base import DynamoDBClient
+from .embedding_codec import (
+    DEFAULT_PRECISION,
+    EmbeddingMigrator,
+    Vector,
+    embedding_attributes,
+    item_embedding,
+    stored_precision,
+    validate_precision,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -26,21 +55,26 @@ TABLE_NAME = "troise_vectors"
 # TTL duration for cached embeddings (30 days)
 TTL_CACHE_SECONDS = 86400 * 30
 
+# Width of the TTL buckets entry counters are kept in
+COUNTER_BUCKET_SECONDS = 86400
+
+# How long a namespace version read from the table is trusted
+NAMESPACE_VERSION_TTL_SECONDS = 30
+
 
 def text_to_hash(text: str) -> str:
     """Generate SHA256 hash of text for cache key."""
     return hashlib.sha256(text.encode('utf-8')).hexdigest()
 
 
-def embedding_to_binary(embedding: List[float]) -> bytes:
-    """Convert embedding list to compact binary format."""
-    return struct.pack(f'{len(embedding)}f', *embedding)
+def entry_sort_key(model: str, version: int = 0) -> str:
+    """Sort key of a cache entry in a model's namespace version."""
+    return f"MODEL#{model}" if version == 0 else f"MODEL#{model}#V{version}"
 
 
-def binary_to_embedding(data: bytes) -> List[float]:
-    """Convert binary data back to embedding list."""
-    count = len(data) // 4  # 4 bytes per float
-    return list(struct.unpack(f'{count}f', data))
+def counter_key(model: str, version: int, ttl: int) -> Dict[str, str]:
+    """Key of the counter tracking entries with this TTL."""
+    return {'PK': f"STATS#{model}", 'SK': f"V{version}#B{ttl // COUNTER_BUCKET_SECONDS}"}
 
 
 @dataclass
@@ -49,10 +83,12 @@ class EmbeddingCacheItem:
     text_hash: str
     model: str
     dimensions: int
-    embedding: List[float]
+    embedding: Vector
     text_preview: str  # First 100 chars for debugging
     created_at: str  # ISO8601
     ttl: int  # Unix timestamp for expiry
+    precision: str = DEFAULT_PRECISION  # Storage precision of the embedding
+    version: int = 0  # Namespace version of the model
 
     @property
     def pk(self) -> str:
@@ -60,7 +96,7 @@ class EmbeddingCacheItem:
 
     @property
     def sk(self) -> str:
-        return f"MODEL#{self.model}"
+        return entry_sort_key(self.model, self.version)
 
     def to_dynamo_item(self) -> Dict[str, Any]:
         """Convert to DynamoDB item format."""
@@ -70,32 +106,28 @@ class EmbeddingCacheItem:
             'text_hash': self.text_hash,
             'model': self.model,
             'dimensions': self.dimensions,
-            'embedding': embedding_to_binary(self.embedding),
+            **embedding_attributes(self.embedding, self.precision),
             'text_preview': self.text_preview,
             'created_at': self.created_at,
             'ttl': self.ttl,
+            'version': self.version,
         }
 
     @classmethod
     def from_dynamo_item(cls, item: Dict[str, Any]) -> "EmbeddingCacheItem":
         """Create from DynamoDB item."""
-        embedding_data = item.get('embedding', b'')
-        if isinstance(embedding_data, bytes):
-            embedding = binary_to_embedding(embedding_data)
-        elif hasattr(embedding_data, 'value'):
-            # boto3 Binary type
-            embedding = binary_to_embedding(embedding_data.value)
-        else:
-            embedding = []
+        embedding = item_embedding(item)
 
         return cls(
             text_hash=item.get('text_hash', ''),
             model=item.get('model', ''),
             dimensions=item.get('dimensions', 0),
-            embedding=embedding,
+            embedding=embedding if embedding is not None else np.zeros(0, dtype=np.float32),
             text_preview=item.get('text_preview', ''),
             created_at=item.get('created_at', ''),
             ttl=item.get('ttl', 0),
+            precision=stored_precision(item),
+            version=int(item.get('version', 0)),
         )
 
 
@@ -105,6 +137,7 @@ class TroiseVectorsAdapter:
 
     Provides embedding caching to avoid redundant calls to embedding APIs.
     Embeddings are cached by (text_hash, model) with 30-day TTL.
+    Writes and deletes keep per-model entry counters up to date.
 
     Example:
         client = DynamoDBClient()
@@ -130,6 +163,7 @@ class TroiseVectorsAdapter:
         self,
         client: DynamoDBClient,
         default_model: str = "nomic-embed-text",
+        embedding_precision: str = DEFAULT_PRECISION,
     ):
         """
         Initialize the adapter.
@@ -137,36 +171,93 @@ class TroiseVectorsAdapter:
         Args:
             client: DynamoDBClient instance.
             default_model: Default embedding model name.
+            embedding_precision: Stored embedding precision (float32, float16, int8).
         """
         self._client = client
         self._table_name = TABLE_NAME
         self._default_model = default_model
+        self._precision = validate_precision(embedding_precision)
+        self._migrator = EmbeddingMigrator(client, self._table_name, self._precision)
+        # model -> (namespace version, monotonic time read)
+        self._versions: Dict[str, Tuple[int, float]] = {}
+        self._registered_models: Set[str] = set()
+
+    # ========== Namespaces and Counters ==========
+
+    async def _namespace_version(self, table, model: str) -> int:
+        """Current namespace version of a model (cached briefly)."""
+        cached = self._versions.get(model)
+        if cached and time.monotonic() - cached[1] < NAMESPACE_VERSION_TTL_SECONDS:
+            return cached[0]
+
+        response = await table.get_item(
+            Key={'PK': f"NAMESPACE#{model}", 'SK': "VERSION"}
+        )
+        version = int(response.get('Item', {}).get('version', 0))
+        self._versions[model] = (version, time.monotonic())
+        return version
+
+    async def _adjust_counter(self, table, model: str, version: int, ttl: int, delta: int) -> None:
+        """Atomically add delta to the counter of the entry's TTL bucket."""
+        key = counter_key(model, version, ttl)
+        bucket_end = (ttl // COUNTER_BUCKET_SECONDS + 1) * COUNTER_BUCKET_SECONDS
+        await table.update_item(
+            Key=key,
+            UpdateExpression="ADD entries :delta SET #ttl = if_not_exists(#ttl, :ttl)",
+            ExpressionAttributeNames={"#ttl": "ttl"},
+            ExpressionAttributeValues={":delta": delta, ":ttl": bucket_end},
+        )
+
+        if model not in self._registered_models:
+            await table.update_item(
+                Key={'PK': "STATS", 'SK': "MODELS"},
+                UpdateExpression="ADD models :model",
+                ExpressionAttributeValues={":model": {model}},
+            )
+            self._registered_models.add(model)
+
+    async def _count_entries(self, table, model: str, version: int) -> int:
+        """Sum a model's live counters for one namespace version."""
+        now = int(time.time())
+        response = await table.query(
+            KeyConditionExpression=Key('PK').eq(f"STATS#{model}") &
+                                   Key('SK').begins_with(f"V{version}#"),
+        )
+        return sum(
+            int(item.get('entries', 0))
+            for item in response.get('Items', [])
+            if int(item.get('ttl', 0)) > now
+        )
 
     async def get_cached_embedding(
         self,
         text: str,
         model: Optional[str] = None,
-    ) -> Optional[List[float]]:
+    ) -> Optional[np.ndarray]:
         """
         Get a cached embedding if available.
 
+        Entries stored wider than the configured precision are rewritten
+        on the way out.
+
         Args:
             text: The text that was embedded.
             model: Embedding model name (uses default if not specified).
 
         Returns:
-            Embedding vector or None if not cached/expired.
+            Embedding vector (float32 array) or None if not cached/expired.
         """
         model = model or self._default_model
         text_hash = text_to_hash(text)
 
         async with self._client.resource() as dynamodb:
             table = await dynamodb.Table(self._table_name)
+            version = await self._namespace_version(table, model)
 
             response = await table.get_item(
                 Key={
                     'PK': f"TEXT#{text_hash}",
-                    'SK': f"MODEL#{model}",
+                    'SK': entry_sort_key(model, version),
                 }
             )
 
@@ -181,13 +272,14 @@ class TroiseVectorsAdapter:
                 return None
 
             cache_item = EmbeddingCacheItem.from_dynamo_item(item)
+            self._migrator.schedule([item])
             logger.debug(f"Cache hit for {text[:50]}... ({len(cache_item.embedding)} dims)")
             return cache_item.embedding
 
     async def cache_embedding(
         self,
         text: str,
-        embedding: List[float],
+        embedding: Vector,
         model: Optional[str] = None,
         ttl_seconds: int = TTL_CACHE_SECONDS,
     ) -> EmbeddingCacheItem:
@@ -206,29 +298,59 @@ class TroiseVectorsAdapter:
         model = model or self._default_model
         text_hash = text_to_hash(text)
 
-        cache_item = EmbeddingCacheItem(
-            text_hash=text_hash,
-            model=model,
-            dimensions=len(embedding),
-            embedding=embedding,
-            text_preview=text[:100],
-            created_at=datetime.now().isoformat(),
-            ttl=int(time.time()) + ttl_seconds,
-        )
-
         async with self._client.resource() as dynamodb:
             table = await dynamodb.Table(self._table_name)
-            await table.put_item(Item=cache_item.to_dynamo_item())
+
+            cache_item = EmbeddingCacheItem(
+                text_hash=text_hash,
+                model=model,
+                dimensions=len(embedding),
+                embedding=embedding,
+                text_preview=text[:100],
+                created_at=datetime.now().isoformat(),
+                ttl=int(time.time()) + ttl_seconds,
+                precision=self._precision,
+                version=await self._namespace_version(table, model),
+            )
+
+            response = await table.put_item(
+                Item=cache_item.to_dynamo_item(),
+                ReturnValues="ALL_OLD",
+            )
+            await self._count_replacement(
+                table, cache_item, (response or {}).get('Attributes')
+            )
 
         logger.debug(f"Cached embedding for {text[:50]}... ({len(embedding)} dims)")
         return cache_item
 
+    async def _count_replacement(
+        self,
+        table,
+        cache_item: EmbeddingCacheItem,
+        old: Optional[Dict[str, Any]],
+    ) -> None:
+        """Update counters after a put (new entry, or one whose TTL moved)."""
+        old_ttl = int(old.get('ttl', 0)) if old else None
+        if old_ttl is not None and (
+            old_ttl // COUNTER_BUCKET_SECONDS == cache_item.ttl // COUNTER_BUCKET_SECONDS
+        ):
+            return
+
+        try:
+            if old_ttl is not None:
+                await self._adjust_counter(table, cache_item.model, cache_item.version, old_ttl, -1)
+            await self._adjust_counter(table, cache_item.model, cache_item.version, cache_item.ttl, 1)
+        except Exception as e:
+            # The entry itself is written; only the stats drift
+            logger.warning(f"Failed to update embedding cache counters: {e}")
+
     async def get_or_compute(
         self,
         text: str,
         compute_fn,
         model: Optional[str] = None,
-    ) -> List[float]:
+    ) -> Vector:
         """
         Get cached embedding or compute and cache it.
 
@@ -346,70 +468,72 @@ class TroiseVectorsAdapter:
         async with self._client.resource() as dynamodb:
             table = await dynamodb.Table(self._table_name)
 
+            version = await self._namespace_version(table, model)
+
             try:
-                await table.delete_item(
+                response = await table.delete_item(
                     Key={
                         'PK': f"TEXT#{text_hash}",
-                        'SK': f"MODEL#{model}",
+                        'SK': entry_sort_key(model, version),
                     },
                     ConditionExpression="attribute_exists(PK)",
+                    ReturnValues="ALL_OLD",
                 )
-                logger.debug(f"Invalidated cache for {text[:50]}...")
-                return True
             except Exception as e:
                 if 'ConditionalCheckFailedException' in str(type(e).__name__):
                     return False
                 raise
 
+            old = (response or {}).get('Attributes') or {}
+            try:
+                await self._adjust_counter(table, model, version, int(old.get('ttl', 0)), -1)
+            except Exception as e:
+                logger.warning(f"Failed to update embedding cache counters: {e}")
+
+            logger.debug(f"Invalidated cache for {text[:50]}...")
+            return True
+
     async def invalidate_model(self, model: str) -> int:
         """
         Invalidate all cached embeddings for a specific model.
 
         Use this when a model is updated and embeddings need to be regenerated.
+        Bumps the model's namespace version in one atomic update: entries of
+        the previous version are no longer read and expire through TTL.
 
         Args:
             model: Embedding model name.
 
         Returns:
-            Number of items deleted.
+            Number of entries invalidated (from the counters).
         """
         async with self._client.resource() as dynamodb:
             table = await dynamodb.Table(self._table_name)
 
-            # Scan for all items with this model
-            response = await table.scan(
-                FilterExpression="#sk = :model",
-                ExpressionAttributeNames={"#sk": "SK"},
-                ExpressionAttributeValues={":model": f"MODEL#{model}"},
+            response = await table.update_item(
+                Key={'PK': f"NAMESPACE#{model}", 'SK': "VERSION"},
+                UpdateExpression="ADD version :one",
+                ExpressionAttributeValues={":one": 1},
+                ReturnValues="UPDATED_NEW",
             )
+            version = int(response['Attributes']['version'])
+            self._versions[model] = (version, time.monotonic())
 
-            count = 0
-            for item in response.get('Items', []):
-                await table.delete_item(
-                    Key={'PK': item['PK'], 'SK': item['SK']}
-                )
-                count += 1
-
-            # Handle pagination
-            while 'LastEvaluatedKey' in response:
-                response = await table.scan(
-                    FilterExpression="#sk = :model",
-                    ExpressionAttributeNames={"#sk": "SK"},
-                    ExpressionAttributeValues={":model": f"MODEL#{model}"},
-                    ExclusiveStartKey=response['LastEvaluatedKey'],
-                )
-                for item in response.get('Items', []):
-                    await table.delete_item(
-                        Key={'PK': item['PK'], 'SK': item['SK']}
-                    )
-                    count += 1
+            count = await self._count_entries(table, model, version - 1)
 
-            logger.info(f"Invalidated {count} cached embeddings for model {model}")
-            return count
+        logger.info(
+            f"Invalidated {count} cached embeddings for model {model} "
+            f"(namespace version {version})"
+        )
+        return count
 
     async def get_cache_stats(self) -> Dict[str, Any]:
         """
-        Get cache statistics.
+        Get cache statistics from the maintained counters.
+
+        Counts cover entries of each model's current namespace version and
+        are exact to within one day of TTL expiry. Entries cached before
+        counters existed are not counted.
 
         Returns:
             Dict with cache statistics.
@@ -417,98 +541,18 @@ class TroiseVectorsAdapter:
         async with self._client.resource() as dynamodb:
             table = await dynamodb.Table(self._table_name)
 
-            # Scan for all items
-            response = await table.scan(
-                ProjectionExpression="#pk, #sk, dimensions, created_at, #ttl",
-                ExpressionAttributeNames={
-                    "#pk": "PK",
-                    "#sk": "SK",
-                    "#ttl": "ttl",
-                },
-            )
-
-            items = response.get('Items', [])
+            response = await table.get_item(Key={'PK': "STATS", 'SK': "MODELS"})
+            model_names = sorted(response.get('Item', {}).get('models', set()))
 
-            # Handle pagination
-            while 'LastEvaluatedKey' in response:
-                response = await table.scan(
-                    ProjectionExpression="#pk, #sk, dimensions, created_at, #ttl",
-                    ExpressionAttributeNames={
-                        "#pk": "PK",
-                        "#sk": "SK",
-                        "#ttl": "ttl",
-                    },
-                    ExclusiveStartKey=response['LastEvaluatedKey'],
-                )
-                items.extend(response.get('Items', []))
-
-            # Count by model
             models = {}
-            expired_count = 0
-            current_time = int(time.time())
-
-            for item in items:
-                sk = item.get('SK', '')
-                model = sk.replace('MODEL#', '') if sk.startswith('MODEL#') else 'unknown'
-                models[model] = models.get(model, 0) + 1
-
-                ttl = item.get('ttl', 0)
-                if ttl and current_time > ttl:
-                    expired_count += 1
+            versions = {}
+            for model in model_names:
+                self._versions.pop(model, None)  # Stats always read the latest version
+                versions[model] = await self._namespace_version(table, model)
+                models[model] = await self._count_entries(table, model, versions[model])
 
             return {
-                "total_cached": len(items),
-                "expired_count": expired_count,
+                "total_cached": sum(models.values()),
                 "models": models,
-                "unique_texts": len(set(item.get('PK') for item in items)),
+                "namespace_versions": versions,
             }
-
-    async def cleanup_expired(self) -> int:
-        """
-        Manually clean up expired cache entries.
-
-        Note: DynamoDB TTL eventually deletes expired items automatically,
-        but this can be used for immediate cleanup.
-
-        Returns:
-            Number of items deleted.
-        """
-        async with self._client.resource() as dynamodb:
-            table = await dynamodb.Table(self._table_name)
-
-            current_time = int(time.time())
-
-            # Scan for expired items
-            response = await table.scan(
-                FilterExpression="#ttl < :now",
-                ExpressionAttributeNames={"#ttl": "ttl"},
-                ExpressionAttributeValues={":now": current_time},
-                ProjectionExpression="PK, SK",
-            )
-
-            count = 0
-            for item in response.get('Items', []):
-                await table.delete_item(
-                    Key={'PK': item['PK'], 'SK': item['SK']}
-                )
-                count += 1
-
-            # Handle pagination
-            while 'LastEvaluatedKey' in response:
-                response = await table.scan(
-                    FilterExpression="#ttl < :now",
-                    ExpressionAttributeNames={"#ttl": "ttl"},
-                    ExpressionAttributeValues={":now": current_time},
-                    ProjectionExpression="PK, SK",
-                    ExclusiveStartKey=response['LastEvaluatedKey'],
-                )
-                for item in response.get('Items', []):
-                    await table.delete_item(
-                        Key={'PK': item['PK'], 'SK': item['SK']}
-                    )
-                    count += 1
-
-            if count > 0:
-                logger.info(f"Cleaned up {count} expired cache entries")
-
-            return count
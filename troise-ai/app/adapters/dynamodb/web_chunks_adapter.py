@@ -10,19 +10,35 @@ Table Design:
     SK patterns:
     - META - URL metadata (title, domain, chunk_count, fetched_at, ttl)
     - CHUNK#{chunk_index:04d} - Individual text chunks with embeddings
+
+    Embeddings are stored compactly (see embedding_codec), in the precision
+    set by rag.embedding_precision.
 """
 import hashlib
 import logging
-import struct
 import time
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 from urllib.parse import urlparse
 
+import numpy as np
 from boto3.dynamodb.conditions import Key
 
 from .base import DynamoDBClient
+from .embedding_codec import (
+    DEFAULT_PRECISION,
+    EmbeddingMigrator,
+    Vector,
+    cosine_similarities,
+    embedding_attributes,
+    item_embedding,
+    stored_precision,
+    validate_precision,
+)
+# Re-exported: these lived here before the codec module existed
+from .embedding_codec import binary_to_embedding as binary_to_embedding
+from .embedding_codec import embedding_to_binary as embedding_to_binary
 from app.core.config import RAGConfig
 
 logger = logging.getLogger(__name__)
@@ -44,17 +60,6 @@ def extract_domain(url: str) -> str:
         return ""
 
 
-def embedding_to_binary(embedding: List[float]) -> bytes:
-    """Convert embedding list to binary format for storage."""
-    return struct.pack(f'{len(embedding)}f', *embedding)
-
-
-def binary_to_embedding(data: bytes) -> List[float]:
-    """Convert binary data back to embedding list."""
-    count = len(data) // 4  # 4 bytes per float
-    return list(struct.unpack(f'{count}f', data))
-
-
 @dataclass
 class WebMetaItem:
     """URL metadata item."""
@@ -122,7 +127,8 @@ class WebChunkItem:
     start_char: int  # Start position in original text
     end_char: int  # End position in original text
     ttl: int  # Unix timestamp for TTL
-    embedding: Optional[List[float]] = None  # Vector embedding
+    embedding: Optional[Vector] = None  # Vector embedding
+    precision: str = DEFAULT_PRECISION  # Storage precision of the embedding
 
     @property
     def url_hash(self) -> str:
@@ -152,22 +158,13 @@ class WebChunkItem:
             'end_char': self.end_char,
             'ttl': self.ttl,
         }
-        if self.embedding:
-            item['embedding'] = embedding_to_binary(self.embedding)
+        if self.embedding is not None and len(self.embedding):
+            item.update(embedding_attributes(self.embedding, self.precision))
         return item
 
     @classmethod
     def from_dynamo_item(cls, item: Dict[str, Any]) -> "WebChunkItem":
         """Create from DynamoDB item."""
-        embedding = None
-        if 'embedding' in item and item['embedding']:
-            embedding_data = item['embedding']
-            if isinstance(embedding_data, bytes):
-                embedding = binary_to_embedding(embedding_data)
-            elif hasattr(embedding_data, 'value'):
-                # boto3 Binary type
-                embedding = binary_to_embedding(embedding_data.value)
-
         return cls(
             chunk_id=item.get('chunk_id', ''),
             chunk_text=item.get('chunk_text', ''),
@@ -177,7 +174,8 @@ class WebChunkItem:
             start_char=item.get('start_char', 0),
             end_char=item.get('end_char', 0),
             ttl=item.get('ttl', 0),
-            embedding=embedding,
+            embedding=item_embedding(item),
+            precision=stored_precision(item),
         )
 
 
@@ -224,11 +222,15 @@ class TroiseWebChunksAdapter:
 
         Args:
             client: DynamoDBClient instance.
-            config: RAGConfig for TTL settings.
+            config: RAGConfig for TTL and embedding precision settings.
         """
         self._client = client
         self._table_name = TABLE_NAME
         self._config = config
+        self._precision = validate_precision(
+            config.embedding_precision if config else DEFAULT_PRECISION
+        )
+        self._migrator = EmbeddingMigrator(client, self._table_name, self._precision)
 
     def _get_ttl_for_url(self, url: str, ttl_hours_override: Optional[int] = None) -> int:
         """
@@ -353,6 +355,7 @@ class TroiseWebChunksAdapter:
                     end_char=chunk_dict.get('end_char', 0),
                     ttl=ttl_timestamp,
                     embedding=embedding,
+                    precision=self._precision,
                 )
                 await table.put_item(Item=chunk.to_dynamo_item())
 
@@ -464,11 +467,12 @@ class TroiseWebChunksAdapter:
                 params['ExpressionAttributeNames'] = {'#ttl': 'ttl'}
 
             response = await table.query(**params)
+            items = response.get('Items', [])
+
+            chunks = [WebChunkItem.from_dynamo_item(item) for item in items]
 
-            chunks = [
-                WebChunkItem.from_dynamo_item(item)
-                for item in response.get('Items', [])
-            ]
+            if include_embeddings:
+                self._migrator.schedule(items)
 
             logger.debug(f"Retrieved {len(chunks)} chunks for {url}")
             return chunks
@@ -494,7 +498,7 @@ class TroiseWebChunksAdapter:
 
     async def search_similar(
         self,
-        query_embedding: List[float],
+        query_embedding: Vector,
         top_k: int = 5,
     ) -> List[WebChunkItem]:
         """
@@ -510,65 +514,49 @@ class TroiseWebChunksAdapter:
         Returns:
             List of WebChunkItem objects sorted by similarity (highest first).
         """
-        import math
-
-        def cosine_similarity(a: List[float], b: List[float]) -> float:
-            """Calculate cosine similarity between two vectors."""
-            dot = sum(x * y for x, y in zip(a, b))
-            norm_a = math.sqrt(sum(x * x for x in a))
-            norm_b = math.sqrt(sum(x * x for x in b))
-            if norm_a == 0 or norm_b == 0:
-                return 0.0
-            return dot / (norm_a * norm_b)
-
         current_time = int(time.time())
-        results = []
+        chunks: List[WebChunkItem] = []
 
         async with self._client.resource() as dynamodb:
             table = await dynamodb.Table(self._table_name)
 
-            # Scan for all CHUNK items
-            response = await table.scan(
-                FilterExpression="begins_with(#sk, :chunk_prefix) AND #ttl > :now",
-                ExpressionAttributeNames={
+            scan_params = {
+                'FilterExpression': "begins_with(#sk, :chunk_prefix) AND #ttl > :now",
+                'ExpressionAttributeNames': {
                     "#sk": "SK",
                     "#ttl": "ttl",
                 },
-                ExpressionAttributeValues={
+                'ExpressionAttributeValues': {
                     ":chunk_prefix": "CHUNK#",
                     ":now": current_time,
                 },
-            )
+            }
 
-            for item in response.get('Items', []):
-                chunk = WebChunkItem.from_dynamo_item(item)
-                if chunk.embedding:
-                    score = cosine_similarity(query_embedding, chunk.embedding)
-                    results.append((score, chunk))
+            # Scan for all CHUNK items
+            response = await table.scan(**scan_params)
+            while True:
+                items = response.get('Items', [])
+                chunks.extend(
+                    chunk for chunk in map(WebChunkItem.from_dynamo_item, items)
+                    if chunk.embedding is not None and len(chunk.embedding)
+                )
+                self._migrator.schedule(items)
 
-            # Handle pagination
-            while 'LastEvaluatedKey' in response:
+                # Handle pagination
+                if 'LastEvaluatedKey' not in response:
+                    break
                 response = await table.scan(
-                    FilterExpression="begins_with(#sk, :chunk_prefix) AND #ttl > :now",
-                    ExpressionAttributeNames={
-                        "#sk": "SK",
-                        "#ttl": "ttl",
-                    },
-                    ExpressionAttributeValues={
-                        ":chunk_prefix": "CHUNK#",
-                        ":now": current_time,
-                    },
+                    **scan_params,
                     ExclusiveStartKey=response['LastEvaluatedKey'],
                 )
-                for item in response.get('Items', []):
-                    chunk = WebChunkItem.from_dynamo_item(item)
-                    if chunk.embedding:
-                        score = cosine_similarity(query_embedding, chunk.embedding)
-                        results.append((score, chunk))
-
-        # Sort by similarity and return top_k
-        results.sort(key=lambda x: x[0], reverse=True)
-        return [chunk for score, chunk in results[:top_k]]
+
+        if not chunks:
+            return []
+
+        # Score all chunks in one matrix product and return top_k
+        scores = cosine_similarities(query_embedding, [c.embedding for c in chunks])
+        order = np.argsort(-scores, kind="stable")[:top_k]
+        return [chunks[i] for i in order]
 
     # ========== Utility ==========
 
@@ -8,14 +8,28 @@ File ID Format:
     Example: "abc-123:def-456-ghi"
 
     This allows O(1) lookups by parsing session from file_id.
+
+Object keys are "{session_id}/{uuid}{ext}", with ext derived from the
+mimetype. Keys written by this process are remembered in a bounded key
+index, so download/exists/delete are a single request; ids uploaded by
+another process (or before a restart) fall back to one prefix listing.
+
+One S3 client (with its connection pool) is kept open for the adapter's
+lifetime; call close() on shutdown.
 """
+import asyncio
+import contextlib
+import hashlib
 import logging
 import os
 import uuid
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Optional, Tuple
+from pathlib import Path
+from typing import AsyncIterator, Optional, Tuple, Union
 
 import aioboto3
+import aiofiles
 from botocore.config import Config
 from botocore.exceptions import ClientError
 
@@ -24,6 +38,9 @@ logger = logging.getLogger(__name__)
 # Separator for composite file IDs
 FILE_ID_SEPARATOR = ":"
 
+# Chunk size for streaming transfers
+STREAM_CHUNK_SIZE = 1024 * 1024
+
 
 @dataclass
 class MinIOConfig:
@@ -34,6 +51,12 @@ class MinIOConfig:
     secure: bool = False
     bucket: str = "troise-uploads"
     retention_days: int = 1
+    max_pool_connections: int = 20
+    key_index_size: int = 10000
+    # Host clients use for presigned URLs (e.g. "files.example.com"), if
+    # different from the internal endpoint
+    public_endpoint: str = ""
+    presign_expiry_seconds: int = 3600
 
     @classmethod
     def from_env(cls) -> "MinIOConfig":
@@ -45,6 +68,10 @@ class MinIOConfig:
             secure=os.getenv("MINIO_SECURE", "false").lower() == "true",
             bucket=os.getenv("MINIO_BUCKET", "troise-uploads"),
             retention_days=int(os.getenv("MINIO_RETENTION_DAYS", "1")),
+            max_pool_connections=int(os.getenv("MINIO_MAX_POOL_CONNECTIONS", "20")),
+            key_index_size=int(os.getenv("MINIO_KEY_INDEX_SIZE", "10000")),
+            public_endpoint=os.getenv("MINIO_PUBLIC_ENDPOINT", ""),
+            presign_expiry_seconds=int(os.getenv("MINIO_PRESIGN_EXPIRY_SECONDS", "3600")),
         )
 
 
@@ -61,7 +88,8 @@ class MinIOAdapter:
     - Async upload/download/delete operations
     - Automatic bucket creation with lifecycle policy
     - Session-scoped file organization
-    - O(1) file lookups via composite IDs
+    - O(1) file lookups via composite IDs and the key index
+    - Streaming transfers to/from disk and presigned download URLs
 
     Example:
         adapter = MinIOAdapter(config)
@@ -77,6 +105,10 @@ class MinIOAdapter:
         # file_id = "session-456:abc-123-def"
 
         content = await adapter.download(file_id)
+
+        # Large files: stream to disk, or hand the client a URL
+        await adapter.download_to_file(file_id, "/tmp/report.pdf")
+        url = await adapter.get_presigned_url(file_id)
     """
 
     def __init__(self, config: Optional[MinIOConfig] = None):
@@ -102,8 +134,23 @@ class MinIOAdapter:
             connect_timeout=10,
             read_timeout=60,
             signature_version='s3v4',
+            max_pool_connections=self._config.max_pool_connections,
+            tcp_keepalive=True,
         )
 
+        # Persistent clients (opened on first use)
+        self._s3 = None
+        self._presign_s3 = None
+        self._exit_stack: Optional[contextlib.AsyncExitStack] = None
+        self._connect_lock = asyncio.Lock()
+
+        # Composite file_id -> object key, for keys this process has seen
+        self._key_index: "OrderedDict[str, str]" = OrderedDict()
+        self._stats = {
+            'index_hits': 0,
+            'index_misses': 0,
+        }
+
         logger.debug(f"MinIO adapter configured for {self._endpoint_url}")
 
     @property
@@ -116,6 +163,104 @@ class MinIOAdapter:
             'config': self._boto_config,
         }
 
+    async def _get_client(self):
+        """Get the shared S3 client, opening it on first use."""
+        if self._s3 is None:
+            async with self._connect_lock:
+                if self._s3 is None:
+                    stack = contextlib.AsyncExitStack()
+                    s3 = await stack.enter_async_context(
+                        self._session.client('s3', **self._client_config)
+                    )
+                    presign_s3 = s3
+                    if self._config.public_endpoint:
+                        # Signatures cover the host, so sign with the public one
+                        protocol = "https" if self._config.secure else "http"
+                        presign_s3 = await stack.enter_async_context(self._session.client(
+                            's3',
+                            **{**self._client_config,
+                               'endpoint_url': f"{protocol}://{self._config.public_endpoint}"},
+                        ))
+                    self._exit_stack = stack
+                    self._presign_s3 = presign_s3
+                    self._s3 = s3
+        return self._s3
+
+    async def close(self) -> None:
+        """Close the shared S3 client(s) and their connection pools."""
+        if self._exit_stack is not None:
+            stack, self._exit_stack = self._exit_stack, None
+            self._s3 = None
+            self._presign_s3 = None
+            await stack.aclose()
+
+    def _remember_key(self, file_id: str, key: str) -> None:
+        self._key_index[file_id] = key
+        self._key_index.move_to_end(file_id)
+        while len(self._key_index) > self._config.key_index_size:
+            self._key_index.popitem(last=False)
+
+    async def _resolve_key(self, file_id: str) -> Optional[str]:
+        """Find the object key for a composite file_id.
+
+        Args:
+            file_id: Composite file ID.
+
+        Returns:
+            Object key, or None if no object exists.
+
+        Raises:
+            ValueError: If file_id format is invalid.
+        """
+        key_prefix = self._build_key_prefix(file_id)
+
+        key = self._key_index.get(file_id)
+        if key is not None:
+            self._key_index.move_to_end(file_id)
+            self._stats['index_hits'] += 1
+            return key
+        self._stats['index_misses'] += 1
+
+        # Unknown id: list with prefix to find exact key (handles extension)
+        s3 = await self._get_client()
+        response = await s3.list_objects_v2(
+            Bucket=self._config.bucket,
+            Prefix=key_prefix,
+            MaxKeys=1,
+        )
+        contents = response.get('Contents', [])
+        if not contents:
+            return None
+
+        key = contents[0]['Key']
+        self._remember_key(file_id, key)
+        return key
+
+    async def _get_object(self, file_id: str) -> dict:
+        """GET an object by composite file_id.
+
+        Raises:
+            FileNotFoundError: If file does not exist.
+            ValueError: If file_id format is invalid.
+        """
+        key = await self._resolve_key(file_id)
+        if key is None:
+            raise FileNotFoundError(f"File not found: {file_id}")
+
+        s3 = await self._get_client()
+        try:
+            return await s3.get_object(
+                Bucket=self._config.bucket,
+                Key=key,
+            )
+        except ClientError as e:
+            error_code = e.response.get('Error', {}).get('Code', '')
+            if error_code == 'NoSuchKey':
+                # Expired or deleted elsewhere
+                self._key_index.pop(file_id, None)
+                raise FileNotFoundError(f"File not found: {file_id}")
+            raise
+
     @staticmethod
     def make_file_id(session_id: str, uuid_part: str) -> str:
         """Create composite file ID from session and UUID.
@@ -158,42 +303,48 @@ class MinIOAdapter:
         if self._initialized:
             return
 
-        async with self._session.client('s3', **self._client_config) as s3:
-            # Create bucket if it doesn't exist
-            try:
-                await s3.head_bucket(Bucket=self._config.bucket)
-                logger.debug(f"Bucket '{self._config.bucket}' already exists")
-            except ClientError as e:
-                error_code = e.response.get('Error', {}).get('Code', '')
-                if error_code in ('404', 'NoSuchBucket'):
-                    await s3.create_bucket(Bucket=self._config.bucket)
-                    logger.info(f"Created bucket '{self._config.bucket}'")
-                else:
-                    raise
-
-            # Set lifecycle policy for automatic cleanup
-            lifecycle_config = {
-                "Rules": [{
-                    "ID": f"expire-after-{self._config.retention_days}-days",
-                    "Status": "Enabled",
-                    "Filter": {"Prefix": ""},
-                    "Expiration": {"Days": self._config.retention_days}
-                }]
-            }
+        s3 = await self._get_client()
 
-            try:
-                await s3.put_bucket_lifecycle_configuration(
-                    Bucket=self._config.bucket,
-                    LifecycleConfiguration=lifecycle_config
-                )
-                logger.info(
-                    f"Set lifecycle policy: {self._config.retention_days} day retention"
-                )
-            except ClientError as e:
-                logger.warning(f"Failed to set lifecycle policy: {e}")
+        # Create bucket if it doesn't exist
+        try:
+            await s3.head_bucket(Bucket=self._config.bucket)
+            logger.debug(f"Bucket '{self._config.bucket}' already exists")
+        except ClientError as e:
+            error_code = e.response.get('Error', {}).get('Code', '')
+            if error_code in ('404', 'NoSuchBucket'):
+                await s3.create_bucket(Bucket=self._config.bucket)
+                logger.info(f"Created bucket '{self._config.bucket}'")
+            else:
+                raise
+
+        # Set lifecycle policy for automatic cleanup
+        lifecycle_config = {
+            "Rules": [{
+                "ID": f"expire-after-{self._config.retention_days}-days",
+                "Status": "Enabled",
+                "Filter": {"Prefix": ""},
+                "Expiration": {"Days": self._config.retention_days}
+            }]
+        }
+
+        try:
+            await s3.put_bucket_lifecycle_configuration(
+                Bucket=self._config.bucket,
+                LifecycleConfiguration=lifecycle_config
+            )
+            logger.info(
+                f"Set lifecycle policy: {self._config.retention_days} day retention"
+            )
+        except ClientError as e:
+            logger.warning(f"Failed to set lifecycle policy: {e}")
 
         self._initialized = True
 
+    def _build_key(self, file_id: str, mimetype: str, session_id: str) -> str:
+        """Build the object key for a new upload."""
+        # Storage key uses / for S3 path
+        return f"{session_id}/{file_id}{self._get_extension(mimetype)}"
+
     async def upload(
         self,
         file_id: str,
@@ -215,25 +366,60 @@ class MinIOAdapter:
         if not self._initialized:
             await self.initialize()
 
-        # Determine file extension from mimetype
-        ext = self._get_extension(mimetype)
-
-        # Storage key uses / for S3 path
-        key = f"{session_id}/{file_id}{ext}"
+        key = self._build_key(file_id, mimetype, session_id)
 
-        async with self._session.client('s3', **self._client_config) as s3:
-            await s3.put_object(
-                Bucket=self._config.bucket,
-                Key=key,
-                Body=content,
-                ContentType=mimetype,
-            )
+        s3 = await self._get_client()
+        await s3.put_object(
+            Bucket=self._config.bucket,
+            Key=key,
+            Body=content,
+            ContentType=mimetype,
+        )
 
         # Return composite file_id for O(1) lookups
         composite_id = self.make_file_id(session_id, file_id)
+        self._remember_key(composite_id, key)
         logger.debug(f"Uploaded {composite_id} to {key} ({len(content)} bytes)")
         return composite_id
 
+    async def upload_file(
+        self,
+        file_id: str,
+        path: Union[str, Path],
+        mimetype: str,
+        session_id: str,
+    ) -> str:
+        """Upload a file from disk without loading it into memory.
+
+        Large files are sent as a multipart upload in fixed-size parts.
+
+        Args:
+            file_id: UUID portion of the file identifier.
+            path: Local file to upload.
+            mimetype: MIME type of the file.
+            session_id: Session identifier for namespacing.
+
+        Returns:
+            Composite file_id: "{session_id}:{uuid}".
+        """
+        if not self._initialized:
+            await self.initialize()
+
+        key = self._build_key(file_id, mimetype, session_id)
+
+        s3 = await self._get_client()
+        await s3.upload_file(
+            Filename=str(path),
+            Bucket=self._config.bucket,
+            Key=key,
+            ExtraArgs={'ContentType': mimetype},
+        )
+
+        composite_id = self.make_file_id(session_id, file_id)
+        self._remember_key(composite_id, key)
+        logger.debug(f"Uploaded {composite_id} to {key} from {path}")
+        return composite_id
+
     def _build_key_prefix(self, file_id: str) -> str:
         """Build S3 key prefix from composite file_id.
 
@@ -262,35 +448,106 @@ class MinIOAdapter:
         if not self._initialized:
             await self.initialize()
 
-        key_prefix = self._build_key_prefix(file_id)
+        response = await self._get_object(file_id)
+        async with response['Body'] as body:
+            content = await body.read()
+        logger.debug(f"Downloaded {file_id} ({len(content)} bytes)")
+        return content
 
-        async with self._session.client('s3', **self._client_config) as s3:
-            # List objects with prefix to find exact key (handles extension)
-            response = await s3.list_objects_v2(
-                Bucket=self._config.bucket,
-                Prefix=key_prefix,
-                MaxKeys=1,
-            )
+    async def stream(
+        self,
+        file_id: str,
+        chunk_size: int = STREAM_CHUNK_SIZE,
+    ) -> AsyncIterator[bytes]:
+        """Stream file contents in chunks.
 
-            contents = response.get('Contents', [])
-            if not contents:
-                raise FileNotFoundError(f"File not found: {file_id}")
+        Args:
+            file_id: Composite file ID "{session_id}:{uuid}".
+            chunk_size: Bytes per chunk.
 
-            key = contents[0]['Key']
+        Yields:
+            File content chunks, in order.
 
-            try:
-                response = await s3.get_object(
-                    Bucket=self._config.bucket,
-                    Key=key,
-                )
-                content = await response['Body'].read()
-                logger.debug(f"Downloaded {file_id} ({len(content)} bytes)")
-                return content
-            except ClientError as e:
-                error_code = e.response.get('Error', {}).get('Code', '')
-                if error_code == 'NoSuchKey':
-                    raise FileNotFoundError(f"File not found: {file_id}")
-                raise
+        Raises:
+            FileNotFoundError: If file does not exist.
+            ValueError: If file_id format is invalid.
+        """
+        if not self._initialized:
+            await self.initialize()
+
+        response = await self._get_object(file_id)
+        async with response['Body'] as body:
+            async for chunk in body.iter_chunks(chunk_size):
+                yield chunk
+
+    async def download_to_file(
+        self,
+        file_id: str,
+        path: Union[str, Path],
+        chunk_size: int = STREAM_CHUNK_SIZE,
+    ) -> str:
+        """Stream a file to disk, holding at most one chunk in memory.
+
+        Args:
+            file_id: Composite file ID "{session_id}:{uuid}".
+            path: Local destination (overwritten).
+            chunk_size: Bytes per chunk.
+
+        Returns:
+            SHA-256 hex digest of the downloaded bytes (computed while
+            streaming, so callers can key caches without re-reading).
+
+        Raises:
+            FileNotFoundError: If file does not exist.
+            ValueError: If file_id format is invalid.
+        """
+        if not self._initialized:
+            await self.initialize()
+
+        # Fetch before opening the destination, so a missing file leaves no
+        # empty file behind
+        response = await self._get_object(file_id)
+        digest = hashlib.sha256()
+        size = 0
+        async with response['Body'] as body, aiofiles.open(path, mode='wb') as f:
+            async for chunk in body.iter_chunks(chunk_size):
+                digest.update(chunk)
+                size += len(chunk)
+                await f.write(chunk)
+        logger.debug(f"Downloaded {file_id} to {path} ({size} bytes)")
+        return digest.hexdigest()
+
+    async def get_presigned_url(
+        self,
+        file_id: str,
+        expires_in: Optional[int] = None,
+    ) -> str:
+        """Create a time-limited URL clients can download the file from directly.
+
+        Signed for public_endpoint when configured. Signing is local; only
+        the key lookup may need a request.
+
+        Args:
+            file_id: Composite file ID "{session_id}:{uuid}".
+            expires_in: URL lifetime in seconds (default: presign_expiry_seconds).
+
+        Returns:
+            Presigned GET URL.
+
+        Raises:
+            FileNotFoundError: If file does not exist.
+            ValueError: If file_id format is invalid.
+        """
+        key = await self._resolve_key(file_id)
+        if key is None:
+            raise FileNotFoundError(f"File not found: {file_id}")
+
+        await self._get_client()
+        return await self._presign_s3.generate_presigned_url(
+            'get_object',
+            Params={'Bucket': self._config.bucket, 'Key': key},
+            ExpiresIn=expires_in or self._config.presign_expiry_seconds,
+        )
 
     async def delete(self, file_id: str) -> bool:
         """Delete file from storage.
@@ -305,33 +562,26 @@ class MinIOAdapter:
             await self.initialize()
 
         try:
-            key_prefix = self._build_key_prefix(file_id)
+            key = await self._resolve_key(file_id)
         except ValueError:
             return False
+        if key is None:
+            return False
 
-        async with self._session.client('s3', **self._client_config) as s3:
-            # List objects with prefix to find exact key
-            response = await s3.list_objects_v2(
+        s3 = await self._get_client()
+        try:
+            # One request for indexed keys (DeleteObject is idempotent, so
+            # an object that already expired also reports True)
+            await s3.delete_object(
                 Bucket=self._config.bucket,
-                Prefix=key_prefix,
-                MaxKeys=1,
+                Key=key,
             )
-
-            contents = response.get('Contents', [])
-            if not contents:
-                return False
-
-            key = contents[0]['Key']
-
-            try:
-                await s3.delete_object(
-                    Bucket=self._config.bucket,
-                    Key=key,
-                )
-                logger.debug(f"Deleted {file_id}")
-                return True
-            except ClientError:
-                return False
+            logger.debug(f"Deleted {file_id}")
+            return True
+        except ClientError:
+            return False
+        finally:
+            self._key_index.pop(file_id, None)
 
     async def exists(self, file_id: str) -> bool:
         """Check if file exists in storage.
@@ -345,18 +595,24 @@ class MinIOAdapter:
         if not self._initialized:
             await self.initialize()
 
-        try:
-            key_prefix = self._build_key_prefix(file_id)
-        except ValueError:
-            return False
+        key = self._key_index.get(file_id)
+        if key is None:
+            # A listing hit is proof enough of existence
+            try:
+                return await self._resolve_key(file_id) is not None
+            except ValueError:
+                return False
 
-        async with self._session.client('s3', **self._client_config) as s3:
-            response = await s3.list_objects_v2(
-                Bucket=self._config.bucket,
-                Prefix=key_prefix,
-                MaxKeys=1,
-            )
-            return len(response.get('Contents', [])) > 0
+        s3 = await self._get_client()
+        try:
+            await s3.head_object(Bucket=self._config.bucket, Key=key)
+            return True
+        except ClientError as e:
+            error_code = e.response.get('Error', {}).get('Code', '')
+            if error_code in ('404', 'NoSuchKey', 'NotFound'):
+                self._key_index.pop(file_id, None)
+                return False
+            raise
 
     async def cleanup_session(self, session_id: str) -> int:
         """Delete all files for a session.
@@ -373,24 +629,29 @@ class MinIOAdapter:
         deleted = 0
         prefix = f"{session_id}/"
 
-        async with self._session.client('s3', **self._client_config) as s3:
-            # List objects with prefix
-            paginator = s3.get_paginator('list_objects_v2')
-            async for page in paginator.paginate(
+        s3 = await self._get_client()
+
+        # List objects with prefix
+        paginator = s3.get_paginator('list_objects_v2')
+        async for page in paginator.paginate(
+            Bucket=self._config.bucket,
+            Prefix=prefix,
+        ):
+            contents = page.get('Contents', [])
+            if not contents:
+                continue
+
+            # Delete in batches
+            objects = [{'Key': obj['Key']} for obj in contents]
+            await s3.delete_objects(
                 Bucket=self._config.bucket,
-                Prefix=prefix,
-            ):
-                contents = page.get('Contents', [])
-                if not contents:
-                    continue
-
-                # Delete in batches
-                objects = [{'Key': obj['Key']} for obj in contents]
-                await s3.delete_objects(
-                    Bucket=self._config.bucket,
-                    Delete={'Objects': objects}
-                )
-                deleted += len(objects)
+                Delete={'Objects': objects}
+            )
+            deleted += len(objects)
+
+        session_prefix = f"{session_id}{FILE_ID_SEPARATOR}"
+        for file_id in [f for f in self._key_index if f.startswith(session_prefix)]:
+            del self._key_index[file_id]
 
         logger.info(f"Cleaned up session {session_id}: {deleted} files deleted")
         return deleted
@@ -402,13 +663,20 @@ class MinIOAdapter:
             True if healthy, False otherwise.
         """
         try:
-            async with self._session.client('s3', **self._client_config) as s3:
-                await s3.list_buckets()
+            s3 = await self._get_client()
+            await s3.list_buckets()
             return True
         except Exception as e:
             logger.warning(f"MinIO health check failed: {e}")
             return False
 
+    def get_stats(self) -> dict:
+        """Get key index statistics."""
+        return {
+            **self._stats,
+            'key_index_size': len(self._key_index),
+        }
+
     @staticmethod
     def _get_extension(mimetype: str) -> str:
         """Get file extension from MIME type.
@@ -6,6 +6,7 @@ from .registry import PluginRegistry
 from .container import Container, create_container, ContainerError, ServiceNotFoundError
 from .router import Router, RoutingResult
 from .tool_factory import ToolFactory, create_simple_tool
+from .tool_cache import ToolResultCache, ToolCachePolicy
 from .executor import Executor, ExecutionResult
 from .base_agent import BaseAgent
 from .streaming import (
@@ -42,6 +43,8 @@ __all__ = [
     # Tool Factory
     "ToolFactory",
     "create_simple_tool",
+    "ToolResultCache",
+    "ToolCachePolicy",
     # Executor
     "Executor",
     "ExecutionResult",
@@ -99,6 +99,9 @@ class RAGConfig:
     web_cache_ttl_hours: int = 2
     ttl_by_domain: Dict[str, int] = field(default_factory=dict)
 
+    # Stored embedding precision: float32 | float16 | int8
+    embedding_precision: str = "float16"
+
     # Nested configs
     fetch: FetchConfig = field(default_factory=FetchConfig)
     parsing: ParsingConfig = field(default_factory=ParsingConfig)
@@ -137,6 +140,7 @@ class RAGConfig:
             max_fetch_tokens=data.get("max_fetch_tokens", 7000),
             web_cache_ttl_hours=data.get("web_cache_ttl_hours", 2),
             ttl_by_domain=data.get("ttl_by_domain", {}),
+            embedding_precision=data.get("embedding_precision", "float16"),
             fetch=fetch_config,
             parsing=parsing_config,
         )
@@ -154,6 +158,9 @@ class ToolsConfig:
     universal_tools: List[str] = field(default_factory=lambda: [
         "remember", "recall", "web_search", "web_fetch"
     ])
+    # Memoize results of tools that declare "cache" in their plugin manifest
+    result_cache_enabled: bool = True
+    result_cache_max_entries: int = 1024
 
     @classmethod
     def from_dict(cls, data: Dict) -> "ToolsConfig":
@@ -165,6 +172,8 @@ class ToolsConfig:
             universal_tools=data.get("universal_tools", [
                 "remember", "recall", "web_search", "web_fetch"
             ]),
+            result_cache_enabled=data.get("result_cache_enabled", True),
+            result_cache_max_entries=data.get("result_cache_max_entries", 1024),
         )
 
 
@@ -213,6 +222,32 @@ class SkillsConfig:
         )
 
 
+# =============================================================================
+# Prompts Configuration
+# =============================================================================
+
+@dataclass
+class PromptsConfig:
+    """Prompt assembly configuration."""
+    # "stable_prefix": immutable agent/interface layers first, then per-user,
+    #   then per-request content, so backends can reuse the cached KV prefix.
+    # "legacy": date header and personalization interleaved with the template.
+    layout: str = "stable_prefix"
+    # Max composed static prefixes kept in memory
+    prefix_cache_size: int = 256
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "PromptsConfig":
+        """Create PromptsConfig from dictionary (e.g., from YAML)."""
+        if not data:
+            return cls()
+
+        return cls(
+            layout=data.get("layout", "stable_prefix"),
+            prefix_cache_size=data.get("prefix_cache_size", 256),
+        )
+
+
 # =============================================================================
 # Queue Configuration
 # =============================================================================
@@ -239,6 +274,12 @@ class QueueConfig:
     # Retry settings
     max_retries: int = 2  # Max retry attempts for stuck requests
 
+    # Graph checkpointing (retries resume from the last successful node)
+    checkpoint_enabled: bool = True
+    checkpoint_ttl_seconds: int = 3600  # Drop abandoned checkpoints after 1 hour
+    checkpoint_max_entries: int = 256   # In-memory bound (oldest evicted first)
+    checkpoint_spill: bool = False      # Also persist to troise_main TMP items
+
     # Alerting thresholds
     alert_queue_depth: int = 10
     alert_wait_time_seconds: int = 60
@@ -261,6 +302,10 @@ class QueueConfig:
             visibility_check_interval_seconds=data.get("visibility_check_interval_seconds", 30),
             result_ttl_seconds=data.get("result_ttl_seconds", 300),
             max_retries=data.get("max_retries", 2),
+            checkpoint_enabled=data.get("checkpoint_enabled", True),
+            checkpoint_ttl_seconds=data.get("checkpoint_ttl_seconds", 3600),
+            checkpoint_max_entries=data.get("checkpoint_max_entries", 256),
+            checkpoint_spill=data.get("checkpoint_spill", False),
             alert_queue_depth=data.get("alert_queue_depth", 10),
             alert_wait_time_seconds=data.get("alert_wait_time_seconds", 60),
         )
@@ -297,6 +342,48 @@ class QueueConfig:
         return self.visibility_timeout_seconds
 
 
+# =============================================================================
+# Preprocessing Configuration
+# =============================================================================
+
+@dataclass
+class PreprocessingConfig:
+    """File extraction configuration."""
+    # PDF extraction (runs in a process pool, off the event loop)
+    pdf_workers: int = 0              # 0 = one per CPU core
+    pdf_pages_per_task: int = 16      # Page range handed to each worker
+    pdf_max_pages: int = 500          # Pages extracted per document (rest skipped)
+    pdf_timeout_seconds: float = 60.0 # Per-document wall time budget
+    # Vision extraction (images in one message are described concurrently)
+    vision_max_concurrency: int = 2   # Simultaneous vision requests per backend
+    vision_max_image_px: int = 1536   # Longest side sent to the model (0 = original)
+    # Extraction cache (keyed by file content hash, shared across sessions)
+    extraction_cache_enabled: bool = True
+    extraction_cache_memory_entries: int = 256
+    extraction_cache_memory_mb: int = 64
+    # Speculative model load (predicted target model prefetched during sanitize + route)
+    speculative_load_enabled: bool = True
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "PreprocessingConfig":
+        """Create PreprocessingConfig from dictionary (e.g., from YAML)."""
+        if not data:
+            return cls()
+
+        return cls(
+            pdf_workers=data.get("pdf_workers", 0),
+            pdf_pages_per_task=data.get("pdf_pages_per_task", 16),
+            pdf_max_pages=data.get("pdf_max_pages", 500),
+            pdf_timeout_seconds=data.get("pdf_timeout_seconds", 60.0),
+            vision_max_concurrency=data.get("vision_max_concurrency", 2),
+            vision_max_image_px=data.get("vision_max_image_px", 1536),
+            extraction_cache_enabled=data.get("extraction_cache_enabled", True),
+            extraction_cache_memory_entries=data.get("extraction_cache_memory_entries", 256),
+            extraction_cache_memory_mb=data.get("extraction_cache_memory_mb", 64),
+            speculative_load_enabled=data.get("speculative_load_enabled", True),
+        )
+
+
 # =============================================================================
 # Circuit Breaker Configuration
 # =============================================================================
@@ -352,9 +439,11 @@ class Config:
         self._rag: RAGConfig = None
         self._session: SessionConfig = None
         self._skills: SkillsConfig = None
+        self._prompts: PromptsConfig = None
         self._tools: ToolsConfig = None
         self._queue: QueueConfig = None
         self._circuit_breaker: CircuitBreakerYAMLConfig = None
+        self._preprocessing: PreprocessingConfig = None
 
         self._load_config()
         self._load_backends()
@@ -363,8 +452,10 @@ class Config:
         self._load_session_config()
         self._load_tools_config()
         self._load_skills_config()
+        self._load_prompts_config()
         self._load_queue_config()
         self._load_circuit_breaker_config()
+        self._load_preprocessing_config()
 
     def _load_config(self):
         """Load configuration from YAML file."""
@@ -446,6 +537,12 @@ class Config:
         self._skills = SkillsConfig.from_dict(skills_data)
         logger.info(f"Loaded skills config: max_skill_depth={self._skills.max_skill_depth}")
 
+    def _load_prompts_config(self):
+        """Load prompt assembly configuration."""
+        prompts_data = self._data.get("prompts", {})
+        self._prompts = PromptsConfig.from_dict(prompts_data)
+        logger.info(f"Loaded prompts config: layout={self._prompts.layout}")
+
     def _load_queue_config(self):
         """Load queue configuration."""
         queue_data = self._data.get("queue", {})
@@ -462,6 +559,20 @@ class Config:
             f"open_timeout={self._circuit_breaker.open_timeout_seconds}s"
         )
 
+    def _load_preprocessing_config(self):
+        """Load file preprocessing configuration."""
+        preprocessing_data = self._data.get("preprocessing", {})
+        self._preprocessing = PreprocessingConfig.from_dict(preprocessing_data)
+        logger.info(
+            f"Loaded preprocessing config: pdf_workers={self._preprocessing.pdf_workers}, "
+            f"pdf_max_pages={self._preprocessing.pdf_max_pages}"
+        )
+
+    @property
+    def preprocessing(self) -> PreprocessingConfig:
+        """Get file preprocessing configuration."""
+        return self._preprocessing
+
     @property
     def circuit_breaker(self) -> CircuitBreakerYAMLConfig:
         """Get circuit breaker configuration."""
@@ -492,6 +603,11 @@ class Config:
         """Get skills configuration."""
         return self._skills
 
+    @property
+    def prompts(self) -> PromptsConfig:
+        """Get prompt assembly configuration."""
+        return self._prompts
+
     @property
     def profile(self) -> "IConfigProfile":
         """Get the active profile."""
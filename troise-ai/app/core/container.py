@@ -298,6 +298,29 @@ def create_container() -> Container:
         )
     )
     # Note: ModelFactory is created internally by VRAMOrchestrator
+
+    # Register SpeculativeModelLoader (prefetches predicted models during routing)
+    from ..services.speculative_loader import SpeculativeModelLoader
+
+    container.register_factory(
+        SpeculativeModelLoader,
+        lambda c: SpeculativeModelLoader(
+            orchestrator=c.resolve(VRAMOrchestrator),
+            enabled=c.resolve(Config).preprocessing.speculative_load_enabled,
+        )
+    )
+
+    # Register ImageGenerationScheduler (batching + result cache for ComfyUI)
+    from ..services.image_scheduler import ImageGenerationScheduler, create_image_scheduler
+
+    def create_scheduler(c: Container) -> ImageGenerationScheduler:
+        comfyui = c.resolve(Config).backends.get("comfyui")
+        return create_image_scheduler(
+            options=comfyui.options if comfyui else None,
+            storage=c.try_resolve(IFileStorage),
+        )
+
+    container.register_factory(ImageGenerationScheduler, create_scheduler)
     # Swarm models are created at execution time via VRAMOrchestrator.get_model()
 
     # Register EmbeddingService (depends on Config, DynamoDBClient, ProfileManager)
@@ -308,6 +331,7 @@ def create_container() -> Container:
             dynamo_client=c.resolve(DynamoDBClient),
             model=c.resolve(ProfileManager).get_current_profile().embedding_model,
             use_cache=True,
+            embedding_precision=c.resolve(Config).rag.embedding_precision,
         )
     )
 
@@ -317,6 +341,7 @@ def create_container() -> Container:
     from ..preprocessing import (
         PromptSanitizer,
         FileExtractionRouter,
+        ExtractionResultCache,
         OutputArtifactDetector,
     )
     from ..preprocessing.extractors import (
@@ -336,13 +361,21 @@ def create_container() -> Container:
 
     # Register FileExtractionRouter with extractors
     def create_extraction_router(c: Container) -> FileExtractionRouter:
-        router = FileExtractionRouter()
+        preprocessing = c.resolve(Config).preprocessing
+        cache = None
+        if preprocessing.extraction_cache_enabled:
+            cache = ExtractionResultCache(
+                storage=c.try_resolve(IFileStorage),
+                max_memory_entries=preprocessing.extraction_cache_memory_entries,
+                max_memory_bytes=preprocessing.extraction_cache_memory_mb * 1024 * 1024,
+            )
+        router = FileExtractionRouter(cache=cache)
         router.register(TextExtractor())
         router.register(ImageExtractor(
             config=c.resolve(Config),
             vram_orchestrator=c.resolve(VRAMOrchestrator),
         ))
-        router.register(PDFExtractor())
+        router.register(PDFExtractor(config=preprocessing))
         return router
 
     container.register_factory(FileExtractionRouter, create_extraction_router)
@@ -459,8 +492,19 @@ def create_container() -> Container:
     container.register_factory(GraphRegistry, lambda c: create_graph_registry())
     container.register_factory(IGraphRegistry, lambda c: c.resolve(GraphRegistry))
 
-    # Register GraphExecutor
-    container.register_factory(GraphExecutor, lambda c: create_graph_executor())
+    # Register GraphExecutor with per-node checkpointing (resume on retry)
+    from .graph_checkpoint import GraphCheckpointStore, create_checkpoint_store
+
+    def create_graph_checkpoint_store(c: Container) -> Optional[GraphCheckpointStore]:
+        queue_config = c.resolve(Config).queue
+        adapter = c.resolve(TroiseMainAdapter) if queue_config.checkpoint_spill else None
+        return create_checkpoint_store(queue_config, main_adapter=adapter)
+
+    container.register_factory(GraphCheckpointStore, create_graph_checkpoint_store)
+    container.register_factory(
+        GraphExecutor,
+        lambda c: create_graph_executor(checkpoint_store=c.resolve(GraphCheckpointStore))
+    )
     container.register_factory(IGraphExecutor, lambda c: c.resolve(GraphExecutor))
 
     # ===========================================================================
@@ -483,10 +527,25 @@ def create_container() -> Container:
         )
     )
 
+    # Register ToolResultCache (memoizes tools with a manifest "cache" policy)
+    from .tool_cache import ToolResultCache
+
+    container.register_factory(
+        ToolResultCache,
+        lambda c: ToolResultCache(max_entries=c.resolve(Config).tools.result_cache_max_entries)
+    )
+
     # Register ToolFactory
     container.register_factory(
         ToolFactory,
-        lambda c: ToolFactory(registry=c.resolve(PluginRegistry), container=c)
+        lambda c: ToolFactory(
+            registry=c.resolve(PluginRegistry),
+            container=c,
+            result_cache=(
+                c.resolve(ToolResultCache)
+                if c.resolve(Config).tools.result_cache_enabled else None
+            ),
+        )
     )
 
     # Register Executor (with graph support)
@@ -353,6 +353,24 @@ class ExecutionContext:
             tool_call_limits=limits,
         )
 
+    def for_parallel_branch(self) -> "ExecutionContext":
+        """
+        Create a child context for a parallel graph branch.
+
+        Branch nodes mutate graph_domain and tool limits while they run;
+        copying those keeps concurrent branches from clobbering each other.
+        Tool call counts stay shared so every branch draws on the same
+        request budget instead of each getting a fresh copy of it.
+        Cancellation, WebSocket and collected sources stay shared too.
+
+        Returns:
+            New ExecutionContext with copied tool limits and shared counts.
+        """
+        return replace(
+            self,
+            tool_call_limits=dict(self.tool_call_limits),
+        )
+
     # Command execution support for execute_command tool (CLI/TUI)
 
     async def execute_command(
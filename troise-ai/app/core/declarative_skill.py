@@ -180,8 +180,9 @@ class DeclarativeSkill:
     def _build_system_prompt(self, context: ExecutionContext) -> str:
         """Build system prompt with context, references, and guardrails.
 
-        Uses PromptComposer to inject interface and personalization layers,
-        then appends loaded references (for SKILL.md format) and guardrails.
+        Uses PromptComposer to inject interface and personalization layers.
+        Loaded references (for SKILL.md format) and guardrails are passed as
+        static sections so they precede any per-user or per-request content.
 
         Args:
             context: Execution context.
@@ -189,24 +190,22 @@ class DeclarativeSkill:
         Returns:
             Formatted system prompt string.
         """
+        # Loaded references (for SKILL.md format with references/ directory)
+        # and guardrails are immutable, so they stay in the static prefix
+        static_sections = []
+        if self._skill_def.references_content:
+            static_sections.append(self._format_references())
+        if self._skill_def.guardrails:
+            static_sections.append(f"<guardrails>\n{self._skill_def.guardrails}\n</guardrails>")
+
         # Use PromptComposer to compose skill prompt with interface and personalization
-        prompt = self._prompt_composer.compose_skill_prompt(
+        return self._prompt_composer.compose_skill_prompt(
             skill_system_prompt=self._skill_def.system_prompt,
             interface=context.interface,
             user_profile=context.user_profile,
+            static_sections=static_sections,
         )
 
-        # Append loaded references (for SKILL.md format with references/ directory)
-        if self._skill_def.references_content:
-            references_text = self._format_references()
-            prompt += f"\n\n{references_text}"
-
-        # Append guardrails if defined
-        if self._skill_def.guardrails:
-            prompt += f"\n\n<guardrails>\n{self._skill_def.guardrails}\n</guardrails>"
-
-        return prompt
-
     def _format_references(self) -> str:
         """Format loaded references for inclusion in system prompt.
 
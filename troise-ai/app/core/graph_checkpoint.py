@@ -0,0 +1,298 @@
+"""Graph checkpointing for TROISE AI.
+
+Stores per-node snapshots of graph execution keyed by request_id so that a
+request requeued by the visibility monitor resumes from the last successful
+node instead of re-running every node (and its research/tool calls) from
+the entry point.
+
+Checkpoints live in memory (bounded, TTL-expired). When spill is enabled
+they are also written to troise_main TMP items so they survive the worker
+that created them; spill is best-effort and never fails a graph.
+"""
+import json
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List, Optional, TYPE_CHECKING
+
+from .interfaces.graph import GraphState, NodeResult
+
+if TYPE_CHECKING:
+    from ..adapters.dynamodb.main_adapter import TroiseMainAdapter
+    from .config import QueueConfig
+
+logger = logging.getLogger(__name__)
+
+# TMP item key prefix in troise_main (SK = TMP#graph_ckpt#{request_id})
+SPILL_KEY_PREFIX = "graph_ckpt#"
+
+
+@dataclass
+class GraphCheckpoint:
+    """Snapshot of a graph execution after a successful node.
+
+    Captures everything GraphExecutor needs to continue the traversal:
+    accumulated state, node results so far, the next node to run and the
+    loop-detection counters.
+    """
+    request_id: str
+    graph_name: str
+    next_node: str
+    state: Dict[str, Any]
+    node_results: List[NodeResult]
+    visited_counts: Dict[str, int] = field(default_factory=dict)
+    loop_count: int = 0
+    collected_sources: List[Dict[str, str]] = field(default_factory=list)
+    tool_call_counts: Dict[str, int] = field(default_factory=dict)
+    created_at: float = field(default_factory=time.time)
+
+    @property
+    def completed_nodes(self) -> List[str]:
+        """Names of nodes whose results are captured in this checkpoint."""
+        return [r.node_name for r in self.node_results]
+
+    def restore_state(self) -> GraphState:
+        """Rebuild a GraphState from the snapshot."""
+        return GraphState(_data=dict(self.state))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Export checkpoint as a JSON-serializable dictionary."""
+        data = asdict(self)
+        data["node_results"] = [asdict(r) for r in self.node_results]
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "GraphCheckpoint":
+        """Create a GraphCheckpoint from a dictionary (e.g., spilled item)."""
+        return cls(
+            request_id=data["request_id"],
+            graph_name=data["graph_name"],
+            next_node=data["next_node"],
+            state=data.get("state", {}),
+            node_results=[NodeResult(**r) for r in data.get("node_results", [])],
+            visited_counts=data.get("visited_counts", {}),
+            loop_count=data.get("loop_count", 0),
+            collected_sources=data.get("collected_sources", []),
+            tool_call_counts=data.get("tool_call_counts", {}),
+            created_at=data.get("created_at", time.time()),
+        )
+
+
+class GraphCheckpointStore:
+    """Bounded in-memory checkpoint store with optional DynamoDB spill.
+
+    One checkpoint is kept per request_id (each save replaces the previous
+    one). Save/load timings are tracked so checkpoint overhead can be
+    compared against node execution time.
+
+    Example:
+        store = GraphCheckpointStore(ttl_seconds=3600)
+        await store.save(checkpoint)
+        checkpoint = await store.load(request_id, graph_name="research")
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: int = 3600,
+        max_entries: int = 256,
+        main_adapter: Optional["TroiseMainAdapter"] = None,
+    ):
+        """Initialize the store.
+
+        Args:
+            ttl_seconds: Seconds before an untouched checkpoint is discarded.
+            max_entries: Maximum in-memory checkpoints (oldest evicted first).
+            main_adapter: Optional troise_main adapter for spill (None disables).
+        """
+        self._ttl = ttl_seconds
+        self._max_entries = max_entries
+        self._adapter = main_adapter
+        self._checkpoints: "OrderedDict[str, GraphCheckpoint]" = OrderedDict()
+        # Session for each spilled checkpoint (TMP items are session-scoped)
+        self._spill_sessions: Dict[str, str] = {}
+
+        # Overhead metrics
+        self._saves = 0
+        self._save_ms = 0.0
+        self._loads = 0
+        self._load_ms = 0.0
+        self._resumes = 0
+        self._nodes_skipped = 0
+        self._spill_errors = 0
+
+    @property
+    def spill_enabled(self) -> bool:
+        """True if checkpoints are also persisted to troise_main."""
+        return self._adapter is not None
+
+    def __len__(self) -> int:
+        return len(self._checkpoints)
+
+    def _is_expired(self, checkpoint: GraphCheckpoint) -> bool:
+        return time.time() - checkpoint.created_at > self._ttl
+
+    def _evict(self) -> None:
+        """Drop expired checkpoints and enforce the size bound."""
+        expired = [k for k, c in self._checkpoints.items() if self._is_expired(c)]
+        for request_id in expired:
+            del self._checkpoints[request_id]
+        while len(self._checkpoints) > self._max_entries:
+            self._checkpoints.popitem(last=False)
+
+    async def save(
+        self,
+        checkpoint: GraphCheckpoint,
+        session_id: Optional[str] = None,
+    ) -> None:
+        """Save (replace) the checkpoint for a request.
+
+        Args:
+            checkpoint: Snapshot to store.
+            session_id: Session for the spilled TMP item (spill skipped if None).
+        """
+        start = time.perf_counter()
+
+        self._checkpoints[checkpoint.request_id] = checkpoint
+        self._checkpoints.move_to_end(checkpoint.request_id)
+        self._evict()
+
+        if self._adapter and session_id:
+            try:
+                await self._adapter.put_temp(
+                    session_id,
+                    f"{SPILL_KEY_PREFIX}{checkpoint.request_id}",
+                    json.dumps(checkpoint.to_dict(), default=str),
+                    ttl_seconds=self._ttl,
+                )
+                self._spill_sessions[checkpoint.request_id] = session_id
+            except Exception as e:
+                self._spill_errors += 1
+                logger.warning(
+                    f"Checkpoint spill failed for {checkpoint.request_id}: {e}"
+                )
+
+        self._saves += 1
+        self._save_ms += (time.perf_counter() - start) * 1000
+
+    async def load(
+        self,
+        request_id: str,
+        graph_name: Optional[str] = None,
+        session_id: Optional[str] = None,
+    ) -> Optional[GraphCheckpoint]:
+        """Load the checkpoint for a request.
+
+        Falls back to the spilled TMP item on a memory miss when spill is
+        enabled and a session_id is given.
+
+        Args:
+            request_id: Request identifier.
+            graph_name: If given, ignore checkpoints from a different graph.
+            session_id: Session for the spilled TMP item.
+
+        Returns:
+            GraphCheckpoint or None if missing, expired, or for another graph.
+        """
+        start = time.perf_counter()
+        try:
+            checkpoint = self._checkpoints.get(request_id)
+            if checkpoint is None and self._adapter and session_id:
+                checkpoint = await self._load_spilled(request_id, session_id)
+
+            if checkpoint is None:
+                return None
+            if self._is_expired(checkpoint):
+                self._checkpoints.pop(request_id, None)
+                return None
+            if graph_name and checkpoint.graph_name != graph_name:
+                logger.warning(
+                    f"Ignoring checkpoint for {request_id}: graph "
+                    f"'{checkpoint.graph_name}' != '{graph_name}'"
+                )
+                return None
+            return checkpoint
+        finally:
+            self._loads += 1
+            self._load_ms += (time.perf_counter() - start) * 1000
+
+    async def _load_spilled(
+        self,
+        request_id: str,
+        session_id: str,
+    ) -> Optional[GraphCheckpoint]:
+        """Read a spilled checkpoint from troise_main."""
+        try:
+            raw = await self._adapter.get_temp(
+                session_id, f"{SPILL_KEY_PREFIX}{request_id}"
+            )
+            if not raw:
+                return None
+            return GraphCheckpoint.from_dict(json.loads(raw))
+        except Exception as e:
+            self._spill_errors += 1
+            logger.warning(f"Checkpoint spill read failed for {request_id}: {e}")
+            return None
+
+    async def discard(self, request_id: str) -> None:
+        """Remove the checkpoint for a finished request.
+
+        Args:
+            request_id: Request identifier.
+        """
+        self._checkpoints.pop(request_id, None)
+        session_id = self._spill_sessions.pop(request_id, None)
+        if self._adapter and session_id:
+            try:
+                await self._adapter.delete_temp(
+                    session_id, f"{SPILL_KEY_PREFIX}{request_id}"
+                )
+            except Exception as e:
+                self._spill_errors += 1
+                logger.warning(f"Checkpoint spill delete failed for {request_id}: {e}")
+
+    def record_resume(self, nodes_skipped: int) -> None:
+        """Record that a retry resumed from a checkpoint.
+
+        Args:
+            nodes_skipped: Number of completed nodes that were not re-run.
+        """
+        self._resumes += 1
+        self._nodes_skipped += nodes_skipped
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get checkpoint overhead and resume statistics."""
+        return {
+            "entries": len(self._checkpoints),
+            "saves": self._saves,
+            "save_ms_total": round(self._save_ms, 3),
+            "save_ms_avg": round(self._save_ms / self._saves, 3) if self._saves else 0.0,
+            "loads": self._loads,
+            "load_ms_total": round(self._load_ms, 3),
+            "resumes": self._resumes,
+            "nodes_skipped": self._nodes_skipped,
+            "spill_enabled": self.spill_enabled,
+            "spill_errors": self._spill_errors,
+        }
+
+
+def create_checkpoint_store(
+    config: "QueueConfig",
+    main_adapter: Optional["TroiseMainAdapter"] = None,
+) -> Optional[GraphCheckpointStore]:
+    """Create a GraphCheckpointStore from queue configuration.
+
+    Args:
+        config: Queue configuration with checkpoint settings.
+        main_adapter: troise_main adapter, used only if spill is enabled.
+
+    Returns:
+        GraphCheckpointStore, or None if checkpointing is disabled.
+    """
+    if not config.checkpoint_enabled:
+        return None
+    return GraphCheckpointStore(
+        ttl_seconds=config.checkpoint_ttl_seconds,
+        max_entries=config.checkpoint_max_entries,
+        main_adapter=main_adapter if config.checkpoint_spill else None,
+    )
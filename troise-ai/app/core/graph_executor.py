@@ -1,8 +1,13 @@
 """Graph executor for TROISE AI.
 
 Orchestrates sequential execution of graph nodes with streaming support
-and loop detection. Implements the IGraphExecutor protocol.
+and loop detection. Implements the IGraphExecutor protocol. Parallel
+fan-out/fan-in happens inside ParallelNode, which uses the
+BranchStreamMultiplexer defined here to share one user-facing stream.
+With a GraphCheckpointStore, progress is checkpointed after every
+successful node so a retried request resumes instead of restarting.
 """
+import asyncio
 import logging
 from typing import Any, Dict, List, Optional, TYPE_CHECKING
 
@@ -13,6 +18,7 @@ from .interfaces.graph import (
     IGraph,
     END,
 )
+from .graph_checkpoint import GraphCheckpoint, GraphCheckpointStore
 
 if TYPE_CHECKING:
     from .context import ExecutionContext
@@ -192,17 +198,197 @@ class SwarmStreamHandler:
         logger.debug(f"Swarm {self._swarm_name}: Agent '{agent_name}' completed")
 
 
+class BranchStreamHandler:
+    """Per-branch stream handler handed to one parallel graph branch.
+
+    Implements the subset of AgentStreamHandler used by agents
+    (stream_event/finalize) and delegates ordering to the multiplexer.
+    """
+
+    def __init__(self, multiplexer: "BranchStreamMultiplexer", branch_name: str):
+        """Initialize branch stream handler.
+
+        Args:
+            multiplexer: Owning multiplexer.
+            branch_name: Name of the branch this handler streams for.
+        """
+        self._multiplexer = multiplexer
+        self._branch_name = branch_name
+
+    async def stream_event(self, event: Dict[str, Any]) -> None:
+        """Forward event to the multiplexer tagged with this branch.
+
+        Args:
+            event: Event from agent streaming.
+        """
+        await self._multiplexer.publish(self._branch_name, event)
+
+    async def finalize(self) -> None:
+        """Mark this branch's stream complete (base stream stays open)."""
+        await self._multiplexer.complete(self._branch_name)
+
+
+class BranchStreamMultiplexer:
+    """Multiplexes events from concurrently running graph branches.
+
+    Branches run in parallel but share one user-facing stream, so text
+    must not interleave. Events are tagged with "_graph_branch". The
+    earliest unfinished branch (in declared order) owns the stream and
+    forwards live; later branches buffer until every branch ahead of
+    them completes, then their buffered events are replayed. Tool
+    events (contentBlockStart) are forwarded immediately so the client
+    sees activity from all branches.
+
+    Events emitted:
+    - graph_branch_start / graph_branch_end: Branch lifecycle
+    - Standard stream events from agents (with branch context added)
+    """
+
+    def __init__(
+        self,
+        base_handler: Optional["AgentStreamHandler"],
+        node_name: str,
+        branch_names: List[str],
+        separator: str = "\n\n",
+    ):
+        """Initialize branch stream multiplexer.
+
+        Args:
+            base_handler: Underlying stream handler (may be None).
+            node_name: Name of the parallel node.
+            branch_names: Streaming branches in output order.
+            separator: Text emitted between consecutive branch outputs.
+        """
+        self._base = base_handler
+        self._node_name = node_name
+        self._order = list(branch_names)
+        self._separator = separator
+        self._head = 0
+        self._buffers: Dict[str, List[Dict[str, Any]]] = {name: [] for name in self._order}
+        self._done: Dict[str, bool] = {name: False for name in self._order}
+        self._emitted_text = False
+        self._lock = asyncio.Lock()
+
+    def handler_for(self, branch_name: str) -> BranchStreamHandler:
+        """Create the stream handler for a branch.
+
+        Args:
+            branch_name: Branch name (must be in branch_names).
+
+        Returns:
+            BranchStreamHandler bound to this multiplexer.
+        """
+        return BranchStreamHandler(self, branch_name)
+
+    def _is_head(self, branch_name: str) -> bool:
+        return self._head < len(self._order) and self._order[self._head] == branch_name
+
+    async def _forward(self, event: Dict[str, Any]) -> None:
+        if not self._base:
+            return
+        if "contentBlockDelta" in event:
+            text = event["contentBlockDelta"].get("delta", {}).get("text")
+            if text:
+                self._emitted_text = True
+        await self._base.stream_event(event)
+
+    async def start_branch(self, branch_name: str) -> None:
+        """Emit branch start event.
+
+        Args:
+            branch_name: Name of the branch starting execution.
+        """
+        if self._base:
+            await self._base.stream_event({
+                "type": "graph_branch_start",
+                "node": self._node_name,
+                "branch": branch_name,
+            })
+
+    async def end_branch(self, branch_name: str, result: NodeResult) -> None:
+        """Emit branch end event.
+
+        Args:
+            branch_name: Name of the completed branch.
+            result: Result from branch execution.
+        """
+        if self._base:
+            await self._base.stream_event({
+                "type": "graph_branch_end",
+                "node": self._node_name,
+                "branch": branch_name,
+                "success": result.success,
+            })
+
+    async def publish(self, branch_name: str, event: Dict[str, Any]) -> None:
+        """Route an event from a branch to the base handler or its buffer.
+
+        Args:
+            branch_name: Branch that produced the event.
+            event: Event from agent streaming.
+        """
+        event["_graph_branch"] = branch_name
+        async with self._lock:
+            if branch_name not in self._buffers or self._is_head(branch_name):
+                await self._forward(event)
+            elif "contentBlockDelta" in event:
+                self._buffers[branch_name].append(event)
+            else:
+                await self._forward(event)
+
+    async def complete(self, branch_name: str) -> None:
+        """Mark a branch complete and hand the stream to the next branch.
+
+        Idempotent; safe to call for branches that failed or never streamed.
+
+        Args:
+            branch_name: Name of the completed branch.
+        """
+        async with self._lock:
+            if branch_name not in self._done or self._done[branch_name]:
+                return
+            self._done[branch_name] = True
+            await self._advance()
+
+    async def _advance(self) -> None:
+        """Move the head past completed branches, replaying buffered events."""
+        while self._head < len(self._order) and self._done[self._order[self._head]]:
+            self._head += 1
+            if self._head >= len(self._order):
+                break
+            next_branch = self._order[self._head]
+            buffered = self._buffers[next_branch]
+            self._buffers[next_branch] = []
+            if buffered and self._emitted_text and self._separator:
+                await self._forward({
+                    "contentBlockDelta": {"delta": {"text": self._separator}},
+                    "_graph_branch": next_branch,
+                })
+            for event in buffered:
+                await self._forward(event)
+
+    async def finish(self) -> None:
+        """Flush all branches and finalize the base stream once."""
+        for name in self._order:
+            await self.complete(name)
+        if self._base:
+            await self._base.finalize()
+
+
 class GraphExecutor:
     """Executes graph nodes sequentially with streaming support.
 
-    Sequential execution ensures thread safety with shared ExecutionContext.
-    Parallel node execution is deferred to v2 (requires context isolation).
+    Top-level nodes execute sequentially with a shared ExecutionContext.
+    Independent steps can be expressed as a ParallelNode (type: parallel in
+    YAML), which runs its branches concurrently on isolated child contexts
+    and joins them into a single NodeResult.
 
     Features:
     - Loop detection and termination (max_loops)
     - Cancellation support via context.check_cancelled()
     - Node transition streaming to WebSocket
     - State propagation between nodes
+    - Per-node checkpoints keyed by context.request_id (resume on retry)
 
     Example:
         executor = GraphExecutor()
@@ -213,6 +399,20 @@ class GraphExecutor:
         )
     """
 
+    def __init__(self, checkpoint_store: Optional[GraphCheckpointStore] = None):
+        """Initialize the graph executor.
+
+        Args:
+            checkpoint_store: Optional store for per-node checkpoints. When set,
+                requests with a request_id resume from their last checkpoint.
+        """
+        self._checkpoints = checkpoint_store
+
+    @property
+    def checkpoint_store(self) -> Optional[GraphCheckpointStore]:
+        """Get the checkpoint store (None if checkpointing is disabled)."""
+        return self._checkpoints
+
     async def execute(
         self,
         graph: IGraph,
@@ -255,6 +455,27 @@ class GraphExecutor:
         loop_count = 0
         visited_counts: Dict[str, int] = {}
 
+        # Resume from checkpoint if this request was retried mid-graph
+        request_id = getattr(context, "request_id", None)
+        session_id = getattr(context, "session_id", None)
+        checkpointing = self._checkpoints is not None and bool(request_id)
+        if checkpointing:
+            checkpoint = await self._checkpoints.load(
+                request_id, graph_name=graph.name, session_id=session_id
+            )
+            if checkpoint:
+                state = checkpoint.restore_state()
+                results = list(checkpoint.node_results)
+                current_node = checkpoint.next_node
+                visited_counts = dict(checkpoint.visited_counts)
+                loop_count = checkpoint.loop_count
+                self._restore_context(context, checkpoint)
+                self._checkpoints.record_resume(len(results))
+                logger.info(
+                    f"Resuming graph '{graph.name}' for {request_id} at node "
+                    f"'{current_node}' (skipping {checkpoint.completed_nodes})"
+                )
+
         logger.info(
             f"Starting graph '{graph.name}' at node '{current_node}' "
             f"(domain={graph.domain})"
@@ -356,6 +577,13 @@ class GraphExecutor:
 
             loop_count += 1
 
+            # Checkpoint progress so a retry resumes at current_node
+            if checkpointing and current_node != END:
+                await self._save_checkpoint(
+                    request_id, session_id, graph.name, current_node,
+                    state, results, visited_counts, loop_count, context,
+                )
+
         # Finalize streaming
         await graph_stream.finalize()
 
@@ -375,14 +603,67 @@ class GraphExecutor:
             f"{len(results)} nodes executed, success={graph_result.success}"
         )
 
+        # Failed graphs keep their checkpoint (TTL-bound) for a later retry
+        if checkpointing and graph_result.success:
+            await self._checkpoints.discard(request_id)
+
         return graph_result
 
+    async def _save_checkpoint(
+        self,
+        request_id: str,
+        session_id: Optional[str],
+        graph_name: str,
+        next_node: str,
+        state: GraphState,
+        results: List[NodeResult],
+        visited_counts: Dict[str, int],
+        loop_count: int,
+        context: "ExecutionContext",
+    ) -> None:
+        """Snapshot progress after a successful node."""
+        await self._checkpoints.save(
+            GraphCheckpoint(
+                request_id=request_id,
+                graph_name=graph_name,
+                next_node=next_node,
+                state=state.to_dict(),
+                node_results=list(results),
+                visited_counts=dict(visited_counts),
+                loop_count=loop_count,
+                collected_sources=list(getattr(context, "collected_sources", None) or []),
+                tool_call_counts=dict(getattr(context, "tool_call_counts", None) or {}),
+            ),
+            session_id=session_id,
+        )
+
+    @staticmethod
+    def _restore_context(context: "ExecutionContext", checkpoint: GraphCheckpoint) -> None:
+        """Carry sources and tool-call budgets over from the checkpoint.
+
+        Keeps citations from skipped nodes and prevents a retry from getting
+        a fresh tool-call budget.
+        """
+        if checkpoint.collected_sources and hasattr(context, "collected_sources"):
+            if not context.collected_sources:
+                context.collected_sources = list(checkpoint.collected_sources)
+        if checkpoint.tool_call_counts and hasattr(context, "tool_call_counts"):
+            for tool_name, count in checkpoint.tool_call_counts.items():
+                context.tool_call_counts[tool_name] = max(
+                    context.tool_call_counts.get(tool_name, 0), count
+                )
+
 
 # Factory function for dependency injection
-def create_graph_executor() -> GraphExecutor:
+def create_graph_executor(
+    checkpoint_store: Optional[GraphCheckpointStore] = None,
+) -> GraphExecutor:
     """Create a GraphExecutor instance.
 
+    Args:
+        checkpoint_store: Optional store enabling resume-on-retry.
+
     Returns:
         New GraphExecutor instance.
     """
-    return GraphExecutor()
+    return GraphExecutor(checkpoint_store=checkpoint_store)
@@ -3,9 +3,10 @@
 Adapts agents and other components to the IGraphNode interface
 for use in graph-based workflows (Dependency Inversion Principle).
 """
+import asyncio
 import logging
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, TYPE_CHECKING
+from typing import Any, Callable, Dict, List, Optional, TYPE_CHECKING
 
 from .interfaces.graph import GraphState, NodeResult, IGraphNode
 
@@ -792,3 +793,237 @@ class ResearchSwarmNode(SwarmNode):
         updates["facts_verified"] = not has_unverified
 
         return updates
+
+
+# =============================================================================
+# Parallel Node Adapter (fan-out / fan-in)
+# =============================================================================
+
+
+def _merge_concat(results: List[NodeResult]) -> str:
+    """Join branch outputs in declared order."""
+    return "\n\n".join(r.content for r in results if r.content)
+
+
+def _merge_first(results: List[NodeResult]) -> str:
+    """Use the first branch's output."""
+    return results[0].content if results else ""
+
+
+def _merge_last(results: List[NodeResult]) -> str:
+    """Use the last branch's output."""
+    return results[-1].content if results else ""
+
+
+def _merge_sections(results: List[NodeResult]) -> str:
+    """Join branch outputs under per-branch headings."""
+    return "\n\n".join(f"## {r.node_name}\n\n{r.content}" for r in results if r.content)
+
+
+# Merge strategies for ParallelNode join (OCP extension point)
+MERGE_STRATEGIES: Dict[str, Callable[[List[NodeResult]], str]] = {
+    "concat": _merge_concat,
+    "first": _merge_first,
+    "last": _merge_last,
+    "sections": _merge_sections,
+}
+
+
+class ParallelNode:
+    """Runs independent branch nodes concurrently and joins their results.
+
+    Fan-out: every branch receives the same input and a read-only view of
+    the graph state, and runs on an isolated child context (see
+    ExecutionContext.for_parallel_branch) under a concurrency cap.
+    Fan-in: branch state updates are applied in declared order and the
+    branch outputs are combined by a named merge strategy.
+
+    Streaming branches share the user-facing stream through a
+    BranchStreamMultiplexer so their text never interleaves.
+
+    Example:
+        node = ParallelNode(
+            branches=[fact_checker_node, citation_node],
+            name="verify",
+            merge="concat",
+            max_concurrency=2,
+        )
+        result = await node.execute(state, context, input_text="...")
+    """
+
+    def __init__(
+        self,
+        branches: List[IGraphNode],
+        name: str,
+        merge: str = "concat",
+        max_concurrency: Optional[int] = None,
+        require_all: bool = True,
+        state_key: Optional[str] = None,
+        streaming: bool = True,
+    ):
+        """Initialize parallel node.
+
+        Args:
+            branches: Branch nodes in output order.
+            name: Unique node identifier.
+            merge: Merge strategy name (key of MERGE_STRATEGIES).
+            max_concurrency: Max branches running at once (default: all).
+            require_all: Fail the node if any branch fails (default: True).
+                If False, succeeds when at least one branch succeeds and
+                merges only successful branches.
+            state_key: Optional key for storing output in state.
+            streaming: Whether branch output streams to the user (default: True).
+
+        Raises:
+            ValueError: If branches is empty or merge strategy is unknown.
+        """
+        if not branches:
+            raise ValueError(f"Parallel node '{name}' requires at least one branch")
+        if merge not in MERGE_STRATEGIES:
+            raise ValueError(
+                f"Unknown merge strategy '{merge}' for parallel node '{name}'. "
+                f"Available: {sorted(MERGE_STRATEGIES)}"
+            )
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be >= 1 for parallel node '{name}'")
+
+        self._branches = branches
+        self._merge = merge
+        self._max_concurrency = max_concurrency or len(branches)
+        self._require_all = require_all
+        self._streaming = streaming
+        self.name = name
+        self._state_key = state_key or name
+
+    @property
+    def streaming(self) -> bool:
+        """Whether this node streams output to user."""
+        return self._streaming
+
+    @property
+    def tools(self) -> List[str]:
+        """Get union of tool names from all branches."""
+        names: List[str] = []
+        for branch in self._branches:
+            for tool in getattr(branch, "tools", []):
+                if tool not in names:
+                    names.append(tool)
+        return names
+
+    @property
+    def branches(self) -> List[IGraphNode]:
+        """Branch nodes in output order."""
+        return list(self._branches)
+
+    async def execute(
+        self,
+        state: GraphState,
+        context: "ExecutionContext",
+        input_text: Optional[str] = None,
+        tool_factory: Optional["ToolFactory"] = None,
+        stream_handler: Optional["AgentStreamHandler"] = None,
+    ) -> NodeResult:
+        """Execute all branches concurrently and merge their results.
+
+        Args:
+            state: Current graph state (read-only for branches).
+            context: Execution context (branches get isolated copies).
+            input_text: Input text passed to every branch.
+            tool_factory: Factory for creating per-branch tools.
+            stream_handler: Optional handler for WebSocket streaming.
+
+        Returns:
+            NodeResult with merged content and combined state updates.
+        """
+        from .graph_executor import BranchStreamMultiplexer
+
+        streaming_names = [
+            b.name for b in self._branches if getattr(b, "streaming", True)
+        ]
+        multiplexer = None
+        if stream_handler is not None and streaming_names:
+            multiplexer = BranchStreamMultiplexer(stream_handler, self.name, streaming_names)
+
+        semaphore = asyncio.Semaphore(self._max_concurrency)
+        branch_contexts = [context.for_parallel_branch() for _ in self._branches]
+
+        async def run_branch(branch: IGraphNode, branch_context: "ExecutionContext") -> NodeResult:
+            branch_stream = None
+            if multiplexer and branch.name in streaming_names:
+                branch_stream = multiplexer.handler_for(branch.name)
+
+            async with semaphore:
+                await context.check_cancelled()
+                if multiplexer:
+                    await multiplexer.start_branch(branch.name)
+                try:
+                    result = await branch.execute(
+                        state=state,
+                        context=branch_context,
+                        input_text=input_text,
+                        tool_factory=tool_factory,
+                        stream_handler=branch_stream,
+                    )
+                except Exception as e:
+                    logger.error(f"ParallelNode '{self.name}' branch '{branch.name}' failed: {e}")
+                    result = NodeResult(
+                        node_name=branch.name,
+                        content=f"Error: {str(e)}",
+                        success=False,
+                        error=str(e),
+                    )
+                finally:
+                    if multiplexer:
+                        await multiplexer.complete(branch.name)
+
+            if multiplexer:
+                await multiplexer.end_branch(branch.name, result)
+            return result
+
+        logger.info(
+            f"ParallelNode '{self.name}' fanning out {len(self._branches)} branches "
+            f"(max_concurrency={self._max_concurrency}, merge={self._merge})"
+        )
+
+        try:
+            results: List[NodeResult] = list(await asyncio.gather(*(
+                run_branch(branch, branch_context)
+                for branch, branch_context in zip(self._branches, branch_contexts)
+            )))
+        finally:
+            if multiplexer:
+                await multiplexer.finish()
+
+        succeeded = [r for r in results if r.success]
+        failed = [r for r in results if not r.success]
+        success = not failed if self._require_all else bool(succeeded)
+
+        merged = MERGE_STRATEGIES[self._merge](succeeded)
+
+        state_updates: Dict[str, Any] = {}
+        for result in results:
+            state_updates.update(result.state_updates)
+        state_updates[f"{self._state_key}_output"] = merged
+        state_updates[f"{self._state_key}_branches"] = {r.node_name: r.content for r in results}
+
+        tool_calls: List[Dict[str, Any]] = []
+        for result in results:
+            tool_calls.extend(result.tool_calls)
+
+        error = None
+        if failed:
+            error = "; ".join(f"{r.node_name}: {r.error or 'failed'}" for r in failed)
+
+        logger.info(
+            f"ParallelNode '{self.name}' joined {len(succeeded)}/{len(results)} "
+            f"successful branches (success={success})"
+        )
+
+        return NodeResult(
+            node_name=self.name,
+            content=merged if success else f"Error: {error}",
+            success=success,
+            state_updates=state_updates,
+            tool_calls=tool_calls,
+            error=None if success else error,
+        )
@@ -161,6 +161,17 @@ class IVRAMOrchestrator(Protocol):
         """
         ...
 
+    async def prefetch(self, model_id: str) -> bool:
+        """Speculatively load a model if it fits without eviction.
+
+        Args:
+            model_id: The model identifier to load.
+
+        Returns:
+            True if the model is loaded or loading, False if skipped or failed.
+        """
+        ...
+
     def is_loaded(self, model_id: str) -> bool:
         """Check if a model is currently loaded.
 
@@ -1,5 +1,6 @@
 """File storage interface for dependency inversion."""
-from typing import Protocol, Optional
+from pathlib import Path
+from typing import AsyncIterator, Protocol, Optional, Union
 
 
 class IFileStorage(Protocol):
@@ -41,6 +42,26 @@ class IFileStorage(Protocol):
         """
         ...
 
+    async def upload_file(
+        self,
+        file_id: str,
+        path: Union[str, Path],
+        mimetype: str,
+        session_id: str,
+    ) -> str:
+        """Upload a file from disk, streaming it.
+
+        Args:
+            file_id: Unique identifier for the file.
+            path: Local file to upload.
+            mimetype: MIME type of the file.
+            session_id: Session identifier for namespacing.
+
+        Returns:
+            Storage key/path where file was stored.
+        """
+        ...
+
     async def download(self, file_id: str) -> bytes:
         """Download file from storage.
 
@@ -55,6 +76,48 @@ class IFileStorage(Protocol):
         """
         ...
 
+    def stream(self, file_id: str, chunk_size: int = ...) -> AsyncIterator[bytes]:
+        """Stream file contents in chunks.
+
+        Args:
+            file_id: File identifier to download.
+            chunk_size: Bytes per chunk.
+
+        Raises:
+            FileNotFoundError: If file does not exist.
+        """
+        ...
+
+    async def download_to_file(self, file_id: str, path: Union[str, Path]) -> str:
+        """Stream a file to disk.
+
+        Args:
+            file_id: File identifier to download.
+            path: Local destination.
+
+        Returns:
+            SHA-256 hex digest of the downloaded bytes.
+
+        Raises:
+            FileNotFoundError: If file does not exist.
+        """
+        ...
+
+    async def get_presigned_url(self, file_id: str, expires_in: Optional[int] = None) -> str:
+        """Create a time-limited direct download URL.
+
+        Args:
+            file_id: File identifier.
+            expires_in: URL lifetime in seconds (backend default if None).
+
+        Returns:
+            URL clients can GET without credentials.
+
+        Raises:
+            FileNotFoundError: If file does not exist.
+        """
+        ...
+
     async def delete(self, file_id: str) -> bool:
         """Delete file from storage.
 
@@ -0,0 +1,48 @@
+"""Concurrency slot hook for Strands models.
+
+Lets the backend layer gate every generation (each Agent turn, sub-agent
+and graph branch) behind a per-backend/per-model concurrency slot without
+callers having to know about it. The slot is held for one model.stream()
+call only - never across tool execution - so nested sub-agents cannot
+deadlock on a slot held by their parent.
+"""
+
+from typing import Any, AsyncContextManager, AsyncGenerator, Callable, Optional
+
+from strands.types.streaming import StreamEvent
+
+SlotProvider = Callable[[], AsyncContextManager[Any]]
+
+
+class ConcurrencySlotMixin:
+    """Mixin that wraps stream() in a slot from an optional provider.
+
+    The provider returns an async context manager (e.g.
+    BackendManager.model_slot(model_id)) whose value may expose
+    mark_first_token() for time-to-first-token feedback.
+    """
+
+    _slot_provider: Optional[SlotProvider] = None
+
+    def set_slot_provider(self, provider: Optional[SlotProvider]) -> None:
+        """Set (or clear) the concurrency slot provider.
+
+        Args:
+            provider: Zero-arg callable returning an async context manager.
+        """
+        self._slot_provider = provider
+
+    async def stream(self, *args: Any, **kwargs: Any) -> AsyncGenerator[StreamEvent, None]:
+        """Stream from the backend while holding a concurrency slot."""
+        if self._slot_provider is None:
+            async for event in super().stream(*args, **kwargs):
+                yield event
+            return
+
+        async with self._slot_provider() as lease:
+            mark_first_token = getattr(lease, "mark_first_token", None)
+            async for event in super().stream(*args, **kwargs):
+                if mark_first_token:
+                    mark_first_token()
+                    mark_first_token = None
+                yield event
@@ -14,9 +14,14 @@ from typing import Any
 from strands.models.ollama import OllamaModel
 from strands.types.streaming import StreamEvent
 
+from app.core.models.concurrency import ConcurrencySlotMixin
 
-class ExtendedOllamaModel(OllamaModel):
-    """Ollama model with fixed token count mapping."""
+
+class ExtendedOllamaModel(ConcurrencySlotMixin, OllamaModel):
+    """Ollama model with fixed token count mapping.
+
+    Generations hold a backend concurrency slot when a provider is set.
+    """
 
     def format_chunk(self, event: dict[str, Any]) -> StreamEvent:
         """Override to fix the swapped input/output token counts.
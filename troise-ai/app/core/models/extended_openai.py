@@ -14,9 +14,14 @@ from typing import Any
 from strands.models.openai import OpenAIModel
 from strands.types.streaming import StreamEvent
 
+from app.core.models.concurrency import ConcurrencySlotMixin
 
-class ExtendedOpenAIModel(OpenAIModel):
-    """OpenAI model that extracts completion_tokens_details.reasoning_tokens."""
+
+class ExtendedOpenAIModel(ConcurrencySlotMixin, OpenAIModel):
+    """OpenAI model that extracts completion_tokens_details.reasoning_tokens.
+
+    Generations hold a backend concurrency slot when a provider is set.
+    """
 
     def format_chunk(self, event: dict[str, Any]) -> StreamEvent:
         """Override to include reasoning_tokens in metadata.
@@ -0,0 +1,258 @@
+"""Tool result memoization for TROISE AI.
+
+Caches successful results of pure/cacheable tools so repeated identical
+calls (same tool, same normalized arguments) skip SearXNG, HTTP or
+DynamoDB round-trips. Tools opt in through a "cache" entry in their
+plugin manifest:
+
+    PLUGIN = {
+        "type": "tool",
+        "name": "web_search",
+        "factory": create_web_search_tool,
+        "cache": {"ttl_seconds": 600, "scope": "global"},
+    }
+
+Scopes:
+    - request: Shared only within one request (context.request_id)
+    - session: Shared within a conversation (context.session_id)
+    - global:  Shared across users and sessions
+
+Concurrent identical calls are coalesced: the first caller executes the
+tool, later callers await the same result.
+"""
+import asyncio
+import json
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from .context import ExecutionContext
+from .interfaces.tool import ToolResult
+
+logger = logging.getLogger(__name__)
+
+SCOPE_REQUEST = "request"
+SCOPE_SESSION = "session"
+SCOPE_GLOBAL = "global"
+VALID_SCOPES = (SCOPE_REQUEST, SCOPE_SESSION, SCOPE_GLOBAL)
+
+CacheKey = Tuple[str, str, str]  # (scope_key, tool_name, normalized_args)
+
+
+@dataclass
+class ToolCachePolicy:
+    """Per-tool cache policy from the plugin manifest "cache" entry."""
+    ttl_seconds: float = 300.0
+    scope: str = SCOPE_SESSION
+    invalidated_by: Tuple[str, ...] = ()  # Tools whose success clears this cache
+
+    @classmethod
+    def from_manifest(cls, data: Any) -> Optional["ToolCachePolicy"]:
+        """Create a policy from a manifest "cache" entry.
+
+        Args:
+            data: True for defaults, a dict of settings, or falsy to disable.
+
+        Returns:
+            ToolCachePolicy, or None if the tool is not cacheable.
+        """
+        if not data:
+            return None
+        if data is True:
+            return cls()
+
+        scope = data.get("scope", SCOPE_SESSION)
+        if scope not in VALID_SCOPES:
+            logger.warning(f"Unknown tool cache scope '{scope}', using '{SCOPE_SESSION}'")
+            scope = SCOPE_SESSION
+
+        return cls(
+            ttl_seconds=data.get("ttl_seconds", 300.0),
+            scope=scope,
+            invalidated_by=tuple(data.get("invalidated_by", ())),
+        )
+
+
+def normalize_args(params: Dict[str, Any]) -> str:
+    """Build a canonical string for tool arguments.
+
+    Keys are sorted, None values dropped and string values stripped so that
+    trivially different calls share one cache entry.
+    """
+    def _normalize(value: Any) -> Any:
+        if isinstance(value, dict):
+            return {k: _normalize(v) for k, v in value.items() if v is not None}
+        if isinstance(value, (list, tuple)):
+            return [_normalize(v) for v in value]
+        if isinstance(value, str):
+            return value.strip()
+        return value
+
+    return json.dumps(_normalize(params or {}), sort_keys=True, default=str)
+
+
+class ToolResultCache:
+    """Bounded TTL cache of tool results with in-flight call coalescing.
+
+    Example:
+        cache = ToolResultCache()
+        result, cached = await cache.get_or_call(
+            "web_search", params, context, policy, lambda: tool.execute(params, context)
+        )
+    """
+
+    def __init__(self, max_entries: int = 1024):
+        """Initialize the cache.
+
+        Args:
+            max_entries: Maximum cached results (least recently used evicted).
+        """
+        self._max_entries = max_entries
+        self._entries: "OrderedDict[CacheKey, Tuple[float, ToolResult]]" = OrderedDict()
+        self._in_flight: Dict[CacheKey, asyncio.Future] = {}
+        self._stats: Dict[str, Dict[str, int]] = {}
+
+    def _tool_stats(self, tool_name: str) -> Dict[str, int]:
+        return self._stats.setdefault(
+            tool_name, {"hits": 0, "misses": 0, "coalesced": 0}
+        )
+
+    @staticmethod
+    def _scope_key(policy: ToolCachePolicy, context: ExecutionContext) -> str:
+        if policy.scope == SCOPE_GLOBAL:
+            return SCOPE_GLOBAL
+        if policy.scope == SCOPE_REQUEST:
+            request_id = getattr(context, "request_id", None) or f"ctx{id(context)}"
+            return f"{SCOPE_REQUEST}:{request_id}"
+        return f"{SCOPE_SESSION}:{context.session_id}"
+
+    def make_key(
+        self,
+        tool_name: str,
+        params: Dict[str, Any],
+        context: ExecutionContext,
+        policy: ToolCachePolicy,
+    ) -> CacheKey:
+        """Build the cache key for a tool call."""
+        return (self._scope_key(policy, context), tool_name, normalize_args(params))
+
+    def lookup(self, key: CacheKey) -> Optional[ToolResult]:
+        """Return a fresh cached result (records a hit), or None."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, result = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        self._tool_stats(key[1])["hits"] += 1
+        return result
+
+    def in_flight(self, key: CacheKey) -> Optional[asyncio.Future]:
+        """Return the pending future for an identical running call, if any."""
+        return self._in_flight.get(key)
+
+    async def get_or_call(
+        self,
+        tool_name: str,
+        params: Dict[str, Any],
+        context: ExecutionContext,
+        policy: ToolCachePolicy,
+        call: Callable[[], Awaitable[ToolResult]],
+    ) -> Tuple[ToolResult, bool]:
+        """Return a cached/coalesced result or execute the call.
+
+        Only successful results are stored; failures are returned to every
+        coalesced caller but not cached.
+
+        Args:
+            tool_name: Tool being called.
+            params: Raw tool parameters.
+            context: Execution context (for scope).
+            policy: Cache policy for the tool.
+            call: Zero-arg coroutine factory executing the tool.
+
+        Returns:
+            Tuple of (result, from_cache). from_cache is True for cache hits
+            and coalesced calls, which did not execute the tool.
+        """
+        key = self.make_key(tool_name, params, context, policy)
+
+        cached = self.lookup(key)
+        if cached is not None:
+            return cached, True
+
+        pending = self._in_flight.get(key)
+        if pending is not None:
+            self._tool_stats(tool_name)["coalesced"] += 1
+            try:
+                return await asyncio.shield(pending), True
+            except asyncio.CancelledError:
+                if not pending.cancelled():
+                    raise
+                # The leading call was cancelled, not us - run it ourselves
+                return await self.get_or_call(tool_name, params, context, policy, call)
+
+        self._tool_stats(tool_name)["misses"] += 1
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = future
+        try:
+            result = await call()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Mark retrieved so an un-awaited future doesn't log a warning
+            future.exception()
+            raise
+        else:
+            if result.success:
+                self._store(key, result, policy.ttl_seconds)
+            future.set_result(result)
+            return result, False
+        finally:
+            self._in_flight.pop(key, None)
+
+    def _store(self, key: CacheKey, result: ToolResult, ttl_seconds: float) -> None:
+        self._entries[key] = (time.monotonic() + ttl_seconds, result)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate_tool(self, tool_name: str) -> int:
+        """Drop all cached results for a tool.
+
+        Args:
+            tool_name: Tool whose entries to remove.
+
+        Returns:
+            Number of entries removed.
+        """
+        keys = [k for k in self._entries if k[1] == tool_name]
+        for key in keys:
+            del self._entries[key]
+        return len(keys)
+
+    def clear(self) -> None:
+        """Drop all cached results and statistics."""
+        self._entries.clear()
+        self._stats.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get hit/miss statistics, overall and per tool."""
+        hits = sum(s["hits"] + s["coalesced"] for s in self._stats.values())
+        misses = sum(s["misses"] for s in self._stats.values())
+        total = hits + misses
+        return {
+            "entries": len(self._entries),
+            "in_flight": len(self._in_flight),
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": round(hits / total, 3) if total else 0.0,
+            "tools": {name: dict(s) for name, s in self._stats.items()},
+        }
+
@@ -8,6 +8,8 @@ Each tool in the registry has a factory function that receives:
 - Container: For resolving service dependencies (brain, vault, etc.)
 
 The ToolFactory wraps these into Strands tool format using the @tool decorator.
+Tools whose manifest declares a "cache" policy are memoized through a shared
+ToolResultCache (see tool_cache.py).
 """
 import json
 import logging
@@ -21,6 +23,7 @@ from .container import Container
 from .context import ExecutionContext
 from .registry import PluginRegistry
 from .interfaces.tool import ITool, ToolResult, ICloseable
+from .tool_cache import ToolCachePolicy, ToolResultCache
 
 logger = logging.getLogger(__name__)
 
@@ -40,17 +43,27 @@ class ToolFactory:
         await factory.cleanup()  # Close tool resources
     """
 
-    def __init__(self, registry: PluginRegistry, container: Container):
+    def __init__(
+        self,
+        registry: PluginRegistry,
+        container: Container,
+        result_cache: Optional[ToolResultCache] = None,
+    ):
         """
         Initialize the tool factory.
 
         Args:
             registry: Plugin registry with tool definitions.
             container: DI container for service resolution.
+            result_cache: Optional cache for tools with a manifest "cache"
+                         policy. None disables memoization.
         """
         self._registry = registry
         self._container = container
+        self._result_cache = result_cache
         self._created_tools: List[ITool] = []  # Track for cleanup
+        # tool name -> cacheable tools whose results it invalidates
+        self._invalidates: Dict[str, set] = {}
 
     def create_tools_for_agent(
         self,
@@ -200,8 +213,15 @@ class ToolFactory:
             # Track for cleanup
             self._created_tools.append(tool_instance)
 
+            cache_policy = None
+            if self._result_cache is not None:
+                cache_policy = ToolCachePolicy.from_manifest(plugin.get("cache"))
+                if cache_policy:
+                    for writer in cache_policy.invalidated_by:
+                        self._invalidates.setdefault(writer, set()).add(tool_name)
+
             # Build Strands tool definition
-            return self._to_strands_tool(tool_instance, context)
+            return self._to_strands_tool(tool_instance, context, cache_policy)
 
         except Exception as e:
             tool_name = plugin.get("name", "unknown")
@@ -212,6 +232,7 @@ class ToolFactory:
         self,
         tool: ITool,
         context: ExecutionContext,
+        cache_policy: Optional[ToolCachePolicy] = None,
     ) -> Any:
         """
         Convert ITool to Strands tool using the @tool decorator.
@@ -219,6 +240,7 @@ class ToolFactory:
         Args:
             tool: The tool instance.
             context: Execution context (captured in closure).
+            cache_policy: Memoization policy, or None to always execute.
 
         Returns:
             Strands-compatible tool (decorated function).
@@ -236,37 +258,61 @@ class ToolFactory:
             # Check for cancellation before execution
             await context.check_cancelled()
 
-            # Check tool call limit BEFORE execution
-            can_call, error_msg = context.can_call_tool(tool.name)
-            if not can_call:
-                logger.warning(f"[TOOL] Limit reached for '{tool.name}': {error_msg}")
-                return json.dumps({
-                    "success": False,
-                    "content": "",
-                    "error": error_msg,
-                })
-
             # Extract params from tool_context (Strands injects this)
             kwargs = tool_context.tool_use.get("input", {})
 
+            # Serve memoized results first - cached hits don't count against limits
+            cache = self._result_cache if cache_policy else None
+            cache_key = None
+            if cache is not None:
+                cache_key = cache.make_key(tool.name, kwargs, context, cache_policy)
+                cached = cache.lookup(cache_key)
+                if cached is not None:
+                    logger.info(f"[TOOL] Cache hit '{tool.name}' ({cache_policy.scope})")
+                    return json.dumps({
+                        "success": cached.success,
+                        "content": cached.content,
+                        "error": cached.error,
+                    })
+
+            # Check tool call limit BEFORE execution (coalesced calls don't execute)
+            if cache_key is None or cache.in_flight(cache_key) is None:
+                can_call, error_msg = context.can_call_tool(tool.name)
+                if not can_call:
+                    logger.warning(f"[TOOL] Limit reached for '{tool.name}': {error_msg}")
+                    return json.dumps({
+                        "success": False,
+                        "content": "",
+                        "error": error_msg,
+                    })
+
             # Log invocation with truncated params
             params_str = json.dumps(kwargs, default=str)
             logger.info(f"[TOOL] Invoking '{tool.name}' | params={truncate(params_str, 200)}")
             start_time = time.time()
 
             try:
-                result = await tool.execute(kwargs, context)
+                from_cache = False
+                if cache is not None:
+                    result, from_cache = await cache.get_or_call(
+                        tool.name, kwargs, context, cache_policy,
+                        lambda: tool.execute(kwargs, context),
+                    )
+                else:
+                    result = await tool.execute(kwargs, context)
                 duration_ms = (time.time() - start_time) * 1000
 
-                # Record ONLY successful tool calls (for limit tracking)
-                if result.success:
+                # Record ONLY successful, executed tool calls (for limit tracking)
+                if result.success and not from_cache:
                     context.record_successful_tool_call(tool.name)
+                    self._invalidate_cached_results(tool.name)
 
                 # Log result with truncation
                 result_preview = truncate(result.content, 300) if result.content else "(empty)"
                 logger.info(
                     f"[TOOL] Completed '{tool.name}' | "
                     f"success={result.success} | "
+                    f"cached={from_cache} | "
                     f"duration={duration_ms:.0f}ms | "
                     f"result={result_preview}"
                 )
@@ -301,6 +347,30 @@ class ToolFactory:
             context=True,
         )(handler)
 
+    def _invalidate_cached_results(self, tool_name: str) -> None:
+        """Drop cached results of tools invalidated by a successful call.
+
+        Args:
+            tool_name: Tool that just succeeded (e.g., write_file).
+        """
+        if self._result_cache is None:
+            return
+        for cached_tool in self._invalidates.get(tool_name, ()):
+            removed = self._result_cache.invalidate_tool(cached_tool)
+            if removed:
+                logger.debug(f"[TOOL] '{tool_name}' invalidated {removed} '{cached_tool}' results")
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """
+        Get tool result cache hit/miss statistics.
+
+        Returns:
+            Cache stats, or {"enabled": False} if memoization is disabled.
+        """
+        if self._result_cache is None:
+            return {"enabled": False}
+        return {"enabled": True, **self._result_cache.get_stats()}
+
     def list_available_tools(self) -> List[str]:
         """
         List all available tools in the registry.
@@ -21,6 +21,19 @@ Example YAML:
         - to: coder
       coder:
         - to: END
+
+Parallel fan-out/fan-in (branches run concurrently, then join):
+    nodes:
+      verify:
+        type: parallel
+        merge: concat          # concat | first | last | sections
+        max_concurrency: 2     # optional, default: all branches
+        require_all: true      # optional, fail node if any branch fails
+        branches:
+          fact_checker:
+            agent: fact_checker
+          citation_formatter:
+            agent: citation_formatter
 """
 import logging
 from pathlib import Path
@@ -41,6 +54,7 @@ from app.core.graph_nodes import (
     SwarmAgentConfig,
     QualitySwarmNode,
     ResearchSwarmNode,
+    ParallelNode,
 )
 
 if TYPE_CHECKING:
@@ -158,7 +172,7 @@ class GraphLoader:
     ) -> Dict[str, AgentNode]:
         """Build node instances from definitions.
 
-        Extended to support both agent nodes and swarm nodes (OCP).
+        Extended to support agent, swarm and parallel nodes (OCP).
         Dispatches based on the 'type' field in node definition.
 
         Args:
@@ -171,18 +185,91 @@ class GraphLoader:
         nodes = {}
 
         for node_name, node_def in node_defs.items():
-            node_type = node_def.get("type", "agent")
+            nodes[node_name] = self._build_node(node_name, node_def, default_domain)
 
-            if node_type == "swarm":
-                # Build swarm node (Phase 2: Strands Swarm Integration)
-                node = self._build_swarm_node(node_name, node_def)
-            else:
-                # Build agent node (existing behavior)
-                node = self._build_agent_node(node_name, node_def, default_domain)
+        return nodes
 
-            nodes[node_name] = node
+    def _build_node(
+        self,
+        node_name: str,
+        node_def: Dict[str, Any],
+        default_domain: Optional[str] = None,
+    ) -> Any:
+        """Build a single node, dispatching on its 'type' field.
 
-        return nodes
+        Args:
+            node_name: Unique node identifier.
+            node_def: Node definition from YAML.
+            default_domain: Default domain for prompt variants.
+
+        Returns:
+            Node instance implementing IGraphNode.
+        """
+        node_type = node_def.get("type", "agent")
+
+        if node_type == "swarm":
+            # Build swarm node (Phase 2: Strands Swarm Integration)
+            return self._build_swarm_node(node_name, node_def)
+        if node_type == "parallel":
+            return self._build_parallel_node(node_name, node_def, default_domain)
+
+        # Build agent node (existing behavior)
+        return self._build_agent_node(node_name, node_def, default_domain)
+
+    def _build_parallel_node(
+        self,
+        node_name: str,
+        node_def: Dict[str, Any],
+        default_domain: Optional[str],
+    ) -> ParallelNode:
+        """Build a ParallelNode (fan-out/fan-in) from YAML definition.
+
+        Branches are inline node definitions of any type and are not
+        addressable by edges; the parallel node itself is the unit the
+        graph routes to.
+
+        Args:
+            node_name: Unique node identifier.
+            node_def: Node definition from YAML with branches.
+            default_domain: Default domain for prompt variants.
+
+        Returns:
+            ParallelNode instance.
+
+        YAML Schema:
+            <node_name>:
+              type: parallel
+              merge: concat          # Optional, default concat
+              max_concurrency: 2     # Optional, default all branches
+              require_all: true      # Optional, default true
+              streaming: true        # Optional, default true
+              branches:
+                <branch_name>: {agent: ..., ...}
+        """
+        branch_defs = node_def.get("branches") or {}
+        if not isinstance(branch_defs, dict) or not branch_defs:
+            raise ValueError(f"Parallel node '{node_name}' requires a 'branches' mapping")
+
+        branches = [
+            self._build_node(branch_name, branch_def or {}, default_domain)
+            for branch_name, branch_def in branch_defs.items()
+        ]
+
+        node = ParallelNode(
+            branches=branches,
+            name=node_name,
+            merge=node_def.get("merge", "concat"),
+            max_concurrency=node_def.get("max_concurrency"),
+            require_all=node_def.get("require_all", True),
+            state_key=node_def.get("state_key"),
+            streaming=node_def.get("streaming", True),
+        )
+
+        logger.debug(
+            f"Built parallel node '{node_name}' with branches "
+            f"{[b.name for b in branches]} (merge={node_def.get('merge', 'concat')})"
+        )
+        return node
 
     def _build_agent_node(
         self,
@@ -20,10 +20,11 @@ _otel_context_logger = logging.getLogger("opentelemetry.context")
 _otel_context_logger.setLevel(logging.CRITICAL)
 
 import asyncio
+import shutil
 import uuid
 from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, List, Optional
 
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect, Query, HTTPException, File, UploadFile, Form
 from fastapi.middleware.cors import CORSMiddleware
@@ -38,13 +39,14 @@ from app.core import (
     PluginRegistry,
     Router,
     Executor,
+    ToolFactory,
 )
 from app.core.router import RoutingResult
 from app.core.context import Message, UserProfile, UserConfig
 from app.core.interfaces.services import IVRAMOrchestrator
 from app.core.interfaces.storage import IFileStorage
 from app.core.interfaces.queue import QueuedRequest, UserTier
-from app.services import QueueManager, CircuitBreakerRegistry, VisibilityMonitor
+from app.services import QueueManager, CircuitBreakerRegistry, VisibilityMonitor, BackendManager, SpeculativeModelLoader
 from app.adapters.websocket.factory import get_message_builder
 
 # Preprocessing imports
@@ -52,6 +54,7 @@ from app.preprocessing import (
     PromptSanitizer,
     FileExtractionRouter,
     OutputArtifactDetector,
+    write_and_hash,
 )
 
 # Postprocessing imports
@@ -67,6 +70,7 @@ from app.adapters.minio import MinIOAdapter
 
 # Configure logging via shared logging service
 import logging_client
+from recent_keys import RecentKeys
 logger = logging_client.setup_logger('troise-ai')
 
 # Global container and services
@@ -78,6 +82,10 @@ queue_manager: Optional[QueueManager] = None
 visibility_monitor: Optional[VisibilityMonitor] = None
 circuit_registry: Optional[CircuitBreakerRegistry] = None
 
+# Client message ids remembered per connection for duplicate detection
+MESSAGE_DEDUP_TTL_SECONDS = 3600
+MESSAGE_DEDUP_MAX_ENTRIES = 10000
+
 
 # ==============================================================================
 # Non-Blocking Persistence Helpers
@@ -203,6 +211,18 @@ async def lifespan(app: FastAPI):
         await queue_manager.stop()
         logger.info("Queue manager stopped")
 
+    # Stop PDF extraction workers
+    from app.preprocessing.extractors.pdf_extractor import shutdown_pdf_pool
+    shutdown_pdf_pool()
+
+    # Stop chunking workers
+    from app.services.chunking_service import shutdown_chunking_pool
+    shutdown_chunking_pool()
+
+    # Close the shared MinIO client
+    if container:
+        await container.resolve(MinIOAdapter).close()
+
 
 # Create FastAPI app
 app = FastAPI(
@@ -355,28 +375,28 @@ async def upload_files(
             # Generate unique UUID for this file
             uuid_part = str(uuid.uuid4())
 
-            # Read file content
-            content_bytes = await upload.read()
             mimetype = upload.content_type or "application/octet-stream"
 
+            # Stream to a temp file (hashing as it goes) instead of reading
+            # the whole upload into memory; extraction reads the same file
+            temp_path = Path(f"/tmp/troise-uploads/{session_id}")
+            temp_path.mkdir(parents=True, exist_ok=True)
+            temp_file = temp_path / f"{uuid_part}_{upload.filename}"
+            content_hash = await asyncio.to_thread(write_and_hash, temp_file, upload.file)
+            size = temp_file.stat().st_size
+
             # Upload to MinIO - returns composite file_id "{session_id}:{uuid}"
-            file_id = await file_storage.upload(
+            file_id = await file_storage.upload_file(
                 file_id=uuid_part,
-                content=content_bytes,
+                path=temp_file,
                 mimetype=mimetype,
                 session_id=session_id,
             )
 
-            # Store temporarily for extraction
-            temp_path = Path(f"/tmp/troise-uploads/{session_id}")
-            temp_path.mkdir(parents=True, exist_ok=True)
-            temp_file = temp_path / f"{uuid_part}_{upload.filename}"
-            temp_file.write_bytes(content_bytes)
-
             # Extract content using extraction router
             file_store = {}
             file_refs = await extraction_router.process_files(
-                [{"path": str(temp_file), "mimetype": mimetype}],
+                [{"path": str(temp_file), "mimetype": mimetype, "sha256": content_hash}],
                 file_store,
             )
 
@@ -394,11 +414,11 @@ async def upload_files(
                 "file_id": file_id,  # Composite: "{session_id}:{uuid}"
                 "filename": upload.filename,
                 "mimetype": mimetype,
-                "size": len(content_bytes),
+                "size": size,
                 "extracted_content": extracted_content,
             })
 
-            logger.info(f"Uploaded file {file_id}: {upload.filename} ({len(content_bytes)} bytes)")
+            logger.info(f"Uploaded file {file_id}: {upload.filename} ({size} bytes)")
 
         return {
             "session_id": session_id,
@@ -416,7 +436,9 @@ async def queue_status():
     """Get queue health and status metrics.
 
     Returns:
-        Queue depth, in-flight count, worker status, metrics, and circuit breaker state.
+        Queue depth, in-flight count, worker status, metrics, circuit breaker
+        state, tool result cache hit/miss stats, backend concurrency limits,
+        and speculative model load hit rate.
     """
     if not queue_manager:
         return {"error": "Queue manager not initialized"}
@@ -438,6 +460,12 @@ async def queue_status():
             for name, metrics in circuit_registry.get_all_metrics().items()
         }
 
+    # Add tool result cache stats and per-model concurrency limits
+    if container:
+        status["tool_cache"] = container.resolve(ToolFactory).get_cache_stats()
+        status["backend_concurrency"] = container.resolve(BackendManager).get_concurrency_stats()
+        status["speculative_load"] = container.resolve(SpeculativeModelLoader).get_stats()
+
     return status
 
 
@@ -572,14 +600,18 @@ async def websocket_chat(
         conversation_history=conversation_history,
     )
 
-    # Track processed message IDs for idempotency
-    processed_message_ids: Set[str] = set()
+    # Track processed message IDs for idempotency (bounded, time-windowed)
+    processed_message_ids = RecentKeys(
+        ttl_seconds=MESSAGE_DEDUP_TTL_SECONDS,
+        max_entries=MESSAGE_DEDUP_MAX_ENTRIES,
+    )
 
     # Resolve preprocessing services
     prompt_sanitizer = container.resolve(PromptSanitizer)
     extraction_router = container.resolve(FileExtractionRouter)
     artifact_detector = container.resolve(OutputArtifactDetector)
     artifact_chain = container.resolve(ArtifactExtractionChain)
+    model_loader = container.resolve(SpeculativeModelLoader)
 
     # Get formatter based on interface
     if interface == "discord":
@@ -664,10 +696,9 @@ async def websocket_chat(
 
                 # Idempotency check - skip duplicate messages
                 if message_id:
-                    if message_id in processed_message_ids:
+                    if processed_message_ids.seen(message_id):
                         logger.debug(f"Skipping duplicate message: {message_id}")
                         continue
-                    processed_message_ids.add(message_id)
 
                 if not content and not file_uploads:
                     continue
@@ -678,6 +709,8 @@ async def websocket_chat(
                     file_names = [f.get("filename", "file") for f in file_uploads]
                     content = f"Analyze this file: {', '.join(file_names)}"
 
+                speculative_load = None  # Model prefetch started during preprocessing
+
                 try:
                     # ==========================================================
                     # RESET REQUEST-SCOPED STATE
@@ -698,6 +731,11 @@ async def websocket_chat(
                         temp_dir = Path(f"/tmp/troise-ws/{session_id}")
                         temp_dir.mkdir(parents=True, exist_ok=True)
 
+                        # Stage every file first, then extract them together
+                        # (extractors run concurrently within their limits)
+                        staged_files = []
+                        staging_dirs = []
+
                         if first_file.get("file_id"):
                             # MinIO-based file uploads: download from storage
                             file_storage: IFileStorage = container.resolve(IFileStorage)
@@ -707,22 +745,12 @@ async def websocket_chat(
                                 mimetype = file_ref.get("mimetype", "application/octet-stream")
 
                                 try:
-                                    # Download from MinIO
-                                    content_bytes = await file_storage.download(file_id)
-
-                                    # Save to temp for extraction
+                                    # Stream from MinIO to temp for extraction
                                     temp_file = temp_dir / file_id
-                                    temp_file.write_bytes(content_bytes)
-
-                                    # Process through extraction router
-                                    refs = await extraction_router.process_files(
-                                        [{"path": str(temp_file), "mimetype": mimetype}],
-                                        context.file_store,
+                                    content_hash = await file_storage.download_to_file(file_id, temp_file)
+                                    staged_files.append(
+                                        {"path": str(temp_file), "mimetype": mimetype, "sha256": content_hash}
                                     )
-                                    file_refs.extend(refs)
-
-                                    # Cleanup temp file
-                                    temp_file.unlink(missing_ok=True)
 
                                 except FileNotFoundError:
                                     logger.warning(f"File not found in storage: {file_id}")
@@ -734,7 +762,7 @@ async def websocket_chat(
                             import base64 as b64
                             logger.info(f"Processing {len(file_uploads)} base64 file(s)")
 
-                            for file_ref in file_uploads:
+                            for index, file_ref in enumerate(file_uploads):
                                 filename = file_ref.get("filename", "unknown")
                                 mimetype = file_ref.get("mimetype", "application/octet-stream")
                                 base64_data = file_ref.get("base64_data", "")
@@ -744,22 +772,18 @@ async def websocket_chat(
                                     # Decode base64 content
                                     content_bytes = b64.b64decode(base64_data)
 
-                                    # Save to temp for extraction
+                                    # Save to temp for extraction (one directory per
+                                    # attachment so equal filenames don't collide)
                                     safe_filename = filename.replace("/", "_").replace("\\", "_")
-                                    temp_file = temp_dir / safe_filename
-                                    temp_file.write_bytes(content_bytes)
-
-                                    # Process through extraction router
-                                    refs = await extraction_router.process_files(
-                                        [{"path": str(temp_file), "mimetype": mimetype}],
-                                        context.file_store,
+                                    temp_file = temp_dir / str(index) / safe_filename
+                                    temp_file.parent.mkdir(exist_ok=True)
+                                    staging_dirs.append(temp_file.parent)
+                                    content_hash = write_and_hash(temp_file, content_bytes)
+                                    staged_files.append(
+                                        {"path": str(temp_file), "mimetype": mimetype, "sha256": content_hash}
                                     )
-                                    file_refs.extend(refs)
-
-                                    # Cleanup temp file
-                                    temp_file.unlink(missing_ok=True)
 
-                                    logger.debug(f"Processed base64 file: {filename} ({len(content_bytes)} bytes)")
+                                    logger.debug(f"Staged base64 file: {filename} ({len(content_bytes)} bytes)")
 
                                 except Exception as e:
                                     logger.error(f"Failed to process base64 file {filename}: {e}")
@@ -771,6 +795,21 @@ async def websocket_chat(
                                 context.file_store,
                             )
 
+                        try:
+                            if staged_files:
+                                # Process through extraction router
+                                file_refs = await extraction_router.process_files(
+                                    staged_files,
+                                    context.file_store,
+                                )
+                        finally:
+                            # Cleanup temp files and per-attachment directories
+                            # (including those of files that failed to stage)
+                            for staged in staged_files:
+                                Path(staged["path"]).unlink(missing_ok=True)
+                            for staging_dir in staging_dirs:
+                                shutil.rmtree(staging_dir, ignore_errors=True)
+
                         logger.debug(f"Extracted {len(file_refs)} files")
 
                     # Build file context directly from extracted content
@@ -812,6 +851,11 @@ async def websocket_chat(
                     # PREPROCESSING PHASE
                     # ==========================================================
 
+                    # Start loading the predicted target model so a cold load
+                    # overlaps sanitize + routing instead of following them
+                    user_model = user_config.model if user_config else None
+                    speculative_load = model_loader.start(user_id, content, user_model=user_model)
+
                     # Run PromptSanitizer and OutputArtifactDetector in PARALLEL
                     sanitize_task = asyncio.create_task(
                         prompt_sanitizer.sanitize(content)  # Sanitize original content
@@ -868,6 +912,7 @@ async def websocket_chat(
                                 "error": f"Model '{user_config.model}' not available in current profile.",
                                 "available_models": available_models,
                             })
+                            model_loader.abandon(speculative_load)
                             continue  # Skip this message, wait for next
 
                         # Capability validation warnings
@@ -903,6 +948,9 @@ async def websocket_chat(
                             has_attachments=bool(file_uploads),
                         )
 
+                    # Commit the speculative load if it targets the routed model
+                    model_loader.resolve(speculative_load, user_id, routing_result, user_model=user_model)
+
                     # Send routing info
                     await websocket.send_json({
                         "type": "routing",
@@ -1015,6 +1063,7 @@ async def websocket_chat(
 
                 except Exception as e:
                     logger.error(f"Error processing message: {e}", exc_info=True)
+                    model_loader.abandon(speculative_load)
                     await websocket.send_json({
                         "type": "error",
                         "content": str(e),
@@ -6,4 +6,5 @@ PLUGIN = {
     "name": "brain_fetch",
     "factory": create_brain_fetch_tool,
     "description": "Fetch the full content of a note from the knowledge base",
+    "cache": {"ttl_seconds": 300, "scope": "session", "invalidated_by": ["write_file"]},
 }
@@ -6,4 +6,5 @@ PLUGIN = {
     "name": "brain_search",
     "factory": create_brain_search_tool,
     "description": "Search the user's knowledge base (Obsidian notes) for relevant information",
+    "cache": {"ttl_seconds": 300, "scope": "session", "invalidated_by": ["write_file"]},
 }
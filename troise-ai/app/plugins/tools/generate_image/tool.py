@@ -7,13 +7,14 @@ VRAMOrchestrator handles model validation and backend resolution.
 import json
 import logging
 import uuid
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 from app.core.context import ExecutionContext
 from app.core.container import Container
 from app.core.interfaces.services import IVRAMOrchestrator
 from app.core.interfaces.storage import IFileStorage
 from app.core.interfaces.tool import ToolResult
+from app.services.image_scheduler import ImageGenerationScheduler, ImageRequest
 
 logger = logging.getLogger(__name__)
 
@@ -80,16 +81,23 @@ Returns a file_id that can be used to display the generated image."""
         "3:4": (896, 1152),
     }
 
-    def __init__(self, context: ExecutionContext, container: Container):
+    def __init__(
+        self,
+        context: ExecutionContext,
+        container: Container,
+        scheduler: Optional[ImageGenerationScheduler] = None,
+    ):
         """
         Initialize the generate image tool.
 
         Args:
             context: Execution context.
             container: DI container for service resolution.
+            scheduler: Batching/caching scheduler (None calls ComfyUI directly).
         """
         self._context = context
         self._container = container
+        self._scheduler = scheduler
 
     async def execute(
         self,
@@ -127,20 +135,38 @@ Returns a file_id that can be used to display the generated image."""
             orchestrator = self._container.resolve(IVRAMOrchestrator)
             # Get the image model from profile (e.g., "flux2-dev-nvfp4")
             image_model = orchestrator.get_profile_model("image")
-            comfyui, workflow_config = await orchestrator.get_diffusion_context(image_model)
 
             # Generate image via ComfyUI (config from profile, not hardcoded)
             logger.info(f"Generating image: {prompt[:50]}... ({width}x{height})")
 
-            image_bytes = await comfyui.generate_image(
-                prompt=prompt,
-                width=width,
-                height=height,
-                steps=num_steps,
-                guidance=guidance,
-                seed=seed,
-                workflow_config=workflow_config,
-            )
+            cached = False
+            if self._scheduler is not None:
+                # Scheduler checks the result cache before loading the model
+                # and batches concurrent same-size requests into one workflow
+                result = await self._scheduler.generate(
+                    ImageRequest(
+                        prompt=prompt,
+                        width=width,
+                        height=height,
+                        steps=num_steps,
+                        guidance=guidance,
+                        seed=seed,
+                    ),
+                    model_id=image_model,
+                    get_context=lambda: orchestrator.get_diffusion_context(image_model),
+                )
+                image_bytes, seed, cached = result.image, result.seed, result.cached
+            else:
+                comfyui, workflow_config = await orchestrator.get_diffusion_context(image_model)
+                image_bytes = await comfyui.generate_image(
+                    prompt=prompt,
+                    width=width,
+                    height=height,
+                    steps=num_steps,
+                    guidance=guidance,
+                    seed=seed,
+                    workflow_config=workflow_config,
+                )
 
             if not image_bytes:
                 return ToolResult(
@@ -151,7 +177,7 @@ Returns a file_id that can be used to display the generated image."""
                     error="Generation failed"
                 )
 
-            logger.info(f"Image generated successfully")
+            logger.info(f"Image generated successfully (cached={cached})")
 
             # Upload to storage
             storage = self._container.try_resolve(IFileStorage)
@@ -181,7 +207,15 @@ Returns a file_id that can be used to display the generated image."""
 
             logger.info(f"Image uploaded: file_id={file_id}, storage_key={storage_key}")
 
-            # Seed is random if not provided (ComfyUI generates internally)
+            # Direct download link so clients needn't proxy the image bytes
+            try:
+                download_url = await storage.get_presigned_url(composite_id)
+            except Exception as e:
+                logger.warning(f"Could not presign {composite_id}: {e}")
+                download_url = None
+
+            # Seed is random if not provided (ComfyUI generates internally);
+            # the scheduler assigns and reports a concrete seed
             actual_seed = seed if seed is not None else "random"
 
             return ToolResult(
@@ -189,6 +223,7 @@ Returns a file_id that can be used to display the generated image."""
                     "success": True,
                     "file_id": file_id,
                     "storage_key": storage_key,
+                    "download_url": download_url,
                     "format": "png",
                     "width": width,
                     "height": height,
@@ -197,6 +232,7 @@ Returns a file_id that can be used to display the generated image."""
                     "num_inference_steps": num_steps,
                     "guidance_scale": guidance,
                     "prompt_used": prompt,
+                    "cached": cached,
                 }),
                 success=True,
             )
@@ -270,4 +306,5 @@ def create_generate_image_tool(
     return GenerateImageTool(
         context=context,
         container=container,
+        scheduler=container.try_resolve(ImageGenerationScheduler),
     )
@@ -6,7 +6,8 @@ PLUGIN = {
     "name": "read_file",
     "class": ReadFileTool,
     "factory": create_read_file_tool,
-    "description": "Read contents of a file from the filesystem"
+    "description": "Read contents of a file from the filesystem",
+    "cache": {"ttl_seconds": 60, "scope": "request", "invalidated_by": ["write_file"]},
 }
 
 __all__ = ["ReadFileTool", "create_read_file_tool", "PLUGIN"]
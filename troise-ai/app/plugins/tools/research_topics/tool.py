@@ -5,6 +5,10 @@ This tool enables the Agent-as-Tool pattern for parallel research:
 - Tool internally spawns sub-agents via asyncio.gather() for parallel execution
 - Results are combined and returned to the lead researcher
 
+Sub-agent generations take a slot from BackendManager's per-model adaptive
+concurrency limiter (via the model returned by VRAMOrchestrator.get_model),
+so many topics queue for the backend instead of oversubscribing it.
+
 This bypasses the unreliable autonomous handoff mechanism in Strands Swarm,
 providing 100% deterministic parallel research execution.
 """
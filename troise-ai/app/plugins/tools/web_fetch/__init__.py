@@ -7,6 +7,7 @@ PLUGIN = {
     "type": "tool",
     "description": "Fetch and extract readable content from web pages",
     "factory": create_web_fetch_tool,
+    "cache": {"ttl_seconds": 900, "scope": "global"},
 }
 
 __all__ = ["WebFetchTool", "create_web_fetch_tool", "PLUGIN"]
@@ -38,7 +38,7 @@ from app.core.container import Container
 from app.core.config import Config, RAGConfig
 from app.core.interfaces.tool import ToolResult
 from app.adapters.dynamodb import DynamoDBClient, TroiseWebChunksAdapter
-from app.services import LangChainChunkingService, EmbeddingService
+from app.services import TokenChunkingService, EmbeddingService
 
 logger = logging.getLogger(__name__)
 
@@ -92,7 +92,7 @@ Returns the main readable content of the page, chunked and processed for context
         context: ExecutionContext,
         container: Container,
         config: Optional[RAGConfig] = None,
-        chunking_service: Optional[LangChainChunkingService] = None,
+        chunking_service: Optional[TokenChunkingService] = None,
         embedding_service: Optional[EmbeddingService] = None,
         web_chunks_adapter: Optional[TroiseWebChunksAdapter] = None,
     ):
@@ -123,7 +123,7 @@ Returns the main readable content of the page, chunked and processed for context
         self._embedding_service = embedding_service
         self._web_chunks_adapter = web_chunks_adapter
 
-    def _get_chunking_service(self) -> LangChainChunkingService:
+    def _get_chunking_service(self) -> TokenChunkingService:
         """Get or create chunking service."""
         if self._chunking_service is None:
             from app.services import create_chunking_service
@@ -6,7 +6,8 @@ PLUGIN = {
     "name": "web_search",
     "class": WebSearchTool,
     "factory": create_web_search_tool,
-    "description": "Search the web for information using DuckDuckGo"
+    "description": "Search the web for information using DuckDuckGo",
+    "cache": {"ttl_seconds": 600, "scope": "global"},
 }
 
 __all__ = ["WebSearchTool", "create_web_search_tool", "PLUGIN"]
@@ -3,10 +3,12 @@
 Handles preprocessing of user messages and files before routing:
 - PromptSanitizer: Extract clean intent from user messages
 - FileExtractionRouter: Route files to extractors, store for tool access
+- ExtractionResultCache: Content-addressed cache of extraction results
 - OutputArtifactDetector: Detect if user wants file output
 """
 from .prompt_sanitizer import PromptSanitizer, SanitizedPrompt
 from .extraction_router import FileExtractionRouter, FileRef, FileContent
+from .extraction_cache import ExtractionResultCache, write_and_hash
 from .artifact_detector import OutputArtifactDetector
 
 __all__ = [
@@ -17,6 +19,8 @@ __all__ = [
     "FileExtractionRouter",
     "FileRef",
     "FileContent",
+    "ExtractionResultCache",
+    "write_and_hash",
     # Artifact Detection
     "OutputArtifactDetector",
 ]
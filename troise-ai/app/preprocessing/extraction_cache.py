@@ -0,0 +1,231 @@
+"""Content-addressed cache of file extraction results.
+
+The same attachment is often extracted many times: re-sent in a thread,
+re-attached in a new session, or shared by several users. Each time it
+pays for pypdf or a vision-model call. FileExtractionRouter consults this
+cache first:
+
+- Key: SHA-256 of the file bytes + extractor name + extractor cache_version
+  (bumped when an extractor's output would change, e.g. a new vision model)
+- In-memory LRU (bounded by entries and text size) over file storage
+  (MinIO, "extraction-cache:{key}" JSON objects). Storage errors are
+  logged and treated as misses; the cache never fails an extraction.
+- Only complete results are stored: errors and timed-out partials are
+  retried next time.
+
+Hashes are computed while the upload is written to disk
+(write_and_hash), so a hit costs no extra read of the file.
+"""
+import hashlib
+import json
+import logging
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Iterable, Optional, Tuple, Union
+
+from .extractors.interface import ExtractionResult
+
+logger = logging.getLogger(__name__)
+
+# Storage session (MinIO prefix) holding cached results
+CACHE_SESSION_ID = "extraction-cache"
+
+DEFAULT_MEMORY_ENTRIES = 256
+DEFAULT_MEMORY_BYTES = 64 * 1024 * 1024
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def write_and_hash(
+    path: Union[str, Path],
+    content: Union[bytes, BinaryIO, Iterable[bytes]],
+) -> str:
+    """Write content to path, hashing it in the same pass.
+
+    Args:
+        path: Destination file.
+        content: Bytes, a binary file object (read in chunks), or an
+            iterable of byte chunks.
+
+    Returns:
+        SHA-256 hex digest of the written bytes.
+    """
+    digest = hashlib.sha256()
+    if isinstance(content, (bytes, bytearray, memoryview)):
+        view = memoryview(content)
+        content = (view[i:i + HASH_CHUNK_SIZE] for i in range(0, len(view), HASH_CHUNK_SIZE))
+    elif hasattr(content, "read"):
+        source = content
+        content = iter(lambda: source.read(HASH_CHUNK_SIZE), b"")
+
+    with open(path, "wb") as f:
+        for chunk in content:
+            digest.update(chunk)
+            f.write(chunk)
+    return digest.hexdigest()
+
+
+def hash_file(path: Union[str, Path]) -> str:
+    """SHA-256 hex digest of a file, read in chunks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(HASH_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def extraction_cache_key(content_hash: str, extractor_name: str, version: str) -> str:
+    """Content address of an extraction.
+
+    Args:
+        content_hash: SHA-256 of the file bytes.
+        extractor_name: Extractor class name.
+        version: Extractor cache_version.
+
+    Returns:
+        Hex digest identifying the extraction result.
+    """
+    payload = f"{content_hash}|{extractor_name}|{version}"
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def is_cacheable(result: ExtractionResult) -> bool:
+    """Whether a result is complete enough to reuse.
+
+    Successes are cached. Partial results are cached only when they are
+    deterministic (a page cap), not when they come from a transient
+    failure (vision model error, timeout).
+    """
+    if result.status == "success":
+        return True
+    return (
+        result.status == "partial"
+        and bool(result.metadata.get("truncated"))
+        and not result.metadata.get("timed_out")
+    )
+
+
+class ExtractionResultCache:
+    """Content-addressed extraction cache: in-memory LRU over file storage."""
+
+    def __init__(
+        self,
+        storage: Optional[Any] = None,
+        max_memory_entries: int = DEFAULT_MEMORY_ENTRIES,
+        max_memory_bytes: int = DEFAULT_MEMORY_BYTES,
+    ):
+        """Initialize the cache.
+
+        Args:
+            storage: IFileStorage for persistent entries (None for memory only).
+            max_memory_entries: Results kept in process memory.
+            max_memory_bytes: Total result text kept in process memory.
+        """
+        self._storage = storage
+        self._max_memory_entries = max_memory_entries
+        self._max_memory_bytes = max_memory_bytes
+        self._memory: "OrderedDict[str, Tuple[ExtractionResult, int]]" = OrderedDict()
+        self._memory_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._storage_errors = 0
+
+    async def get(self, key: str) -> Optional[ExtractionResult]:
+        """Look up a cached result.
+
+        Args:
+            key: Content key from extraction_cache_key().
+
+        Returns:
+            A copy of the cached ExtractionResult, or None on a miss.
+        """
+        entry = self._memory.get(key)
+        if entry is not None:
+            self._memory.move_to_end(key)
+            self._hits += 1
+            return self._copy(entry[0])
+
+        result = None
+        if self._storage is not None:
+            try:
+                data = await self._storage.download(f"{CACHE_SESSION_ID}:{key}")
+                result = ExtractionResult(**json.loads(data))
+            except FileNotFoundError:
+                result = None
+            except Exception as e:
+                self._storage_errors += 1
+                logger.warning(f"Extraction cache lookup failed for {key[:12]}: {e}")
+                result = None
+
+        if result is None:
+            self._misses += 1
+            return None
+
+        self._hits += 1
+        self._remember(key, result)
+        return self._copy(result)
+
+    async def put(self, key: str, result: ExtractionResult) -> None:
+        """Store a result.
+
+        Args:
+            key: Content key from extraction_cache_key().
+            result: Extraction result (text and metadata).
+        """
+        self._remember(key, self._copy(result))
+        if self._storage is None:
+            return
+        try:
+            payload = json.dumps({
+                "text": result.text,
+                "extractor_name": result.extractor_name,
+                "status": result.status,
+                "error_message": result.error_message,
+                "metadata": result.metadata,
+            }, default=str)
+            await self._storage.upload(
+                file_id=key,
+                content=payload.encode("utf-8"),
+                mimetype="application/json",
+                session_id=CACHE_SESSION_ID,
+            )
+        except Exception as e:
+            self._storage_errors += 1
+            logger.warning(f"Extraction cache store failed for {key[:12]}: {e}")
+
+    @staticmethod
+    def _copy(result: ExtractionResult) -> ExtractionResult:
+        return ExtractionResult(
+            text=result.text,
+            extractor_name=result.extractor_name,
+            status=result.status,
+            error_message=result.error_message,
+            metadata=dict(result.metadata),
+        )
+
+    def _remember(self, key: str, result: ExtractionResult) -> None:
+        """Insert into the in-memory LRU."""
+        size = len(result.text)
+        if self._max_memory_entries <= 0 or size > self._max_memory_bytes:
+            return
+        old = self._memory.pop(key, None)
+        if old is not None:
+            self._memory_bytes -= old[1]
+        self._memory[key] = (result, size)
+        self._memory_bytes += size
+        while (
+            len(self._memory) > self._max_memory_entries
+            or self._memory_bytes > self._max_memory_bytes
+        ):
+            _, (_, evicted_size) = self._memory.popitem(last=False)
+            self._memory_bytes -= evicted_size
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "memory_entries": len(self._memory),
+            "memory_bytes": self._memory_bytes,
+            "storage_errors": self._storage_errors,
+            "persistent": self._storage is not None,
+        }
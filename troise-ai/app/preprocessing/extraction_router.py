@@ -3,13 +3,20 @@
 Routes files to appropriate extractors and stores content
 for tool access. Uses session-scoped storage to prevent
 data collision between WebSocket sessions.
+
+Extraction results are shared across sessions through an optional
+content-addressed ExtractionResultCache; concurrent requests for the
+same bytes share one extraction.
 """
+import asyncio
+import dataclasses
 import logging
 import uuid
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 
+from .extraction_cache import ExtractionResultCache, extraction_cache_key, hash_file, is_cacheable
 from .extractors.interface import IContentExtractor, ExtractionResult
 
 logger = logging.getLogger(__name__)
@@ -57,8 +64,15 @@ class FileExtractionRouter:
         content = context.file_store[ref.file_id]["content"]
     """
 
-    def __init__(self):
+    def __init__(self, cache: Optional[ExtractionResultCache] = None):
+        """Initialize the router.
+
+        Args:
+            cache: Content-addressed result cache (None disables caching).
+        """
         self._extractors: Dict[str, IContentExtractor] = {}
+        self._cache = cache
+        self._in_flight: Dict[str, "asyncio.Task[ExtractionResult]"] = {}
 
     def register(self, extractor: IContentExtractor) -> None:
         """Register an extractor for its supported MIME types.
@@ -92,6 +106,7 @@ class FileExtractionRouter:
         file_path: str,
         mimetype: str,
         file_store: Dict[str, Dict[str, Any]],
+        content_hash: Optional[str] = None,
     ) -> FileRef:
         """Extract content from file and store for tool access.
 
@@ -99,6 +114,8 @@ class FileExtractionRouter:
             file_path: Path to the file to process.
             mimetype: MIME type of the file.
             file_store: Session-scoped storage (from ExecutionContext).
+            content_hash: SHA-256 of the file bytes, if computed while the
+                file was written (hashed here otherwise, when caching).
 
         Returns:
             FileRef with file_id for later access.
@@ -123,7 +140,7 @@ class FileExtractionRouter:
             )
 
         try:
-            result = await extractor.extract(file_path, mimetype)
+            result = await self._extract(extractor, file_path, mimetype, content_hash)
 
             # Store in session-scoped file store
             file_store[file_id] = {
@@ -162,29 +179,81 @@ class FileExtractionRouter:
                 error_message=str(e),
             )
 
+    async def _extract(
+        self,
+        extractor: IContentExtractor,
+        file_path: str,
+        mimetype: str,
+        content_hash: Optional[str],
+    ) -> ExtractionResult:
+        """Extract through the result cache when possible."""
+        version = getattr(extractor, "cache_version", None)
+        if self._cache is None or version is None:
+            return await extractor.extract(file_path, mimetype)
+
+        if content_hash is None:
+            content_hash = await asyncio.to_thread(hash_file, file_path)
+        key = extraction_cache_key(content_hash, type(extractor).__name__, version)
+
+        cached = await self._cache.get(key)
+        if cached is not None:
+            cached.metadata["cache_hit"] = True
+            return cached
+
+        # Single flight: identical uploads arriving together extract once
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._extract_and_store(key, extractor, file_path, mimetype))
+            self._in_flight[key] = task
+            task.add_done_callback(lambda _: self._in_flight.pop(key, None))
+
+        result = await asyncio.shield(task)
+        return dataclasses.replace(result, metadata=dict(result.metadata))
+
+    async def _extract_and_store(
+        self,
+        key: str,
+        extractor: IContentExtractor,
+        file_path: str,
+        mimetype: str,
+    ) -> ExtractionResult:
+        result = await extractor.extract(file_path, mimetype)
+        if is_cacheable(result):
+            await self._cache.put(key, result)
+        return result
+
+    def get_cache_stats(self) -> Optional[Dict[str, Any]]:
+        """Get extraction cache statistics (None when caching is disabled)."""
+        return self._cache.get_stats() if self._cache else None
+
     async def process_files(
         self,
         files: List[Dict[str, str]],
         file_store: Dict[str, Dict[str, Any]],
     ) -> List[FileRef]:
-        """Process multiple files.
+        """Process multiple files concurrently.
+
+        Extractors bound their own concurrency (PDF worker pool, vision
+        request limit), so a message with several attachments takes
+        about as long as its slowest file.
 
         Args:
-            files: List of dicts with "path" and "mimetype" keys.
+            files: List of dicts with "path" and "mimetype" keys, and
+                optionally "sha256" (hex digest of the file bytes).
             file_store: Session-scoped storage.
 
         Returns:
-            List of FileRef objects.
+            List of FileRef objects, in the order of files.
         """
-        refs = []
-        for file_info in files:
-            ref = await self.process_file(
+        return list(await asyncio.gather(*[
+            self.process_file(
                 file_info["path"],
                 file_info["mimetype"],
                 file_store,
+                content_hash=file_info.get("sha256"),
             )
-            refs.append(ref)
-        return refs
+            for file_info in files
+        ]))
 
     def get_content(
         self,
@@ -1,8 +1,17 @@
-"""Image file extractor using vision model."""
+"""Image file extractor using vision model.
+
+Vision calls run off the event loop on a client shared by all extractions,
+so several images in one message are described concurrently (up to
+vision_max_concurrency per extractor). Images larger than the model's
+input resolution are downscaled before upload: the model would resize
+them anyway, and the smaller payload is cheaper to encode and ship.
+"""
+import asyncio
 import base64
+import io
 import logging
 from pathlib import Path
-from typing import List, Optional, TYPE_CHECKING
+from typing import List, Optional, Tuple, TYPE_CHECKING
 
 import ollama
 
@@ -15,6 +24,57 @@ from .interface import ExtractionResult
 logger = logging.getLogger(__name__)
 
 
+def _load_image_module():
+    try:
+        from PIL import Image
+    except ImportError:
+        return None
+    return Image
+
+
+def downscale_image(data: bytes, max_px: int) -> Tuple[bytes, Optional[Tuple[int, int]]]:
+    """Shrink an image so its longest side is at most max_px.
+
+    JPEG sources stay JPEG; everything else is re-encoded as PNG so text
+    in screenshots stays sharp. The original bytes are returned when
+    Pillow is unavailable, the image already fits, or re-encoding would
+    not make it smaller.
+
+    Args:
+        data: Encoded image bytes.
+        max_px: Longest side in pixels (0 disables downscaling).
+
+    Returns:
+        (image bytes, (width, height) sent) - size is None if unchanged.
+    """
+    Image = _load_image_module()
+    if Image is None or max_px <= 0:
+        return data, None
+
+    try:
+        with Image.open(io.BytesIO(data)) as image:
+            if max(image.size) <= max_px:
+                return data, None
+            is_jpeg = image.format == "JPEG"
+            image.thumbnail((max_px, max_px), Image.LANCZOS)
+            out = io.BytesIO()
+            if is_jpeg:
+                image.convert("RGB").save(out, format="JPEG", quality=90)
+            else:
+                if image.mode not in ("RGB", "RGBA", "L", "LA"):
+                    image = image.convert("RGBA")
+                image.save(out, format="PNG", optimize=True)
+            size = image.size
+    except Exception as e:
+        logger.debug(f"Image downscale skipped: {e}")
+        return data, None
+
+    resized = out.getvalue()
+    if len(resized) >= len(data):
+        return data, None
+    return resized, size
+
+
 class ImageExtractor:
     """Extract text/description from images using vision model.
 
@@ -55,6 +115,9 @@ Be thorough but concise."""
         self._config = config
         self._orchestrator = vram_orchestrator
         self._ollama_host: Optional[str] = None
+        self._client: Optional[ollama.Client] = None
+        self._max_image_px = 0
+        self._semaphore = asyncio.Semaphore(1)
 
         # Get Ollama host from config
         if config:
@@ -62,11 +125,29 @@ Be thorough but concise."""
             model_caps = config.get_model_capabilities(vision_model)
             if model_caps:
                 self._ollama_host = model_caps.backend.host
+            self._max_image_px = config.preprocessing.vision_max_image_px
+            self._semaphore = asyncio.Semaphore(max(1, config.preprocessing.vision_max_concurrency))
+
+    def _get_client(self) -> ollama.Client:
+        """Shared Ollama client (one connection pool for all extractions)."""
+        if self._client is None:
+            self._client = ollama.Client(host=self._ollama_host)
+        return self._client
 
     @property
     def supported_mimetypes(self) -> List[str]:
         return self.MIMETYPES
 
+    @property
+    def cache_version(self) -> Optional[str]:
+        """Extraction cache version: descriptions depend on the vision model.
+
+        None (not cached) when vision is disabled.
+        """
+        if not self._config or not self._orchestrator:
+            return None
+        return f"2:{self._config.profile.vision_model}:{self._max_image_px}"
+
     async def extract(self, file_path: str, mimetype: str) -> ExtractionResult:
         """Extract description from image.
 
@@ -104,33 +185,41 @@ Be thorough but concise."""
             # Ensure vision model is loaded via VRAMOrchestrator
             await self._orchestrator.request_load(vision_model)
 
-            # Read and encode image
-            image_data = path.read_bytes()
-            image_b64 = base64.b64encode(image_data).decode("utf-8")
+            # Read, downscale and encode image off the event loop
+            image_data = await asyncio.to_thread(path.read_bytes)
+            upload_data, sent_size = await asyncio.to_thread(
+                downscale_image, image_data, self._max_image_px
+            )
+            image_b64 = base64.b64encode(upload_data).decode("utf-8")
+            if sent_size:
+                logger.info(
+                    f"ImageExtractor: Downscaled {path.name} to {sent_size[0]}x{sent_size[1]} "
+                    f"({len(image_data)} -> {len(upload_data)} bytes)"
+                )
             logger.info(
-                f"ImageExtractor: Encoded {path.name} ({len(image_data)} bytes), "
+                f"ImageExtractor: Encoded {path.name} ({len(upload_data)} bytes), "
                 f"calling vision model {vision_model}"
             )
 
-            # Use Ollama API directly for vision
-            # Note: We use the sync client since we're in an async context
-            # and ollama's async client has issues with some setups
-            client = ollama.Client(host=self._ollama_host)
-
+            # The sync client runs in a worker thread (ollama's async client
+            # has issues with some setups); the semaphore caps concurrent
+            # requests to the vision backend
             try:
-                logger.info(f"ImageExtractor: Calling Ollama vision API")
-                response = client.chat(
-                    model=vision_model,
-                    messages=[{
-                        "role": "user",
-                        "content": self.VISION_PROMPT,
-                        "images": [image_b64],
-                    }],
-                    options={
-                        "temperature": 0.1,
-                        "num_predict": 1024,
-                    },
-                )
+                async with self._semaphore:
+                    logger.info(f"ImageExtractor: Calling Ollama vision API")
+                    response = await asyncio.to_thread(
+                        self._get_client().chat,
+                        model=vision_model,
+                        messages=[{
+                            "role": "user",
+                            "content": self.VISION_PROMPT,
+                            "images": [image_b64],
+                        }],
+                        options={
+                            "temperature": 0.1,
+                            "num_predict": 1024,
+                        },
+                    )
 
                 result_text = response.get("message", {}).get("content", "")
                 logger.info(
@@ -156,6 +245,7 @@ Be thorough but concise."""
                     "filename": path.name,
                     "mimetype": mimetype,
                     "size_bytes": len(image_data),
+                    "sent_bytes": len(upload_data),
                     "model": vision_model,
                 },
             )
@@ -1,12 +1,117 @@
-"""PDF file extractor."""
+"""PDF file extractor.
+
+Text extraction is CPU-bound pure Python (pypdf), so it runs in a shared
+process pool instead of on the event loop. Large documents are split into
+page ranges extracted in parallel; extract_pages() yields pages in order
+as their ranges finish, so consumers can start before the last page.
+
+Every pool call runs under pdf_timeout_seconds. A worker stuck on a
+pathological document cannot be cancelled, so on timeout the pool is
+recycled: its workers are terminated and the next call starts a new pool.
+"""
+import asyncio
 import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from typing import List
+from typing import AsyncIterator, List, Optional, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from app.core.config import PreprocessingConfig
 
 from .interface import IContentExtractor, ExtractionResult
 
 logger = logging.getLogger(__name__)
 
+# Shared across extractor instances (one pool per process)
+_pool: Optional[ProcessPoolExecutor] = None
+
+
+def _get_pool(workers: int) -> ProcessPoolExecutor:
+    """Get the shared PDF worker pool, creating it on first use."""
+    global _pool
+    if _pool is None:
+        _pool = ProcessPoolExecutor(
+            max_workers=workers or os.cpu_count() or 1,
+            # spawn: never fork a process that already runs threads
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _pool
+
+
+def shutdown_pdf_pool() -> None:
+    """Stop the shared PDF worker pool (called on application shutdown)."""
+    global _pool
+    if _pool is not None:
+        _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
+
+
+def _recycle_pool(pool: ProcessPoolExecutor) -> None:
+    """Retire a pool and terminate its workers so a timed-out task stops using CPU.
+
+    Only clears the shared pool if it is still this one, so a fresh pool
+    started by another extraction survives. Queued and running tasks of
+    other documents on this pool are not cancelled: they fail with
+    BrokenProcessPool, which extract() reports as an error result.
+    """
+    global _pool
+    if _pool is pool:
+        _pool = None
+    # concurrent.futures has no public way to stop a running task
+    for process in list((getattr(pool, "_processes", None) or {}).values()):
+        process.terminate()
+    pool.shutdown(wait=False)
+
+
+def _load_reader_class():
+    try:
+        from pypdf import PdfReader
+    except ImportError:
+        try:
+            from PyPDF2 import PdfReader
+        except ImportError:
+            return None
+    return PdfReader
+
+
+# Worker-process state: the last document opened, so a worker handling
+# several ranges of one document parses its xref and page tree only once
+_worker_reader: Optional[Tuple[tuple, object]] = None
+
+
+def _open_reader(file_path: str):
+    global _worker_reader
+    stat = os.stat(file_path)
+    key = (file_path, stat.st_mtime_ns, stat.st_size)
+    if _worker_reader is None or _worker_reader[0] != key:
+        _worker_reader = None  # Release the previous document first
+        _worker_reader = (key, _load_reader_class()(file_path))
+    return _worker_reader[1]
+
+
+def _count_pages(file_path: str) -> int:
+    """Worker: number of pages in the document."""
+    return len(_open_reader(file_path).pages)
+
+
+def _extract_page_range(file_path: str, start: int, end: int) -> List[str]:
+    """Worker: text of pages [start, end), "" for pages that fail to parse."""
+    reader = _open_reader(file_path)
+    texts = []
+    for index in range(start, end):
+        try:
+            texts.append(reader.pages[index].extract_text() or "")
+        except Exception:
+            texts.append("")
+    return texts
+
+
+class PDFExtractionTimeout(Exception):
+    """Raised by extract_pages when the per-document time budget runs out."""
+
 
 class PDFExtractor:
     """Extract text from PDF documents.
@@ -19,10 +124,106 @@ class PDFExtractor:
         "application/pdf",
     ]
 
+    def __init__(self, config: Optional["PreprocessingConfig"] = None):
+        if config is None:
+            from app.core.config import PreprocessingConfig
+            config = PreprocessingConfig()
+        self._config = config
+
     @property
     def supported_mimetypes(self) -> List[str]:
         return self.MIMETYPES
 
+    @property
+    def cache_version(self) -> str:
+        """Extraction cache version (the page cap changes truncated output)."""
+        return f"1:{self._config.pdf_max_pages}"
+
+    async def count_pages(self, file_path: str, timeout: Optional[float] = None) -> int:
+        """Count pages without blocking the event loop.
+
+        Args:
+            file_path: Path to the PDF file.
+            timeout: Seconds to wait (default: pdf_timeout_seconds).
+
+        Raises:
+            PDFExtractionTimeout: The document did not open in time (the
+                pool is recycled).
+        """
+        loop = asyncio.get_running_loop()
+        pool = _get_pool(self._config.pdf_workers)
+        if timeout is None:
+            timeout = self._config.pdf_timeout_seconds
+        try:
+            return await asyncio.wait_for(
+                loop.run_in_executor(pool, _count_pages, str(file_path)),
+                timeout=max(timeout, 0),
+            )
+        except asyncio.TimeoutError:
+            _recycle_pool(pool)
+            raise PDFExtractionTimeout(
+                f"PDF page count exceeded {self._config.pdf_timeout_seconds}s"
+            )
+        except BrokenProcessPool:
+            _recycle_pool(pool)
+            raise
+
+    async def extract_pages(
+        self,
+        file_path: str,
+        page_count: Optional[int] = None,
+    ) -> AsyncIterator[Tuple[int, str]]:
+        """Stream (page_number, text) pairs in page order.
+
+        Page ranges are submitted to the pool up front and extracted in
+        parallel; each range is yielded as soon as it and all earlier
+        ranges are done. Stops after pdf_max_pages pages.
+
+        Args:
+            file_path: Path to the PDF file.
+            page_count: Page count if already known.
+
+        Raises:
+            PDFExtractionTimeout: pdf_timeout_seconds elapsed (pages already
+                yielded remain valid). Ranges still running are stopped by
+                recycling the pool.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self._config.pdf_timeout_seconds
+        file_path = str(file_path)
+
+        if page_count is None:
+            page_count = await self.count_pages(file_path, timeout=deadline - loop.time())
+        pool = _get_pool(self._config.pdf_workers)
+        last_page = min(page_count, self._config.pdf_max_pages)
+        step = max(1, self._config.pdf_pages_per_task)
+
+        futures = []
+        try:
+            for start in range(0, last_page, step):
+                futures.append((start, loop.run_in_executor(
+                    pool, _extract_page_range, file_path, start, min(start + step, last_page)
+                )))
+
+            for start, future in futures:
+                remaining = deadline - loop.time()
+                try:
+                    texts = await asyncio.wait_for(future, timeout=max(remaining, 0))
+                except asyncio.TimeoutError:
+                    _recycle_pool(pool)
+                    raise PDFExtractionTimeout(
+                        f"PDF extraction exceeded {self._config.pdf_timeout_seconds}s"
+                    )
+                for offset, text in enumerate(texts):
+                    yield start + offset + 1, text
+        except BrokenProcessPool:
+            _recycle_pool(pool)
+            raise
+        finally:
+            # Queued ranges are dropped (running ones were stopped on timeout)
+            for _, future in futures:
+                future.cancel()
+
     async def extract(self, file_path: str, mimetype: str) -> ExtractionResult:
         """Extract text from PDF.
 
@@ -43,35 +244,51 @@ class PDFExtractor:
                 error_message=f"File not found: {file_path}",
             )
 
+        if _load_reader_class() is None:
+            return ExtractionResult(
+                text=f"[PDF: {path.name}]",
+                extractor_name="PDFExtractor",
+                status="error",
+                error_message="PDF library not available (install pypdf)",
+            )
+
         try:
-            # Try to import pypdf
             try:
-                from pypdf import PdfReader
-            except ImportError:
-                try:
-                    from PyPDF2 import PdfReader
-                except ImportError:
-                    return ExtractionResult(
-                        text=f"[PDF: {path.name}]",
-                        extractor_name="PDFExtractor",
-                        status="error",
-                        error_message="PDF library not available (install pypdf)",
-                    )
-
-            reader = PdfReader(str(path))
-            page_count = len(reader.pages)
+                page_count = await self.count_pages(str(path))
+            except PDFExtractionTimeout as e:
+                logger.warning(f"{e}: {path.name}")
+                return ExtractionResult(
+                    text=f"[PDF: {path.name}]",
+                    extractor_name="PDFExtractor",
+                    status="error",
+                    error_message="PDF extraction timed out",
+                    metadata={"filename": path.name},
+                )
 
-            # Extract text from all pages
+            # Extract text from pages (in order, as ranges complete)
             text_parts = []
-            for i, page in enumerate(reader.pages):
-                page_text = page.extract_text()
-                if page_text:
-                    text_parts.append(f"--- Page {i + 1} ---\n{page_text}")
+            timed_out = False
+            try:
+                async for page_number, page_text in self.extract_pages(str(path), page_count):
+                    if page_text:
+                        text_parts.append(f"--- Page {page_number} ---\n{page_text}")
+            except PDFExtractionTimeout as e:
+                logger.warning(f"{e}: {path.name} ({len(text_parts)} pages with text kept)")
+                timed_out = True
 
             full_text = "\n\n".join(text_parts)
             word_count = len(full_text.split())
+            truncated = page_count > self._config.pdf_max_pages
 
             if not full_text.strip():
+                if timed_out:
+                    return ExtractionResult(
+                        text=f"[PDF: {path.name} - {page_count} pages]",
+                        extractor_name="PDFExtractor",
+                        status="error",
+                        error_message="PDF extraction timed out",
+                        metadata={"page_count": page_count, "filename": path.name},
+                    )
                 # PDF might be image-based
                 return ExtractionResult(
                     text=f"[PDF: {path.name} - {page_count} pages, no extractable text]",
@@ -81,18 +298,38 @@ class PDFExtractor:
                     metadata={"page_count": page_count, "filename": path.name},
                 )
 
+            error_message = None
+            if timed_out:
+                error_message = "PDF extraction timed out, text is incomplete"
+            elif truncated:
+                error_message = f"Only the first {self._config.pdf_max_pages} pages were extracted"
+
             return ExtractionResult(
                 text=full_text,
                 extractor_name="PDFExtractor",
-                status="success",
+                status="partial" if error_message else "success",
+                error_message=error_message,
                 metadata={
                     "page_count": page_count,
                     "word_count": word_count,
                     "char_count": len(full_text),
                     "filename": path.name,
+                    "truncated": truncated,
+                    "timed_out": timed_out,
                 },
             )
 
+        except BrokenProcessPool as e:
+            # A worker died (OOM on a hostile file, or another document's
+            # timeout recycled the pool); that pool was already retired
+            logger.error(f"PDF worker pool broke on {file_path}: {e}")
+            return ExtractionResult(
+                text=f"[PDF: {path.name}]",
+                extractor_name="PDFExtractor",
+                status="error",
+                error_message="PDF extraction worker crashed",
+            )
+
         except Exception as e:
             logger.error(f"Failed to extract PDF {file_path}: {e}")
             return ExtractionResult(
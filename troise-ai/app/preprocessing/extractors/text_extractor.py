@@ -1,7 +1,7 @@
 """Text and code file extractor."""
 import logging
 from pathlib import Path
-from typing import List
+from typing import List, Optional
 
 from .interface import IContentExtractor, ExtractionResult
 
@@ -70,6 +70,11 @@ class TextExtractor:
     def supported_mimetypes(self) -> List[str]:
         return self.MIMETYPES
 
+    @property
+    def cache_version(self) -> Optional[str]:
+        """Not cached: decoding text is cheaper than a cache round-trip."""
+        return None
+
     async def extract(self, file_path: str, mimetype: str) -> ExtractionResult:
         """Extract text from file.
 
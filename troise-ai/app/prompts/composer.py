@@ -3,8 +3,9 @@
 Composes multi-layer prompts for agents and skills with profile and interface awareness.
 """
 import logging
+from collections import OrderedDict
 from datetime import date
-from typing import Optional, TYPE_CHECKING
+from typing import Any, Callable, Dict, List, Optional, Tuple, TYPE_CHECKING
 
 from .registry import PromptRegistry, prompt_registry
 
@@ -15,6 +16,16 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+# Prompt layouts
+LAYOUT_LEGACY = "legacy"
+LAYOUT_STABLE_PREFIX = "stable_prefix"
+
+# Placeholders left in the static prefix when dynamic content moves to the tail
+_USER_CONTEXT_REF = "See the User Context section at the end of this prompt."
+_DATE_REF = "see the Request Context section at the end of this prompt"
+_NO_PREFERENCES = "No specific user preferences."
+
+
 class PromptComposer:
     """Composes multi-layer prompts for agents and skills.
 
@@ -24,6 +35,15 @@ class PromptComposer:
     3. INTERFACE FORMATTING - Discord/Web/CLI/API rules
     4. USER PERSONALIZATION - User preferences (optional)
 
+    Layouts:
+    - legacy: Date header first, personalization substituted inline.
+    - stable_prefix: Strict order of immutable per-agent layers, then
+      per-user personalization, then per-request content (date). The
+      static prefix is byte-identical across users and days, so backends
+      with prefix caching (Ollama, SGLang, vLLM) reuse its KV cache. The
+      composed prefix is memoized per (agent, profile, interface, prompt
+      file version).
+
     Example:
         composer = PromptComposer(registry, config)
         prompt = composer.compose_agent_prompt(
@@ -38,16 +58,45 @@ class PromptComposer:
         self,
         registry: PromptRegistry = None,
         config: "Config" = None,
+        layout: Optional[str] = None,
+        prefix_cache_size: Optional[int] = None,
     ):
         """Initialize the prompt composer.
 
         Args:
             registry: PromptRegistry instance. Defaults to singleton.
-            config: Config instance for default profile.
+            config: Config instance for default profile and prompt layout.
+            layout: Explicit layout ('legacy' or 'stable_prefix').
+                Defaults to config.prompts.layout, else 'legacy'.
+            prefix_cache_size: Max memoized static prefixes.
+                Defaults to config.prompts.prefix_cache_size, else 256.
         """
         self._registry = registry or prompt_registry
         self._config = config
 
+        prompts_config = getattr(config, "prompts", None) if config else None
+        if layout is None:
+            layout = getattr(prompts_config, "layout", None)
+        if layout not in (LAYOUT_LEGACY, LAYOUT_STABLE_PREFIX):
+            layout = LAYOUT_LEGACY
+        self._layout = layout
+
+        if prefix_cache_size is None:
+            prefix_cache_size = getattr(prompts_config, "prefix_cache_size", None)
+        if not isinstance(prefix_cache_size, int) or prefix_cache_size <= 0:
+            prefix_cache_size = 256
+        self._prefix_cache_size = prefix_cache_size
+
+        # Static prefix memo: key -> (prefix, wants_personalization)
+        self._prefix_cache: "OrderedDict[Tuple, Tuple[str, bool]]" = OrderedDict()
+        self._prefix_hits = 0
+        self._prefix_misses = 0
+
+    @property
+    def layout(self) -> str:
+        """Active prompt layout ('legacy' or 'stable_prefix')."""
+        return self._layout
+
     def _get_profile(self, profile: Optional[str] = None) -> str:
         """Get profile name, falling back to config default.
 
@@ -65,6 +114,123 @@ class PromptComposer:
 
         return "balanced"
 
+    def _get_interface_context(self, interface: str, profile: str) -> str:
+        """Load the interface formatting layer, empty if missing."""
+        try:
+            return self._registry.get_prompt(
+                category="layers",
+                name=f"interface_{interface}",
+                profile=profile,
+            )
+        except FileNotFoundError:
+            logger.warning(f"Interface layer not found: {interface}, using empty")
+            return ""
+
+    def _load_agent_prompt(
+        self,
+        agent_name: str,
+        profile: str,
+        graph_domain: Optional[str],
+    ) -> str:
+        """Load the agent identity layer (with graph_domain support for nested variants)."""
+        try:
+            return self._registry.get_prompt(
+                category="agents",
+                name=agent_name,
+                profile=profile,
+                graph_domain=graph_domain,
+            )
+        except FileNotFoundError:
+            logger.error(
+                f"Agent prompt not found: {agent_name}, profile={profile}, "
+                f"graph_domain={graph_domain}"
+            )
+            raise
+
+    @staticmethod
+    def _substitute(template: str, template_vars: Dict[str, Any], source: str) -> str:
+        """Apply template substitution, falling back to partial replacement."""
+        try:
+            return template.format(**template_vars)
+        except (KeyError, IndexError, ValueError) as e:
+            logger.warning(f"Missing template variable in {source}: {e}")
+            composed = template
+            for key, value in template_vars.items():
+                composed = composed.replace(f"{{{key}}}", str(value))
+            return composed
+
+    @staticmethod
+    def _personalization(user_profile: Optional["UserProfile"]) -> str:
+        """Get the user's personalization context, or empty string."""
+        if user_profile:
+            return user_profile.get_personalization_context() or ""
+        return ""
+
+    def _get_static_prefix(
+        self,
+        key: Tuple,
+        template: Callable[[], str],
+        interface: str,
+        profile: str,
+        source: str,
+        format_vars: Dict[str, Any],
+        static_sections: Optional[List[str]] = None,
+    ) -> Tuple[str, bool]:
+        """Return the memoized static prefix for key, composing it on a miss.
+
+        Args:
+            key: Cache key (without prompt file version).
+            template: Callable returning the raw identity template.
+            interface: Interface type for the formatting layer.
+            profile: Effective profile.
+            source: Template name for log messages.
+            format_vars: Additional template variables (part of the key).
+            static_sections: Immutable sections appended after the template.
+
+        Returns:
+            Tuple of (static prefix, whether the template wants personalization).
+        """
+        full_key = key + (self._registry.version,)
+        cached = self._prefix_cache.get(full_key)
+        if cached is not None:
+            self._prefix_hits += 1
+            self._prefix_cache.move_to_end(full_key)
+            return cached
+
+        self._prefix_misses += 1
+        raw = template()
+        wants_personalization = "{personalization_context}" in raw
+
+        template_vars = {
+            "interface_context": self._get_interface_context(interface, profile),
+            "personalization_context": _USER_CONTEXT_REF,
+            "current_date": _DATE_REF,
+            **format_vars,
+        }
+        prefix = self._substitute(raw, template_vars, source)
+        for section in static_sections or ():
+            prefix += f"\n\n{section}"
+
+        entry = (prefix, wants_personalization)
+        self._prefix_cache[full_key] = entry
+        if len(self._prefix_cache) > self._prefix_cache_size:
+            self._prefix_cache.popitem(last=False)
+        return entry
+
+    def _append_dynamic_layers(
+        self,
+        prefix: str,
+        wants_personalization: bool,
+        user_profile: Optional["UserProfile"],
+    ) -> str:
+        """Append per-user then per-request layers after the static prefix."""
+        parts = [prefix]
+        if wants_personalization:
+            personalization = self._personalization(user_profile) or _NO_PREFERENCES
+            parts.append(f"## User Context\n{personalization}")
+        parts.append(f"## Request Context\nToday's date: {date.today().isoformat()}")
+        return "\n\n".join(parts)
+
     def compose_agent_prompt(
         self,
         agent_name: str,
@@ -100,61 +266,42 @@ class PromptComposer:
         """
         effective_profile = self._get_profile(profile)
 
-        # Layer 1: Agent identity (with graph_domain support for nested variants)
-        try:
-            agent_prompt = self._registry.get_prompt(
-                category="agents",
-                name=agent_name,
-                profile=effective_profile,
-                graph_domain=graph_domain,
-            )
-        except FileNotFoundError:
-            logger.error(
-                f"Agent prompt not found: {agent_name}, profile={effective_profile}, "
-                f"graph_domain={graph_domain}"
+        if self._layout == LAYOUT_STABLE_PREFIX:
+            key = (
+                "agent",
+                agent_name,
+                effective_profile,
+                interface,
+                graph_domain,
+                tuple(sorted((k, str(v)) for k, v in format_vars.items())),
             )
-            raise
-
-        # Layer 2: Interface formatting
-        try:
-            interface_context = self._registry.get_prompt(
-                category="layers",
-                name=f"interface_{interface}",
-                profile=effective_profile,
+            prefix, wants_personalization = self._get_static_prefix(
+                key,
+                lambda: self._load_agent_prompt(agent_name, effective_profile, graph_domain),
+                interface,
+                effective_profile,
+                f"{agent_name}.prompt",
+                format_vars,
             )
-        except FileNotFoundError:
-            logger.warning(f"Interface layer not found: {interface}, using empty")
-            interface_context = ""
-
-        # Layer 3: User personalization
-        personalization_context = ""
-        if user_profile:
-            personalization_context = user_profile.get_personalization_context()
-
-        # Build template variables
-        template_vars = {
-            "interface_context": interface_context,
-            "personalization_context": personalization_context or "No specific user preferences.",
-            "current_date": date.today().isoformat(),
-            **format_vars,
-        }
-
-        # Apply template substitution
-        try:
-            composed = agent_prompt.format(**template_vars)
-        except KeyError as e:
-            logger.error(f"Missing template variable in {agent_name}.prompt: {e}")
-            # Fall back to partial substitution
-            composed = agent_prompt
-            for key, value in template_vars.items():
-                composed = composed.replace(f"{{{key}}}", str(value))
-
-        # Prepend date context
-        composed = f"Today's date: {date.today().isoformat()}\n\n{composed}"
+            composed = self._append_dynamic_layers(prefix, wants_personalization, user_profile)
+        else:
+            agent_prompt = self._load_agent_prompt(agent_name, effective_profile, graph_domain)
+            template_vars = {
+                "interface_context": self._get_interface_context(interface, effective_profile),
+                "personalization_context": (
+                    self._personalization(user_profile) or _NO_PREFERENCES
+                ),
+                "current_date": date.today().isoformat(),
+                **format_vars,
+            }
+            composed = self._substitute(agent_prompt, template_vars, f"{agent_name}.prompt")
+
+            # Prepend date context
+            composed = f"Today's date: {date.today().isoformat()}\n\n{composed}"
 
         logger.debug(
             f"Composed agent prompt: agent={agent_name}, profile={effective_profile}, "
-            f"interface={interface}, length={len(composed)}"
+            f"interface={interface}, layout={self._layout}, length={len(composed)}"
         )
 
         return composed
@@ -165,6 +312,7 @@ class PromptComposer:
         interface: str,
         profile: Optional[str] = None,
         user_profile: Optional["UserProfile"] = None,
+        static_sections: Optional[List[str]] = None,
     ) -> str:
         """Compose skill prompt with interface and personalization layers.
 
@@ -176,49 +324,68 @@ class PromptComposer:
             interface: Interface type ('discord', 'web', 'cli', 'api')
             profile: Profile for interface layer variant
             user_profile: Optional user profile for personalization
+            static_sections: Immutable sections (references, guardrails) that
+                belong to the skill and are kept ahead of dynamic content.
 
         Returns:
             Complete skill system prompt with layers.
         """
         effective_profile = self._get_profile(profile)
 
-        # Get interface context
-        try:
-            interface_context = self._registry.get_prompt(
-                category="layers",
-                name=f"interface_{interface}",
-                profile=effective_profile,
+        if self._layout == LAYOUT_STABLE_PREFIX:
+            key = (
+                "skill",
+                skill_system_prompt,
+                effective_profile,
+                interface,
+                tuple(static_sections or ()),
             )
-        except FileNotFoundError:
-            interface_context = ""
-
-        # Get personalization
-        personalization_context = ""
-        if user_profile:
-            personalization_context = user_profile.get_personalization_context()
+            prefix, wants_personalization = self._get_static_prefix(
+                key,
+                lambda: skill_system_prompt,
+                interface,
+                effective_profile,
+                "skill prompt",
+                {},
+                static_sections,
+            )
+            return self._append_dynamic_layers(prefix, wants_personalization, user_profile)
 
-        # Template variables
         template_vars = {
-            "interface_context": interface_context,
-            "personalization_context": personalization_context or "No specific user preferences.",
+            "interface_context": self._get_interface_context(interface, effective_profile),
+            "personalization_context": self._personalization(user_profile) or _NO_PREFERENCES,
             "current_date": date.today().isoformat(),
         }
-
-        # Apply template substitution
-        try:
-            composed = skill_system_prompt.format(**template_vars)
-        except KeyError as e:
-            logger.debug(f"Missing template variable in skill prompt: {e}")
-            # Fall back to partial substitution
-            composed = skill_system_prompt
-            for key, value in template_vars.items():
-                composed = composed.replace(f"{{{key}}}", str(value))
+        composed = self._substitute(skill_system_prompt, template_vars, "skill prompt")
 
         # Prepend date context
         composed = f"Today's date: {date.today().isoformat()}\n\n{composed}"
 
+        for section in static_sections or ():
+            composed += f"\n\n{section}"
+
         return composed
 
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Get static prefix cache statistics.
+
+        Returns:
+            Dict with layout, size, max_size, hits, misses and hit_rate.
+        """
+        total = self._prefix_hits + self._prefix_misses
+        return {
+            "layout": self._layout,
+            "size": len(self._prefix_cache),
+            "max_size": self._prefix_cache_size,
+            "hits": self._prefix_hits,
+            "misses": self._prefix_misses,
+            "hit_rate": self._prefix_hits / total if total else 0.0,
+        }
+
+    def clear_cache(self) -> None:
+        """Drop all memoized static prefixes."""
+        self._prefix_cache.clear()
+
 
 # Factory function for container registration
 def create_prompt_composer(
@@ -44,6 +44,7 @@ class PromptRegistry:
 
         self._prompts_dir = prompts_dir
         self._cache: Dict[str, str] = {}
+        self._version = 0
         self._initialized = True
 
         logger.info(f"PromptRegistry initialized with prompts_dir: {prompts_dir}")
@@ -120,6 +121,15 @@ class PromptRegistry:
             f"Searched: {default_path}"
         )
 
+    @property
+    def version(self) -> int:
+        """Prompt file generation, bumped whenever the cache is cleared.
+
+        Consumers that memoize composed prompts include this in their
+        cache key so a reload invalidates them too.
+        """
+        return self._version
+
     def list_prompts(self, category: str) -> List[str]:
         """List available prompts in a category.
 
@@ -190,6 +200,7 @@ class PromptRegistry:
     def clear_cache(self):
         """Clear the prompt cache (for development/testing)."""
         self._cache.clear()
+        self._version += 1
         logger.info("Prompt cache cleared")
 
     def reload(self):
@@ -12,6 +12,17 @@ from .backend_manager import (
     VLLMClient,
     BackendManager,
 )
+from .concurrency_limiter import (
+    AdaptiveConcurrencyLimiter,
+    ConcurrencySettings,
+)
+from .image_scheduler import (
+    ImageGenerationScheduler,
+    ImageRequest,
+    ImageResult,
+    ImageResultCache,
+    create_image_scheduler,
+)
 from .profile_manager import (
     ProfileManager,
     ProfileManagerState,
@@ -24,6 +35,10 @@ from .vram_orchestrator import (
     VRAMOrchestrator,
     LoadedModel,
 )
+from .speculative_loader import (
+    SpeculativeModelLoader,
+    SpeculativeLoad,
+)
 from .embedding_service import (
     EmbeddingService,
     EmbeddingServiceError,
@@ -43,6 +58,7 @@ from .user_profile_service import (
     create_user_memory_adapter,
 )
 from .chunking_service import (
+    TokenChunkingService,
     LangChainChunkingService,
     ChunkingServiceError,
     create_chunking_service,
@@ -72,6 +88,14 @@ __all__ = [
     "SGLangClient",
     "VLLMClient",
     "BackendManager",
+    "AdaptiveConcurrencyLimiter",
+    "ConcurrencySettings",
+    # Image generation scheduling
+    "ImageGenerationScheduler",
+    "ImageRequest",
+    "ImageResult",
+    "ImageResultCache",
+    "create_image_scheduler",
     # Profile management
     "ProfileManager",
     "ProfileManagerState",
@@ -82,6 +106,8 @@ __all__ = [
     # VRAM orchestration
     "VRAMOrchestrator",
     "LoadedModel",
+    "SpeculativeModelLoader",
+    "SpeculativeLoad",
     # Embedding service
     "EmbeddingService",
     "EmbeddingServiceError",
@@ -98,6 +124,7 @@ __all__ = [
     "create_user_profile_service",
     "create_user_memory_adapter",
     # Chunking service (RAG)
+    "TokenChunkingService",
     "LangChainChunkingService",
     "ChunkingServiceError",
     "create_chunking_service",
@@ -10,18 +10,21 @@ Features:
 - Async HTTP communication with backends
 - SSH-based remote backend management on DGX
 - Health checking and model lifecycle management
+- Adaptive per-backend/per-model concurrency slots (AIMD)
 - Graceful error handling and logging
 """
 
 import asyncio
 import logging
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional, Any, TYPE_CHECKING
+from contextlib import asynccontextmanager
+from typing import AsyncContextManager, Dict, List, Optional, Any, Tuple, TYPE_CHECKING
 
 import aiohttp
 import asyncssh
 
 from app.core.config import Config, BackendConfig
+from .concurrency_limiter import AdaptiveConcurrencyLimiter, ConcurrencySettings, SlotLease
 
 if TYPE_CHECKING:
     from app.core.interfaces.services import IComfyUICompletionWaiter
@@ -679,37 +682,10 @@ class ComfyUIClient(IBackendClient):
         )
 
         try:
-            session = await self._get_session()
-
-            # Connect WebSocket FIRST to get client_id for event routing
-            # ComfyUI sends completion events only to the client that submitted the prompt
-            waiter = await self._get_completion_waiter()
-            client_id = waiter.client_id if waiter else None
-
-            # Build submission payload (include client_id if available)
-            payload = {"prompt": workflow}
-            if client_id:
-                payload["client_id"] = client_id
-
-            # Submit workflow
-            async with session.post(
-                f"{self._host}/prompt",
-                json=payload,
-                timeout=aiohttp.ClientTimeout(total=30)
-            ) as resp:
-                if resp.status != 200:
-                    error_text = await resp.text()
-                    logger.error(f"ComfyUI: Prompt submission failed: {resp.status} - {error_text}")
-                    return None
-                result = await resp.json()
-                prompt_id = result.get("prompt_id")
-
+            prompt_id = await self._submit_workflow(workflow)
             if not prompt_id:
-                logger.error("ComfyUI: No prompt_id returned")
                 return None
 
-            logger.info(f"ComfyUI: Submitted workflow, prompt_id={prompt_id}, client_id={client_id}")
-
             # Wait for completion via WebSocket (client_id already connected)
             image_data = await self._wait_for_completion(prompt_id)
             return image_data
@@ -718,6 +694,206 @@ class ComfyUIClient(IBackendClient):
             logger.error(f"ComfyUI: Image generation failed: {e}", exc_info=True)
             return None
 
+    async def generate_image_batch(
+        self,
+        items: List[Dict[str, Any]],
+        workflow_config: Optional[Dict[str, Any]] = None,
+    ) -> List[Optional[bytes]]:
+        """
+        Generate several images with a single ComfyUI workflow submission.
+
+        Each item gets its own encode/sample/decode/save branch with its own
+        seed, sharing the model loader nodes. ComfyUI loads the models once
+        and runs the branches back to back, and the batch needs a single
+        completion wait and history fetch. Results match per-item
+        generate_image() calls with the same seed.
+
+        Args:
+            items: Per-image kwargs of generate_image() (prompt, width,
+                height, steps, guidance, seed).
+            workflow_config: Model-specific workflow settings from profile.
+
+        Returns:
+            Image bytes (or None on failure) per item, in input order.
+        """
+        if not items:
+            return []
+
+        workflow, output_nodes = self._build_batch_workflow(items, workflow_config or {})
+
+        try:
+            prompt_id = await self._submit_workflow(workflow)
+            if not prompt_id:
+                return [None] * len(items)
+
+            images = await self._wait_for_batch_outputs(prompt_id, output_nodes)
+            return [images.get(node_id) for node_id in output_nodes]
+
+        except Exception as e:
+            logger.error(f"ComfyUI: Batch image generation failed: {e}", exc_info=True)
+            return [None] * len(items)
+
+    async def _submit_workflow(self, workflow: Dict[str, Any]) -> Optional[str]:
+        """
+        Submit a workflow to ComfyUI.
+
+        Args:
+            workflow: ComfyUI workflow dictionary.
+
+        Returns:
+            prompt_id on success, None if submission failed.
+        """
+        session = await self._get_session()
+
+        # Connect WebSocket FIRST to get client_id for event routing
+        # ComfyUI sends completion events only to the client that submitted the prompt
+        waiter = await self._get_completion_waiter()
+        client_id = waiter.client_id if waiter else None
+
+        # Build submission payload (include client_id if available)
+        payload = {"prompt": workflow}
+        if client_id:
+            payload["client_id"] = client_id
+
+        async with session.post(
+            f"{self._host}/prompt",
+            json=payload,
+            timeout=aiohttp.ClientTimeout(total=30)
+        ) as resp:
+            if resp.status != 200:
+                error_text = await resp.text()
+                logger.error(f"ComfyUI: Prompt submission failed: {resp.status} - {error_text}")
+                return None
+            result = await resp.json()
+            prompt_id = result.get("prompt_id")
+
+        if not prompt_id:
+            logger.error("ComfyUI: No prompt_id returned")
+            return None
+
+        logger.info(f"ComfyUI: Submitted workflow, prompt_id={prompt_id}, client_id={client_id}")
+        return prompt_id
+
+    def _build_batch_workflow(
+        self,
+        items: List[Dict[str, Any]],
+        config: Dict[str, Any],
+    ) -> Tuple[Dict[str, Any], List[str]]:
+        """
+        Merge per-item workflows into one, sharing the loader nodes.
+
+        Args:
+            items: Per-image generation kwargs.
+            config: Workflow configuration from profile.
+
+        Returns:
+            Tuple of (workflow, SaveImage node id per item).
+        """
+        import random
+
+        shared_nodes = {"1", "2", "3"}  # UNETLoader, CLIPLoader, VAELoader
+        workflow: Dict[str, Any] = {}
+        output_nodes: List[str] = []
+
+        for index, item in enumerate(items):
+            seed = item.get("seed")
+            single = self._build_workflow(
+                prompt=item["prompt"],
+                width=item.get("width", 1024),
+                height=item.get("height", 1024),
+                steps=item.get("steps", 28),
+                guidance=item.get("guidance", 4.0),
+                seed=seed if seed is not None else random.randint(0, 2**32 - 1),
+                config=config,
+            )
+            prefix = f"b{index}_"
+
+            for node_id, node in single.items():
+                if node_id in shared_nodes:
+                    workflow.setdefault(node_id, node)
+                    continue
+
+                inputs = {}
+                for name, value in node["inputs"].items():
+                    # Re-point links to this item's branch ([node_id, output_index])
+                    if isinstance(value, list) and len(value) == 2 and value[0] not in shared_nodes:
+                        value = [prefix + value[0], value[1]]
+                    inputs[name] = value
+
+                if node["class_type"] == "SaveImage":
+                    inputs["filename_prefix"] = f"troise_{prefix.rstrip('_')}"
+                    output_nodes.append(prefix + node_id)
+
+                workflow[prefix + node_id] = {"class_type": node["class_type"], "inputs": inputs}
+
+        return workflow, output_nodes
+
+    async def _wait_for_batch_outputs(
+        self,
+        prompt_id: str,
+        output_nodes: List[str],
+    ) -> Dict[str, bytes]:
+        """Wait for a batch workflow and fetch the image of each output node.
+
+        Args:
+            prompt_id: The ComfyUI prompt ID to wait for.
+            output_nodes: SaveImage node ids to collect.
+
+        Returns:
+            Mapping of node id to image bytes (missing nodes failed).
+        """
+        ws_confirmed = False
+        waiter = await self._get_completion_waiter()
+        if waiter is not None:
+            try:
+                if not await waiter.wait_for_completion(prompt_id, self.WORKFLOW_TIMEOUT_SECONDS):
+                    logger.warning(f"ComfyUI: WebSocket reported failure for prompt {prompt_id}")
+                    return {}
+                ws_confirmed = True
+            except Exception as e:
+                logger.warning(f"ComfyUI: WebSocket completion failed: {e}")
+
+        # After a WebSocket completion only the history race needs retries
+        if ws_confirmed:
+            timeout, delay = self.HISTORY_POLL_RETRIES * self.HISTORY_POLL_DELAY, self.HISTORY_POLL_DELAY
+        else:
+            timeout, delay = self.WORKFLOW_TIMEOUT_SECONDS, 1.0
+
+        session = await self._get_session()
+        loop = asyncio.get_event_loop()
+        start_time = loop.time()
+
+        while True:
+            try:
+                async with session.get(f"{self._host}/history/{prompt_id}") as resp:
+                    history = await resp.json() if resp.status == 200 else {}
+
+                outputs = history.get(prompt_id, {}).get("outputs", {})
+                ready = {
+                    node_id: outputs[node_id]["images"][0]
+                    for node_id in output_nodes
+                    if outputs.get(node_id, {}).get("images")
+                }
+                if len(ready) == len(output_nodes):
+                    images = await asyncio.gather(*(
+                        self._fetch_image(info["filename"], info.get("subfolder", ""))
+                        for info in ready.values()
+                    ))
+                    logger.info(f"ComfyUI: Batch of {len(output_nodes)} images ready")
+                    return {
+                        node_id: image
+                        for node_id, image in zip(ready.keys(), images)
+                        if image is not None
+                    }
+
+            except Exception as e:
+                logger.warning(f"ComfyUI: Error polling batch history: {e}")
+
+            if loop.time() - start_time >= timeout:
+                logger.error(f"ComfyUI: Timeout waiting for batch prompt {prompt_id}")
+                return {}
+            await asyncio.sleep(delay)
+
     def _build_workflow(
         self,
         prompt: str,
@@ -1239,6 +1415,7 @@ class BackendManager:
     - Health checking across all backends
     - Model lifecycle management (load/unload)
     - Aggregated model listing
+    - Per-backend/per-model concurrency slots sized from BackendConfig.options
     """
 
     def __init__(self, config: Config):
@@ -1252,6 +1429,7 @@ class BackendManager:
         self.config = config
         self._clients: Dict[str, IBackendClient] = {}
         self._ssh_conn: Optional[asyncssh.SSHClientConnection] = None
+        self._limiters: Dict[str, AdaptiveConcurrencyLimiter] = {}
 
         self._init_clients()
 
@@ -1589,3 +1767,80 @@ class BackendManager:
             The backend client, or None if not found.
         """
         return self._clients.get(backend_name)
+
+    # ========== Concurrency Slots ==========
+
+    def get_limiter(self, model_id: str) -> Optional[AdaptiveConcurrencyLimiter]:
+        """
+        Get (or create) the concurrency limiter for a model.
+
+        Limiters are keyed by backend type, host and model. Settings come from
+        the top-level backend options of the same type, overridden by the
+        profile's BackendConfig.options for the model.
+
+        Args:
+            model_id: The model identifier.
+
+        Returns:
+            The model's limiter, or None if no backend is configured for it.
+        """
+        backend_config = self.config.get_backend_for_model(model_id)
+        if not backend_config:
+            return None
+
+        key = f"{backend_config.type}:{backend_config.host}:{model_id}"
+        limiter = self._limiters.get(key)
+        if limiter is None:
+            options: Dict[str, Any] = {}
+            for config in self.config.backends.values():
+                if config.type == backend_config.type:
+                    options.update(config.options or {})
+                    break
+            options.update(backend_config.options or {})
+
+            settings = ConcurrencySettings.from_options(options, backend_config.type)
+            limiter = AdaptiveConcurrencyLimiter(f"{backend_config.type}:{model_id}", settings)
+            self._limiters[key] = limiter
+            logger.info(
+                f"Concurrency limiter for {limiter.name}: limit={limiter.limit}, "
+                f"max={settings.max_concurrency}"
+            )
+        return limiter
+
+    def model_slot(self, model_id: str) -> AsyncContextManager[Optional[SlotLease]]:
+        """
+        Hold a generation slot for a model.
+
+        Callers (model streams, sub-agents, graph branches) wrap one
+        generation in this context manager so concurrent work on a backend
+        never exceeds its adaptive limit.
+
+        Args:
+            model_id: The model identifier.
+
+        Returns:
+            Async context manager yielding a SlotLease (None if unlimited).
+
+        Example:
+            async with backend_manager.model_slot("gpt-oss:20b") as lease:
+                ...
+        """
+        limiter = self.get_limiter(model_id)
+        if limiter is None:
+            return _no_slot()
+        return limiter.slot()
+
+    def get_concurrency_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get concurrency limiter stats for all models seen so far.
+
+        Returns:
+            Dictionary mapping limiter name (backend:model) to its stats.
+        """
+        return {limiter.name: limiter.get_stats() for limiter in self._limiters.values()}
+
+
+@asynccontextmanager
+async def _no_slot():
+    """Null slot for models without a configured backend."""
+    yield None
@@ -18,7 +18,6 @@ Architecture:
 """
 
 import logging
-import math
 import re
 from collections import Counter
 from dataclasses import dataclass, field
@@ -26,12 +25,14 @@ from datetime import datetime
 from typing import Any, Dict, List, Optional, Tuple
 
 from app.core.interfaces import IBrainService, IVaultService, IEmbeddingService
+from .chunking_service import run_in_chunking_pool
 from app.adapters.dynamodb import (
     DynamoDBClient,
     TroiseBrainAdapter,
     NoteMetaItem,
     NoteChunkItem,
 )
+from app.adapters.dynamodb.embedding_codec import Vector, cosine_similarities
 
 logger = logging.getLogger(__name__)
 
@@ -265,14 +266,12 @@ class BrainService:
             logger.warning("No chunks with embeddings found in brain index")
             return []
 
-        # Calculate similarities
+        # Calculate similarities (one matrix product over all chunks)
+        similarities = cosine_similarities(
+            query_embedding, [chunk.embedding for chunk, _ in chunks_with_meta]
+        )
         scored_results = []
-        for chunk, meta in chunks_with_meta:
-            if not chunk.embedding:
-                continue
-
-            similarity = self._cosine_similarity(query_embedding, chunk.embedding)
-
+        for (chunk, meta), similarity in zip(chunks_with_meta, similarities.tolist()):
             if similarity >= min_score:
                 scored_results.append(SearchResult(
                     path=chunk.path,
@@ -533,8 +532,8 @@ class BrainService:
         if isinstance(aliases, str):
             aliases = [a.strip() for a in aliases.split(",")]
 
-        # Generate embeddings for chunks
-        chunks = self._brain._chunk_content(content_without_front, path)
+        # Generate embeddings for chunks (chunked off the event loop)
+        chunks = await run_in_chunking_pool(self._brain._chunk_content, content_without_front, path)
         chunk_texts = [c.text for c in chunks]
         embeddings = await self._embedding.embed_batch(chunk_texts) if chunk_texts else []
 
@@ -681,19 +680,9 @@ class BrainService:
 
         return [w for w in words if w not in stop_words]
 
-    def _cosine_similarity(self, v1: List[float], v2: List[float]) -> float:
+    def _cosine_similarity(self, v1: Vector, v2: Vector) -> float:
         """Calculate cosine similarity between two vectors."""
-        if len(v1) != len(v2):
-            return 0.0
-
-        dot_product = sum(a * b for a, b in zip(v1, v2))
-        norm1 = math.sqrt(sum(a * a for a in v1))
-        norm2 = math.sqrt(sum(b * b for b in v2))
-
-        if norm1 == 0 or norm2 == 0:
-            return 0.0
-
-        return dot_product / (norm1 * norm2)
+        return float(cosine_similarities(v1, [v2])[0])
 
     def _generate_snippet(
         self,
@@ -1,27 +1,199 @@
-"""Text chunking service using LangChain with tiktoken for token counting."""
-import uuid
+"""Token-offset text chunking with tiktoken.
+
+The document is tokenized once. Chunks are cut on token offsets, and each
+cut is pulled back to the nearest separator ("\\n\\n", then "\\n", ". ", " ")
+within the last part of the chunk, so chunks end on paragraph or sentence
+boundaries when possible. Token counts come from the offsets, with no
+re-encoding of chunks.
+
+Large inputs are chunked on a shared thread pool: tiktoken releases the
+GIL while encoding, and the remaining work is a few C-level passes, so the
+event loop stays responsive while vaults or long pages are indexed. The
+first call per encoding also runs there, whatever its size, because it
+builds the vocabulary byte-length table.
+"""
+import asyncio
+import bisect
+import itertools
 import logging
-from typing import List, Optional
+import os
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple, TypeVar
 
 import tiktoken
-from langchain_text_splitters import RecursiveCharacterTextSplitter
 
 from app.core.interfaces import TextChunk, IChunkingService
 from app.core.config import RAGConfig
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# Texts at least this long are chunked on the worker pool
+OFFLOAD_MIN_CHARS = 20_000
+
+# Fraction of a chunk (from its end) searched for a separator to cut at
+BOUNDARY_LOOKBACK = 0.25
+
+# Shared across service instances (one pool per process)
+_pool: Optional[ThreadPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+# Per-encoding table of token id -> byte length
+_token_lengths: Dict[str, List[int]] = {}
+_token_lengths_lock = threading.Lock()
+
+
+def _get_pool() -> ThreadPoolExecutor:
+    """Get the shared chunking pool, creating it on first use."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ThreadPoolExecutor(
+                max_workers=os.cpu_count() or 1, thread_name_prefix="chunker"
+            )
+    return _pool
+
+
+async def run_in_chunking_pool(func: Callable[..., T], *args) -> T:
+    """Run CPU-bound text processing on the shared chunking pool."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_pool(), func, *args)
+
+
+def shutdown_chunking_pool() -> None:
+    """Stop the shared chunking pool (called on application shutdown)."""
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=False, cancel_futures=True)
+            _pool = None
+
+
+def _get_token_lengths(tokenizer: tiktoken.Encoding) -> List[int]:
+    """Byte length of every token in the vocabulary (built once per encoding).
+
+    Building walks the whole vocabulary, so callers on the event loop
+    check has_token_lengths() and build on the chunking pool instead.
+    """
+    lengths = _token_lengths.get(tokenizer.name)
+    if lengths is None:
+        with _token_lengths_lock:
+            lengths = _token_lengths.get(tokenizer.name)
+            if lengths is None:
+                lengths = []
+                for token in range(tokenizer.n_vocab):
+                    try:
+                        lengths.append(len(tokenizer.decode_single_token_bytes(token)))
+                    except KeyError:
+                        lengths.append(0)  # Unused id (specials never occur in ordinary text)
+                _token_lengths[tokenizer.name] = lengths
+    return lengths
+
+
+def has_token_lengths(tokenizer: tiktoken.Encoding) -> bool:
+    """Whether the byte-length table for this encoding is already built."""
+    return tokenizer.name in _token_lengths
+
+
+def split_token_spans(
+    tokenizer: tiktoken.Encoding,
+    text: str,
+    chunk_size: int,
+    chunk_overlap: int,
+    separators: List[str],
+) -> List[Tuple[int, int, int]]:
+    """Split text into chunks on token offsets.
+
+    Args:
+        tokenizer: tiktoken encoding.
+        text: Text to split.
+        chunk_size: Maximum tokens per chunk.
+        chunk_overlap: Tokens repeated at the start of the next chunk.
+        separators: Preferred cut points, highest priority first.
+
+    Returns:
+        (start_char, end_char, token_count) per chunk, in order.
+    """
+    tokens = tokenizer.encode_ordinary(text)
+    if not tokens:
+        return []
+
+    data = text.encode("utf-8")
+    lengths = _get_token_lengths(tokenizer)
+    # byte_offsets[i] = byte where token i starts; byte_offsets[-1] = len(data)
+    byte_offsets = list(itertools.accumulate(map(lengths.__getitem__, tokens), initial=0))
+    n = len(tokens)
+    lookback = max(1, int(chunk_size * BOUNDARY_LOOKBACK))
+    separator_bytes = [s.encode("utf-8") for s in separators if s]
+
+    spans = []
+    start = 0
+    while start < n:
+        end = min(start + chunk_size, n)
+
+        if end < n:
+            # Pull the cut back to the last separator near the end of the chunk
+            window_start = max(start + 1, end - lookback)
+            lo, hi = byte_offsets[window_start], byte_offsets[end]
+            for separator in separator_bytes:
+                found = data.rfind(separator, lo, hi)
+                if found != -1:
+                    cut = bisect.bisect_right(byte_offsets, found + len(separator), window_start, end + 1) - 1
+                    if cut > start:
+                        end = cut
+                        break
+
+        spans.append((start, end))
+        if end >= n:
+            break
+        start = max(end - chunk_overlap, start + 1)
+
+    return _spans_to_chars(data, text, byte_offsets, spans)
+
+
+def _spans_to_chars(
+    data: bytes,
+    text: str,
+    byte_offsets: List[int],
+    spans: List[Tuple[int, int]],
+) -> List[Tuple[int, int, int]]:
+    """Convert token spans to character offsets."""
+    ascii_only = len(data) == len(text)
+    boundaries = sorted({byte_offsets[i] for span in spans for i in span})
+    char_at = {}
+    previous_byte = previous_char = 0
+    for b in boundaries:
+        if ascii_only:
+            char_at[b] = b
+            continue
+        # Tokens can split a multi-byte character: move to its first byte
+        snapped = b
+        while snapped < len(data) and (data[snapped] & 0xC0) == 0x80:
+            snapped += 1
+        previous_char += len(data[previous_byte:snapped].decode("utf-8"))
+        previous_byte = snapped
+        char_at[b] = previous_char
+
+    return [
+        (char_at[byte_offsets[start]], char_at[byte_offsets[end]], end - start)
+        for start, end in spans
+    ]
+
 
 class ChunkingServiceError(Exception):
     """Error during text chunking."""
     pass
 
 
-class LangChainChunkingService:
-    """Chunking service using LangChain's RecursiveCharacterTextSplitter.
+class TokenChunkingService:
+    """Chunking service cutting text on tiktoken token offsets.
 
     Implements IChunkingService following Single Responsibility Principle.
-    Uses tiktoken for accurate token counting.
+    Tokenizes each document once; chunk sizes and token counts are exact
+    with respect to that tokenization.
 
     All parameters are configurable via RAGConfig.
     """
@@ -33,7 +205,7 @@ class LangChainChunkingService:
         encoding: str = "cl100k_base",
         separators: Optional[List[str]] = None,
     ):
-        """Initialize chunking service with LangChain splitter.
+        """Initialize chunking service.
 
         Args:
             chunk_size: Target tokens per chunk
@@ -46,7 +218,7 @@ class LangChainChunkingService:
         self.encoding = encoding
         self.separators = separators or ["\n\n", "\n", ". ", " ", ""]
 
-        # Initialize tiktoken encoder for token counting
+        # Initialize tiktoken encoder
         try:
             self.tokenizer = tiktoken.get_encoding(encoding)
         except Exception as e:
@@ -54,29 +226,20 @@ class LangChainChunkingService:
             self.tokenizer = tiktoken.get_encoding("cl100k_base")
             self.encoding = "cl100k_base"
 
-        # Create LangChain text splitter with tiktoken
-        self.text_splitter = RecursiveCharacterTextSplitter.from_tiktoken_encoder(
-            encoding_name=self.encoding,
-            chunk_size=self.chunk_size,
-            chunk_overlap=self.chunk_overlap,
-            separators=self.separators,
-            keep_separator=True  # Keep separators for context
-        )
-
         logger.info(
-            f"LangChainChunkingService initialized "
+            f"TokenChunkingService initialized "
             f"(chunk_size={self.chunk_size}, overlap={self.chunk_overlap}, encoding={self.encoding})"
         )
 
     @classmethod
-    def from_config(cls, config: RAGConfig) -> "LangChainChunkingService":
+    def from_config(cls, config: RAGConfig) -> "TokenChunkingService":
         """Create chunking service from RAGConfig.
 
         Args:
             config: RAGConfig instance
 
         Returns:
-            Configured LangChainChunkingService
+            Configured TokenChunkingService
         """
         return cls(
             chunk_size=config.chunk_size,
@@ -92,7 +255,7 @@ class LangChainChunkingService:
         chunk_size: Optional[int] = None,
         chunk_overlap: Optional[int] = None
     ) -> List[TextChunk]:
-        """Split text into overlapping chunks using LangChain.
+        """Split text into overlapping chunks.
 
         Args:
             text: The text content to chunk
@@ -112,45 +275,33 @@ class LangChainChunkingService:
         if not source_url:
             raise ValueError("Source URL is required")
 
-        # Use custom splitter if parameters differ from defaults
-        if chunk_size is not None or chunk_overlap is not None:
-            custom_splitter = RecursiveCharacterTextSplitter.from_tiktoken_encoder(
-                encoding_name=self.encoding,
-                chunk_size=chunk_size if chunk_size is not None else self.chunk_size,
-                chunk_overlap=chunk_overlap if chunk_overlap is not None else self.chunk_overlap,
-                separators=self.separators,
-                keep_separator=True
+        size = chunk_size if chunk_size is not None else self.chunk_size
+        overlap = chunk_overlap if chunk_overlap is not None else self.chunk_overlap
+        if size <= 0 or not 0 <= overlap < size:
+            raise ValueError(
+                f"Invalid chunk parameters: chunk_size={size}, chunk_overlap={overlap}"
             )
-            splits = custom_splitter.split_text(text)
-        else:
-            splits = self.text_splitter.split_text(text)
-
-        # Create TextChunk objects with metadata
-        chunks = []
-        current_pos = 0
-
-        for idx, chunk_text in enumerate(splits):
-            # Find actual position in original text
-            start_char = text.find(chunk_text, current_pos)
-            if start_char == -1:
-                # Fallback: use current position (may happen with overlaps)
-                start_char = current_pos
-            end_char = start_char + len(chunk_text)
-            current_pos = end_char
 
-            # Count tokens for this chunk
-            token_count = len(self.tokenizer.encode(chunk_text))
+        args = (self.tokenizer, text, size, overlap, self.separators)
+        if len(text) >= OFFLOAD_MIN_CHARS or not has_token_lengths(self.tokenizer):
+            spans = await run_in_chunking_pool(split_token_spans, *args)
+        else:
+            spans = split_token_spans(*args)
 
-            chunk = TextChunk(
+        chunks = [
+            TextChunk(
                 chunk_id=str(uuid.uuid4()),
-                text=chunk_text,
+                text=text[start_char:end_char],
                 chunk_index=idx,
                 token_count=token_count,
                 source_url=source_url,
                 start_char=start_char,
                 end_char=end_char
             )
-            chunks.append(chunk)
+            for idx, (start_char, end_char, token_count) in enumerate(
+                span for span in spans if span[1] > span[0]
+            )
+        ]
 
         total_tokens = sum(c.token_count for c in chunks)
         logger.debug(
@@ -169,16 +320,20 @@ class LangChainChunkingService:
         Returns:
             Token count
         """
-        return len(self.tokenizer.encode(text))
+        return len(self.tokenizer.encode_ordinary(text))
+
+
+# Previous name, kept for existing imports
+LangChainChunkingService = TokenChunkingService
 
 
-def create_chunking_service(config: RAGConfig) -> LangChainChunkingService:
+def create_chunking_service(config: RAGConfig) -> TokenChunkingService:
     """Factory function to create chunking service from config.
 
     Args:
         config: RAGConfig instance
 
     Returns:
-        Configured LangChainChunkingService
+        Configured TokenChunkingService
     """
-    return LangChainChunkingService.from_config(config)
+    return TokenChunkingService.from_config(config)
@@ -0,0 +1,260 @@
+"""Adaptive per-backend/per-model concurrency limits for TROISE AI.
+
+Each inference backend has a real parallel capacity (Ollama NUM_PARALLEL,
+SGLang/vLLM batch slots). Exceeding it queues requests inside the backend,
+thrashes the KV cache and pushes long generations into timeouts. The
+AdaptiveConcurrencyLimiter gates generations with an AIMD limit:
+
+- Additive increase: +1/limit per healthy generation while saturated
+  (about +1 slot per full window of requests)
+- Multiplicative decrease: limit *= backoff_factor when time-to-first-token
+  exceeds the target (or latency_tolerance x the observed average), or the
+  backend times out / refuses connections. At most once per window.
+
+Limits are configured from BackendConfig.options:
+
+    options:
+      max_concurrency: 4          # Hard cap (e.g., OLLAMA_NUM_PARALLEL)
+      min_concurrency: 1
+      initial_concurrency: 2      # Defaults to max_concurrency
+      target_latency_seconds: 5   # TTFT target (optional)
+"""
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# Default hard caps when a backend doesn't configure max_concurrency
+DEFAULT_MAX_CONCURRENCY = {
+    "ollama": 4,     # Ollama's default NUM_PARALLEL
+    "sglang": 32,    # Continuous batching
+    "vllm": 32,
+    "comfyui": 1,    # Image generation is serialized on the GPU
+    "diffusion": 1,
+}
+
+# Errors that indicate the backend is overloaded (vs. request bugs)
+OVERLOAD_ERRORS = (asyncio.TimeoutError, TimeoutError, ConnectionError)
+
+EWMA_ALPHA = 0.2
+MIN_SAMPLES_FOR_BASELINE = 5
+# Ignore baseline deviations smaller than this (scheduling noise, not load)
+MIN_LATENCY_DELTA_SECONDS = 0.05
+
+
+@dataclass
+class ConcurrencySettings:
+    """Concurrency settings for one backend/model limiter."""
+    max_concurrency: int
+    min_concurrency: int = 1
+    initial_concurrency: Optional[int] = None
+    target_latency_seconds: Optional[float] = None
+    latency_tolerance: float = 2.0
+    backoff_factor: float = 0.5
+
+    @classmethod
+    def from_options(cls, options: Dict[str, Any], backend_type: str) -> "ConcurrencySettings":
+        """Create settings from BackendConfig.options.
+
+        Args:
+            options: Backend options (unrelated keys are ignored).
+            backend_type: Backend type for the default hard cap.
+
+        Returns:
+            ConcurrencySettings with defaults filled in.
+        """
+        options = options or {}
+        max_concurrency = options.get(
+            "max_concurrency",
+            options.get("num_parallel", DEFAULT_MAX_CONCURRENCY.get(backend_type.lower(), 4)),
+        )
+        max_concurrency = max(1, int(max_concurrency))
+        min_concurrency = max(1, min(int(options.get("min_concurrency", 1)), max_concurrency))
+        initial = options.get("initial_concurrency")
+        target = options.get("target_latency_seconds")
+
+        return cls(
+            max_concurrency=max_concurrency,
+            min_concurrency=min_concurrency,
+            initial_concurrency=int(initial) if initial is not None else None,
+            target_latency_seconds=float(target) if target is not None else None,
+            latency_tolerance=float(options.get("latency_tolerance", 2.0)),
+            backoff_factor=float(options.get("backoff_factor", 0.5)),
+        )
+
+
+class SlotLease:
+    """A held concurrency slot.
+
+    Generators call mark_first_token() when the first chunk arrives so the
+    limiter adapts on time-to-first-token (queueing + prefill) rather than
+    total generation time, which mostly reflects output length.
+    """
+
+    def __init__(self, saturated: bool):
+        self.acquired_at = time.monotonic()
+        self.first_token_at: Optional[float] = None
+        self.saturated = saturated
+
+    def mark_first_token(self) -> None:
+        """Record arrival of the first generated chunk (idempotent)."""
+        if self.first_token_at is None:
+            self.first_token_at = time.monotonic()
+
+    @property
+    def latency(self) -> float:
+        """Time-to-first-token if marked, else time held so far."""
+        end = self.first_token_at if self.first_token_at is not None else time.monotonic()
+        return end - self.acquired_at
+
+
+class AdaptiveConcurrencyLimiter:
+    """AIMD-adapted semaphore for one backend/model.
+
+    Example:
+        limiter = AdaptiveConcurrencyLimiter("ollama:gpt-oss:20b", settings)
+        async with limiter.slot() as lease:
+            async for chunk in backend.stream(...):
+                lease.mark_first_token()
+    """
+
+    def __init__(self, name: str, settings: ConcurrencySettings):
+        """Initialize the limiter.
+
+        Args:
+            name: Identifier for logging and stats (backend:model).
+            settings: Concurrency bounds and adaptation parameters.
+        """
+        self.name = name
+        self._settings = settings
+        initial = settings.initial_concurrency or settings.max_concurrency
+        self._limit = float(min(max(initial, settings.min_concurrency), settings.max_concurrency))
+        self._in_flight = 0
+        self._waiting = 0
+        self._cond = asyncio.Condition()
+        self._latency_ewma: Optional[float] = None
+        self._samples = 0
+        self._last_decrease = 0.0
+
+        # Stats
+        self._acquired = 0
+        self._wait_total = 0.0
+        self._increases = 0
+        self._decreases = 0
+        self._overload_errors = 0
+
+    @property
+    def limit(self) -> int:
+        """Current effective concurrency limit."""
+        return max(self._settings.min_concurrency, int(self._limit))
+
+    @property
+    def in_flight(self) -> int:
+        """Number of slots currently held."""
+        return self._in_flight
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[SlotLease]:
+        """Hold a slot for one generation.
+
+        Waits while the limit is reached. Outcome and latency of the
+        generation feed back into the limit when the slot is released.
+
+        Yields:
+            SlotLease for reporting time-to-first-token.
+        """
+        wait_start = time.monotonic()
+        async with self._cond:
+            self._waiting += 1
+            try:
+                await self._cond.wait_for(lambda: self._in_flight < self.limit)
+            finally:
+                self._waiting -= 1
+            self._in_flight += 1
+            saturated = self._in_flight >= self.limit
+
+        self._acquired += 1
+        self._wait_total += time.monotonic() - wait_start
+        lease = SlotLease(saturated=saturated)
+        outcome = "ok"
+        try:
+            yield lease
+        except OVERLOAD_ERRORS:
+            outcome = "overloaded"
+            raise
+        except BaseException:
+            # Cancellations and request errors say nothing about backend load
+            outcome = "neutral"
+            raise
+        finally:
+            async with self._cond:
+                self._in_flight -= 1
+                if outcome != "neutral":
+                    self._adapt(lease, overloaded_error=outcome == "overloaded")
+                self._cond.notify_all()
+
+    def _adapt(self, lease: SlotLease, overloaded_error: bool) -> None:
+        """Apply AIMD to the limit from one completed generation."""
+        settings = self._settings
+        latency = lease.latency
+
+        if overloaded_error:
+            self._overload_errors += 1
+            slow = True
+        elif settings.target_latency_seconds is not None:
+            slow = latency > settings.target_latency_seconds
+        else:
+            slow = (
+                self._samples >= MIN_SAMPLES_FOR_BASELINE
+                and latency > settings.latency_tolerance * self._latency_ewma
+                and latency - self._latency_ewma > MIN_LATENCY_DELTA_SECONDS
+            )
+
+        if not overloaded_error:
+            self._samples += 1
+            if self._latency_ewma is None:
+                self._latency_ewma = latency
+            else:
+                self._latency_ewma += EWMA_ALPHA * (latency - self._latency_ewma)
+
+        if slow:
+            # Once per window: ignore slow results from slots acquired before
+            # the last decrease - they ran under the old, higher limit
+            if lease.acquired_at >= self._last_decrease:
+                previous = self.limit
+                self._limit = max(
+                    float(settings.min_concurrency), self._limit * settings.backoff_factor
+                )
+                self._last_decrease = time.monotonic()
+                self._decreases += 1
+                logger.info(
+                    f"Concurrency limit for {self.name}: {previous} -> {self.limit} "
+                    f"(latency={latency:.2f}s, error={overloaded_error})"
+                )
+        elif lease.saturated and self._limit < settings.max_concurrency:
+            previous = self.limit
+            self._limit = min(
+                float(settings.max_concurrency), self._limit + 1.0 / self._limit
+            )
+            if self.limit > previous:
+                self._increases += 1
+                logger.debug(f"Concurrency limit for {self.name}: {previous} -> {self.limit}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get limiter state and statistics."""
+        return {
+            "limit": self.limit,
+            "max_concurrency": self._settings.max_concurrency,
+            "in_flight": self._in_flight,
+            "waiting": self._waiting,
+            "acquired": self._acquired,
+            "avg_wait_ms": round(self._wait_total / self._acquired * 1000, 1) if self._acquired else 0.0,
+            "latency_ewma_ms": round(self._latency_ewma * 1000, 1) if self._latency_ewma else None,
+            "increases": self._increases,
+            "decreases": self._decreases,
+            "overload_errors": self._overload_errors,
+        }
@@ -21,6 +21,7 @@ import aiohttp
 
 from app.core.interfaces import IEmbeddingService
 from app.adapters.dynamodb import DynamoDBClient, TroiseVectorsAdapter
+from app.adapters.dynamodb.embedding_codec import DEFAULT_PRECISION
 
 logger = logging.getLogger(__name__)
 
@@ -66,6 +67,7 @@ class EmbeddingService:
         dynamo_client: Optional[DynamoDBClient] = None,
         model: str = DEFAULT_MODEL,
         use_cache: bool = True,
+        embedding_precision: str = DEFAULT_PRECISION,
     ):
         """
         Initialize the embedding service.
@@ -75,6 +77,7 @@ class EmbeddingService:
             dynamo_client: DynamoDB client for caching (optional).
             model: Embedding model to use.
             use_cache: Whether to use the embedding cache.
+            embedding_precision: Precision of cached embeddings (float32, float16, int8).
         """
         self._ollama_host = ollama_host.rstrip('/')
         self._model = model
@@ -83,7 +86,11 @@ class EmbeddingService:
         # Initialize cache adapter if enabled
         self._cache: Optional[TroiseVectorsAdapter] = None
         if use_cache and dynamo_client:
-            self._cache = TroiseVectorsAdapter(dynamo_client, default_model=model)
+            self._cache = TroiseVectorsAdapter(
+                dynamo_client,
+                default_model=model,
+                embedding_precision=embedding_precision,
+            )
             logger.info(f"Embedding cache enabled for model {model}")
         else:
             logger.info(f"Embedding cache disabled")
@@ -160,7 +167,8 @@ class EmbeddingService:
             text: Text to embed.
 
         Returns:
-            Embedding vector (list of floats).
+            Embedding vector (list of floats; a float32 array when served
+            from the cache).
 
         Raises:
             EmbeddingServiceError: If embedding generation fails.
@@ -395,6 +403,7 @@ def create_embedding_service(
     dynamo_client: Optional[DynamoDBClient] = None,
     model: str = DEFAULT_MODEL,
     use_cache: bool = True,
+    embedding_precision: str = DEFAULT_PRECISION,
 ) -> EmbeddingService:
     """
     Create an EmbeddingService instance.
@@ -406,6 +415,7 @@ def create_embedding_service(
         dynamo_client: DynamoDB client for caching.
         model: Embedding model to use.
         use_cache: Whether to use the embedding cache.
+        embedding_precision: Precision of cached embeddings.
 
     Returns:
         Configured EmbeddingService instance.
@@ -415,4 +425,5 @@ def create_embedding_service(
         dynamo_client=dynamo_client,
         model=model,
         use_cache=use_cache,
+        embedding_precision=embedding_precision,
     )
@@ -0,0 +1,400 @@
+"""Image generation batching and result cache for TROISE AI.
+
+ComfyUI executes one workflow at a time, and every generate_image call
+pays a model-context check (VRAMOrchestrator.request_load), a prompt
+submission and a completion wait. The ImageGenerationScheduler sits in
+front of ComfyUIClient and reduces that work:
+
+- Result cache: images are content-addressed by a hash of
+  (model, prompt, seed, size, steps, guidance). A hit skips the GPU and the
+  model load entirely. Requests without a seed get a random one assigned
+  up front, so every result is reproducible and addressable.
+- Coalescing: concurrent identical requests share one generation.
+- Batching: requests for the same model and resolution arriving within
+  batch_window are submitted as one multi-branch workflow
+  (ComfyUIClient.generate_image_batch), up to max_batch_size images.
+
+Settings come from the comfyui backend options:
+
+    backends:
+      comfyui:
+        options:
+          batch_window_ms: 50
+          max_batch_size: 4
+          result_cache: true
+          result_cache_memory_entries: 16
+"""
+import asyncio
+import hashlib
+import json
+import logging
+import random
+from collections import OrderedDict
+from dataclasses import asdict, dataclass, replace
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Storage session (MinIO prefix) holding cached images
+CACHE_SESSION_ID = "image-cache"
+
+DEFAULT_BATCH_WINDOW_MS = 50
+DEFAULT_MAX_BATCH_SIZE = 4
+DEFAULT_MEMORY_ENTRIES = 16
+
+# Returns (ComfyUIClient, workflow_config), e.g. VRAMOrchestrator.get_diffusion_context
+ContextProvider = Callable[[], Awaitable[Tuple[Any, Dict[str, Any]]]]
+BatchGroup = Tuple[str, int, int]  # (model_id, width, height)
+
+
+@dataclass(frozen=True)
+class ImageRequest:
+    """Parameters of one image generation (generate_image kwargs)."""
+    prompt: str
+    width: int = 1024
+    height: int = 1024
+    steps: int = 28
+    guidance: float = 4.0
+    seed: Optional[int] = None
+
+
+@dataclass
+class ImageResult:
+    """Outcome of a scheduled image generation."""
+    image: Optional[bytes]
+    seed: int
+    cached: bool = False
+
+
+def image_cache_key(request: ImageRequest, model_id: str) -> str:
+    """Content address of an image generation.
+
+    Args:
+        request: Generation parameters (seed must be set).
+        model_id: Diffusion model identifier.
+
+    Returns:
+        Hex digest identifying the generated image.
+    """
+    payload = json.dumps(
+        {"model": model_id, **asdict(request)},
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ImageResultCache:
+    """Content-addressed image cache: small in-memory LRU over file storage.
+
+    Images are stored under deterministic ids ("image-cache:{key}"), so a
+    lookup is a single download with no separate index. Storage errors are
+    logged and treated as misses; the cache never fails a generation.
+    """
+
+    def __init__(
+        self,
+        storage: Optional[Any] = None,
+        max_memory_entries: int = DEFAULT_MEMORY_ENTRIES,
+    ):
+        """Initialize the cache.
+
+        Args:
+            storage: IFileStorage for persistent entries (None for memory only).
+            max_memory_entries: Images kept in process memory.
+        """
+        self._storage = storage
+        self._max_memory_entries = max_memory_entries
+        self._memory: "OrderedDict[str, bytes]" = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._storage_errors = 0
+
+    async def get(self, key: str) -> Optional[bytes]:
+        """Look up a cached image.
+
+        Args:
+            key: Content key from image_cache_key().
+
+        Returns:
+            Image bytes, or None on a miss.
+        """
+        image = self._memory.get(key)
+        if image is not None:
+            self._memory.move_to_end(key)
+            self._hits += 1
+            return image
+
+        if self._storage is not None:
+            try:
+                image = await self._storage.download(f"{CACHE_SESSION_ID}:{key}")
+            except FileNotFoundError:
+                image = None
+            except Exception as e:
+                self._storage_errors += 1
+                logger.warning(f"Image cache lookup failed for {key[:12]}: {e}")
+                image = None
+
+        if image is None:
+            self._misses += 1
+            return None
+
+        self._hits += 1
+        self._remember(key, image)
+        return image
+
+    async def put(self, key: str, image: bytes) -> None:
+        """Store an image.
+
+        Args:
+            key: Content key from image_cache_key().
+            image: PNG bytes.
+        """
+        self._remember(key, image)
+        if self._storage is None:
+            return
+        try:
+            await self._storage.upload(
+                file_id=key,
+                content=image,
+                mimetype="image/png",
+                session_id=CACHE_SESSION_ID,
+            )
+        except Exception as e:
+            self._storage_errors += 1
+            logger.warning(f"Image cache store failed for {key[:12]}: {e}")
+
+    def _remember(self, key: str, image: bytes) -> None:
+        """Insert into the in-memory LRU."""
+        if self._max_memory_entries <= 0:
+            return
+        self._memory[key] = image
+        self._memory.move_to_end(key)
+        while len(self._memory) > self._max_memory_entries:
+            self._memory.popitem(last=False)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "memory_entries": len(self._memory),
+            "storage_errors": self._storage_errors,
+            "persistent": self._storage is not None,
+        }
+
+
+@dataclass
+class _PendingImage:
+    """A queued request awaiting its batch."""
+    request: ImageRequest
+    key: str
+    future: asyncio.Future
+    get_context: ContextProvider
+
+
+class ImageGenerationScheduler:
+    """Batches, coalesces and caches image generations for ComfyUI.
+
+    Example:
+        scheduler = ImageGenerationScheduler(cache=ImageResultCache(storage))
+        result = await scheduler.generate(
+            ImageRequest(prompt="a lighthouse", seed=42),
+            model_id="flux2-dev-nvfp4",
+            get_context=lambda: orchestrator.get_diffusion_context("flux2-dev-nvfp4"),
+        )
+    """
+
+    def __init__(
+        self,
+        cache: Optional[ImageResultCache] = None,
+        batch_window_seconds: float = DEFAULT_BATCH_WINDOW_MS / 1000,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+    ):
+        """Initialize the scheduler.
+
+        Args:
+            cache: Result cache (None disables caching).
+            batch_window_seconds: How long the first request of a batch
+                waits for others with the same model and resolution.
+            max_batch_size: Maximum images per ComfyUI workflow.
+        """
+        self._cache = cache
+        self._batch_window = max(0.0, batch_window_seconds)
+        self._max_batch_size = max(1, max_batch_size)
+        self._queues: Dict[BatchGroup, List[_PendingImage]] = {}
+        self._full: Dict[BatchGroup, asyncio.Event] = {}
+        self._dispatchers: Dict[BatchGroup, asyncio.Task] = {}
+        self._in_flight: Dict[str, asyncio.Future] = {}
+        # ComfyUI runs one workflow at a time and shares one completion
+        # WebSocket; while a batch runs, the next one fills up
+        self._dispatch_lock = asyncio.Lock()
+
+        self._stats = {
+            "requests": 0,
+            "cache_hits": 0,
+            "coalesced": 0,
+            "batches": 0,
+            "images_generated": 0,
+            "failures": 0,
+        }
+
+    async def generate(
+        self,
+        request: ImageRequest,
+        model_id: str,
+        get_context: ContextProvider,
+    ) -> ImageResult:
+        """Generate (or fetch from cache) one image.
+
+        Args:
+            request: Generation parameters. A random seed is assigned if unset.
+            model_id: Diffusion model identifier (part of the cache key).
+            get_context: Coroutine factory returning (ComfyUIClient,
+                workflow_config). Called once per batch, never on cache hits.
+
+        Returns:
+            ImageResult with image bytes (None if ComfyUI produced no image).
+
+        Raises:
+            Exceptions from get_context (e.g. MemoryError, ValueError,
+            RuntimeError) propagate to every request of the batch.
+        """
+        self._stats["requests"] += 1
+        if request.seed is None:
+            request = replace(request, seed=random.randint(0, 2**32 - 1))
+        key = image_cache_key(request, model_id)
+
+        if self._cache is not None:
+            image = await self._cache.get(key)
+            if image is not None:
+                self._stats["cache_hits"] += 1
+                return ImageResult(image=image, seed=request.seed, cached=True)
+
+        existing = self._in_flight.get(key)
+        if existing is not None:
+            self._stats["coalesced"] += 1
+            return await asyncio.shield(existing)
+
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = future
+
+        group = (model_id, request.width, request.height)
+        queue = self._queues.setdefault(group, [])
+        queue.append(_PendingImage(request, key, future, get_context))
+
+        if group not in self._dispatchers:
+            self._full[group] = asyncio.Event()
+            self._dispatchers[group] = asyncio.create_task(self._dispatch(group))
+        if len(queue) >= self._max_batch_size:
+            self._full[group].set()
+
+        # Shielded: a cancelled caller doesn't abort the shared batch
+        return await asyncio.shield(future)
+
+    async def _dispatch(self, group: BatchGroup) -> None:
+        """Wait for the batch window (or a full batch), then run it."""
+        try:
+            try:
+                await asyncio.wait_for(self._full[group].wait(), timeout=self._batch_window)
+            except asyncio.TimeoutError:
+                pass
+
+            async with self._dispatch_lock:
+                queue = self._queues.get(group, [])
+                batch = queue[:self._max_batch_size]
+                del queue[:len(batch)]
+                if batch:
+                    await self._run_batch(batch)
+        finally:
+            del self._dispatchers[group]
+            if self._queues.get(group):
+                # Leftovers have already waited a window; dispatch right away
+                self._full[group] = asyncio.Event()
+                self._full[group].set()
+                self._dispatchers[group] = asyncio.create_task(self._dispatch(group))
+            else:
+                self._queues.pop(group, None)
+                self._full.pop(group, None)
+
+    async def _run_batch(self, batch: List[_PendingImage]) -> None:
+        """Generate one batch and resolve its futures."""
+        try:
+            comfyui, workflow_config = await batch[0].get_context()
+            if len(batch) == 1:
+                images = [await comfyui.generate_image(
+                    **asdict(batch[0].request),
+                    workflow_config=workflow_config,
+                )]
+            else:
+                images = await comfyui.generate_image_batch(
+                    [asdict(item.request) for item in batch],
+                    workflow_config=workflow_config,
+                )
+            self._stats["batches"] += 1
+        except BaseException as e:
+            self._stats["failures"] += len(batch)
+            for item in batch:
+                self._in_flight.pop(item.key, None)
+                if not item.future.done():
+                    item.future.set_exception(e)
+            if not isinstance(e, Exception):
+                raise
+            return
+
+        logger.info(f"Image batch completed: {len(batch)} image(s) at "
+                    f"{batch[0].request.width}x{batch[0].request.height}")
+
+        for item, image in zip(batch, images):
+            if image:
+                self._stats["images_generated"] += 1
+                if self._cache is not None:
+                    await self._cache.put(item.key, image)
+            else:
+                self._stats["failures"] += 1
+            self._in_flight.pop(item.key, None)
+            if not item.future.done():
+                item.future.set_result(ImageResult(image=image, seed=item.request.seed))
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get scheduler statistics."""
+        batches = self._stats["batches"]
+        generated = self._stats["images_generated"]
+        return {
+            **self._stats,
+            "avg_batch_size": round(generated / batches, 2) if batches else 0.0,
+            "queued": sum(len(q) for q in self._queues.values()),
+            "in_flight": len(self._in_flight),
+            "cache": self._cache.get_stats() if self._cache is not None else None,
+        }
+
+
+def create_image_scheduler(
+    options: Optional[Dict[str, Any]] = None,
+    storage: Optional[Any] = None,
+) -> ImageGenerationScheduler:
+    """
+    Create an ImageGenerationScheduler from comfyui backend options.
+
+    This is the factory function for the DI container.
+
+    Args:
+        options: BackendConfig.options of the comfyui backend.
+        storage: IFileStorage for persistent cache entries (optional).
+
+    Returns:
+        Configured ImageGenerationScheduler instance.
+    """
+    options = options or {}
+    cache = None
+    if options.get("result_cache", True):
+        cache = ImageResultCache(
+            storage=storage,
+            max_memory_entries=int(options.get("result_cache_memory_entries", DEFAULT_MEMORY_ENTRIES)),
+        )
+
+    return ImageGenerationScheduler(
+        cache=cache,
+        batch_window_seconds=float(options.get("batch_window_ms", DEFAULT_BATCH_WINDOW_MS)) / 1000,
+        max_batch_size=int(options.get("max_batch_size", DEFAULT_MAX_BATCH_SIZE)),
+    )
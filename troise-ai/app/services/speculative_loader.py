@@ -0,0 +1,246 @@
+"""Speculative model loading for TROISE AI.
+
+The request path is serial: sanitize, route (an LLM call), queue, and only
+then does the chosen agent ask the VRAMOrchestrator for its model. When
+that model is cold, its load is stacked on top of the routing call.
+
+SpeculativeModelLoader predicts the target model as soon as a message
+arrives and starts a prefetch (VRAMOrchestrator.prefetch: no eviction,
+cancellable) that runs alongside sanitize and route. The prediction uses,
+in order:
+
+- The model the user selected (routing is bypassed, so this is certain)
+- Cheap content signals (code fences, stack traces, source file names -> CODE)
+- The user's last routed classification
+- The default classification
+
+Once routing decides, the load is committed (left running) if it targets
+the routed model, or abandoned (cancelled) otherwise. Hit rate, abandoned
+loads and the routing time overlapped by hits are reported by get_stats().
+"""
+import asyncio
+import logging
+import re
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
+
+if TYPE_CHECKING:
+    from app.core.interfaces.services import IVRAMOrchestrator
+    from app.core.router import RoutingResult
+
+logger = logging.getLogger(__name__)
+
+# Classification -> profile model role of the agent that handles it.
+# IMAGE is left out: diffusion models are managed by ComfyUI.
+ROLE_BY_CLASSIFICATION = {
+    "GENERAL": "general",
+    "RESEARCH": "research",
+    "CODE": "code",
+    "BRAINDUMP": "braindump",
+}
+
+_CODE_SIGNAL = re.compile(
+    r"```|Traceback \(most recent call last\)|\b\w+\.(?:py|js|ts|tsx|go|rs|java|cpp|rb|php|sql)\b"
+    r"|^\s*(?:def|class|import|function|const|fn|func)\s",
+    re.MULTILINE,
+)
+
+
+@dataclass
+class SpeculativeLoad:
+    """A prefetch started for one message."""
+    model_id: Optional[str]
+    reason: str
+    started_at: float
+    task: Optional[asyncio.Task] = None
+    resolved: bool = False
+
+
+class SpeculativeModelLoader:
+    """
+    Predicts and prefetches the target model while a message is routed.
+
+    Example:
+        load = loader.start(user_id, content)
+        sanitized = await sanitizer.sanitize(content)
+        routing_result = await router.route(sanitized.intent, ...)
+        loader.resolve(load, user_id, routing_result)
+    """
+
+    def __init__(
+        self,
+        orchestrator: "IVRAMOrchestrator",
+        enabled: bool = True,
+        default_classification: str = "GENERAL",
+        max_users: int = 10000,
+    ):
+        """
+        Initialize the loader.
+
+        Args:
+            orchestrator: VRAM orchestrator used to resolve and prefetch models.
+            enabled: If False, start() predicts nothing and loads nothing.
+            default_classification: Prediction for users with no routing history.
+            max_users: Users whose last classification is remembered (LRU).
+        """
+        self._orchestrator = orchestrator
+        self._enabled = enabled
+        self._default_classification = default_classification
+        self._max_users = max(1, max_users)
+        self._last_classification: "OrderedDict[str, str]" = OrderedDict()
+        self._stats = {
+            "predictions": 0,
+            "hits": 0,
+            "misses": 0,
+            "loads_started": 0,
+            "already_loaded": 0,
+            "abandoned": 0,
+        }
+        self._overlap_seconds = 0.0
+
+    def _model_for_classification(self, classification: Optional[str]) -> Optional[str]:
+        """Profile model of the agent handling a classification."""
+        role = ROLE_BY_CLASSIFICATION.get(classification or "")
+        if not role:
+            return None
+        try:
+            return self._orchestrator.get_profile_model(role)
+        except Exception as e:
+            logger.debug(f"No profile model for {classification}: {e}")
+            return None
+
+    def predict(
+        self,
+        user_id: str,
+        content: str,
+        user_model: Optional[str] = None,
+    ) -> Tuple[Optional[str], str]:
+        """
+        Predict the model a message will run on.
+
+        Args:
+            user_id: User sending the message.
+            content: Raw message content.
+            user_model: Model selected by the user, if any.
+
+        Returns:
+            Tuple of (model_id or None, reason).
+        """
+        if user_model:
+            return user_model, "user_model"
+        if content and _CODE_SIGNAL.search(content):
+            return self._model_for_classification("CODE"), "code_signal"
+        last = self._last_classification.get(user_id)
+        if last:
+            return self._model_for_classification(last), f"last_route:{last}"
+        return self._model_for_classification(self._default_classification), "default"
+
+    def start(
+        self,
+        user_id: str,
+        content: str,
+        user_model: Optional[str] = None,
+    ) -> SpeculativeLoad:
+        """
+        Predict the target model and start prefetching it in the background.
+
+        Returns:
+            SpeculativeLoad to pass to resolve() (or abandon()).
+        """
+        if not self._enabled:
+            return SpeculativeLoad(model_id=None, reason="disabled", started_at=time.monotonic())
+
+        model_id, reason = self.predict(user_id, content, user_model)
+        load = SpeculativeLoad(model_id=model_id, reason=reason, started_at=time.monotonic())
+        if not model_id:
+            return load
+
+        self._stats["predictions"] += 1
+        if self._orchestrator.is_loaded(model_id):
+            self._stats["already_loaded"] += 1
+        else:
+            load.task = asyncio.create_task(self._prefetch(model_id))
+            self._stats["loads_started"] += 1
+            logger.debug(f"Speculative load of {model_id} ({reason})")
+        return load
+
+    async def _prefetch(self, model_id: str) -> bool:
+        try:
+            return await self._orchestrator.prefetch(model_id)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.debug(f"Speculative load of {model_id} failed: {e}")
+            return False
+
+    def resolve(
+        self,
+        load: SpeculativeLoad,
+        user_id: str,
+        routing_result: "RoutingResult",
+        user_model: Optional[str] = None,
+    ) -> bool:
+        """
+        Commit or abandon a speculative load once routing has decided.
+
+        Also records the routed classification as the user's last route.
+
+        Args:
+            load: Load returned by start().
+            user_id: User the message came from.
+            routing_result: Routing decision.
+            user_model: Model selected by the user, if any.
+
+        Returns:
+            True if the prediction matched the routed model.
+        """
+        classification = getattr(routing_result, "classification", None)
+        if classification and not user_model:
+            self._last_classification[user_id] = classification
+            self._last_classification.move_to_end(user_id)
+            while len(self._last_classification) > self._max_users:
+                self._last_classification.popitem(last=False)
+
+        if load.resolved or not load.model_id:
+            return False
+        load.resolved = True
+
+        target = user_model or self._model_for_classification(classification)
+        hit = target is not None and target == load.model_id
+        if hit:
+            self._stats["hits"] += 1
+            if load.task is not None:
+                # Commit: the load keeps running and request_load() waits for it
+                self._overlap_seconds += time.monotonic() - load.started_at
+        else:
+            self._stats["misses"] += 1
+            self._cancel(load)
+        logger.debug(
+            f"Speculative load {'hit' if hit else 'miss'}: predicted={load.model_id} "
+            f"({load.reason}), routed={target}"
+        )
+        return hit
+
+    def abandon(self, load: Optional[SpeculativeLoad]) -> None:
+        """Abandon a load whose message will not be executed."""
+        if load is None or load.resolved:
+            return
+        load.resolved = True
+        self._cancel(load)
+
+    def _cancel(self, load: SpeculativeLoad) -> None:
+        if load.task is not None and not load.task.done():
+            load.task.cancel()
+            self._stats["abandoned"] += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get prediction and load counters."""
+        decided = self._stats["hits"] + self._stats["misses"]
+        return {
+            **self._stats,
+            "enabled": self._enabled,
+            "hit_rate": round(self._stats["hits"] / decided, 3) if decided else 0.0,
+            "overlapped_seconds": round(self._overlap_seconds, 3),
+        }
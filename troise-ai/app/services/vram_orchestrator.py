@@ -80,6 +80,8 @@ class VRAMOrchestrator:
         self._model_factory = ModelFactory(config)
         self._registry: Dict[str, LoadedModel] = {}
         self._loading: Set[str] = set()
+        self._prefetching: Dict[str, float] = {}  # model_id -> reserved GB
+        self._prefetch_loads: Dict[str, asyncio.Future] = {}  # model_id -> in-flight prefetch result
         self._lock = asyncio.Lock()
         self._vram_limit_gb = self._detect_system_vram()
 
@@ -169,7 +171,9 @@ class VRAMOrchestrator:
             Available RAM in GB.
         """
         current_used = self._get_current_memory_usage_gb()
-        available = self._vram_limit_gb - current_used
+        # Speculative loads in flight may not show up in `free` yet
+        reserved = sum(self._prefetching.values())
+        available = self._vram_limit_gb - current_used - reserved
         return max(0.0, available)
 
     @property
@@ -293,7 +297,7 @@ class VRAMOrchestrator:
         Returns:
             True if the model is being loaded, False otherwise.
         """
-        return model_id in self._loading
+        return model_id in self._loading or model_id in self._prefetch_loads
 
     async def request_load(self, model_id: str) -> bool:
         """
@@ -307,6 +311,10 @@ class VRAMOrchestrator:
         5. Loads the model via BackendManager
         6. Notifies ProfileManager of success/failure
 
+        If a prefetch of the model is in flight, waits for it first; if the
+        prefetch fails or is abandoned, the model goes through the normal
+        load path (with eviction).
+
         Args:
             model_id: The model identifier to load.
 
@@ -317,113 +325,198 @@ class VRAMOrchestrator:
             ValueError: If model is not in the current profile.
             MemoryError: If there's not enough VRAM and eviction failed.
         """
-        async with self._lock:
-            logger.debug(f"request_load: {model_id}, registry={list(self._registry.keys())}")
+        while True:
+            prefetch = self._prefetch_loads.get(model_id)
+            if prefetch is not None:
+                logger.debug(f"Waiting for prefetch of '{model_id}'")
+                # Shielded: a cancelled request must not cancel the shared result
+                await asyncio.shield(prefetch)
+                continue
+
+            async with self._lock:
+                # A prefetch may have started while we waited for the lock
+                if model_id not in self._prefetch_loads:
+                    return await self._load_locked(model_id)
+
+    async def _load_locked(self, model_id: str) -> bool:
+        """Load a model, evicting if needed (caller holds the lock)."""
+        logger.debug(f"request_load: {model_id}, registry={list(self._registry.keys())}")
+
+        # Already in our registry?
+        if model_id in self._registry:
+            self._registry[model_id].last_accessed = datetime.now()
+            logger.debug(f"Keep-alive extended: {model_id}")
+            return True
 
-            # Already in our registry?
-            if model_id in self._registry:
-                self._registry[model_id].last_accessed = datetime.now()
-                logger.debug(f"Keep-alive extended: {model_id}")
-                return True
+        # Already loading?
+        if model_id in self._loading:
+            logger.debug(f"Model '{model_id}' is already being loaded")
+            return True
 
-            # Already loading?
-            if model_id in self._loading:
-                logger.debug(f"Model '{model_id}' is already being loaded")
+        # Get model config FROM PROFILE
+        model_caps = self._get_model_capabilities(model_id)
+        if not model_caps:
+            error = f"Model '{model_id}' not in profile '{self._profile.profile_name}'"
+            logger.error(error)
+            self._profile_manager.record_load_failure(model_id, error)
+            raise ValueError(error)
+
+        # Check if model is already loaded in backend (but not in our registry)
+        try:
+            loaded_models = await self._backend_manager.list_loaded_models()
+            loaded_ids = {m.get('name', m.get('model', '')) for m in loaded_models}
+            if model_id in loaded_ids:
+                # Model is already loaded in backend, just register it
+                await self._mark_loaded(model_id, model_caps)
+                self._profile_manager.record_load_success(model_id)
+                logger.info(f"Model already loaded in backend: {model_id}")
                 return True
+        except Exception as e:
+            logger.warning(f"Failed to check backend for loaded models: {e}")
 
-            # Get model config FROM PROFILE
-            model_caps = self._get_model_capabilities(model_id)
-            if not model_caps:
-                error = f"Model '{model_id}' not in profile '{self._profile.profile_name}'"
-                logger.error(error)
-                self._profile_manager.record_load_failure(model_id, error)
-                raise ValueError(error)
+        required_gb = model_caps.vram_size_gb
 
-            # Check if model is already loaded in backend (but not in our registry)
-            try:
-                loaded_models = await self._backend_manager.list_loaded_models()
-                loaded_ids = {m.get('name', m.get('model', '')) for m in loaded_models}
-                if model_id in loaded_ids:
-                    # Model is already loaded in backend, just register it
-                    await self._mark_loaded(model_id, model_caps)
-                    self._profile_manager.record_load_success(model_id)
-                    logger.info(f"Model already loaded in backend: {model_id}")
-                    return True
-            except Exception as e:
-                logger.warning(f"Failed to check backend for loaded models: {e}")
+        # Check if eviction needed using fresh RAM detection
+        # This accounts for memory used by other processes/models outside our registry
+        available_gb = self._get_available_ram_gb()
+        if required_gb > available_gb:
+            logger.info(
+                f"Need {required_gb:.1f}GB for '{model_id}', "
+                f"only {available_gb:.1f}GB available (registry: {self.current_usage_gb:.1f}GB)"
+            )
+            freed = await self._evict_for_space(required_gb)
+            if not freed:
+                # Memory release can be async (especially ComfyUI /free)
+                # FLUX model (~20GB) can take 10-20 seconds to fully release
+                # Retry with delays to allow memory to be properly released
+                max_retries = 15
+                retry_delay = 2.0  # seconds (total: 30s max wait)
+                for retry in range(max_retries):
+                    await asyncio.sleep(retry_delay)
+                    available_gb = self._get_available_ram_gb()
+                    if required_gb <= available_gb:
+                        logger.info(
+                            f"Memory available after {retry + 1} retries: "
+                            f"{available_gb:.1f}GB (need {required_gb:.1f}GB)"
+                        )
+                        break
+                    logger.debug(
+                        f"Waiting for memory release (retry {retry + 1}/{max_retries}): "
+                        f"{available_gb:.1f}GB available, need {required_gb:.1f}GB"
+                    )
+                else:
+                    # All retries exhausted
+                    available_gb = self._get_available_ram_gb()
+                    if required_gb > available_gb:
+                        error = f"Cannot free {required_gb:.1f}GB for '{model_id}', only {available_gb:.1f}GB available after {max_retries} retries"
+                        logger.error(error)
+                        self._profile_manager.record_load_failure(model_id, error)
+                        raise MemoryError(error)
+
+        # Mark as loading
+        self._loading.add(model_id)
+        load_start = time.time()
+
+        try:
+            # Determine keep_alive from backend options
+            keep_alive = "10m"
+            if model_caps.backend.options:
+                keep_alive = model_caps.backend.options.get("keep_alive", "10m")
+
+            # Use BackendManager to actually load
+            backend_type = model_caps.backend.type if model_caps.backend else "unknown"
+            logger.info(f"Loading model via backend: {model_id} (type={backend_type}, size={required_gb:.1f}GB)")
+            success = await self._backend_manager.load_model(model_id, keep_alive)
+            load_ms = (time.time() - load_start) * 1000
+
+            if success:
+                await self._mark_loaded(model_id, model_caps)
+                self._profile_manager.record_load_success(model_id)
+                logger.info(f"Model loaded: {model_id} ({required_gb:.1f}GB), load_time={load_ms:.0f}ms")
+            else:
+                self._profile_manager.record_load_failure(model_id, "Backend returned false")
+                logger.error(f"Failed to load model '{model_id}': Backend returned false")
+
+            return success
+
+        except Exception as e:
+            self._profile_manager.record_load_failure(model_id, str(e))
+            logger.error(f"Failed to load model '{model_id}': {e}")
+            raise
+
+        finally:
+            self._loading.discard(model_id)
+
+    async def prefetch(self, model_id: str) -> bool:
+        """
+        Speculatively load a model without evicting anything.
 
-            required_gb = model_caps.vram_size_gb
+        Low-priority counterpart of request_load() for loads started before
+        the model is known to be needed. The load only starts if the model
+        fits in currently free memory, and the lock is not held while the
+        backend loads, so requests for other models are not blocked behind
+        it. Cancelling the calling task abandons the load.
+
+        While the load is in flight, request_load() for the same model
+        waits for it, and falls back to a normal load if it fails.
+
+        Args:
+            model_id: The model identifier to load.
+
+        Returns:
+            True if the model is loaded (or was already loaded or loading),
+            False if it was skipped or failed.
+        """
+        async with self._lock:
+            if model_id in self._registry or model_id in self._loading or model_id in self._prefetch_loads:
+                return True
+
+            model_caps = self._get_model_capabilities(model_id)
+            if not model_caps or not model_caps.api_managed:
+                return False
 
-            # Check if eviction needed using fresh RAM detection
-            # This accounts for memory used by other processes/models outside our registry
             available_gb = self._get_available_ram_gb()
-            if required_gb > available_gb:
-                logger.info(
-                    f"Need {required_gb:.1f}GB for '{model_id}', "
-                    f"only {available_gb:.1f}GB available (registry: {self.current_usage_gb:.1f}GB)"
+            if model_caps.vram_size_gb > available_gb:
+                logger.debug(
+                    f"Skipping prefetch of '{model_id}': needs {model_caps.vram_size_gb:.1f}GB, "
+                    f"{available_gb:.1f}GB free"
                 )
-                freed = await self._evict_for_space(required_gb)
-                if not freed:
-                    # Memory release can be async (especially ComfyUI /free)
-                    # FLUX model (~20GB) can take 10-20 seconds to fully release
-                    # Retry with delays to allow memory to be properly released
-                    max_retries = 15
-                    retry_delay = 2.0  # seconds (total: 30s max wait)
-                    for retry in range(max_retries):
-                        await asyncio.sleep(retry_delay)
-                        available_gb = self._get_available_ram_gb()
-                        if required_gb <= available_gb:
-                            logger.info(
-                                f"Memory available after {retry + 1} retries: "
-                                f"{available_gb:.1f}GB (need {required_gb:.1f}GB)"
-                            )
-                            break
-                        logger.debug(
-                            f"Waiting for memory release (retry {retry + 1}/{max_retries}): "
-                            f"{available_gb:.1f}GB available, need {required_gb:.1f}GB"
-                        )
-                    else:
-                        # All retries exhausted
-                        available_gb = self._get_available_ram_gb()
-                        if required_gb > available_gb:
-                            error = f"Cannot free {required_gb:.1f}GB for '{model_id}', only {available_gb:.1f}GB available after {max_retries} retries"
-                            logger.error(error)
-                            self._profile_manager.record_load_failure(model_id, error)
-                            raise MemoryError(error)
-
-            # Mark as loading
-            self._loading.add(model_id)
-            load_start = time.time()
-
-            try:
-                # Determine keep_alive from backend options
-                keep_alive = "10m"
-                if model_caps.backend.options:
-                    keep_alive = model_caps.backend.options.get("keep_alive", "10m")
+                return False
 
-                # Use BackendManager to actually load
-                backend_type = model_caps.backend.type if model_caps.backend else "unknown"
-                logger.info(f"Loading model via backend: {model_id} (type={backend_type}, size={required_gb:.1f}GB)")
-                success = await self._backend_manager.load_model(model_id, keep_alive)
-                load_ms = (time.time() - load_start) * 1000
+            self._prefetching[model_id] = model_caps.vram_size_gb
+            done = asyncio.get_running_loop().create_future()
+            self._prefetch_loads[model_id] = done
 
-                if success:
+        load_start = time.time()
+        success = False
+        try:
+            keep_alive = "10m"
+            if model_caps.backend.options:
+                keep_alive = model_caps.backend.options.get("keep_alive", "10m")
+
+            logger.info(f"Prefetching model: {model_id} ({model_caps.vram_size_gb:.1f}GB)")
+            loaded = await self._backend_manager.load_model(model_id, keep_alive)
+            if loaded:
+                async with self._lock:
                     await self._mark_loaded(model_id, model_caps)
-                    self._profile_manager.record_load_success(model_id)
-                    logger.info(f"Model loaded: {model_id} ({required_gb:.1f}GB), load_time={load_ms:.0f}ms")
-                else:
-                    self._profile_manager.record_load_failure(model_id, "Backend returned false")
-                    logger.error(f"Failed to load model '{model_id}': Backend returned false")
+                logger.info(f"Model prefetched: {model_id}, load_time={(time.time() - load_start) * 1000:.0f}ms")
+            # Only reported to waiting request_load() calls once registered
+            success = loaded
+            return success
 
-                return success
+        except asyncio.CancelledError:
+            logger.debug(f"Prefetch of '{model_id}' abandoned")
+            raise
 
-            except Exception as e:
-                self._profile_manager.record_load_failure(model_id, str(e))
-                logger.error(f"Failed to load model '{model_id}': {e}")
-                raise
+        except Exception as e:
+            # Speculative: leave profile fallback state to real loads
+            logger.warning(f"Prefetch of '{model_id}' failed: {e}")
+            return False
 
-            finally:
-                self._loading.discard(model_id)
+        finally:
+            self._prefetching.pop(model_id, None)
+            self._prefetch_loads.pop(model_id, None)
+            done.set_result(success)
 
     async def _mark_loaded(self, model_id: str, caps: ModelCapabilities) -> None:
         """
@@ -667,7 +760,7 @@ class VRAMOrchestrator:
                 }
                 for m in self._registry.values()
             ],
-            "loading": list(self._loading),
+            "loading": list(self._loading | set(self._prefetch_loads)),
         }
 
     async def health_check_loop(self) -> None:
@@ -776,8 +869,8 @@ class VRAMOrchestrator:
         if model_caps.backend.options:
             keep_alive = model_caps.backend.options.get("keep_alive", "10m")
 
-        # Create and return the Strands Model via factory
-        return self._model_factory.create_model(
+        # Create the Strands Model via factory
+        model = self._model_factory.create_model(
             model_id=model_id,
             temperature=temperature,
             max_tokens=max_tokens,
@@ -785,6 +878,13 @@ class VRAMOrchestrator:
             keep_alive=keep_alive,
         )
 
+        # Gate each generation behind the backend's adaptive concurrency slot
+        # (covers agents, research sub-agents, graph branches and queue workers)
+        if hasattr(model, "set_slot_provider"):
+            model.set_slot_provider(lambda: self._backend_manager.model_slot(model_id))
+
+        return model
+
     def _resolve_additional_args(
         self,
         model_caps: ModelCapabilities,
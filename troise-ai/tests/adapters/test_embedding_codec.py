@@ -0,0 +1,173 @@
+"""Unit tests for compact embedding storage and lazy migration."""
+import numpy as np
+import pytest
+
+from app.adapters.dynamodb.brain_adapter import NoteChunkItem
+from app.adapters.dynamodb.embedding_codec import (
+    DTYPE_ATTRIBUTE,
+    cosine_similarities,
+    decode_embedding,
+    encode_embedding,
+    embedding_to_binary,
+    item_embedding,
+    needs_migration,
+    rewrite_embeddings,
+    stored_precision,
+    validate_precision,
+)
+from app.adapters.dynamodb.vectors_adapter import TroiseVectorsAdapter, text_to_hash
+
+
+class FakeTable:
+    """Minimal DynamoDB table with get/put/update for migration tests."""
+
+    def __init__(self):
+        self.items = {}
+        self.updates = 0
+
+    async def get_item(self, Key):
+        item = self.items.get((Key['PK'], Key['SK']))
+        return {'Item': dict(item)} if item else {}
+
+    async def put_item(self, Item):
+        self.items[(Item['PK'], Item['SK'])] = Item
+
+    async def update_item(self, Key, UpdateExpression, ConditionExpression,
+                          ExpressionAttributeNames, ExpressionAttributeValues):
+        key = (Key['PK'], Key['SK'])
+        item = self.items.get(key)
+        # attribute_exists(embedding) AND (attribute_not_exists(dtype) OR dtype = :old)
+        if not item or 'embedding' not in item or stored_precision(item) != ExpressionAttributeValues[':old']:
+            raise RuntimeError("ConditionalCheckFailedException")
+        self.updates += 1
+        self.items[key]['embedding'] = ExpressionAttributeValues[':embedding']
+        self.items[key][DTYPE_ATTRIBUTE] = ExpressionAttributeValues[':dtype']
+
+
+class FakeClient:
+    def __init__(self, table):
+        self._table = table
+
+    def resource(self):
+        client = self
+
+        class Resource:
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *exc):
+                return False
+
+            async def Table(self, name):
+                return client._table
+
+        return Resource()
+
+
+def random_vector(dims=768, seed=0):
+    return np.random.default_rng(seed).standard_normal(dims).astype(np.float32)
+
+
+# =============================================================================
+# Encoding
+# =============================================================================
+
+@pytest.mark.parametrize("precision,size,tolerance", [
+    ("float32", 768 * 4, 1e-7),
+    ("float16", 768 * 2, 1e-3),
+    ("int8", 768 + 4, 2e-2),
+])
+def test_roundtrip_size_and_error(precision, size, tolerance):
+    vector = random_vector()
+
+    data = encode_embedding(vector, precision)
+    decoded = decode_embedding(data, precision)
+
+    assert len(data) == size
+    assert decoded.dtype == np.float32
+    assert np.max(np.abs(decoded - vector)) <= tolerance * np.max(np.abs(vector))
+
+
+def test_quantized_vectors_keep_ranking():
+    query = random_vector(seed=1)
+    docs = [random_vector(seed=s) for s in range(2, 22)]
+    exact = cosine_similarities(query, docs)
+
+    for precision in ("float16", "int8"):
+        decoded = [decode_embedding(encode_embedding(d, precision), precision) for d in docs]
+        approx = cosine_similarities(query, decoded)
+        assert np.argmax(approx) == np.argmax(exact)
+        assert np.max(np.abs(approx - exact)) < 0.01
+
+
+def test_zero_and_empty_vectors():
+    assert decode_embedding(encode_embedding([0.0, 0.0], "int8"), "int8").tolist() == [0.0, 0.0]
+    assert decode_embedding(encode_embedding([], "int8"), "int8").size == 0
+    assert cosine_similarities([1.0, 0.0], [[0.0, 0.0], [1.0, 0.0, 0.0], None]).tolist() == [0, 0, 0]
+    with pytest.raises(ValueError):
+        validate_precision("bfloat16")
+
+
+# =============================================================================
+# Legacy Items and Migration
+# =============================================================================
+
+def test_legacy_items_decode_as_float32():
+    item = {'PK': 'NOTE#a', 'SK': 'CHUNK#0000', 'path': 'a.md', 'embedding': embedding_to_binary([0.5, -1.0])}
+
+    chunk = NoteChunkItem.from_dynamo_item(item)
+
+    assert chunk.embedding.tolist() == [0.5, -1.0]
+    assert chunk.precision == "float32"
+    assert needs_migration(item, "float16")
+    assert not needs_migration(item, "float32")
+    assert not needs_migration({**item, DTYPE_ATTRIBUTE: "int8"}, "float16")
+
+
+async def test_rewrite_embeddings_skips_deleted_items():
+    table = FakeTable()
+    legacy = {'PK': 'URL#a', 'SK': 'CHUNK#0000', 'embedding': embedding_to_binary([0.25, 0.5])}
+    gone = {'PK': 'URL#a', 'SK': 'CHUNK#0001', 'embedding': embedding_to_binary([1.0, 0.0])}
+    table.items[('URL#a', 'CHUNK#0000')] = dict(legacy)
+
+    count = await rewrite_embeddings(table, [legacy, gone], "float16")
+
+    stored = table.items[('URL#a', 'CHUNK#0000')]
+    assert count == 1
+    assert stored[DTYPE_ATTRIBUTE] == "float16"
+    assert len(stored['embedding']) == 4
+    assert item_embedding(stored).tolist() == [0.25, 0.5]
+    assert ('URL#a', 'CHUNK#0001') not in table.items
+
+
+async def test_rewrite_embeddings_keeps_concurrent_reindex():
+    """A vector re-embedded between the read and the rewrite is not overwritten."""
+    table = FakeTable()
+    legacy = {'PK': 'URL#a', 'SK': 'CHUNK#0000', 'embedding': embedding_to_binary([0.25, 0.5])}
+    table.items[('URL#a', 'CHUNK#0000')] = {
+        'PK': 'URL#a', 'SK': 'CHUNK#0000',
+        'embedding': encode_embedding([1.0, 0.0], "int8"), DTYPE_ATTRIBUTE: "int8",
+    }
+
+    assert await rewrite_embeddings(table, [legacy], "float16") == 0
+    assert item_embedding(table.items[('URL#a', 'CHUNK#0000')]).tolist() == [1.0, 0.0]
+
+
+async def test_cache_migrates_legacy_entry_in_background():
+    table = FakeTable()
+    adapter = TroiseVectorsAdapter(FakeClient(table), embedding_precision="int8")
+    vector = random_vector(dims=16)
+    key = (f"TEXT#{text_to_hash('hello')}", "MODEL#nomic-embed-text")
+    table.items[key] = {'PK': key[0], 'SK': key[1], 'embedding': embedding_to_binary(vector)}
+
+    first = await adapter.get_cached_embedding("hello")
+    assert table.updates == 0  # Read returned before the rewrite ran
+    await adapter.get_cached_embedding("hello")  # Already queued: not scheduled twice
+    await adapter._migrator.drain()
+    second = await adapter.get_cached_embedding("hello")
+
+    assert isinstance(first, np.ndarray)
+    assert np.array_equal(first, vector)
+    assert table.items[key][DTYPE_ATTRIBUTE] == "int8"
+    assert table.updates == 1
+    assert np.allclose(second, vector, atol=0.05)
@@ -0,0 +1,170 @@
+"""Unit tests for MinIOAdapter (persistent client, key index, streaming)."""
+import hashlib
+
+import pytest
+from botocore.exceptions import ClientError
+
+from app.adapters.minio import MinIOAdapter, MinIOConfig
+
+
+class FakeBody:
+    """aiobotocore StreamingBody stand-in."""
+
+    def __init__(self, data: bytes):
+        self._data = data
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def read(self):
+        return self._data
+
+    async def iter_chunks(self, chunk_size):
+        for i in range(0, len(self._data), chunk_size):
+            yield self._data[i:i + chunk_size]
+
+
+class FakeS3:
+    """In-memory S3 client that records the requests it receives."""
+
+    def __init__(self):
+        self.objects = {}
+        self.calls = []
+
+    def _missing(self, operation):
+        return ClientError({"Error": {"Code": "NoSuchKey"}}, operation)
+
+    async def put_object(self, Bucket, Key, Body, ContentType):
+        self.calls.append("put_object")
+        self.objects[Key] = Body
+
+    async def upload_file(self, Filename, Bucket, Key, ExtraArgs=None):
+        self.calls.append("upload_file")
+        with open(Filename, "rb") as f:
+            self.objects[Key] = f.read()
+
+    async def list_objects_v2(self, Bucket, Prefix, MaxKeys):
+        self.calls.append("list_objects_v2")
+        keys = sorted(k for k in self.objects if k.startswith(Prefix))[:MaxKeys]
+        return {"Contents": [{"Key": k} for k in keys]} if keys else {}
+
+    async def get_object(self, Bucket, Key):
+        self.calls.append("get_object")
+        if Key not in self.objects:
+            raise self._missing("GetObject")
+        return {"Body": FakeBody(self.objects[Key])}
+
+    async def head_object(self, Bucket, Key):
+        self.calls.append("head_object")
+        if Key not in self.objects:
+            raise ClientError({"Error": {"Code": "404"}}, "HeadObject")
+        return {}
+
+    async def delete_object(self, Bucket, Key):
+        self.calls.append("delete_object")
+        self.objects.pop(Key, None)
+
+    async def generate_presigned_url(self, operation, Params, ExpiresIn):
+        return f"http://public/{Params['Bucket']}/{Params['Key']}?expires={ExpiresIn}"
+
+
+@pytest.fixture
+def s3():
+    return FakeS3()
+
+
+@pytest.fixture
+def adapter(s3):
+    adapter = MinIOAdapter(MinIOConfig(bucket="files", key_index_size=100))
+    adapter._s3 = s3
+    adapter._presign_s3 = s3
+    adapter._initialized = True
+    return adapter
+
+
+# =============================================================================
+# Lookups
+# =============================================================================
+
+async def test_download_after_upload_is_one_request(adapter, s3):
+    file_id = await adapter.upload("abc", b"pdf bytes", "application/pdf", "sess")
+    s3.calls.clear()
+
+    assert await adapter.download(file_id) == b"pdf bytes"
+    assert s3.calls == ["get_object"]
+
+
+async def test_unknown_id_is_listed_once_then_indexed(adapter, s3):
+    s3.objects["sess/abc.png"] = b"img"
+
+    await adapter.download("sess:abc")
+    await adapter.download("sess:abc")
+
+    assert s3.calls == ["list_objects_v2", "get_object", "get_object"]
+    assert adapter.get_stats()["index_hits"] == 1
+
+
+async def test_missing_file_raises_not_found(adapter, s3):
+    file_id = await adapter.upload("abc", b"x", "text/plain", "sess")
+    del s3.objects["sess/abc.txt"]  # Expired by lifecycle policy
+
+    with pytest.raises(FileNotFoundError):
+        await adapter.download(file_id)
+    with pytest.raises(FileNotFoundError):
+        await adapter.download("sess:never-uploaded")
+    assert not await adapter.exists(file_id)
+
+
+async def test_exists_and_delete_skip_listing_for_indexed_keys(adapter, s3):
+    file_id = await adapter.upload("abc", b"x", "text/plain", "sess")
+    s3.calls.clear()
+
+    assert await adapter.exists(file_id)
+    assert await adapter.delete(file_id)
+
+    assert s3.calls == ["head_object", "delete_object"]
+    assert not await adapter.exists(file_id)
+
+
+# =============================================================================
+# Streaming and Presigned URLs
+# =============================================================================
+
+async def test_download_to_file_streams_and_hashes(adapter, s3, tmp_path):
+    data = bytes(range(256)) * 1000
+    file_id = await adapter.upload("abc", data, "application/pdf", "sess")
+
+    digest = await adapter.download_to_file(file_id, tmp_path / "out.pdf", chunk_size=4096)
+    chunks = [chunk async for chunk in adapter.stream(file_id, chunk_size=100_000)]
+
+    assert digest == hashlib.sha256(data).hexdigest()
+    assert (tmp_path / "out.pdf").read_bytes() == data
+    assert [len(c) for c in chunks] == [100_000, 100_000, 56_000]
+
+
+async def test_missing_download_leaves_no_file(adapter, tmp_path):
+    with pytest.raises(FileNotFoundError):
+        await adapter.download_to_file("sess:missing", tmp_path / "out")
+
+    assert not (tmp_path / "out").exists()
+
+
+async def test_upload_file_from_disk(adapter, s3, tmp_path):
+    path = tmp_path / "big.bin"
+    path.write_bytes(b"z" * 10_000)
+
+    file_id = await adapter.upload_file("abc", path, "application/pdf", "sess")
+
+    assert file_id == "sess:abc"
+    assert s3.objects["sess/abc.pdf"] == b"z" * 10_000
+
+
+async def test_presigned_url_points_at_object_key(adapter):
+    file_id = await adapter.upload("abc", b"img", "image/png", "sess")
+
+    url = await adapter.get_presigned_url(file_id, expires_in=60)
+
+    assert url == "http://public/files/sess/abc.png?expires=60"
@@ -0,0 +1,149 @@
+"""Unit tests for TroiseVectorsAdapter counters and namespace invalidation."""
+import numpy as np
+import pytest
+
+from app.adapters.dynamodb.vectors_adapter import TroiseVectorsAdapter
+
+
+class ConditionalCheckFailedException(Exception):
+    pass
+
+
+class FakeTable:
+    """In-memory table for the operations the adapter uses (no scans)."""
+
+    def __init__(self):
+        self.items = {}
+
+    async def get_item(self, Key):
+        item = self.items.get((Key['PK'], Key['SK']))
+        return {'Item': dict(item)} if item else {}
+
+    async def put_item(self, Item, ReturnValues="NONE"):
+        old = self.items.get((Item['PK'], Item['SK']))
+        self.items[(Item['PK'], Item['SK'])] = dict(Item)
+        return {'Attributes': old} if old and ReturnValues == "ALL_OLD" else {}
+
+    async def delete_item(self, Key, ConditionExpression=None, ReturnValues="NONE"):
+        old = self.items.pop((Key['PK'], Key['SK']), None)
+        if old is None and ConditionExpression:
+            raise ConditionalCheckFailedException()
+        return {'Attributes': old} if old and ReturnValues == "ALL_OLD" else {}
+
+    async def update_item(self, Key, UpdateExpression, ExpressionAttributeValues,
+                          ExpressionAttributeNames=None, ConditionExpression=None,
+                          ReturnValues="NONE"):
+        item = self.items.setdefault((Key['PK'], Key['SK']), dict(Key))
+        values = ExpressionAttributeValues
+        if UpdateExpression.startswith("ADD entries"):
+            item['entries'] = item.get('entries', 0) + values[':delta']
+            item.setdefault('ttl', values[':ttl'])
+        elif UpdateExpression == "ADD models :model":
+            item['models'] = item.get('models', set()) | values[':model']
+        elif UpdateExpression == "ADD version :one":
+            item['version'] = item.get('version', 0) + values[':one']
+            return {'Attributes': {'version': item['version']}}
+        else:
+            raise AssertionError(f"Unexpected update: {UpdateExpression}")
+        return {}
+
+    async def query(self, KeyConditionExpression):
+        pk_condition, sk_condition = KeyConditionExpression.get_expression()['values']
+        pk = pk_condition.get_expression()['values'][1]
+        prefix = sk_condition.get_expression()['values'][1]
+        return {'Items': [
+            dict(item) for (item_pk, item_sk), item in self.items.items()
+            if item_pk == pk and item_sk.startswith(prefix)
+        ]}
+
+    async def scan(self, **kwargs):
+        raise AssertionError("vectors adapter must not scan")
+
+
+class FakeClient:
+    def __init__(self, table):
+        self._table = table
+
+    def resource(self):
+        client = self
+
+        class Resource:
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *exc):
+                return False
+
+            async def Table(self, name):
+                return client._table
+
+        return Resource()
+
+
+@pytest.fixture
+def table():
+    return FakeTable()
+
+
+@pytest.fixture
+def adapter(table):
+    return TroiseVectorsAdapter(FakeClient(table), default_model="embed-a", embedding_precision="float32")
+
+
+# =============================================================================
+# Counters
+# =============================================================================
+
+async def test_counters_track_puts_overwrites_and_deletes(adapter):
+    for text in ("one", "two", "three"):
+        await adapter.cache_embedding(text, [0.1, 0.2])
+    await adapter.cache_embedding("one", [0.3, 0.4])  # Overwrite, same TTL bucket
+
+    assert (await adapter.get_cache_stats())["total_cached"] == 3
+
+    assert await adapter.invalidate("two")
+    assert not await adapter.invalidate("two")
+
+    stats = await adapter.get_cache_stats()
+    assert stats["models"] == {"embed-a": 2}
+    assert stats["namespace_versions"] == {"embed-a": 0}
+
+
+async def test_expired_counter_buckets_are_not_counted(adapter):
+    await adapter.cache_embedding("live", [1.0])
+    await adapter.cache_embedding("stale", [1.0], ttl_seconds=-2 * 86400)
+
+    assert (await adapter.get_cache_stats())["total_cached"] == 1
+    assert await adapter.get_cached_embedding("stale") is None
+
+
+# =============================================================================
+# Namespace Invalidation
+# =============================================================================
+
+async def test_invalidate_model_bumps_namespace_version(adapter, table):
+    await adapter.cache_embedding("hello", [1.0, 2.0])
+    await adapter.cache_embedding("hello", [5.0], model="embed-b")
+    items_before = len(table.items)
+
+    assert await adapter.invalidate_model("embed-a") == 1
+
+    assert len(table.items) == items_before + 1  # Only the version item is added
+    assert await adapter.get_cached_embedding("hello") is None
+    assert np.array_equal(await adapter.get_cached_embedding("hello", model="embed-b"), [5.0])
+
+    await adapter.cache_embedding("hello", [3.0, 4.0])
+    assert np.array_equal(await adapter.get_cached_embedding("hello"), [3.0, 4.0])
+    stats = await adapter.get_cache_stats()
+    assert stats["models"] == {"embed-a": 1, "embed-b": 1}
+    assert stats["namespace_versions"] == {"embed-a": 1, "embed-b": 0}
+
+
+async def test_other_processes_see_invalidation(table):
+    writer = TroiseVectorsAdapter(FakeClient(table), default_model="embed-a")
+    reader = TroiseVectorsAdapter(FakeClient(table), default_model="embed-a")
+    await writer.cache_embedding("hello", [1.0])
+
+    await writer.invalidate_model("embed-a")
+
+    assert await reader.get_cached_embedding("hello") is None
@@ -1,7 +1,7 @@
 """Unit tests for Configuration management."""
 import pytest
 
-from app.core.config import SkillsConfig, ToolsConfig
+from app.core.config import PromptsConfig, SkillsConfig, ToolsConfig
 
 
 # =============================================================================
@@ -75,3 +75,30 @@ def test_skills_config_from_dict_none():
     config = SkillsConfig.from_dict(None)
 
     assert config.max_skill_depth == 2
+
+
+# =============================================================================
+# PromptsConfig Tests
+# =============================================================================
+
+def test_prompts_config_defaults():
+    """PromptsConfig defaults to the stable prefix layout."""
+    config = PromptsConfig()
+
+    assert config.layout == "stable_prefix"
+    assert config.prefix_cache_size == 256
+
+
+def test_prompts_config_from_dict():
+    """PromptsConfig.from_dict parses YAML data correctly."""
+    config = PromptsConfig.from_dict({"layout": "legacy", "prefix_cache_size": 16})
+
+    assert config.layout == "legacy"
+    assert config.prefix_cache_size == 16
+
+
+def test_prompts_config_from_dict_none():
+    """PromptsConfig.from_dict returns defaults for None."""
+    config = PromptsConfig.from_dict(None)
+
+    assert config.layout == "stable_prefix"
@@ -51,6 +51,7 @@ class MockPromptComposer:
         interface: str,
         profile: str = None,
         user_profile=None,
+        static_sections=None,
     ) -> str:
         """Compose skill prompt with interface and personalization layers."""
         interface_context = f"## {interface.title()} Interface\nFormatted for {interface}."
@@ -65,6 +66,8 @@ class MockPromptComposer:
             "{personalization_context}",
             personalization_context or "No specific preferences.",
         )
+        for section in static_sections or []:
+            prompt += f"\n\n{section}"
         return prompt
 
 
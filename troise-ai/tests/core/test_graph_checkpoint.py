@@ -0,0 +1,242 @@
+"""Unit tests for graph checkpointing and resume-on-retry."""
+import json
+import time
+from typing import Dict
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.core.config import QueueConfig
+from app.core.context import ExecutionContext
+from app.core.graph import Graph
+from app.core.graph_checkpoint import (
+    GraphCheckpoint,
+    GraphCheckpointStore,
+    create_checkpoint_store,
+)
+from app.core.graph_executor import GraphExecutor
+from app.core.interfaces.graph import END, Edge, NodeResult
+
+
+# =============================================================================
+# Mock Infrastructure
+# =============================================================================
+
+
+class CountingNode:
+    """Node that counts executions and can fail on demand."""
+
+    def __init__(self, name: str, calls: Dict[str, int]):
+        self.name = name
+        self.streaming = True
+        self.tools = []
+        self.fail_next = False
+        self._calls = calls
+
+    async def execute(self, state, context, input_text=None, tool_factory=None, stream_handler=None):
+        self._calls[self.name] = self._calls.get(self.name, 0) + 1
+        if self.fail_next:
+            self.fail_next = False
+            raise RuntimeError(f"{self.name} crashed")
+        context.record_successful_tool_call("web_search")
+        return NodeResult(
+            node_name=self.name,
+            content=f"{self.name}({input_text})",
+            success=True,
+            state_updates={f"{self.name}_done": True},
+        )
+
+
+def build_graph(calls: Dict[str, int]) -> Graph:
+    names = ["research", "analyze", "write"]
+    nodes = {n: CountingNode(n, calls) for n in names}
+    return Graph(
+        name="deep_research",
+        domain="research",
+        nodes=nodes,
+        edges={
+            "research": [Edge(to="analyze")],
+            "analyze": [Edge(to="write")],
+            "write": [Edge(to=END)],
+        },
+        entry_node="research",
+    )
+
+
+@pytest.fixture
+def context():
+    ctx = ExecutionContext(user_id="u1", session_id="s1", interface="web")
+    ctx.request_id = "req-1"
+    return ctx
+
+
+# =============================================================================
+# GraphExecutor Resume Tests
+# =============================================================================
+
+
+async def test_retry_resumes_from_last_successful_node(context):
+    """A retried request skips nodes completed before the failure."""
+    calls: Dict[str, int] = {}
+    graph = build_graph(calls)
+    store = GraphCheckpointStore()
+    executor = GraphExecutor(checkpoint_store=store)
+
+    graph.nodes["write"].fail_next = True
+    first = await executor.execute(graph, context, "topic")
+    assert not first.success
+
+    second = await executor.execute(graph, context, "topic")
+
+    assert second.success
+    assert calls == {"research": 1, "analyze": 1, "write": 2}
+    assert second.nodes_executed == ["research", "analyze", "write"]
+    assert second.final_content == "write(analyze(research(topic)))"
+    assert second.final_state.get("research_done") is True
+    assert store.get_stats()["resumes"] == 1
+    assert store.get_stats()["nodes_skipped"] == 2
+
+
+async def test_successful_graph_discards_checkpoint(context):
+    calls: Dict[str, int] = {}
+    store = GraphCheckpointStore()
+    result = await GraphExecutor(checkpoint_store=store).execute(
+        build_graph(calls), context, "topic"
+    )
+
+    assert result.success
+    assert len(store) == 0
+    assert store.get_stats()["saves"] == 2  # No checkpoint after the last node
+
+
+async def test_no_checkpointing_without_request_id():
+    calls: Dict[str, int] = {}
+    store = GraphCheckpointStore()
+    ctx = ExecutionContext(user_id="u1", session_id="s1", interface="web")
+
+    await GraphExecutor(checkpoint_store=store).execute(build_graph(calls), ctx, "topic")
+
+    assert store.get_stats()["saves"] == 0
+
+
+async def test_resume_carries_tool_call_budget(context):
+    """Tool-call counts from skipped nodes are restored on retry."""
+    calls: Dict[str, int] = {}
+    graph = build_graph(calls)
+    store = GraphCheckpointStore()
+    executor = GraphExecutor(checkpoint_store=store)
+
+    graph.nodes["write"].fail_next = True
+    await executor.execute(graph, context, "topic")
+
+    retry_ctx = ExecutionContext(user_id="u1", session_id="s1", interface="web")
+    retry_ctx.request_id = "req-1"
+    await executor.execute(graph, retry_ctx, "topic")
+
+    # 2 restored from checkpoint + 1 from the re-run write node
+    assert retry_ctx.tool_call_counts["web_search"] == 3
+
+
+async def test_checkpoint_for_other_graph_is_ignored(context):
+    store = GraphCheckpointStore()
+    await store.save(GraphCheckpoint(
+        request_id="req-1",
+        graph_name="other_graph",
+        next_node="write",
+        state={},
+        node_results=[],
+    ))
+
+    assert await store.load("req-1", graph_name="deep_research") is None
+
+
+# =============================================================================
+# GraphCheckpointStore Tests
+# =============================================================================
+
+
+def make_checkpoint(request_id: str, **kwargs) -> GraphCheckpoint:
+    return GraphCheckpoint(
+        request_id=request_id,
+        graph_name="g",
+        next_node="b",
+        state={"input": "x", "a_done": True},
+        node_results=[NodeResult(node_name="a", content="A", success=True)],
+        **kwargs,
+    )
+
+
+async def test_store_evicts_oldest_beyond_max_entries():
+    store = GraphCheckpointStore(max_entries=2)
+    for i in range(3):
+        await store.save(make_checkpoint(f"r{i}"))
+
+    assert len(store) == 2
+    assert await store.load("r0") is None
+    assert await store.load("r2") is not None
+
+
+async def test_store_expires_checkpoints():
+    store = GraphCheckpointStore(ttl_seconds=60)
+    await store.save(make_checkpoint("r1", created_at=time.time() - 120))
+
+    assert await store.load("r1") is None
+
+
+async def test_checkpoint_dict_roundtrip():
+    checkpoint = make_checkpoint("r1", visited_counts={"a": 1}, loop_count=1)
+    restored = GraphCheckpoint.from_dict(json.loads(json.dumps(checkpoint.to_dict())))
+
+    assert restored.completed_nodes == ["a"]
+    assert restored.restore_state().get("a_done") is True
+    assert restored.visited_counts == {"a": 1}
+
+
+async def test_spill_writes_and_reads_temp_items():
+    items = {}
+    adapter = AsyncMock()
+    adapter.put_temp.side_effect = lambda s, k, v, ttl_seconds: items.__setitem__((s, k), v)
+    adapter.get_temp.side_effect = lambda s, k: items.get((s, k))
+
+    writer = GraphCheckpointStore(main_adapter=adapter)
+    await writer.save(make_checkpoint("r1"), session_id="s1")
+
+    # A fresh store (e.g., another worker) falls back to the spilled item
+    reader = GraphCheckpointStore(main_adapter=adapter)
+    loaded = await reader.load("r1", session_id="s1")
+
+    assert loaded is not None
+    assert loaded.next_node == "b"
+    assert ("s1", "graph_ckpt#r1") in items
+
+
+async def test_spill_failure_does_not_fail_save():
+    adapter = AsyncMock()
+    adapter.put_temp.side_effect = RuntimeError("dynamo down")
+    store = GraphCheckpointStore(main_adapter=adapter)
+
+    await store.save(make_checkpoint("r1"), session_id="s1")
+
+    assert await store.load("r1") is not None
+    assert store.get_stats()["spill_errors"] == 1
+
+
+def test_create_checkpoint_store_respects_config():
+    assert create_checkpoint_store(QueueConfig(checkpoint_enabled=False)) is None
+
+    store = create_checkpoint_store(QueueConfig(), main_adapter=AsyncMock())
+    assert store is not None
+    assert not store.spill_enabled  # Spill is opt-in
+
+    spill_store = create_checkpoint_store(
+        QueueConfig(checkpoint_spill=True), main_adapter=AsyncMock()
+    )
+    assert spill_store.spill_enabled
+
+
+def test_queue_config_checkpoint_from_dict():
+    config = QueueConfig.from_dict({"checkpoint_ttl_seconds": 60, "checkpoint_spill": True})
+
+    assert config.checkpoint_enabled is True
+    assert config.checkpoint_ttl_seconds == 60
+    assert config.checkpoint_spill is True
@@ -0,0 +1,368 @@
+"""Unit tests for ParallelNode fan-out/fan-in and branch stream multiplexing."""
+import asyncio
+from typing import List, Optional
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.core.context import ExecutionContext
+from app.core.graph_executor import BranchStreamMultiplexer, GraphExecutor
+from app.core.graph_nodes import MERGE_STRATEGIES, ParallelNode
+from app.core.interfaces.graph import GraphState, NodeResult
+from app.graphs.loader import GraphLoader
+
+
+# =============================================================================
+# Mock Infrastructure
+# =============================================================================
+
+
+class SleepyNode:
+    """Branch node that sleeps, streams its response, and records concurrency."""
+
+    def __init__(
+        self,
+        name: str,
+        response: str,
+        delay: float = 0.05,
+        fail: bool = False,
+        tracker: Optional[dict] = None,
+        streaming: bool = True,
+        tools: Optional[List[str]] = None,
+    ):
+        self.name = name
+        self._response = response
+        self._delay = delay
+        self._fail = fail
+        self._tracker = tracker if tracker is not None else {"running": 0, "peak": 0}
+        self.streaming = streaming
+        self.tools = tools or []
+        self.received_input = None
+        self.received_context = None
+
+    async def execute(self, state, context, input_text=None, tool_factory=None, stream_handler=None):
+        self.received_input = input_text
+        self.received_context = context
+        self._tracker["running"] += 1
+        self._tracker["peak"] = max(self._tracker["peak"], self._tracker["running"])
+        try:
+            context.graph_domain = f"domain-{self.name}"
+            context.record_successful_tool_call("web_search")
+            for word in self._response.split(" "):
+                await asyncio.sleep(self._delay / 5)
+                if stream_handler:
+                    await stream_handler.stream_event(
+                        {"contentBlockDelta": {"delta": {"text": word + " "}}}
+                    )
+            if self._fail:
+                raise RuntimeError(f"{self.name} exploded")
+            if stream_handler:
+                await stream_handler.finalize()
+            return NodeResult(
+                node_name=self.name,
+                content=self._response,
+                success=True,
+                state_updates={f"{self.name}_output": self._response},
+                tool_calls=[{"name": "web_search"}],
+            )
+        finally:
+            self._tracker["running"] -= 1
+
+
+class RecordingHandler:
+    """Base stream handler that records forwarded events."""
+
+    def __init__(self):
+        self.events: List[dict] = []
+        self.finalized = 0
+
+    async def stream_event(self, event: dict) -> None:
+        self.events.append(event)
+
+    async def finalize(self) -> None:
+        self.finalized += 1
+
+    @property
+    def text(self) -> str:
+        return "".join(
+            e["contentBlockDelta"]["delta"]["text"]
+            for e in self.events
+            if "contentBlockDelta" in e
+        )
+
+
+@pytest.fixture
+def context():
+    return ExecutionContext(user_id="u1", session_id="s1", interface="web")
+
+
+# =============================================================================
+# ParallelNode Tests
+# =============================================================================
+
+
+async def test_branches_run_concurrently(context):
+    """All branches are in flight at the same time."""
+    tracker = {"running": 0, "peak": 0}
+    nodes = [SleepyNode(f"b{i}", "done", tracker=tracker) for i in range(3)]
+    node = ParallelNode(branches=nodes, name="fan")
+
+    result = await node.execute(GraphState(), context, input_text="go")
+
+    assert result.success
+    assert tracker["peak"] == 3
+    assert all(n.received_input == "go" for n in nodes)
+
+
+async def test_max_concurrency_caps_running_branches(context):
+    """max_concurrency limits how many branches run at once."""
+    tracker = {"running": 0, "peak": 0}
+    nodes = [SleepyNode(f"b{i}", "x", tracker=tracker) for i in range(4)]
+    node = ParallelNode(branches=nodes, name="fan", max_concurrency=2)
+
+    await node.execute(GraphState(), context, input_text="go")
+
+    assert tracker["peak"] == 2
+
+
+async def test_concat_merge_in_declared_order(context):
+    """Merged output follows branch declaration order, not finish order."""
+    nodes = [
+        SleepyNode("slow", "first", delay=0.1),
+        SleepyNode("fast", "second", delay=0.01),
+    ]
+    node = ParallelNode(branches=nodes, name="fan", merge="concat")
+
+    result = await node.execute(GraphState(), context, input_text="go")
+
+    assert result.content == "first\n\nsecond"
+    assert result.state_updates["slow_output"] == "first"
+    assert result.state_updates["fast_output"] == "second"
+    assert result.state_updates["fan_output"] == "first\n\nsecond"
+    assert len(result.tool_calls) == 2
+
+
+@pytest.mark.parametrize("merge,expected", [
+    ("first", "a"),
+    ("last", "b"),
+    ("sections", "## x\n\na\n\n## y\n\nb"),
+])
+async def test_merge_strategies(context, merge, expected):
+    """Each registered merge strategy combines branch outputs."""
+    node = ParallelNode(
+        branches=[SleepyNode("x", "a", delay=0.01), SleepyNode("y", "b", delay=0.01)],
+        name="fan",
+        merge=merge,
+    )
+
+    result = await node.execute(GraphState(), context, input_text="go")
+
+    assert result.content == expected
+
+
+def test_unknown_merge_strategy_raises():
+    """Unknown merge strategy is rejected at construction."""
+    with pytest.raises(ValueError, match="Unknown merge strategy"):
+        ParallelNode(branches=[SleepyNode("x", "a")], name="fan", merge="vote")
+
+    assert "concat" in MERGE_STRATEGIES
+
+
+async def test_require_all_fails_on_branch_error(context):
+    """With require_all, any failed branch fails the node."""
+    node = ParallelNode(
+        branches=[SleepyNode("ok", "fine", delay=0.01), SleepyNode("bad", "x", delay=0.01, fail=True)],
+        name="fan",
+    )
+
+    result = await node.execute(GraphState(), context, input_text="go")
+
+    assert not result.success
+    assert "bad" in result.error
+
+
+async def test_any_success_merges_successful_branches(context):
+    """With require_all=False, successful branches are merged."""
+    node = ParallelNode(
+        branches=[SleepyNode("ok", "fine", delay=0.01), SleepyNode("bad", "x", delay=0.01, fail=True)],
+        name="fan",
+        require_all=False,
+    )
+
+    result = await node.execute(GraphState(), context, input_text="go")
+
+    assert result.success
+    assert result.content == "fine"
+
+
+async def test_branches_get_isolated_contexts(context):
+    """Branch context mutations do not leak; tool counts land in the parent."""
+    context.graph_domain = "research"
+    nodes = [SleepyNode("a", "x", delay=0.01), SleepyNode("b", "y", delay=0.01)]
+    node = ParallelNode(branches=nodes, name="fan")
+
+    await node.execute(GraphState(), context, input_text="go")
+
+    assert nodes[0].received_context is not nodes[1].received_context
+    assert context.graph_domain == "research"
+    assert context.tool_call_counts["web_search"] == 2
+
+
+class GreedyToolNode:
+    """Branch node that calls a limited tool until the budget refuses it."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.streaming = False
+        self.tools = ["web_search"]
+        self.calls = 0
+
+    async def execute(self, state, context, input_text=None, tool_factory=None, stream_handler=None):
+        while True:
+            allowed, _ = context.can_call_tool("web_search")
+            if not allowed:
+                break
+            context.record_successful_tool_call("web_search")
+            self.calls += 1
+            await asyncio.sleep(0)
+        return NodeResult(node_name=self.name, content=str(self.calls), success=True)
+
+
+async def test_branches_share_tool_call_budget(context):
+    """Concurrent branches draw on one tool budget instead of a copy each."""
+    context.tool_call_limits["web_search"] = 4
+    context.tool_call_counts["web_search"] = 1
+    nodes = [GreedyToolNode("a"), GreedyToolNode("b"), GreedyToolNode("c")]
+    node = ParallelNode(branches=nodes, name="fan", merge="concat")
+
+    await node.execute(GraphState(), context, input_text="go")
+
+    assert sum(n.calls for n in nodes) == 3
+    assert context.tool_call_counts["web_search"] == 4
+
+
+def test_tools_union():
+    """tools returns the union of branch tools."""
+    node = ParallelNode(
+        branches=[SleepyNode("a", "x", tools=["web_search"]), SleepyNode("b", "y", tools=["web_search", "web_fetch"])],
+        name="fan",
+    )
+
+    assert node.tools == ["web_search", "web_fetch"]
+
+
+# =============================================================================
+# Stream Multiplexing Tests
+# =============================================================================
+
+
+async def test_stream_text_not_interleaved(context):
+    """Streamed text arrives branch by branch in declared order."""
+    handler = RecordingHandler()
+    node = ParallelNode(
+        branches=[
+            SleepyNode("slow", "one two three", delay=0.1),
+            SleepyNode("fast", "four five six", delay=0.01),
+        ],
+        name="fan",
+    )
+
+    await node.execute(GraphState(), context, input_text="go", stream_handler=handler)
+
+    assert handler.text == "one two three \n\nfour five six "
+    assert handler.finalized == 1
+    branches = [e["_graph_branch"] for e in handler.events if "contentBlockDelta" in e]
+    assert branches[:3] == ["slow"] * 3
+
+
+async def test_branch_lifecycle_events(context):
+    """Branch start/end events are emitted for each branch."""
+    handler = RecordingHandler()
+    node = ParallelNode(branches=[SleepyNode("a", "x", delay=0.01)], name="fan")
+
+    await node.execute(GraphState(), context, input_text="go", stream_handler=handler)
+
+    types = [e.get("type") for e in handler.events if "type" in e]
+    assert types == ["graph_branch_start", "graph_branch_end"]
+
+
+async def test_multiplexer_flushes_failed_head():
+    """A failed head branch hands the stream to the next branch."""
+    handler = RecordingHandler()
+    mux = BranchStreamMultiplexer(handler, "fan", ["a", "b"])
+
+    await mux.publish("b", {"contentBlockDelta": {"delta": {"text": "later"}}})
+    assert handler.text == ""
+
+    await mux.complete("a")
+    assert handler.text == "later"
+
+    await mux.finish()
+    assert handler.finalized == 1
+
+
+# =============================================================================
+# Loader / Executor Integration
+# =============================================================================
+
+
+class _FakeAgent:
+    tools: List[str] = []
+
+    def __init__(self, name):
+        self.name = name
+
+
+def test_loader_builds_parallel_node():
+    """GraphLoader builds ParallelNode with inline branches."""
+    loader = GraphLoader(container=MagicMock(), conditions={})
+    loader._resolve_agent = lambda name: _FakeAgent(name)
+
+    node = loader._build_node("verify", {
+        "type": "parallel",
+        "merge": "sections",
+        "max_concurrency": 1,
+        "branches": {
+            "fact_checker": {"agent": "fact_checker"},
+            "citation_formatter": {"agent": "citation_formatter", "streaming": False},
+        },
+    })
+
+    assert isinstance(node, ParallelNode)
+    assert [b.name for b in node.branches] == ["fact_checker", "citation_formatter"]
+    assert node.branches[1].streaming is False
+
+
+def test_loader_rejects_parallel_without_branches():
+    """Parallel node without branches is a definition error."""
+    loader = GraphLoader(container=MagicMock(), conditions={})
+
+    with pytest.raises(ValueError, match="branches"):
+        loader._build_node("verify", {"type": "parallel"})
+
+
+async def test_executor_runs_parallel_node(context):
+    """GraphExecutor treats ParallelNode like any other node."""
+
+    class Graph:
+        name = "g"
+        domain = "research"
+        max_loops = 1
+        nodes = {
+            "fan": ParallelNode(
+                branches=[SleepyNode("a", "x", delay=0.01), SleepyNode("b", "y", delay=0.01)],
+                name="fan",
+            ),
+        }
+
+        def get_entry_node(self, input_text):
+            return "fan"
+
+        def get_next_node(self, current, state):
+            return "END"
+
+    result = await GraphExecutor().execute(Graph(), context, "go")
+
+    assert result.success
+    assert result.final_content == "x\n\ny"
+    assert result.final_state.get("a_output") == "x"
@@ -0,0 +1,264 @@
+"""Unit tests for tool result memoization."""
+import asyncio
+import json
+import time
+from types import SimpleNamespace
+from typing import Any, Dict
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.core.config import ToolsConfig
+from app.core.container import Container
+from app.core.context import ExecutionContext
+from app.core.interfaces.tool import ToolResult
+from app.core.registry import PluginRegistry
+from app.core.tool_cache import ToolCachePolicy, ToolResultCache, normalize_args
+from app.core.tool_factory import ToolFactory
+
+
+# =============================================================================
+# Mock Infrastructure
+# =============================================================================
+
+
+class CountingTool:
+    """Tool that counts executions (shared across instances via class attr)."""
+    name = "web_search"
+    description = "Counting search"
+    parameters = {"type": "object", "properties": {"query": {"type": "string"}}}
+    calls = 0
+    delay = 0.0
+    succeed = True
+
+    def __init__(self, context: ExecutionContext, container: Container):
+        pass
+
+    async def execute(self, params: Dict[str, Any], context: ExecutionContext) -> ToolResult:
+        type(self).calls += 1
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        if not self.succeed:
+            return ToolResult(content="", success=False, error="upstream down")
+        return ToolResult(content=f"results for {params.get('query')}", success=True)
+
+
+class WriterTool(CountingTool):
+    name = "write_file"
+
+
+@pytest.fixture(autouse=True)
+def reset_counters():
+    CountingTool.calls = 0
+    CountingTool.delay = 0.0
+    CountingTool.succeed = True
+    WriterTool.calls = 0
+
+
+def make_context(session_id: str = "s1", request_id: str = "r1") -> ExecutionContext:
+    context = ExecutionContext(user_id="u1", session_id=session_id, interface="web")
+    context.request_id = request_id
+    return context
+
+
+def make_factory(scope: str = "global", cache: bool = True) -> ToolFactory:
+    registry = PluginRegistry()
+    registry._tools["web_search"] = {
+        "type": "tool",
+        "name": "web_search",
+        "class": CountingTool,
+        "cache": {"ttl_seconds": 60, "scope": scope, "invalidated_by": ["write_file"]},
+    }
+    registry._tools["write_file"] = {"type": "tool", "name": "write_file", "class": WriterTool}
+    return ToolFactory(registry, Container(), result_cache=ToolResultCache() if cache else None)
+
+
+async def call(factory: ToolFactory, context: ExecutionContext, tool_name: str = "web_search", **params):
+    tool = factory.create_tool(tool_name, context)
+    raw = await tool._tool_func(SimpleNamespace(tool_use={"input": params}))
+    return json.loads(raw)
+
+
+# =============================================================================
+# ToolFactory Integration Tests
+# =============================================================================
+
+
+async def test_repeated_call_is_served_from_cache():
+    factory = make_factory()
+    context = make_context()
+
+    first = await call(factory, context, query="python")
+    second = await call(factory, context, query="  python ")
+
+    assert first == second
+    assert CountingTool.calls == 1
+    stats = factory.get_cache_stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["tools"]["web_search"]["hits"] == 1
+
+
+async def test_global_scope_shared_across_sessions():
+    factory = make_factory(scope="global")
+
+    await call(factory, make_context("s1"), query="q")
+    await call(factory, make_context("s2"), query="q")
+
+    assert CountingTool.calls == 1
+
+
+async def test_session_scope_isolated_between_sessions():
+    factory = make_factory(scope="session")
+
+    await call(factory, make_context("s1", "r1"), query="q")
+    await call(factory, make_context("s1", "r2"), query="q")
+    await call(factory, make_context("s2", "r3"), query="q")
+
+    assert CountingTool.calls == 2
+
+
+async def test_request_scope_isolated_between_requests():
+    factory = make_factory(scope="request")
+
+    await call(factory, make_context("s1", "r1"), query="q")
+    await call(factory, make_context("s1", "r1"), query="q")
+    await call(factory, make_context("s1", "r2"), query="q")
+
+    assert CountingTool.calls == 2
+
+
+async def test_concurrent_identical_calls_are_coalesced():
+    CountingTool.delay = 0.05
+    factory = make_factory()
+    context = make_context()
+
+    results = await asyncio.gather(*(call(factory, context, query="q") for _ in range(5)))
+
+    assert CountingTool.calls == 1
+    assert all(r["success"] for r in results)
+    assert factory.get_cache_stats()["tools"]["web_search"]["coalesced"] == 4
+    # Only the executing call counts toward limits
+    assert context.tool_call_counts["web_search"] == 1
+
+
+async def test_cached_hits_do_not_count_against_limits():
+    factory = make_factory()
+    context = make_context().with_tool_limits({"web_search": 1})
+
+    await call(factory, context, query="q")
+    cached = await call(factory, context, query="q")
+    limited = await call(factory, context, query="other")
+
+    assert cached["success"] is True
+    assert limited["success"] is False
+    assert "limit" in limited["error"]
+    assert context.tool_call_counts["web_search"] == 1
+
+
+async def test_failed_results_are_not_cached():
+    CountingTool.succeed = False
+    factory = make_factory()
+    context = make_context()
+
+    await call(factory, context, query="q")
+    CountingTool.succeed = True
+    result = await call(factory, context, query="q")
+
+    assert result["success"] is True
+    assert CountingTool.calls == 2
+
+
+async def test_invalidating_tool_clears_cached_results():
+    factory = make_factory()
+    context = make_context()
+
+    await call(factory, context, query="q")
+    await call(factory, context, tool_name="write_file", query="note")
+    await call(factory, context, query="q")
+
+    assert CountingTool.calls == 2
+
+
+async def test_tools_without_cache_policy_always_execute():
+    factory = make_factory(cache=False)
+    context = make_context()
+
+    await call(factory, context, query="q")
+    await call(factory, context, query="q")
+
+    assert CountingTool.calls == 2
+    assert factory.get_cache_stats() == {"enabled": False}
+
+
+# =============================================================================
+# ToolResultCache / Policy Tests
+# =============================================================================
+
+
+def test_normalize_args_is_order_and_whitespace_insensitive():
+    assert normalize_args({"b": 1, "a": " x "}) == normalize_args({"a": "x", "b": 1, "c": None})
+    assert normalize_args({"a": "x"}) != normalize_args({"a": "y"})
+
+
+def test_policy_from_manifest():
+    assert ToolCachePolicy.from_manifest(None) is None
+    assert ToolCachePolicy.from_manifest(True).scope == "session"
+
+    policy = ToolCachePolicy.from_manifest({"ttl_seconds": 10, "scope": "bogus"})
+    assert policy.ttl_seconds == 10
+    assert policy.scope == "session"
+
+
+async def test_entries_expire_after_ttl():
+    cache = ToolResultCache()
+    policy = ToolCachePolicy(ttl_seconds=0.01, scope="global")
+    execute = AsyncMock(return_value=ToolResult(content="x", success=True))
+    context = make_context()
+
+    await cache.get_or_call("t", {}, context, policy, execute)
+    time.sleep(0.02)
+    _, from_cache = await cache.get_or_call("t", {}, context, policy, execute)
+
+    assert from_cache is False
+    assert execute.await_count == 2
+
+
+async def test_cache_evicts_least_recently_used():
+    cache = ToolResultCache(max_entries=2)
+    policy = ToolCachePolicy(scope="global")
+    execute = AsyncMock(return_value=ToolResult(content="x", success=True))
+    context = make_context()
+
+    for query in ("a", "b", "c"):
+        await cache.get_or_call("t", {"q": query}, context, policy, execute)
+
+    assert cache.get_stats()["entries"] == 2
+    assert cache.lookup(cache.make_key("t", {"q": "a"}, context, policy)) is None
+
+
+async def test_coalesced_callers_receive_leader_exception():
+    cache = ToolResultCache()
+    policy = ToolCachePolicy(scope="global")
+    context = make_context()
+
+    async def boom():
+        await asyncio.sleep(0.01)
+        raise RuntimeError("boom")
+
+    results = await asyncio.gather(
+        cache.get_or_call("t", {}, context, policy, boom),
+        cache.get_or_call("t", {}, context, policy, boom),
+        return_exceptions=True,
+    )
+
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert cache.get_stats()["in_flight"] == 0
+
+
+def test_tools_config_cache_settings():
+    config = ToolsConfig.from_dict({"result_cache_enabled": False, "result_cache_max_entries": 10})
+
+    assert config.result_cache_enabled is False
+    assert config.result_cache_max_entries == 10
+    assert ToolsConfig().result_cache_enabled is True
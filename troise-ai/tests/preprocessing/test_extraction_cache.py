@@ -0,0 +1,199 @@
+"""Unit tests for the content-addressed extraction cache."""
+import asyncio
+import hashlib
+
+from app.preprocessing.extraction_cache import (
+    CACHE_SESSION_ID,
+    ExtractionResultCache,
+    extraction_cache_key,
+    is_cacheable,
+    write_and_hash,
+)
+from app.preprocessing.extraction_router import FileExtractionRouter
+from app.preprocessing.extractors.interface import ExtractionResult
+from app.preprocessing.extractors.text_extractor import TextExtractor
+
+
+class FakeStorage:
+    """In-memory IFileStorage stand-in."""
+
+    def __init__(self):
+        self.objects = {}
+        self.fail = False
+
+    async def upload(self, file_id, content, mimetype, session_id):
+        if self.fail:
+            raise ConnectionError("storage down")
+        self.objects[f"{session_id}:{file_id}"] = content
+        return f"{session_id}:{file_id}"
+
+    async def download(self, file_id):
+        if self.fail:
+            raise ConnectionError("storage down")
+        if file_id not in self.objects:
+            raise FileNotFoundError(file_id)
+        return self.objects[file_id]
+
+
+class CountingExtractor:
+    """Extractor returning the file text, counting calls."""
+
+    supported_mimetypes = ["text/plain"]
+    cache_version = "1"
+
+    def __init__(self, status="success", delay=0.0):
+        self.calls = 0
+        self.status = status
+        self.delay = delay
+
+    async def extract(self, file_path, mimetype):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        with open(file_path) as f:
+            text = f.read()
+        return ExtractionResult(
+            text=text,
+            extractor_name="CountingExtractor",
+            status=self.status,
+            metadata={"word_count": len(text.split())},
+        )
+
+
+def write_file(path, text):
+    return str(path), write_and_hash(path, text.encode())
+
+
+# =============================================================================
+# Hashing and Keys
+# =============================================================================
+
+def test_write_and_hash_matches_sha256(tmp_path):
+    data = b"x" * (3 * 1024 * 1024 + 7)
+
+    digest = write_and_hash(tmp_path / "f.bin", data)
+
+    assert digest == hashlib.sha256(data).hexdigest()
+    assert (tmp_path / "f.bin").read_bytes() == data
+    with open(tmp_path / "f.bin", "rb") as source:
+        assert write_and_hash(tmp_path / "copy.bin", source) == digest
+
+
+def test_key_depends_on_extractor_version():
+    content = hashlib.sha256(b"a").hexdigest()
+
+    assert extraction_cache_key(content, "PDFExtractor", "1:500") != \
+        extraction_cache_key(content, "PDFExtractor", "1:100")
+    assert ":" not in extraction_cache_key(content, "PDFExtractor", "1:500")
+
+
+def test_only_complete_results_are_cacheable():
+    assert is_cacheable(ExtractionResult("t", "X", "success"))
+    assert is_cacheable(ExtractionResult("t", "X", "partial", metadata={"truncated": True}))
+    assert not is_cacheable(ExtractionResult("t", "X", "partial", metadata={"truncated": True, "timed_out": True}))
+    assert not is_cacheable(ExtractionResult("", "X", "partial", "Vision model error"))
+    assert not is_cacheable(ExtractionResult("", "X", "error", "boom"))
+
+
+# =============================================================================
+# Cache
+# =============================================================================
+
+async def test_cache_reads_through_to_storage():
+    storage = FakeStorage()
+    await ExtractionResultCache(storage=storage).put(
+        "k", ExtractionResult("hello", "X", "success", metadata={"page_count": 2})
+    )
+
+    fresh = ExtractionResultCache(storage=storage)
+    result = await fresh.get("k")
+
+    assert f"{CACHE_SESSION_ID}:k" in storage.objects
+    assert result.text == "hello"
+    assert result.metadata == {"page_count": 2}
+    assert fresh.get_stats()["memory_entries"] == 1
+
+
+async def test_cache_memory_is_bounded_by_bytes():
+    cache = ExtractionResultCache(max_memory_entries=10, max_memory_bytes=10)
+
+    await cache.put("a", ExtractionResult("x" * 6, "X", "success"))
+    await cache.put("b", ExtractionResult("y" * 6, "X", "success"))
+
+    assert await cache.get("a") is None
+    assert (await cache.get("b")).text == "y" * 6
+    assert cache.get_stats()["memory_bytes"] == 6
+
+
+async def test_storage_errors_are_misses():
+    storage = FakeStorage()
+    storage.fail = True
+    cache = ExtractionResultCache(storage=storage, max_memory_entries=0)
+
+    await cache.put("k", ExtractionResult("t", "X", "success"))
+
+    assert await cache.get("k") is None
+    assert cache.get_stats()["storage_errors"] == 2
+
+
+# =============================================================================
+# Router Integration
+# =============================================================================
+
+async def test_same_content_extracts_once_across_sessions(tmp_path):
+    extractor = CountingExtractor()
+    router = FileExtractionRouter(cache=ExtractionResultCache(storage=FakeStorage()))
+    router.register(extractor)
+    path_a, hash_a = write_file(tmp_path / "a.txt", "same bytes")
+    path_b, hash_b = write_file(tmp_path / "b.txt", "same bytes")
+    store_a, store_b = {}, {}
+
+    [ref_a] = await router.process_files([{"path": path_a, "mimetype": "text/plain", "sha256": hash_a}], store_a)
+    [ref_b] = await router.process_files([{"path": path_b, "mimetype": "text/plain"}], store_b)
+
+    assert extractor.calls == 1
+    assert store_b[ref_b.file_id]["content"] == "same bytes"
+    assert store_b[ref_b.file_id]["metadata"]["filename"] == "b.txt"
+    assert store_b[ref_b.file_id]["metadata"]["cache_hit"] is True
+    assert "cache_hit" not in store_a[ref_a.file_id]["metadata"]
+
+
+async def test_concurrent_identical_files_share_one_extraction(tmp_path):
+    extractor = CountingExtractor(delay=0.05)
+    router = FileExtractionRouter(cache=ExtractionResultCache())
+    router.register(extractor)
+    path, digest = write_file(tmp_path / "a.txt", "payload")
+
+    refs = await asyncio.gather(*[
+        router.process_file(path, "text/plain", {}, content_hash=digest) for _ in range(5)
+    ])
+
+    assert extractor.calls == 1
+    assert all(ref.status == "success" for ref in refs)
+
+
+async def test_failed_extractions_are_retried(tmp_path):
+    extractor = CountingExtractor(status="error")
+    router = FileExtractionRouter(cache=ExtractionResultCache())
+    router.register(extractor)
+    path, digest = write_file(tmp_path / "a.txt", "payload")
+
+    await router.process_file(path, "text/plain", {}, content_hash=digest)
+    await router.process_file(path, "text/plain", {}, content_hash=digest)
+
+    assert extractor.calls == 2
+
+
+async def test_text_files_bypass_the_cache(tmp_path):
+    """Plain text is decoded directly: no hashing, no cache entry."""
+    cache = ExtractionResultCache()
+    router = FileExtractionRouter(cache=cache)
+    router.register(TextExtractor())
+    path = tmp_path / "notes.txt"
+    path.write_text("plain notes")
+
+    ref = await router.process_file(str(path), "text/plain", {})
+
+    assert ref.status == "success"
+    stats = cache.get_stats()
+    assert stats["misses"] == 0
+    assert stats["memory_entries"] == 0
@@ -0,0 +1,126 @@
+"""Unit tests for ImageExtractor (shared client, concurrency, downscaling)."""
+import asyncio
+import io
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+Image = pytest.importorskip("PIL.Image")
+
+from app.core.config import PreprocessingConfig
+from app.preprocessing.extraction_router import FileExtractionRouter
+from app.preprocessing.extractors.image_extractor import ImageExtractor, downscale_image
+
+
+def make_png(width, height):
+    image = Image.new("RGB", (width, height))
+    for x in range(0, width, 7):
+        for y in range(0, height, 5):
+            image.putpixel((x, y), ((x * 3) % 256, (y * 7) % 256, (x + y) % 256))
+    out = io.BytesIO()
+    image.save(out, format="PNG")
+    return out.getvalue()
+
+
+class FakeVisionClient:
+    """Blocking ollama.Client stand-in that tracks concurrent calls."""
+
+    def __init__(self, delay=0.1):
+        self.delay = delay
+        self.active = 0
+        self.peak = 0
+        self.image_sizes = []
+        self._lock = threading.Lock()
+
+    def chat(self, model, messages, options):
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        self.image_sizes.append(len(messages[0]["images"][0]))
+        time.sleep(self.delay)
+        with self._lock:
+            self.active -= 1
+        return {"message": {"content": f"description by {model}"}}
+
+
+def make_extractor(client, max_concurrency=2, max_px=1536):
+    config = SimpleNamespace(
+        profile=SimpleNamespace(vision_model="vision-model"),
+        get_model_capabilities=lambda model: None,
+        preprocessing=PreprocessingConfig(
+            vision_max_concurrency=max_concurrency,
+            vision_max_image_px=max_px,
+        ),
+    )
+    extractor = ImageExtractor(config=config, vram_orchestrator=AsyncMock())
+    extractor._client = client
+    return extractor
+
+
+# =============================================================================
+# Downscaling
+# =============================================================================
+
+def test_downscale_caps_longest_side():
+    data = make_png(2400, 1200)
+
+    resized, size = downscale_image(data, 800)
+
+    assert size == (800, 400)
+    assert len(resized) < len(data)
+    assert Image.open(io.BytesIO(resized)).size == (800, 400)
+
+
+def test_small_or_undecodable_images_are_untouched():
+    small = make_png(100, 50)
+
+    assert downscale_image(small, 800) == (small, None)
+    assert downscale_image(b"not an image", 800) == (b"not an image", None)
+    assert downscale_image(small, 0) == (small, None)
+
+
+# =============================================================================
+# Extraction
+# =============================================================================
+
+async def test_images_are_described_concurrently_up_to_limit(tmp_path):
+    client = FakeVisionClient(delay=0.2)
+    router = FileExtractionRouter()
+    router.register(make_extractor(client, max_concurrency=5))
+    files = []
+    for i in range(5):
+        path = tmp_path / f"shot{i}.png"
+        path.write_bytes(make_png(64, 64))
+        files.append({"path": str(path), "mimetype": "image/png"})
+
+    refs = await router.process_files(files, {})
+
+    assert [ref.filename for ref in refs] == [f"shot{i}.png" for i in range(5)]
+    assert all(ref.status == "success" for ref in refs)
+    assert client.peak == 5
+
+
+async def test_concurrency_limit_is_respected(tmp_path):
+    client = FakeVisionClient(delay=0.05)
+    extractor = make_extractor(client, max_concurrency=2)
+    path = tmp_path / "shot.png"
+    path.write_bytes(make_png(64, 64))
+
+    await asyncio.gather(*[extractor.extract(str(path), "image/png") for _ in range(6)])
+
+    assert client.peak == 2
+
+
+async def test_large_image_is_downscaled_before_upload(tmp_path):
+    client = FakeVisionClient(delay=0)
+    extractor = make_extractor(client, max_px=512)
+    path = tmp_path / "big.png"
+    path.write_bytes(make_png(2048, 2048))
+
+    result = await extractor.extract(str(path), "image/png")
+
+    assert result.status == "success"
+    assert result.metadata["sent_bytes"] < result.metadata["size_bytes"]
@@ -0,0 +1,196 @@
+"""Unit tests for PDFExtractor (process pool, page ranges, caps)."""
+import asyncio
+import time
+
+import pytest
+
+pypdf = pytest.importorskip("pypdf")
+from pypdf.generic import DecodedStreamObject, DictionaryObject, NameObject
+
+from app.core.config import PreprocessingConfig
+from app.preprocessing.extractors import pdf_extractor
+from app.preprocessing.extractors.pdf_extractor import (
+    PDFExtractor,
+    PDFExtractionTimeout,
+    shutdown_pdf_pool,
+)
+
+
+def make_pdf(path, pages, blank=()):
+    """Write a PDF whose page N contains the text 'Page N content'."""
+    writer = pypdf.PdfWriter()
+    font = DictionaryObject({
+        NameObject("/Type"): NameObject("/Font"),
+        NameObject("/Subtype"): NameObject("/Type1"),
+        NameObject("/BaseFont"): NameObject("/Helvetica"),
+    })
+    for n in range(1, pages + 1):
+        page = writer.add_blank_page(612, 792)
+        if n in blank:
+            continue
+        stream = DecodedStreamObject()
+        stream.set_data(f"BT /F1 12 Tf 72 720 Td (Page {n} content) Tj ET".encode())
+        page[NameObject("/Contents")] = writer._add_object(stream)
+        page[NameObject("/Resources")] = DictionaryObject({
+            NameObject("/Font"): DictionaryObject({NameObject("/F1"): font})
+        })
+    with open(path, "wb") as f:
+        writer.write(f)
+    return str(path)
+
+
+@pytest.fixture(scope="module", autouse=True)
+def pdf_pool():
+    """Share one worker pool across the module (spawning workers is slow)."""
+    yield
+    shutdown_pdf_pool()
+
+
+def extractor(**overrides):
+    return PDFExtractor(PreprocessingConfig(pdf_workers=2, pdf_pages_per_task=3, **overrides))
+
+
+# =============================================================================
+# Extraction Tests
+# =============================================================================
+
+async def test_extract_all_pages_in_order(tmp_path):
+    """Page ranges are reassembled in document order."""
+    path = make_pdf(tmp_path / "doc.pdf", 10)
+
+    result = await extractor().extract(path, "application/pdf")
+
+    assert result.status == "success"
+    assert result.metadata["page_count"] == 10
+    markers = [f"--- Page {n} ---\nPage {n} content" for n in range(1, 11)]
+    assert result.text == "\n\n".join(markers)
+
+
+async def test_extract_pages_streams_page_numbers(tmp_path):
+    """extract_pages yields every page once, in order."""
+    path = make_pdf(tmp_path / "doc.pdf", 8, blank={4})
+
+    pages = [(n, text) async for n, text in extractor().extract_pages(path)]
+
+    assert [n for n, _ in pages] == list(range(1, 9))
+    assert pages[3][1] == ""
+    assert pages[7][1] == "Page 8 content"
+
+
+async def test_page_cap_marks_result_partial(tmp_path):
+    """Pages beyond pdf_max_pages are skipped and reported."""
+    path = make_pdf(tmp_path / "doc.pdf", 10)
+
+    result = await extractor(pdf_max_pages=4).extract(path, "application/pdf")
+
+    assert result.status == "partial"
+    assert result.metadata["truncated"] is True
+    assert "Page 4 content" in result.text
+    assert "Page 5" not in result.text
+
+
+async def test_timeout_raises_after_budget(tmp_path):
+    """A zero budget stops extraction before any range is awaited."""
+    path = make_pdf(tmp_path / "doc.pdf", 6)
+    page_count = await extractor().count_pages(path)
+    pool = pdf_extractor._get_pool(2)
+
+    with pytest.raises(PDFExtractionTimeout):
+        async for _ in extractor(pdf_timeout_seconds=0).extract_pages(path, page_count):
+            pass
+
+    # Ranges still running are stopped by replacing the pool
+    assert pdf_extractor._get_pool(2) is not pool
+
+
+async def test_page_count_timeout_returns_error(tmp_path):
+    """Opening the document is bounded by the same budget."""
+    path = make_pdf(tmp_path / "doc.pdf", 2)
+
+    result = await extractor(pdf_timeout_seconds=0).extract(path, "application/pdf")
+
+    assert result.status == "error"
+    assert result.error_message == "PDF extraction timed out"
+
+
+async def test_recycle_pool_terminates_running_workers():
+    """A task that never finishes does not keep its worker after a timeout."""
+    pool = pdf_extractor._get_pool(1)
+    future = asyncio.get_running_loop().run_in_executor(pool, time.sleep, 60)
+    while not pool._processes:
+        await asyncio.sleep(0.01)
+    workers = list(pool._processes.values())
+
+    pdf_extractor._recycle_pool(pool)
+
+    for worker in workers:
+        worker.join(timeout=5)
+        assert not worker.is_alive()
+    with pytest.raises(Exception):
+        await future
+
+
+async def test_timeout_does_not_cancel_other_documents(tmp_path):
+    """A timed-out document recycles the pool; a concurrent one gets an error result."""
+    shutdown_pdf_pool()
+    pool = pdf_extractor._get_pool(1)
+    # Occupy the only worker so both page counts queue behind it
+    blocker = asyncio.get_running_loop().run_in_executor(pool, time.sleep, 60)
+    slow = make_pdf(tmp_path / "slow.pdf", 2)
+    other = make_pdf(tmp_path / "other.pdf", 2)
+
+    slow_result, other_result = await asyncio.gather(
+        extractor(pdf_timeout_seconds=0.5).extract(slow, "application/pdf"),
+        extractor().extract(other, "application/pdf"),
+    )
+
+    assert slow_result.error_message == "PDF extraction timed out"
+    assert other_result.status == "error"
+    assert other_result.error_message == "PDF extraction worker crashed"
+    with pytest.raises(Exception):
+        await blocker
+    # The next extraction starts on a fresh pool
+    assert (await extractor().extract(other, "application/pdf")).status == "success"
+
+
+async def test_broken_pool_only_retires_its_own_pool(tmp_path, monkeypatch):
+    """A broken pool that was already replaced does not take the new pool down."""
+    path = make_pdf(tmp_path / "doc.pdf", 2)
+    fresh = pdf_extractor._get_pool(2)
+
+    async def broken_count(self, file_path, timeout=None):
+        raise pdf_extractor.BrokenProcessPool("worker died")
+
+    monkeypatch.setattr(PDFExtractor, "count_pages", broken_count)
+    result = await extractor().extract(path, "application/pdf")
+
+    assert result.status == "error"
+    assert pdf_extractor._get_pool(2) is fresh
+
+
+async def test_image_only_pdf_is_partial(tmp_path):
+    """PDFs without a text layer keep the original 'no extractable text' result."""
+    path = make_pdf(tmp_path / "scan.pdf", 2, blank={1, 2})
+
+    result = await extractor().extract(path, "application/pdf")
+
+    assert result.status == "partial"
+    assert "no extractable text" in result.text
+
+
+async def test_corrupt_pdf_returns_error(tmp_path):
+    """Parse failures in a worker come back as an error result."""
+    path = tmp_path / "broken.pdf"
+    path.write_bytes(b"%PDF-1.4 not really a pdf")
+
+    result = await extractor().extract(str(path), "application/pdf")
+
+    assert result.status == "error"
+
+
+async def test_missing_file_returns_error(tmp_path):
+    """Missing files are reported without touching the pool."""
+    result = await extractor().extract(str(tmp_path / "missing.pdf"), "application/pdf")
+
+    assert result.status == "error"
+    assert result.error_message.startswith("File not found")
@@ -0,0 +1,290 @@
+"""Tests for PromptComposer layouts and the static prefix cache.
+
+Includes a simulated prefill comparison against a prefix-caching backend stand-in
+that models how Ollama/SGLang/vLLM reuse KV cache for a shared prompt
+prefix: only tokens after the longest cached prefix are prefilled.
+"""
+from dataclasses import dataclass
+from datetime import date
+from typing import Dict, List, Optional
+
+import pytest
+
+from app.core.context import UserProfile
+from app.prompts import PromptComposer, prompt_registry
+from app.prompts import composer as composer_module
+
+
+class FakeRegistry:
+    """In-memory prompt registry with a bumpable version."""
+
+    def __init__(self, prompts: Dict[str, str]):
+        self.prompts = prompts
+        self.version = 0
+        self.loads = 0
+
+    def get_prompt(self, category, name, profile=None, graph_domain=None):
+        self.loads += 1
+        key = f"{category}/{name}"
+        if key not in self.prompts:
+            raise FileNotFoundError(key)
+        return self.prompts[key]
+
+    def clear_cache(self):
+        self.version += 1
+
+
+@pytest.fixture
+def registry():
+    return FakeRegistry({
+        "agents/general": (
+            "Date: {current_date}\nYou are helpful.\n\n{interface_context}\n\n"
+            "{personalization_context}"
+        ),
+        "agents/plain": "You are plain.\n\n{interface_context}",
+        "layers/interface_discord": "Use Discord markdown.",
+    })
+
+
+def make_user(style: str) -> UserProfile:
+    return UserProfile(user_id=f"user-{style}", communication_style=style)
+
+
+# =============================================================================
+# Layout Tests
+# =============================================================================
+
+def test_legacy_layout_prepends_date(registry):
+    """Legacy layout keeps the date header at the start of the prompt."""
+    composer = PromptComposer(registry=registry, layout="legacy")
+
+    prompt = composer.compose_agent_prompt("general", "discord", user_profile=make_user("terse"))
+
+    assert prompt.startswith(f"Today's date: {date.today().isoformat()}")
+    assert "User prefers terse communication style." in prompt
+
+
+def test_default_layout_without_config_is_legacy(registry):
+    """Composer without config falls back to the legacy layout."""
+    composer = PromptComposer(registry=registry)
+
+    assert composer.layout == "legacy"
+
+
+def test_stable_layout_orders_static_user_request(registry):
+    """Stable layout puts agent/interface layers first, then user, then request."""
+    composer = PromptComposer(registry=registry, layout="stable_prefix")
+
+    prompt = composer.compose_agent_prompt("general", "discord", user_profile=make_user("terse"))
+
+    assert prompt.startswith("Date: see the Request Context section")
+    interface_pos = prompt.index("Use Discord markdown.")
+    user_pos = prompt.index("## User Context\nUser prefers terse communication style.")
+    date_pos = prompt.index(f"## Request Context\nToday's date: {date.today().isoformat()}")
+    assert interface_pos < user_pos < date_pos
+
+
+def test_stable_layout_prefix_identical_across_users(registry):
+    """Static prefix is byte-identical regardless of user personalization."""
+    composer = PromptComposer(registry=registry, layout="stable_prefix")
+
+    a = composer.compose_agent_prompt("general", "discord", user_profile=make_user("terse"))
+    b = composer.compose_agent_prompt("general", "discord", user_profile=make_user("verbose"))
+
+    split = "## User Context"
+    assert a.split(split)[0] == b.split(split)[0]
+    assert a != b
+
+
+def test_stable_layout_skips_user_section_when_template_has_none(registry):
+    """Templates without personalization placeholder get no User Context section."""
+    composer = PromptComposer(registry=registry, layout="stable_prefix")
+
+    prompt = composer.compose_agent_prompt("plain", "discord", user_profile=make_user("terse"))
+
+    assert "## User Context" not in prompt
+    assert "## Request Context" in prompt
+
+
+def test_stable_layout_no_preferences_placeholder(registry):
+    """Missing user profile renders the default no-preferences text."""
+    composer = PromptComposer(registry=registry, layout="stable_prefix")
+
+    prompt = composer.compose_agent_prompt("general", "discord")
+
+    assert "## User Context\nNo specific user preferences." in prompt
+
+
+def test_skill_static_sections_precede_dynamic_layers(registry):
+    """Skill references/guardrails stay in the static prefix."""
+    composer = PromptComposer(registry=registry, layout="stable_prefix")
+
+    prompt = composer.compose_skill_prompt(
+        "Skill body.\n{personalization_context}",
+        "discord",
+        user_profile=make_user("terse"),
+        static_sections=["<guardrails>\n- no\n</guardrails>"],
+    )
+
+    assert prompt.index("<guardrails>") < prompt.index("## User Context")
+
+
+def test_legacy_skill_static_sections_appended(registry):
+    """Legacy layout appends static sections at the end (previous behavior)."""
+    composer = PromptComposer(registry=registry, layout="legacy")
+
+    prompt = composer.compose_skill_prompt(
+        "Skill body.", "discord", static_sections=["<guardrails>\nx\n</guardrails>"]
+    )
+
+    assert prompt.endswith("<guardrails>\nx\n</guardrails>")
+
+
+# =============================================================================
+# Prefix Cache Tests
+# =============================================================================
+
+def test_prefix_cache_hits_skip_registry(registry):
+    """Repeated compositions reuse the memoized prefix."""
+    composer = PromptComposer(registry=registry, layout="stable_prefix")
+
+    composer.compose_agent_prompt("general", "discord", user_profile=make_user("a"))
+    loads = registry.loads
+    composer.compose_agent_prompt("general", "discord", user_profile=make_user("b"))
+
+    assert registry.loads == loads
+    stats = composer.get_cache_stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+
+
+def test_prefix_cache_keyed_by_interface_and_profile(registry):
+    """Different interface or profile produce separate cache entries."""
+    composer = PromptComposer(registry=registry, layout="stable_prefix")
+
+    composer.compose_agent_prompt("general", "discord", profile="balanced")
+    composer.compose_agent_prompt("general", "web", profile="balanced")
+    composer.compose_agent_prompt("general", "discord", profile="performance")
+
+    assert composer.get_cache_stats()["size"] == 3
+
+
+def test_prefix_cache_invalidated_by_registry_version(registry):
+    """Reloading prompt files invalidates memoized prefixes."""
+    composer = PromptComposer(registry=registry, layout="stable_prefix")
+
+    first = composer.compose_agent_prompt("general", "discord")
+    registry.prompts["agents/general"] = "Updated.\n{personalization_context}"
+    registry.clear_cache()
+    second = composer.compose_agent_prompt("general", "discord")
+
+    assert first.startswith("Date:")
+    assert second.startswith("Updated.")
+
+
+def test_prefix_cache_bounded(registry):
+    """Cache evicts least recently used prefixes beyond max size."""
+    composer = PromptComposer(registry=registry, layout="stable_prefix", prefix_cache_size=2)
+
+    for interface in ("discord", "web", "cli"):
+        composer.compose_agent_prompt("general", interface)
+
+    assert composer.get_cache_stats()["size"] == 2
+
+
+# =============================================================================
+# Simulated Prefill
+# =============================================================================
+
+@dataclass
+class PrefillRecord:
+    prompt_tokens: int
+    cached_tokens: int
+    prefill_seconds: float
+
+
+class PrefixCachingBackend:
+    """Stand-in for a backend with automatic prefix caching.
+
+    Tokens are approximated as 4 characters. Prefill cost is charged only
+    for tokens after the longest prefix shared with a previously seen prompt.
+    """
+
+    def __init__(self, seconds_per_token: float = 0.0002):
+        self._seconds_per_token = seconds_per_token
+        self._seen: List[str] = []
+        self.records: List[PrefillRecord] = []
+
+    @staticmethod
+    def _common_prefix(a: str, b: str) -> int:
+        n = min(len(a), len(b))
+        i = 0
+        while i < n and a[i] == b[i]:
+            i += 1
+        return i
+
+    def prefill(self, prompt: str) -> PrefillRecord:
+        cached_chars = max((self._common_prefix(prompt, s) for s in self._seen), default=0)
+        self._seen.append(prompt)
+        prompt_tokens = len(prompt) // 4
+        cached_tokens = cached_chars // 4
+        record = PrefillRecord(
+            prompt_tokens=prompt_tokens,
+            cached_tokens=cached_tokens,
+            prefill_seconds=(prompt_tokens - cached_tokens) * self._seconds_per_token,
+        )
+        self.records.append(record)
+        return record
+
+    @property
+    def total_prefill_seconds(self) -> float:
+        return sum(r.prefill_seconds for r in self.records)
+
+
+def _simulate_prefill(
+    layout: str,
+    users: List[Optional[UserProfile]],
+    days: List[date],
+    monkeypatch,
+) -> Dict[str, float]:
+    """Replay one request per user per day for a few agents through the backend stand-in."""
+    composer = PromptComposer(registry=prompt_registry, layout=layout)
+    backend = PrefixCachingBackend()
+
+    for day in days:
+        monkeypatch.setattr(composer_module, "date", _fixed_date(day))
+        for agent_name in ("general", "deep_research", "fact_checker"):
+            for user in users:
+                prompt = composer.compose_agent_prompt(
+                    agent_name=agent_name,
+                    interface="discord",
+                    profile="balanced",
+                    user_profile=user,
+                )
+                backend.prefill(prompt)
+
+    return {
+        "prefill_seconds": backend.total_prefill_seconds,
+        "cached_tokens": sum(r.cached_tokens for r in backend.records),
+    }
+
+
+def _fixed_date(day: date):
+    class _FixedDate(date):
+        @classmethod
+        def today(cls):
+            return day
+
+    return _FixedDate
+
+
+def test_stable_prefix_reduces_prefill(monkeypatch):
+    """Stable prefix layout prefills fewer tokens than legacy across users and days."""
+    users = [make_user(style) for style in ("terse", "verbose", "casual")] + [None]
+    days = [date(2026, 1, d) for d in range(1, 6)]
+
+    legacy = _simulate_prefill("legacy", users, days, monkeypatch)
+    stable = _simulate_prefill("stable_prefix", users, days, monkeypatch)
+
+    assert stable["cached_tokens"] > legacy["cached_tokens"]
+    assert stable["prefill_seconds"] < legacy["prefill_seconds"]
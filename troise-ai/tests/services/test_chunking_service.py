@@ -1,8 +1,10 @@
-"""Unit tests for LangChainChunkingService."""
+"""Unit tests for the chunking service."""
 import pytest
 from unittest.mock import MagicMock
 
+from app.services import chunking_service
 from app.services.chunking_service import (
+    TokenChunkingService,
     LangChainChunkingService,
     ChunkingServiceError,
     create_chunking_service,
@@ -373,3 +375,76 @@ async def test_chunk_text_newlines_preserved():
     assert "First" in all_text
     assert "Second" in all_text
     assert "Third" in all_text
+
+
+# =============================================================================
+# Token-Offset Chunking Tests
+# =============================================================================
+
+async def test_chunks_are_exact_slices_of_text():
+    """Chunk offsets index the original text, including multi-byte characters."""
+    service = TokenChunkingService(chunk_size=40, chunk_overlap=8)
+    text = "Überschrift\n\n" + "Grüße aus Köln, 世界. " * 60
+
+    chunks = await service.chunk_text(text, "https://example.com")
+
+    assert chunks[0].start_char == 0
+    assert chunks[-1].end_char == len(text)
+    for chunk in chunks:
+        assert text[chunk.start_char:chunk.end_char] == chunk.text
+        assert 0 < chunk.token_count <= 40
+    for previous, current in zip(chunks, chunks[1:]):
+        assert current.start_char < previous.end_char  # Overlapping
+
+
+async def test_chunks_end_on_separators():
+    """Cuts are pulled back to paragraph or sentence boundaries."""
+    service = TokenChunkingService(chunk_size=60, chunk_overlap=0)
+    text = "\n\n".join("This is a sentence. " * 6 for _ in range(20))
+
+    chunks = await service.chunk_text(text, "https://example.com")
+
+    assert "".join(c.text for c in chunks) == text
+    for chunk in chunks[:-1]:
+        assert chunk.text.endswith(("\n\n", ". "))
+
+
+async def test_large_text_matches_inline_result(monkeypatch):
+    """Texts chunked on the worker pool match inline chunking."""
+    service = TokenChunkingService(chunk_size=100, chunk_overlap=20)
+    text = "Word " * 2000
+
+    inline = await service.chunk_text(text, "https://example.com")
+    monkeypatch.setattr(chunking_service, "OFFLOAD_MIN_CHARS", 0)
+    offloaded = await service.chunk_text(text, "https://example.com")
+
+    assert [(c.start_char, c.end_char, c.token_count) for c in inline] == \
+        [(c.start_char, c.end_char, c.token_count) for c in offloaded]
+
+
+async def test_first_small_text_builds_table_on_pool(monkeypatch):
+    """The vocabulary table is built on the worker pool, not the event loop."""
+    offloaded = []
+    run_in_pool = chunking_service.run_in_chunking_pool
+
+    async def recording_run_in_pool(func, *args):
+        offloaded.append(func)
+        return await run_in_pool(func, *args)
+
+    monkeypatch.setattr(chunking_service, "run_in_chunking_pool", recording_run_in_pool)
+    monkeypatch.setattr(chunking_service, "_token_lengths", {})
+    service = TokenChunkingService(chunk_size=100, chunk_overlap=20)
+
+    await service.chunk_text("Short text.", "https://example.com")
+    await service.chunk_text("Another short text.", "https://example.com")
+
+    assert offloaded == [chunking_service.split_token_spans]
+    assert chunking_service.has_token_lengths(service.tokenizer)
+
+
+async def test_overlap_must_be_smaller_than_chunk_size():
+    """chunk_text() rejects an overlap that would never advance."""
+    service = TokenChunkingService()
+
+    with pytest.raises(ValueError):
+        await service.chunk_text("Some text", "https://example.com", chunk_size=10, chunk_overlap=10)
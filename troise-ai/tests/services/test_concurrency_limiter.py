@@ -0,0 +1,274 @@
+"""Tests for adaptive backend concurrency limits.
+
+Tests cover:
+- ConcurrencySettings: parsing from BackendConfig.options
+- AdaptiveConcurrencyLimiter: slot gating, AIMD increase/decrease
+- BackendManager: per-backend/per-model limiters
+- ConcurrencySlotMixin: model streams hold a slot per generation
+"""
+import asyncio
+from typing import Any, AsyncGenerator, Dict
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.core.config import BackendConfig, Config
+from app.core.models.concurrency import ConcurrencySlotMixin
+from app.services.backend_manager import BackendManager
+from app.services.concurrency_limiter import (
+    AdaptiveConcurrencyLimiter,
+    ConcurrencySettings,
+)
+
+
+# =============================================================================
+# Helpers
+# =============================================================================
+
+
+class SimulatedBackend:
+    """Backend with fixed parallel capacity; excess requests queue (TTFT grows)."""
+
+    def __init__(self, capacity: int, service_time: float):
+        self._sem = asyncio.Semaphore(capacity)
+        self._service_time = service_time
+        self.running = 0
+        self.peak = 0
+
+    async def generate(self, lease) -> None:
+        async with self._sem:
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+            if lease:
+                lease.mark_first_token()
+            await asyncio.sleep(self._service_time)
+            self.running -= 1
+
+
+@pytest.fixture
+def backend_config():
+    config = MagicMock(spec=Config)
+    config.backends = {
+        "ollama": BackendConfig(
+            type="ollama",
+            host="http://localhost:11434",
+            options={"num_ctx": 32768, "max_concurrency": 3},
+        ),
+    }
+    profile_backend = BackendConfig(
+        type="ollama", host="http://localhost:11434", options={"min_concurrency": 2}
+    )
+    config.get_backend_for_model = MagicMock(
+        side_effect=lambda model_id: profile_backend if model_id != "unknown" else None
+    )
+    return config
+
+
+# =============================================================================
+# ConcurrencySettings Tests
+# =============================================================================
+
+
+def test_settings_from_options():
+    settings = ConcurrencySettings.from_options(
+        {"max_concurrency": 8, "target_latency_seconds": 3, "num_ctx": 1}, "sglang"
+    )
+
+    assert settings.max_concurrency == 8
+    assert settings.target_latency_seconds == 3.0
+    assert settings.min_concurrency == 1
+
+
+def test_settings_defaults_by_backend_type():
+    assert ConcurrencySettings.from_options({}, "ollama").max_concurrency == 4
+    assert ConcurrencySettings.from_options({}, "sglang").max_concurrency == 32
+    assert ConcurrencySettings.from_options({}, "comfyui").max_concurrency == 1
+    assert ConcurrencySettings.from_options({"num_parallel": 2}, "ollama").max_concurrency == 2
+
+
+# =============================================================================
+# AdaptiveConcurrencyLimiter Tests
+# =============================================================================
+
+
+async def test_limiter_caps_in_flight():
+    limiter = AdaptiveConcurrencyLimiter("t", ConcurrencySettings(max_concurrency=2))
+    backend = SimulatedBackend(capacity=10, service_time=0.02)
+
+    async def work():
+        async with limiter.slot() as lease:
+            await backend.generate(lease)
+
+    await asyncio.gather(*(work() for _ in range(6)))
+
+    assert backend.peak == 2
+    assert limiter.in_flight == 0
+    assert limiter.get_stats()["acquired"] == 6
+
+
+async def test_limiter_backs_off_on_slow_first_token():
+    settings = ConcurrencySettings(max_concurrency=8, target_latency_seconds=0.01)
+    limiter = AdaptiveConcurrencyLimiter("t", settings)
+
+    async with limiter.slot():
+        await asyncio.sleep(0.02)  # No first token before target
+
+    assert limiter.limit == 4
+    assert limiter.get_stats()["decreases"] == 1
+
+
+async def test_limiter_decreases_once_per_window():
+    """Slow results from slots acquired before a decrease don't compound it."""
+    settings = ConcurrencySettings(max_concurrency=8, target_latency_seconds=0.01)
+    limiter = AdaptiveConcurrencyLimiter("t", settings)
+
+    async def slow():
+        async with limiter.slot():
+            await asyncio.sleep(0.02)
+
+    await asyncio.gather(*(slow() for _ in range(8)))
+
+    assert limiter.limit == 4
+
+
+async def test_limiter_backs_off_on_timeout_and_respects_min():
+    settings = ConcurrencySettings(max_concurrency=2, min_concurrency=1)
+    limiter = AdaptiveConcurrencyLimiter("t", settings)
+
+    for _ in range(3):
+        with pytest.raises(asyncio.TimeoutError):
+            async with limiter.slot():
+                raise asyncio.TimeoutError()
+
+    assert limiter.limit == 1
+    assert limiter.get_stats()["overload_errors"] == 3
+
+
+async def test_limiter_ignores_request_errors_and_cancellation():
+    limiter = AdaptiveConcurrencyLimiter("t", ConcurrencySettings(max_concurrency=4))
+
+    with pytest.raises(ValueError):
+        async with limiter.slot():
+            raise ValueError("bad tool spec")
+
+    assert limiter.limit == 4
+    assert limiter.in_flight == 0
+
+
+async def test_limiter_increases_only_when_saturated():
+    settings = ConcurrencySettings(max_concurrency=4, initial_concurrency=1)
+    limiter = AdaptiveConcurrencyLimiter("t", settings)
+
+    for _ in range(3):
+        async with limiter.slot() as lease:
+            lease.mark_first_token()
+
+    # Only the first call filled the limit; sequential use doesn't grow it further
+    assert limiter.limit == 2
+
+    async def work():
+        async with limiter.slot() as lease:
+            lease.mark_first_token()
+            await asyncio.sleep(0.005)
+
+    await asyncio.gather(*(work() for _ in range(20)))
+
+    assert limiter.limit == 4  # Grew under load, capped at max
+
+
+async def test_waiters_released_when_slot_frees():
+    limiter = AdaptiveConcurrencyLimiter("t", ConcurrencySettings(max_concurrency=1))
+    order = []
+
+    async def work(i):
+        async with limiter.slot() as lease:
+            lease.mark_first_token()
+            order.append(i)
+            await asyncio.sleep(0.01)
+
+    await asyncio.gather(*(work(i) for i in range(3)))
+
+    assert sorted(order) == [0, 1, 2]
+    assert limiter.get_stats()["waiting"] == 0
+
+
+async def test_aimd_converges_near_backend_capacity():
+    """Overdriven backend: limiter backs off toward real capacity."""
+    capacity, service = 3, 0.02
+    settings = ConcurrencySettings(max_concurrency=12, target_latency_seconds=service * 1.5)
+    limiter = AdaptiveConcurrencyLimiter("t", settings)
+    backend = SimulatedBackend(capacity=capacity, service_time=service)
+
+    async def work():
+        async with limiter.slot() as lease:
+            await backend.generate(lease)
+
+    await asyncio.gather(*(work() for _ in range(60)))
+
+    assert limiter.limit <= 2 * capacity
+    assert limiter.get_stats()["decreases"] >= 1
+
+
+# =============================================================================
+# BackendManager Tests
+# =============================================================================
+
+
+def test_backend_manager_limiter_per_model(backend_config):
+    manager = BackendManager(backend_config)
+
+    a = manager.get_limiter("model-a")
+    b = manager.get_limiter("model-b")
+
+    assert a is manager.get_limiter("model-a")
+    assert a is not b
+    # max from top-level backend options, min from the profile's BackendConfig
+    assert a.get_stats()["max_concurrency"] == 3
+    assert a._settings.min_concurrency == 2
+
+
+async def test_backend_manager_model_slot(backend_config):
+    manager = BackendManager(backend_config)
+
+    async with manager.model_slot("model-a") as lease:
+        assert lease is not None
+        assert manager.get_concurrency_stats()["ollama:model-a"]["in_flight"] == 1
+
+    async with manager.model_slot("unknown") as lease:
+        assert lease is None
+
+
+# =============================================================================
+# ConcurrencySlotMixin Tests
+# =============================================================================
+
+
+class FakeBaseModel:
+    async def stream(self, messages, **kwargs) -> AsyncGenerator[Dict[str, Any], None]:
+        for i in range(3):
+            yield {"chunk": i}
+
+
+class FakeModel(ConcurrencySlotMixin, FakeBaseModel):
+    pass
+
+
+async def test_model_stream_holds_slot_for_generation():
+    limiter = AdaptiveConcurrencyLimiter("t", ConcurrencySettings(max_concurrency=2))
+    model = FakeModel()
+    model.set_slot_provider(limiter.slot)
+
+    events = []
+    async for event in model.stream([]):
+        events.append(event)
+        assert limiter.in_flight == 1
+
+    assert len(events) == 3
+    assert limiter.in_flight == 0
+    assert limiter.get_stats()["latency_ewma_ms"] is not None
+
+
+async def test_model_stream_without_provider():
+    events = [e async for e in FakeModel().stream([])]
+
+    assert len(events) == 3
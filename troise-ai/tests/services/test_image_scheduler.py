@@ -0,0 +1,303 @@
+"""Tests for image generation batching and the content-addressed result cache.
+
+Tests cover:
+- ComfyUIClient.generate_image_batch: multi-branch workflow, one submission
+- ImageGenerationScheduler: batching, coalescing, cache hits, failures
+- ImageResultCache: memory LRU over file storage
+- Throughput against a fake ComfyUI with per-workflow overhead
+"""
+import asyncio
+import itertools
+from typing import Dict
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from app.services.backend_manager import ComfyUIClient
+from app.services.image_scheduler import (
+    ImageGenerationScheduler,
+    ImageRequest,
+    ImageResultCache,
+    create_image_scheduler,
+    image_cache_key,
+)
+
+
+# =============================================================================
+# Fake ComfyUI
+# =============================================================================
+
+
+class FakeComfyUI:
+    """ComfyUI stand-in: serial execution, fixed per-workflow and per-image cost.
+
+    /ws is not served, so the client falls back to history polling. The
+    workflow runs inside POST /prompt, so history is ready on the first poll.
+    """
+
+    def __init__(self, workflow_overhead: float = 0.0, per_image: float = 0.0):
+        self.workflow_overhead = workflow_overhead
+        self.per_image = per_image
+        self.submissions = 0
+        self._gpu = asyncio.Lock()
+        self._history: Dict[str, dict] = {}
+        self._files: Dict[str, bytes] = {}
+        self._ids = itertools.count()
+
+    def app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_post("/prompt", self.prompt)
+        app.router.add_get("/history/{prompt_id}", self.history)
+        app.router.add_get("/view", self.view)
+        return app
+
+    async def prompt(self, request: web.Request) -> web.Response:
+        workflow = (await request.json())["prompt"]
+        self.submissions += 1
+        prompt_id = f"p{next(self._ids)}"
+        save_nodes = [n for n, node in workflow.items() if node["class_type"] == "SaveImage"]
+
+        async with self._gpu:
+            await asyncio.sleep(self.workflow_overhead + self.per_image * len(save_nodes))
+
+        outputs = {}
+        for node_id in save_nodes:
+            prefix = node_id[:-1]  # "8" -> "", "b0_8" -> "b0_"
+            text = workflow[prefix + "4"]["inputs"]["text"]
+            seed = workflow[prefix + "6"]["inputs"]["seed"]
+            filename = f"{prompt_id}_{node_id}.png"
+            self._files[filename] = f"{text}|{seed}".encode()
+            outputs[node_id] = {"images": [{"filename": filename, "subfolder": "", "type": "output"}]}
+
+        self._history[prompt_id] = {"outputs": outputs}
+        return web.json_response({"prompt_id": prompt_id})
+
+    async def history(self, request: web.Request) -> web.Response:
+        prompt_id = request.match_info["prompt_id"]
+        if prompt_id not in self._history:
+            return web.json_response({})
+        return web.json_response({prompt_id: self._history[prompt_id]})
+
+    async def view(self, request: web.Request) -> web.Response:
+        return web.Response(body=self._files[request.query["filename"]])
+
+
+class FakeStorage:
+    """In-memory IFileStorage."""
+
+    def __init__(self):
+        self.files: Dict[str, bytes] = {}
+
+    async def upload(self, file_id, content, mimetype, session_id):
+        self.files[f"{session_id}:{file_id}"] = content
+        return f"{session_id}:{file_id}"
+
+    async def download(self, file_id):
+        if file_id not in self.files:
+            raise FileNotFoundError(file_id)
+        return self.files[file_id]
+
+
+@pytest.fixture
+async def comfyui():
+    fake = FakeComfyUI()
+    server = TestServer(fake.app())
+    await server.start_server()
+    client = ComfyUIClient(str(server.make_url("")).rstrip("/"))
+    yield fake, client
+    if client._session and not client._session.closed:
+        await client._session.close()
+    await server.close()
+
+
+def context_provider(client, calls):
+    async def get_context():
+        calls.append(1)
+        return client, {}
+    return get_context
+
+
+# =============================================================================
+# ComfyUIClient Batch Tests
+# =============================================================================
+
+
+def test_batch_workflow_shares_loaders():
+    client = ComfyUIClient("http://comfyui:8188")
+    workflow, outputs = client._build_batch_workflow(
+        [{"prompt": "a", "seed": 1}, {"prompt": "b", "seed": 2}], {}
+    )
+
+    assert outputs == ["b0_8", "b1_8"]
+    assert sum(1 for n in workflow.values() if n["class_type"] == "UNETLoader") == 1
+    assert workflow["b1_6"]["inputs"]["seed"] == 2
+    assert workflow["b1_6"]["inputs"]["model"] == ["1", 0]
+    assert workflow["b1_6"]["inputs"]["positive"] == ["b1_4a", 0]
+    assert workflow["b1_4"]["inputs"]["text"] == "b"
+
+
+async def test_generate_image_batch_single_submission(comfyui):
+    fake, client = comfyui
+
+    images = await client.generate_image_batch(
+        [{"prompt": "cat", "seed": 1}, {"prompt": "dog", "seed": 2}]
+    )
+
+    assert images == [b"cat|1", b"dog|2"]
+    assert fake.submissions == 1
+
+
+# =============================================================================
+# ImageGenerationScheduler Tests
+# =============================================================================
+
+
+async def test_concurrent_same_size_requests_are_batched(comfyui):
+    fake, client = comfyui
+    scheduler = ImageGenerationScheduler(batch_window_seconds=0.02, max_batch_size=4)
+    calls = []
+
+    results = await asyncio.gather(*(
+        scheduler.generate(ImageRequest(prompt=f"p{i}", seed=i), "flux", context_provider(client, calls))
+        for i in range(3)
+    ))
+
+    assert [r.image for r in results] == [b"p0|0", b"p1|1", b"p2|2"]
+    assert fake.submissions == 1
+    assert len(calls) == 1
+    assert scheduler.get_stats()["avg_batch_size"] == 3
+
+
+async def test_different_sizes_are_not_batched(comfyui):
+    fake, client = comfyui
+    scheduler = ImageGenerationScheduler(batch_window_seconds=0.02)
+    calls = []
+
+    await asyncio.gather(
+        scheduler.generate(ImageRequest(prompt="a", width=1024, seed=1), "flux", context_provider(client, calls)),
+        scheduler.generate(ImageRequest(prompt="b", width=1344, seed=1), "flux", context_provider(client, calls)),
+    )
+
+    assert fake.submissions == 2
+
+
+async def test_max_batch_size_splits_batches(comfyui):
+    fake, client = comfyui
+    scheduler = ImageGenerationScheduler(batch_window_seconds=1.0, max_batch_size=2)
+
+    results = await asyncio.gather(*(
+        scheduler.generate(ImageRequest(prompt=f"p{i}", seed=i), "flux", context_provider(client, []))
+        for i in range(5)
+    ))
+
+    assert all(r.image for r in results)
+    assert fake.submissions == 3
+    assert scheduler.get_stats()["queued"] == 0
+
+
+async def test_cache_hit_skips_model_context(comfyui):
+    fake, client = comfyui
+    storage = FakeStorage()
+    calls = []
+
+    first = ImageGenerationScheduler(cache=ImageResultCache(storage), batch_window_seconds=0)
+    await first.generate(ImageRequest(prompt="cat", seed=7), "flux", context_provider(client, calls))
+
+    # Fresh process: memory cache empty, entry served from storage
+    second = ImageGenerationScheduler(
+        cache=ImageResultCache(storage, max_memory_entries=0), batch_window_seconds=0
+    )
+    result = await second.generate(ImageRequest(prompt="cat", seed=7), "flux", context_provider(client, calls))
+
+    assert result.cached is True
+    assert result.image == b"cat|7"
+    assert len(calls) == 1
+    assert fake.submissions == 1
+
+
+async def test_identical_in_flight_requests_are_coalesced(comfyui):
+    fake, client = comfyui
+    scheduler = ImageGenerationScheduler(batch_window_seconds=0.02)
+    request = ImageRequest(prompt="cat", seed=3)
+
+    results = await asyncio.gather(*(
+        scheduler.generate(request, "flux", context_provider(client, [])) for _ in range(3)
+    ))
+
+    assert {r.image for r in results} == {b"cat|3"}
+    assert scheduler.get_stats()["coalesced"] == 2
+    assert fake.submissions == 1
+
+
+async def test_unseeded_requests_get_distinct_reported_seeds(comfyui):
+    _, client = comfyui
+    scheduler = ImageGenerationScheduler(batch_window_seconds=0.02)
+
+    a, b = await asyncio.gather(*(
+        scheduler.generate(ImageRequest(prompt="cat"), "flux", context_provider(client, []))
+        for _ in range(2)
+    ))
+
+    assert a.image == f"cat|{a.seed}".encode()
+    assert b.image == f"cat|{b.seed}".encode()
+
+
+async def test_context_errors_reach_every_request():
+    scheduler = ImageGenerationScheduler(batch_window_seconds=0.02)
+
+    async def no_vram():
+        raise MemoryError("no VRAM")
+
+    results = await asyncio.gather(*(
+        scheduler.generate(ImageRequest(prompt=f"p{i}", seed=i), "flux", no_vram) for i in range(2)
+    ), return_exceptions=True)
+
+    assert all(isinstance(r, MemoryError) for r in results)
+    assert scheduler.get_stats()["in_flight"] == 0
+
+
+def test_cache_key_covers_generation_parameters():
+    base = ImageRequest(prompt="cat", seed=1)
+
+    assert image_cache_key(base, "flux") == image_cache_key(ImageRequest(prompt="cat", seed=1), "flux")
+    assert image_cache_key(base, "flux") != image_cache_key(base, "sdxl")
+    assert image_cache_key(base, "flux") != image_cache_key(ImageRequest(prompt="cat", seed=2), "flux")
+    assert image_cache_key(base, "flux") != image_cache_key(ImageRequest(prompt="cat", seed=1, steps=20), "flux")
+
+
+def test_create_image_scheduler_from_options():
+    scheduler = create_image_scheduler({"batch_window_ms": 10, "max_batch_size": 2, "result_cache": False})
+
+    assert scheduler._batch_window == 0.01
+    assert scheduler._max_batch_size == 2
+    assert scheduler.get_stats()["cache"] is None
+    assert create_image_scheduler().get_stats()["cache"]["persistent"] is False
+
+
+# =============================================================================
+# Batching
+# =============================================================================
+
+
+async def test_batching_reduces_workflow_submissions():
+    """Eight concurrent requests: one workflow each vs. batches of four."""
+    fake = FakeComfyUI()
+    server = TestServer(fake.app())
+    await server.start_server()
+    client = ComfyUIClient(str(server.make_url("")).rstrip("/"))
+
+    try:
+        async def run(scheduler):
+            before = fake.submissions
+            await asyncio.gather(*(
+                scheduler.generate(ImageRequest(prompt=f"p{i}", seed=i), "flux", context_provider(client, []))
+                for i in range(8)
+            ))
+            return fake.submissions - before
+
+        assert await run(ImageGenerationScheduler(batch_window_seconds=0, max_batch_size=1)) == 8
+        assert await run(ImageGenerationScheduler(batch_window_seconds=0.01, max_batch_size=4)) == 2
+    finally:
+        await client._session.close()
+        await server.close()
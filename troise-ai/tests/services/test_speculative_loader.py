@@ -0,0 +1,126 @@
+"""Tests for SpeculativeModelLoader."""
+import asyncio
+
+import pytest
+
+from app.core.router import RoutingResult
+from app.services.speculative_loader import SpeculativeModelLoader
+
+
+class MockOrchestrator:
+    """Orchestrator with controllable prefetches."""
+
+    ROLES = {"general": "general-model", "code": "code-model", "research": "research-model"}
+
+    def __init__(self, loaded=()):
+        self.loaded = set(loaded)
+        self.prefetched = []
+        self.cancelled = []
+        self.release = asyncio.Event()
+
+    def get_profile_model(self, role: str = "agent") -> str:
+        return self.ROLES.get(role, "general-model")
+
+    def is_loaded(self, model_id: str) -> bool:
+        return model_id in self.loaded
+
+    async def prefetch(self, model_id: str) -> bool:
+        self.prefetched.append(model_id)
+        try:
+            await self.release.wait()
+        except asyncio.CancelledError:
+            self.cancelled.append(model_id)
+            raise
+        self.loaded.add(model_id)
+        return True
+
+
+def routed(classification: str) -> RoutingResult:
+    return RoutingResult(type="agent", name="x", reason="test", classification=classification)
+
+
+@pytest.fixture
+def orchestrator():
+    return MockOrchestrator()
+
+
+@pytest.fixture
+def loader(orchestrator):
+    return SpeculativeModelLoader(orchestrator)
+
+
+# =============================================================================
+# Prediction
+# =============================================================================
+
+def test_predict_order(loader):
+    assert loader.predict("u1", "hello", user_model="picked") == ("picked", "user_model")
+    assert loader.predict("u1", "```python\nprint(1)\n```")[0] == "code-model"
+    assert loader.predict("u1", "Fix the bug in main.py please")[0] == "code-model"
+    assert loader.predict("u1", "hello") == ("general-model", "default")
+
+
+async def test_last_route_drives_prediction(loader, orchestrator):
+    load = loader.start("u1", "hello")
+    loader.resolve(load, "u1", routed("RESEARCH"))
+
+    assert loader.predict("u1", "and what about 2023?") == ("research-model", "last_route:RESEARCH")
+    assert loader.predict("u2", "hi")[0] == "general-model"
+
+
+# =============================================================================
+# Commit / Abandon
+# =============================================================================
+
+async def test_hit_commits_running_load(loader, orchestrator):
+    load = loader.start("u1", "hello")
+    await asyncio.sleep(0)
+
+    assert loader.resolve(load, "u1", routed("GENERAL")) is True
+    orchestrator.release.set()
+    assert await load.task is True
+    assert orchestrator.is_loaded("general-model")
+
+    stats = loader.get_stats()
+    assert stats["hits"] == 1 and stats["abandoned"] == 0
+    assert stats["hit_rate"] == 1.0
+
+
+async def test_miss_abandons_running_load(loader, orchestrator):
+    load = loader.start("u1", "hello")
+    await asyncio.sleep(0)
+
+    assert loader.resolve(load, "u1", routed("CODE")) is False
+    with pytest.raises(asyncio.CancelledError):
+        await load.task
+
+    assert orchestrator.cancelled == ["general-model"]
+    stats = loader.get_stats()
+    assert stats["misses"] == 1 and stats["abandoned"] == 1
+    assert stats["hit_rate"] == 0.0
+
+
+async def test_loaded_model_is_not_prefetched(orchestrator):
+    orchestrator.loaded.add("general-model")
+    loader = SpeculativeModelLoader(orchestrator)
+
+    load = loader.start("u1", "hello")
+
+    assert load.task is None
+    assert loader.resolve(load, "u1", routed("GENERAL")) is True
+    assert orchestrator.prefetched == []
+    assert loader.get_stats()["already_loaded"] == 1
+
+
+async def test_disabled_and_abandon(orchestrator):
+    disabled = SpeculativeModelLoader(orchestrator, enabled=False)
+    assert disabled.start("u1", "hello").model_id is None
+
+    loader = SpeculativeModelLoader(orchestrator)
+    load = loader.start("u1", "hello")
+    await asyncio.sleep(0)
+    loader.abandon(load)
+    loader.abandon(None)
+    with pytest.raises(asyncio.CancelledError):
+        await load.task
+    assert loader.resolve(load, "u1", routed("GENERAL")) is False
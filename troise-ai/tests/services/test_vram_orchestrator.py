@@ -405,6 +405,141 @@ async def test_request_load_backend_failure(mock_config, mock_backend_manager, m
         assert len(mock_profile_manager.load_failures) == 1
 
 
+# =============================================================================
+# Prefetch Tests
+# =============================================================================
+
+async def test_prefetch_loads_without_recording_profile_state(mock_config, mock_backend_manager, mock_profile_manager):
+    """prefetch() loads a model that fits and registers it."""
+    with patch("subprocess.run") as mock_run:
+        mock_run.return_value = MagicMock(returncode=0, stdout=_make_free_output(128.0))
+        orchestrator = VRAMOrchestrator(mock_config, mock_backend_manager, mock_profile_manager)
+
+        assert await orchestrator.prefetch("medium-model") is True
+        assert orchestrator.is_loaded("medium-model")
+        assert not orchestrator.is_loading("medium-model")
+
+        # Already loaded: no second backend call
+        assert await orchestrator.prefetch("medium-model") is True
+        assert len(mock_backend_manager.load_calls) == 1
+        assert await orchestrator.prefetch("unknown-model") is False
+
+
+async def test_prefetch_never_evicts(mock_config, mock_backend_manager, mock_profile_manager):
+    """prefetch() skips models that would need eviction."""
+    with patch("subprocess.run") as mock_run:
+        # 10GB limit, 20GB model
+        mock_run.return_value = MagicMock(returncode=0, stdout=_make_free_output(10.53))
+        orchestrator = VRAMOrchestrator(mock_config, mock_backend_manager, mock_profile_manager)
+
+        assert await orchestrator.prefetch("large-model") is False
+        assert mock_backend_manager.load_calls == []
+        assert mock_backend_manager.unload_calls == []
+        assert mock_profile_manager.load_failures == []
+
+
+async def test_prefetch_cancel_releases_reservation(mock_config, mock_profile_manager):
+    """Cancelling prefetch() abandons the load without blocking other loads."""
+    import asyncio
+
+    class SlowBackendManager(MockBackendManager):
+        def __init__(self):
+            super().__init__()
+            self.release = asyncio.Event()
+
+        async def load_model(self, model_id: str, keep_alive: str = "10m") -> bool:
+            if model_id == "large-model":
+                await self.release.wait()
+            return await super().load_model(model_id, keep_alive)
+
+    backend = SlowBackendManager()
+    with patch("subprocess.run") as mock_run:
+        mock_run.return_value = MagicMock(returncode=0, stdout=_make_free_output(128.0))
+        orchestrator = VRAMOrchestrator(mock_config, backend, mock_profile_manager)
+
+        task = asyncio.create_task(orchestrator.prefetch("large-model"))
+        await asyncio.sleep(0)
+        assert orchestrator.is_loading("large-model")
+        available_during = orchestrator._get_available_ram_gb()
+
+        # Lock is not held while the prefetch loads
+        assert await asyncio.wait_for(orchestrator.request_load("small-model"), timeout=1) is True
+
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert not orchestrator.is_loading("large-model")
+        assert not orchestrator.is_loaded("large-model")
+        assert orchestrator._get_available_ram_gb() == pytest.approx(available_during + 20.0)
+
+
+class GatedBackendManager(MockBackendManager):
+    """Backend whose first load of a model waits for a gate, then succeeds or fails."""
+
+    def __init__(self, first_load_fails: bool):
+        super().__init__()
+        import asyncio
+        self.gate = asyncio.Event()
+        self.first_load_fails = first_load_fails
+
+    async def load_model(self, model_id: str, keep_alive: str = "10m") -> bool:
+        if not self.load_calls:
+            self.load_calls.append({"model_id": model_id, "keep_alive": keep_alive})
+            await self.gate.wait()
+            if self.first_load_fails:
+                raise RuntimeError("backend crashed")
+            self._loaded_models.add(model_id)
+            return True
+        return await super().load_model(model_id, keep_alive)
+
+
+async def test_request_load_waits_for_prefetch(mock_config, mock_profile_manager):
+    """request_load() for a model being prefetched waits and reuses that load."""
+    import asyncio
+
+    backend = GatedBackendManager(first_load_fails=False)
+    with patch("subprocess.run") as mock_run:
+        mock_run.return_value = MagicMock(returncode=0, stdout=_make_free_output(128.0))
+        orchestrator = VRAMOrchestrator(mock_config, backend, mock_profile_manager)
+
+        prefetch = asyncio.create_task(orchestrator.prefetch("medium-model"))
+        await asyncio.sleep(0)
+        request = asyncio.create_task(orchestrator.request_load("medium-model"))
+        await asyncio.sleep(0.01)
+        assert not request.done()
+
+        backend.gate.set()
+        assert await request is True
+        assert await prefetch is True
+        assert orchestrator.is_loaded("medium-model")
+        assert len(backend.load_calls) == 1
+
+
+async def test_request_load_falls_back_when_prefetch_fails(mock_config, mock_profile_manager):
+    """A failed prefetch does not satisfy a waiting request_load(); it loads normally."""
+    import asyncio
+
+    backend = GatedBackendManager(first_load_fails=True)
+    with patch("subprocess.run") as mock_run:
+        mock_run.return_value = MagicMock(returncode=0, stdout=_make_free_output(128.0))
+        orchestrator = VRAMOrchestrator(mock_config, backend, mock_profile_manager)
+
+        prefetch = asyncio.create_task(orchestrator.prefetch("medium-model"))
+        await asyncio.sleep(0)
+        request = asyncio.create_task(orchestrator.request_load("medium-model"))
+        await asyncio.sleep(0.01)
+        assert not request.done()
+
+        backend.gate.set()
+        assert await prefetch is False
+        assert await request is True
+
+        assert orchestrator.is_loaded("medium-model")
+        assert len(backend.load_calls) == 2
+        assert mock_profile_manager.load_successes == ["medium-model"]
+
+
 # =============================================================================
 # Eviction Tests
 # =============================================================================
@@ -64,6 +64,59 @@ export interface MonitoringData {
   timestamp: string;
 }
 
+// ============================================================================
+// Delta frames
+// ============================================================================
+
+type MonitoringFrame =
+  | { type: "full"; data: MonitoringData }
+  | { type: "delta"; data: Record<string, unknown> }
+  | { type: "error"; error: string; timestamp: string };
+
+/**
+ * Apply a JSON merge patch (RFC 7386): nested objects merge,
+ * null removes a key, anything else replaces.
+ */
+function mergePatch(target: unknown, patch: unknown): unknown {
+  if (patch === null || typeof patch !== "object" || Array.isArray(patch)) {
+    return patch;
+  }
+  const result: Record<string, unknown> =
+    target !== null && typeof target === "object" && !Array.isArray(target)
+      ? { ...(target as Record<string, unknown>) }
+      : {};
+  for (const [key, value] of Object.entries(patch as Record<string, unknown>)) {
+    if (value === null) {
+      delete result[key];
+    } else {
+      result[key] = mergePatch(result[key], value);
+    }
+  }
+  return result;
+}
+
+/**
+ * Fold a ?delta=true monitoring frame into the current snapshot.
+ * Deltas before the first full frame are ignored (server always leads with one).
+ */
+function reduceMonitoringFrame(
+  previous: MonitoringData | null,
+  message: unknown
+): MonitoringData | null {
+  const frame = message as MonitoringFrame;
+  switch (frame.type) {
+    case "full":
+      return frame.data;
+    case "delta":
+      return previous ? (mergePatch(previous, frame.data) as MonitoringData) : previous;
+    default:
+      if (frame.type === "error") {
+        console.error("[useAdminMonitoring] Stream error:", frame.error);
+      }
+      return previous;
+  }
+}
+
 // ============================================================================
 // Hooks
 // ============================================================================
@@ -77,10 +130,11 @@ export function useAdminMonitoring(enabled = true) {
   const { accessToken, refreshAccessToken } = useAuth();
   const isRefreshingRef = useRef(false);
 
-  // Construct URL with token query parameter for SSE authentication
+  // Construct URL with token query parameter for SSE authentication.
+  // delta=true: full snapshot first, then only changed fields.
   const url = accessToken
-    ? `${baseUrl}/admin/monitoring/stream?token=${encodeURIComponent(accessToken)}`
-    : `${baseUrl}/admin/monitoring/stream`;
+    ? `${baseUrl}/admin/monitoring/stream?delta=true&token=${encodeURIComponent(accessToken)}`
+    : `${baseUrl}/admin/monitoring/stream?delta=true`;
 
   // Handle SSE errors - check if token expired and refresh
   const handleError = useCallback(async () => {
@@ -111,6 +165,7 @@ export function useAdminMonitoring(enabled = true) {
     retryInterval: 5000,
     withCredentials: false, // Token is in URL, not cookies
     onError: handleError,
+    reduce: reduceMonitoringFrame,
   });
 
   // Also check token expiry periodically while connected
@@ -24,6 +24,11 @@ interface UseSSEOptions<T> {
   retryInterval?: number;
   /** Include credentials in request */
   withCredentials?: boolean;
+  /**
+   * Fold each parsed message into the current data (e.g. apply a delta).
+   * Defaults to replacing data with the message.
+   */
+  reduce?: (previous: T | null, message: unknown) => T | null;
 }
 
 interface UseSSEReturn<T> {
@@ -47,6 +52,7 @@ export function useSSE<T>({
   enabled = true,
   retryInterval = 5000,
   withCredentials = true,
+  reduce,
 }: UseSSEOptions<T>): UseSSEReturn<T> {
   const [data, setData] = useState<T | null>(null);
   const [isConnected, setIsConnected] = useState(false);
@@ -55,17 +61,20 @@ export function useSSE<T>({
   const eventSourceRef = useRef<EventSource | null>(null);
   const retryTimeoutRef = useRef<NodeJS.Timeout | null>(null);
   const mountedRef = useRef(true);
+  const dataRef = useRef<T | null>(null);
 
   // Store callbacks in refs to avoid reconnections
   const onMessageRef = useRef(onMessage);
   const onErrorRef = useRef(onError);
   const onOpenRef = useRef(onOpen);
+  const reduceRef = useRef(reduce);
 
   useEffect(() => {
     onMessageRef.current = onMessage;
     onErrorRef.current = onError;
     onOpenRef.current = onOpen;
-  }, [onMessage, onError, onOpen]);
+    reduceRef.current = reduce;
+  }, [onMessage, onError, onOpen, reduce]);
 
   const disconnect = useCallback(() => {
     if (retryTimeoutRef.current) {
@@ -99,9 +108,16 @@ export function useSSE<T>({
       eventSource.onmessage = (event) => {
         if (!mountedRef.current) return;
         try {
-          const parsedData = JSON.parse(event.data) as T;
-          setData(parsedData);
-          onMessageRef.current?.(parsedData);
+          const message = JSON.parse(event.data);
+          const nextData = reduceRef.current
+            ? reduceRef.current(dataRef.current, message)
+            : (message as T);
+          if (nextData === dataRef.current) return;
+          dataRef.current = nextData;
+          setData(nextData);
+          if (nextData !== null) {
+            onMessageRef.current?.(nextData);
+          }
         } catch (e) {
           console.error("[useSSE] Failed to parse data:", e);
         }